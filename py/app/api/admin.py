@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+관리자 API
+- X-Admin-Token 헤더가 ADMIN_TOKEN 환경변수와 같을 때만 허용 (미설정 시 비활성화)
+- 쿼리 통계 / 느린 쿼리 로그
+- 요청 / 파이프라인 단계 프로파일 목록 / 다운로드
+"""
+
+import os
+import hmac
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query
+from fastapi.responses import FileResponse
+
+from core.profiling import get_profile_store
+from core.query_stats import QueryStatsRecorder, get_query_stats
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+def is_admin_token(value: Optional[str]) -> bool:
+    """ADMIN_TOKEN과 같은 토큰인지 확인 (ADMIN_TOKEN 미설정이면 항상 False)"""
+    token = os.getenv("ADMIN_TOKEN", "")
+    return bool(token and value and hmac.compare_digest(value, token))
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None, description="관리자 토큰")):
+    """관리자 토큰 확인 의존성"""
+    if not os.getenv("ADMIN_TOKEN", ""):
+        raise HTTPException(status_code=403, detail="관리자 API가 비활성화되어 있습니다. (ADMIN_TOKEN 미설정)")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=401, detail="관리자 토큰이 올바르지 않습니다.")
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get(
+    "/query-stats",
+    summary="쿼리 통계",
+    description="SQL 지문별 호출 수 / 총·평균·p95 시간 / 행 수와 느린 쿼리 로그를 반환합니다."
+)
+async def get_query_statistics(
+    sort: str = Query("total_ms", description=f"정렬 기준 ({', '.join(QueryStatsRecorder.SORT_KEYS)})"),
+    limit: int = Query(50, gt=0, le=500, description="최대 지문 수"),
+    slow_limit: int = Query(50, gt=0, le=1000, description="최대 느린 쿼리 수"),
+):
+    """쿼리 통계 조회"""
+    recorder = get_query_stats()
+    try:
+        statements = recorder.snapshot(sort=sort, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "summary": recorder.summary(),
+        "statements": statements,
+        "slow_queries": recorder.slow_queries(limit=slow_limit),
+    }
+
+
+@router.post(
+    "/query-stats/reset",
+    summary="쿼리 통계 초기화",
+    description="쿼리 통계와 느린 쿼리 로그를 초기화합니다."
+)
+async def reset_query_statistics():
+    """쿼리 통계 초기화"""
+    get_query_stats().reset()
+    logger.info("🗑️ 쿼리 통계 초기화 완료")
+    return {"message": "쿼리 통계가 초기화되었습니다."}
+
+
+@router.get(
+    "/profiles",
+    summary="프로파일 목록",
+    description="최근 요청 / 파이프라인 단계 프로파일 메타데이터를 최신순으로 반환합니다."
+)
+async def list_profiles(limit: int = Query(20, gt=0, le=500, description="최대 개수")):
+    """프로파일 목록"""
+    store = get_profile_store()
+    return {"directory": store.directory, "profiles": store.list(limit=limit)}
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    summary="프로파일 다운로드",
+    description="collapsed stack 파일을 내려받습니다 (flamegraph.pl / speedscope에서 열기)."
+)
+async def download_profile(profile_id: str = Path(..., description="프로파일 ID")):
+    """프로파일 다운로드"""
+    path = get_profile_store().path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"프로파일을 찾을 수 없습니다: {profile_id}")
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=os.path.basename(path))
@@ -17,6 +17,9 @@ from pydantic import BaseModel, Field
 
 # 상대 경로로 import 수정
 from core.database import PostgreSQLDatabase
+from core.metrics import CACHE_ENTRIES, CACHE_EVENTS, get_metrics
+from core.search import SearchIndexNotReady, get_search_index
+from core.bert.knn_graph import get_knn_graph_store
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -43,6 +46,43 @@ class RecommendationResponse(BaseModel):
     books: List[BookResponse] = Field(..., description="책 목록")
     cache_hit: bool = Field(False, description="캐시 히트 여부")
 
+class SearchBookResponse(BaseModel):
+    """검색 결과 책 정보 모델"""
+    books_isbn: str = Field(..., description="책 ISBN")
+    books_title: Optional[str] = Field(None, description="책 제목")
+    books_description: Optional[str] = Field(None, description="책 설명")
+    books_img: Optional[str] = Field(None, description="책 이미지 URL")
+    books_publisher: Optional[str] = Field(None, description="출판사")
+    similarity_score: float = Field(..., description="검색어와의 유사도 점수")
+
+class SearchResponse(BaseModel):
+    """의미 검색 응답 모델"""
+    query: str = Field(..., description="검색어")
+    k: int = Field(..., description="요청한 결과 수")
+    total_books: int = Field(..., description="색인된 전체 책 수")
+    books: List[SearchBookResponse] = Field(..., description="유사도 순 책 목록")
+    cache_hit: bool = Field(False, description="검색어 임베딩 캐시 히트 여부")
+    embed_ms: float = Field(..., description="검색어 임베딩 시간(ms)")
+    search_ms: float = Field(..., description="인덱스 검색 시간(ms)")
+
+class SimilarBookResponse(BaseModel):
+    """비슷한 책 정보 모델"""
+    books_isbn: str = Field(..., description="책 ISBN")
+    books_title: str = Field(..., description="책 제목")
+    similarity_score: float = Field(..., description="기준 책과의 유사도 점수")
+
+class SimilarBooksResponse(BaseModel):
+    """비슷한 책 응답 모델"""
+    books_isbn: str = Field(..., description="기준 책 ISBN")
+    graph_version: Optional[str] = Field(None, description="이웃 그래프 카탈로그 버전")
+    books: List[SimilarBookResponse] = Field(..., description="유사도 순 책 목록")
+
+class BatchRecommendationResponse(BaseModel):
+    """여러 카테고리 추천 응답 모델"""
+    limit: int = Field(..., description="카테고리당 항목 수")
+    categories: Dict[str, RecommendationResponse] = Field(..., description="카테고리별 첫 페이지 추천")
+    cache_hits: int = Field(0, description="캐시에서 응답한 카테고리 수")
+
 class ErrorResponse(BaseModel):
     """에러 응답 모델"""
     error: bool = Field(True, description="에러 여부")
@@ -67,8 +107,11 @@ def is_cache_valid(cache_key: str) -> bool:
 def get_cached_data(cache_key: str) -> Optional[Dict[str, Any]]:
     """캐시된 데이터 조회"""
     if is_cache_valid(cache_key):
+        CACHE_EVENTS.labels("recommendation", "hit").inc()
         logger.info(f"📦 캐시 히트: {cache_key}")
         return recommendation_cache.get(cache_key)
+    # TTL이 지난 항목은 다음 저장 때 교체되므로 만료로 집계
+    CACHE_EVENTS.labels("recommendation", "expired" if cache_key in cache_timestamps else "miss").inc()
     return None
 
 def set_cached_data(cache_key: str, data: Dict[str, Any]):
@@ -77,6 +120,50 @@ def set_cached_data(cache_key: str, data: Dict[str, Any]):
     cache_timestamps[cache_key] = time.time()
     logger.info(f"💾 캐시 저장: {cache_key}")
 
+def _collect_cache_metrics():
+    CACHE_ENTRIES.labels("recommendation").set(len(recommendation_cache))
+
+get_metrics().add_collector(_collect_cache_metrics)
+
+# 카테고리
+VALID_CATEGORIES = ["politics", "sports", "economic", "society", "world"]
+
+# 오타 수정 (일반적인 오타들)
+CATEGORY_FIXES = {
+    "ecomonic": "economic",
+    "economy": "economic",
+    "politic": "politics",
+    "sport": "sports",
+    "social": "society",
+    "international": "world"
+}
+
+def normalize_category(category: str) -> str:
+    """카테고리 오타 수정 및 검증 (허용되지 않은 값이면 400)"""
+    if category in CATEGORY_FIXES:
+        original_category = category
+        category = CATEGORY_FIXES[category]
+        logger.info(f"🔧 카테고리 오타 수정: '{original_category}' → '{category}'")
+    
+    if category not in VALID_CATEGORIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"유효하지 않은 카테고리입니다. 허용된 값: {', '.join(VALID_CATEGORIES)}"
+        )
+    return category
+
+def _book_from_row(row) -> BookResponse:
+    """추천 조회 행 (isbn, 카테고리, 이미지, 설명, 제목, 출판사, 뉴스 날짜, 점수) → BookResponse"""
+    return BookResponse(
+        books_isbn=row[0],
+        news_category=row[1],
+        books_img=row[2],
+        books_description=row[3],
+        books_title=row[4],
+        books_publisher=row[5],
+        similarity_score=float(row[7]) if row[7] else None
+    )
+
 # 데이터베이스 의존성
 def get_database():
     """데이터베이스 연결 의존성"""
@@ -86,6 +173,127 @@ def get_database():
     finally:
         db.close()
 
+# 카테고리별 상위 limit개를 한 번에 조회 (카테고리마다 ROW_NUMBER로 순위, 전체 수는 집계 CTE)
+BATCH_RECOMMEND_QUERY = """
+    WITH candidates AS (
+        SELECT DISTINCT
+            b.books_isbn, n.news_category, b.books_img,
+            b.books_description, b.books_title, b.books_publisher,
+            n.news_date, r.similarity_score
+        FROM tb_recommend r
+        JOIN tb_news_keyword n ON r.news_id = n.news_id
+        JOIN tb_books b ON r.books_isbn = b.books_isbn
+        WHERE n.news_category IN ({placeholders})
+    ),
+    ranked AS (
+        SELECT candidates.*,
+            ROW_NUMBER() OVER (
+                PARTITION BY news_category
+                ORDER BY similarity_score DESC, news_date DESC
+            ) AS category_rank
+        FROM candidates
+    ),
+    totals AS (
+        SELECT news_category, COUNT(DISTINCT books_isbn) AS total
+        FROM candidates
+        GROUP BY news_category
+    )
+    SELECT
+        ranked.books_isbn, ranked.news_category, ranked.books_img,
+        ranked.books_description, ranked.books_title, ranked.books_publisher,
+        ranked.news_date, ranked.similarity_score, totals.total
+    FROM ranked
+    JOIN totals ON ranked.news_category = totals.news_category
+    WHERE ranked.category_rank <= %s
+    ORDER BY ranked.news_category, ranked.category_rank
+"""
+
+@router.get(
+    "/recommend",
+    response_model=BatchRecommendationResponse,
+    summary="여러 카테고리 도서 추천",
+    description="요청한 카테고리의 첫 페이지 추천을 한 번에 반환합니다. 캐시에 없는 카테고리는 쿼리 한 번으로 조회합니다.",
+    responses={
+        200: {"description": "카테고리별 추천 도서 (추천이 없는 카테고리는 total 0)"},
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        500: {"model": ErrorResponse, "description": "서버 내부 오류"}
+    }
+)
+async def get_batch_recommendations(
+    categories: Optional[str] = Query(None, description="쉼표로 구분한 카테고리 (기본값: 전체)"),
+    limit: int = Query(10, gt=0, le=100, description="카테고리당 항목 수"),
+    db: PostgreSQLDatabase = Depends(get_database)
+):
+    """
+    여러 카테고리 도서 추천 API
+
+    조회한 카테고리는 `/recommend/{category}?limit=N` 첫 페이지와 같은 캐시 키로 저장되어
+    이후 단일 카테고리 요청도 캐시에서 응답합니다.
+
+    - **categories**: 쉼표로 구분한 카테고리 (예: politics,sports / 생략하면 전체)
+    - **limit**: 카테고리당 항목 수 (기본값: 10, 최대: 100)
+    """
+    start_time = time.time()
+    
+    try:
+        requested = [normalize_category(category.strip())
+                     for category in (categories or ",".join(VALID_CATEGORIES)).split(",") if category.strip()]
+        requested = list(dict.fromkeys(requested))
+        if not requested:
+            raise HTTPException(status_code=400, detail="카테고리를 하나 이상 지정하세요.")
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for category in requested:
+            cached_data = get_cached_data(get_cache_key(category, None, 1, limit))
+            if cached_data:
+                results[category] = dict(cached_data, cache_hit=True)
+            else:
+                missing.append(category)
+        cache_hits = len(results)
+        
+        if missing:
+            logger.info(f"📥 일괄 추천 요청: categories={','.join(missing)}, limit={limit}")
+            query = BATCH_RECOMMEND_QUERY.format(placeholders=", ".join(["%s"] * len(missing)))
+            try:
+                rows = db.fetch_query(query, missing + [limit], name="recommend_batch")
+            except Exception as e:
+                logger.error(f"❌ 일괄 추천 조회 실패: {e}")
+                raise HTTPException(status_code=500, detail="데이터베이스 조회 중 오류가 발생했습니다.")
+            
+            grouped: Dict[str, List] = {category: [] for category in missing}
+            for row in rows:
+                grouped[row[1]].append(row)
+            for category, category_rows in grouped.items():
+                total = category_rows[0][8] if category_rows else 0
+                response_data = {
+                    "total": total,
+                    "page": 1,
+                    "limit": limit,
+                    "total_pages": (total + limit - 1) // limit,
+                    "books": [_book_from_row(row) for row in category_rows],
+                    "cache_hit": False
+                }
+                # 추천이 없는 카테고리는 단일 카테고리 API가 404를 반환하도록 캐시하지 않음
+                if total:
+                    set_cached_data(get_cache_key(category, None, 1, limit), response_data)
+                results[category] = response_data
+        
+        process_time = time.time() - start_time
+        logger.info(f"📤 일괄 추천 응답: {len(requested)}개 카테고리 (캐시 {cache_hits}개), {process_time:.3f}초")
+        
+        return BatchRecommendationResponse(
+            limit=limit,
+            categories={category: RecommendationResponse(**results[category]) for category in requested},
+            cache_hits=cache_hits
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 일괄 추천 API 오류: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="내부 서버 오류가 발생했습니다.")
+
 @router.get(
     "/recommend/{category}",
     response_model=RecommendationResponse,
@@ -118,29 +326,7 @@ async def get_recommendations(
     
     try:
         # 입력 검증 및 오타 수정
-        valid_categories = ["politics", "sports", "economic", "society", "world"]
-        
-        # 오타 수정 (일반적인 오타들)
-        category_fixes = {
-            "ecomonic": "economic",
-            "economy": "economic",
-            "politic": "politics",
-            "sport": "sports",
-            "social": "society",
-            "international": "world"
-        }
-        
-        # 오타 수정 적용
-        if category in category_fixes:
-            original_category = category
-            category = category_fixes[category]
-            logger.info(f"🔧 카테고리 오타 수정: '{original_category}' → '{category}'")
-        
-        if category not in valid_categories:
-            raise HTTPException(
-                status_code=400,
-                detail=f"유효하지 않은 카테고리입니다. 허용된 값: {', '.join(valid_categories)}"
-            )
+        category = normalize_category(category)
         
         # 날짜 형식 검증
         if date:
@@ -180,7 +366,7 @@ async def get_recommendations(
             count_params.append(date)
         
         try:
-            total_result = db.fetch_query(count_query, count_params)
+            total_result = db.fetch_query(count_query, count_params, name="recommend_count")
             total = total_result[0][0] if total_result else 0
         except Exception as e:
             logger.error(f"❌ 전체 개수 조회 실패: {e}")
@@ -213,24 +399,13 @@ async def get_recommendations(
         data_params.extend([limit, offset])
         
         try:
-            rows = db.fetch_query(data_query, data_params)
+            rows = db.fetch_query(data_query, data_params, name="recommend_page")
         except Exception as e:
             logger.error(f"❌ 데이터 조회 실패: {e}")
             raise HTTPException(status_code=500, detail="데이터베이스 조회 중 오류가 발생했습니다.")
         
         # 응답 데이터 구성
-        books = [
-            BookResponse(
-                books_isbn=row[0],
-                news_category=row[1],
-                books_img=row[2],
-                books_description=row[3],
-                books_title=row[4],
-                books_publisher=row[5],
-                similarity_score=float(row[7]) if row[7] else None
-            )
-            for row in rows
-        ]
+        books = [_book_from_row(row) for row in rows]
         
         total_pages = (total + limit - 1) // limit
         
@@ -257,6 +432,83 @@ async def get_recommendations(
         logger.error(f"❌ 추천 API 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="내부 서버 오류가 발생했습니다.")
 
+@router.get(
+    "/search",
+    response_model=SearchResponse,
+    summary="도서 의미 검색",
+    description="검색어를 임베딩해 도서 설명 임베딩 인덱스에서 유사한 도서를 찾습니다.",
+    responses={
+        200: {"description": "유사도 순 검색 결과"},
+        500: {"model": ErrorResponse, "description": "서버 내부 오류"},
+        503: {"model": ErrorResponse, "description": "검색 인덱스 생성 중"}
+    }
+)
+def search_books(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    k: int = Query(10, gt=0, le=100, description="반환할 도서 수"),
+):
+    """
+    도서 의미 검색 API
+
+    모델 순전파 / 행렬 곱이 이벤트 루프를 막지 않도록 동기 함수로 정의해 스레드 풀에서 실행합니다.
+    첫 인덱스 (또는 임베딩 방식이 바뀐 뒤의 인덱스)는 백그라운드에서 만들며, 그동안은 503을 반환합니다.
+
+    - **q**: 검색어 (최대 200자)
+    - **k**: 반환할 도서 수 (기본값: 10, 최대: 100)
+    """
+    try:
+        result = get_search_index().search(q, k, wait=False)
+    except SearchIndexNotReady as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    except Exception as e:
+        logger.error(f"❌ 검색 API 오류: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="검색 중 오류가 발생했습니다.")
+
+    logger.info(f"🔎 검색: '{q}' → {len(result['results'])}권 "
+                f"(임베딩 {result['embed_ms']:.1f}ms, 검색 {result['search_ms']:.1f}ms, 캐시 {result['cache_hit']})")
+    return SearchResponse(
+        query=q,
+        k=k,
+        total_books=result["total_books"],
+        books=[SearchBookResponse(**book) for book in result["results"]],
+        cache_hit=result["cache_hit"],
+        embed_ms=result["embed_ms"],
+        search_ms=result["search_ms"],
+    )
+
+@router.get(
+    "/books/{isbn}/similar",
+    response_model=SimilarBooksResponse,
+    summary="비슷한 책",
+    description="파이프라인이 미리 계산한 도서 이웃 그래프에서 비슷한 책을 반환합니다 (모델 추론 없음).",
+    responses={
+        200: {"description": "유사도 순 비슷한 책 목록"},
+        404: {"model": ErrorResponse, "description": "그래프에 없는 ISBN"},
+        503: {"model": ErrorResponse, "description": "이웃 그래프가 아직 없음"}
+    }
+)
+async def get_similar_books(
+    isbn: str = Path(..., description="기준 책 ISBN"),
+    limit: int = Query(10, gt=0, le=100, description="최대 항목 수"),
+):
+    """
+    비슷한 책 API (ISBN → 행 조회 + CSR 배열 슬라이스)
+
+    - **isbn**: 기준 책 ISBN
+    - **limit**: 최대 항목 수 (기본값: 10, 그래프의 KNN_GRAPH_K를 넘지 않음)
+    """
+    graph = get_knn_graph_store().get()
+    if graph is None:
+        raise HTTPException(status_code=503, detail="도서 이웃 그래프가 아직 생성되지 않았습니다.")
+    neighbours = graph.neighbours(isbn, limit)
+    if neighbours is None:
+        raise HTTPException(status_code=404, detail=f"이웃 그래프에 없는 도서입니다: {isbn}")
+    return SimilarBooksResponse(
+        books_isbn=isbn,
+        graph_version=graph.version,
+        books=[SimilarBookResponse(**book) for book in neighbours],
+    )
+
 @router.get(
     "/visualize",
     summary="모델 시각화",
@@ -280,6 +532,26 @@ async def visualize_model():
         logger.error(f"❌ 모델 시각화 실패: {e}")
         raise HTTPException(status_code=500, detail="모델 시각화 중 오류가 발생했습니다.")
 
+@router.get(
+    "/models/status",
+    summary="모델 레지스트리 상태",
+    description="프로세스에 로드된 모델의 로드 시간과 메모리 사용량을 확인합니다."
+)
+async def get_models_status():
+    """모델 레지스트리 상태 확인"""
+    try:
+        from core.bert.model_registry import get_model_registry
+        from core.bert.shared_store import get_shared_store_stats
+        
+        return {
+            "models": get_model_registry().stats(),
+            "shared_embedding_store": get_shared_store_stats(),
+            "search_index": get_search_index().stats(),
+        }
+    except Exception as e:
+        logger.error(f"❌ 모델 상태 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="모델 상태 조회 중 오류가 발생했습니다.")
+
 @router.get(
     "/categories",
     summary="사용 가능한 카테고리",
@@ -305,6 +577,7 @@ async def clear_cache():
     """캐시 초기화"""
     try:
         global recommendation_cache, cache_timestamps
+        CACHE_EVENTS.labels("recommendation", "eviction").inc(len(recommendation_cache))
         recommendation_cache.clear()
         cache_timestamps.clear()
         logger.info("🗑️ 캐시 초기화 완료")
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+추천 파이프라인 벤치마크 CLI
+- run_recommendation.py와 같은 crawl → keywords → embed_books → score → publish → similar_books 흐름을
+  로컬 픽스처 HTML 서버 + SQLite DB + 소형 BERT로 실행 (네트워크 / KoBERT / Supabase 없음)
+- 도서 수(1k / 10k / 100k)별, 단계별 경과 시간 / CPU 시간 / 최대 RSS / 처리 행 수 보고
+- --baseline 보고서 대비 단계 시간이 기준 비율 이상 늘면 실패 (종료 코드 1)
+
+사용법 (py 폴더에서):
+    python -m app.bench pipeline --scales 1000,10000,100000 --output reports/pipeline.json
+    python -m app.bench pipeline --scales 1000,10000 --baseline reports/pipeline.json --max-regression 20
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import resource
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+PY_DIR = os.path.dirname(APP_DIR)
+sys.path.append(APP_DIR)
+sys.path.append(os.path.join(PY_DIR, "benchmarks"))
+
+from report import build_report, compare_reports, load_report, print_comparison, write_report
+from standins import SQLiteDatabase, SyntheticCorpus, build_tiny_model
+
+FIXTURES_DIR = os.path.join(PY_DIR, "tests", "fixtures")
+DEFAULT_MODEL_DIR = os.path.join(PY_DIR, "cache", "bench_tiny_bert")
+SECTIONS = ["politics", "sports", "economic", "society", "world"]
+CARD = '<li class="card"><h2 class="headline"><a href="/article/{i}">{title}</a></h2></li>'
+
+
+# -------------------------------------------------------------------
+# 단계 측정
+# -------------------------------------------------------------------
+def _rss_mb() -> float:
+    """현재 프로세스 RSS (MB)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError):
+        # /proc이 없으면 프로세스 최대 RSS로 대신함 (macOS는 바이트 단위)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def _cpu_seconds() -> float:
+    """현재 프로세스 + 종료된 자식 프로세스(명사 추출 워커 등) CPU 시간"""
+    total = 0.0
+    for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN):
+        usage = resource.getrusage(who)
+        total += usage.ru_utime + usage.ru_stime
+    return total
+
+
+class StageMonitor:
+    """단계 실행 중 RSS를 주기적으로 샘플링해 최대값 기록"""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.peak = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, _rss_mb())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak = _rss_mb()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_mb())
+
+
+def instrument(pipeline, rows: Dict[str, Callable[[Any], int]], results: Dict[str, Dict[str, Any]]):
+    """파이프라인 단계 함수를 측정 래퍼로 교체"""
+    for stage in pipeline.stages:
+        def measured(outputs, func=stage.func, name=stage.name):
+            rss_before = _rss_mb()
+            cpu_before = _cpu_seconds()
+            start = time.perf_counter()
+            with StageMonitor() as monitor:
+                output = func(outputs)
+            results[name] = {
+                "seconds": round(time.perf_counter() - start, 4),
+                "cpu_seconds": round(_cpu_seconds() - cpu_before, 4),
+                "peak_rss_mb": round(monitor.peak, 1),
+                "rss_delta_mb": round(monitor.peak - rss_before, 1),
+                "rows": rows[name](output),
+            }
+            return output
+        stage.func = measured
+
+
+# -------------------------------------------------------------------
+# 픽스처 뉴스 서버
+# -------------------------------------------------------------------
+def build_site(directory: str, corpus: SyntheticCorpus, pages: int, headlines: int) -> None:
+    """
+    섹션 페이지 생성 (1페이지는 tests/fixtures 페이지를 그대로, 나머지는 같은 마크업의 합성 헤드라인)
+
+    Args:
+        directory: 페이지를 쓸 디렉토리 (섹션별 하위 폴더)
+        corpus: 헤드라인 생성용 코퍼스
+        pages: 섹션별 페이지 수
+        headlines: 페이지당 헤드라인 수
+    """
+    fixtures = {name[:-5]: name for name in os.listdir(FIXTURES_DIR) if name.endswith(".html")}
+    for section in SECTIONS:
+        os.makedirs(os.path.join(directory, section), exist_ok=True)
+        for page in range(1, pages + 1):
+            path = os.path.join(directory, section, f"{page}.html")
+            if page == 1 and section in fixtures:
+                with open(os.path.join(FIXTURES_DIR, fixtures[section]), encoding="utf-8") as f:
+                    html = f.read()
+            else:
+                cards = "".join(CARD.format(i=i, title=corpus.sentence(int(corpus.rng.integers(4, 10))))
+                                for i in range(headlines))
+                html = (f"<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'></head>"
+                        f"<body><ul class='story_list'>{cards}</ul></body></html>")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(html)
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(directory: str) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# -------------------------------------------------------------------
+# 실행
+# -------------------------------------------------------------------
+def run_scale(books: int, args, workdir: str, engine=None) -> Dict[str, Dict[str, Any]]:
+    """
+    도서 books권 규모로 파이프라인 1회 실행
+
+    Args:
+        books: 합성 도서 수
+        args: pipeline 서브커맨드 인자
+        workdir: 픽스처 페이지 / 체크포인트 / 헤드라인 기록을 둘 임시 디렉토리
+        engine: 임베딩 엔진 (None이면 소형 BERT로 생성)
+
+    Returns:
+        단계 이름별 측정 결과 (+ "total")
+    """
+    from core.async_crawler import AsyncCrawler
+    from core.bert.embedding_cache import EmbeddingCache
+    from core.bert.embedding_engine import EmbeddingEngine
+    from core.crowling import Crowling
+    from core.headline_dedup import HeadlineDeduplicator
+    from core.news_sources import NewsSource
+    from core.pipeline import RecommendationPipeline
+    from core.recommendation.bert_recommendation_gpu import GPUBertRecommendationSystem
+
+    corpus = SyntheticCorpus(seed=args.seed)
+    catalogue = corpus.books(books)
+    db = SQLiteDatabase()
+    db.load_books(catalogue)
+    if engine is None:
+        model_dir = build_tiny_model(args.model_dir, corpus.texts(2000), layers=args.layers)
+        engine = EmbeddingEngine(model_dir, device=args.device, cache=EmbeddingCache(None),
+                                 cpu_processes=1, projection_path=None)
+
+    site_dir = os.path.join(workdir, "site")
+    build_site(site_dir, corpus, args.pages, args.headlines)
+    server = start_server(site_dir)
+    host, port = server.server_address
+    source = NewsSource("bench", {
+        section: [f"http://{host}:{port}/{section}/{page}.html" for page in range(1, args.pages + 1)]
+        for section in SECTIONS
+    })
+
+    recommender = GPUBertRecommendationSystem(engine=engine, db=db, book_limit=0)
+    pipeline = RecommendationPipeline(
+        checkpoint_dir=os.path.join(workdir, "checkpoints"),
+        run_id=f"bench-{books}",
+        recommender=recommender,
+        crawler=Crowling(crawler=AsyncCrawler(timeout=10), use_cache=False, sources=[source]),
+        deduplicator=HeadlineDeduplicator(store_path=os.path.join(workdir, "headlines.pkl")),
+        knn_graph_path=os.path.join(workdir, "knn_graph.npz"),
+    )
+
+    results: Dict[str, Dict[str, Any]] = {}
+    instrument(pipeline, {
+        "crawl": lambda output: sum(map(len, output["titles"].values())),
+        "keywords": lambda output: sum(map(len, output["keywords"].values())),
+        "embed_books": lambda output: len(output["books"]["isbn"]),
+        "score": lambda output: sum(map(len, output.values())),
+        "publish": lambda output: db.count("tb_recommend", "method = ?", (output["method"],)),
+        "similar_books": lambda output: output["books"],
+    }, results)
+    try:
+        start = time.perf_counter()
+        pipeline.run(resume=False)
+        results["total"] = {"seconds": round(time.perf_counter() - start, 4)}
+    finally:
+        pipeline.close()
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m app.bench", description="추천 파이프라인 벤치마크")
+    commands = parser.add_subparsers(dest="command", required=True)
+    pipeline = commands.add_parser("pipeline", help="단계별 전체 파이프라인 측정")
+    pipeline.add_argument("--scales", default="1000,10000,100000", help="도서 수 목록 (쉼표 구분)")
+    pipeline.add_argument("--pages", type=int, default=3, help="섹션별 페이지 수")
+    pipeline.add_argument("--headlines", type=int, default=40, help="합성 페이지당 헤드라인 수")
+    pipeline.add_argument("--device", default="cpu", help="cpu / cuda / auto")
+    pipeline.add_argument("--layers", type=int, default=2, help="소형 BERT 층 수")
+    pipeline.add_argument("--model-dir", default=DEFAULT_MODEL_DIR, help="소형 BERT 저장 경로")
+    pipeline.add_argument("--seed", type=int, default=0, help="코퍼스 시드")
+    pipeline.add_argument("--output", help="결과 JSON 저장 경로")
+    pipeline.add_argument("--baseline", help="기준 보고서 JSON (단계 시간이 늘면 실패)")
+    pipeline.add_argument("--max-regression", type=float, default=20.0,
+                          help="허용하는 단계 시간 증가율(%%)")
+    pipeline.add_argument("--min-seconds", type=float, default=0.05,
+                          help="기준 시간이 이보다 짧은 단계는 회귀 판정에서 제외 (측정 잡음)")
+    return parser.parse_args(argv)
+
+
+def print_stage_table(results: Dict[str, Dict[str, Any]]):
+    header = f"{'scale.stage':<24}{'wall s':>10}{'cpu s':>10}{'peak MB':>10}{'Δ MB':>8}{'rows':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        print(f"{name:<24}{result['seconds']:>10}{result.get('cpu_seconds', '-'):>10}"
+              f"{result.get('peak_rss_mb', '-'):>10}{result.get('rss_delta_mb', '-'):>8}"
+              f"{result.get('rows', '-'):>9}")
+
+
+def find_regressions(baseline: Dict[str, Any], report: Dict[str, Any], max_regression: float,
+                     min_seconds: float) -> List[Dict[str, Any]]:
+    """기준 대비 max_regression% 넘게 느려진 단계"""
+    return [row for row in compare_reports(baseline, report)
+            if row["baseline"] >= min_seconds and row["change_pct"] > max_regression]
+
+
+def run_pipeline_benchmark(args) -> int:
+    scales = [int(scale) for scale in args.scales.split(",") if scale]
+    results: Dict[str, Dict[str, Any]] = {}
+    cwd = os.getcwd()
+    try:
+        import torch  # noqa: F401
+        import transformers  # noqa: F401
+    except ImportError as e:
+        print(f"❌ 소형 BERT 실행에는 torch / transformers가 필요합니다: {e}")
+        return 1
+    for books in scales:
+        print(f"🚀 파이프라인 벤치마크: 도서 {books:,}권")
+        with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as workdir:
+            # 키워드 말뭉치 / 캐시 등 상대 경로 파일이 실제 cache/를 건드리지 않도록 임시 폴더에서 실행
+            os.chdir(workdir)
+            try:
+                for stage, result in run_scale(books, args, workdir).items():
+                    results[f"{books}.{stage}"] = result
+            finally:
+                os.chdir(cwd)
+
+    print()
+    print_stage_table(results)
+    report = build_report(results, {
+        "scales": scales,
+        "pages": args.pages,
+        "headlines": args.headlines,
+        "device": args.device,
+        "layers": args.layers,
+        "seed": args.seed,
+    })
+    if args.output:
+        write_report(report, args.output)
+
+    if not args.baseline:
+        return 0
+    baseline = load_report(args.baseline)
+    print_comparison(compare_reports(baseline, report), baseline["meta"])
+    regressions = find_regressions(baseline, report, args.max_regression, args.min_seconds)
+    if regressions:
+        print(f"\n❌ {len(regressions)}개 단계가 {args.max_regression}% 넘게 느려졌습니다:")
+        for row in regressions:
+            print(f"   - {row['name']}: {row['baseline']}초 → {row['current']}초 (+{row['change_pct']}%)")
+        return 1
+    print(f"\n✅ 모든 단계가 기준 대비 {args.max_regression}% 이내입니다.")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    # 단계 로그 대신 측정 표만 출력
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+    if args.command == "pipeline":
+        return run_pipeline_benchmark(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
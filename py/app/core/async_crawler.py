@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+비동기 HTTP 크롤러
+- 공유 연결 풀 (keep-alive 재사용)
+- 호스트별 동시 요청 수 / 요청 간격 제한
+- 타임아웃 / 지수 백오프 재시도
+- 전체 URL 단일 gather
+"""
+
+import asyncio
+import random
+import threading
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; book-recommender-crawler/2.0)",
+    "Accept": "text/html,application/xhtml+xml",
+}
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class PageResult(NamedTuple):
+    """페이지 조회 결과"""
+    url: str
+    status_code: int
+    text: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        """조건부 요청 결과 변경 없음(304) 여부"""
+        return self.status_code == 304
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 및 요청 시작 간격 제한"""
+
+    def __init__(self, concurrency: int, min_interval: float = 0.0):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        if self.min_interval > 0:
+            async with self._lock:
+                loop = asyncio.get_running_loop()
+                wait = self._next_start - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._next_start = loop.time() + self.min_interval
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+
+
+class AsyncCrawler:
+    """httpx 기반 비동기 페이지 수집기"""
+
+    def __init__(self, timeout: float = 10.0, max_per_host: int = 4,
+                 max_connections: int = 20, retries: int = 3,
+                 backoff: float = 0.5, headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            timeout: 요청당 타임아웃(초)
+            max_per_host: 호스트별 동시 요청 수
+            max_connections: 전체 연결 풀 크기
+            retries: 실패 시 재시도 횟수
+            backoff: 재시도 대기 기본값(초) - 시도마다 2배씩 증가
+            headers: 요청 헤더
+        """
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        self.max_connections = max_connections
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = headers or DEFAULT_HEADERS
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """연결 풀을 공유하는 클라이언트 생성"""
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            headers=self.headers,
+            follow_redirects=True,
+        )
+
+    async def fetch(self, client: httpx.AsyncClient, url: str,
+                    limiter: HostLimiter,
+                    headers: Optional[Dict[str, str]] = None) -> Optional[PageResult]:
+        """
+        단일 URL 조회 (재시도 포함)
+
+        Args:
+            headers: 요청별 추가 헤더 (If-None-Match 등 조건부 요청용)
+
+        Returns:
+            조회 결과 (최종 실패 시 None)
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                async with limiter:
+                    response = await client.get(url, headers=headers)
+                if response.status_code == 304:
+                    return PageResult(url, 304, None,
+                                      response.headers.get("ETag"),
+                                      response.headers.get("Last-Modified"))
+                if response.status_code in RETRY_STATUS_CODES and attempt < self.retries:
+                    raise httpx.HTTPStatusError(
+                        f"재시도 대상 상태 코드: {response.status_code}",
+                        request=response.request, response=response
+                    )
+                response.raise_for_status()
+                return PageResult(url, response.status_code, response.text,
+                                  response.headers.get("ETag"),
+                                  response.headers.get("Last-Modified"))
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                retriable = (
+                    isinstance(e, httpx.TransportError)
+                    or e.response.status_code in RETRY_STATUS_CODES
+                )
+                if not retriable or attempt >= self.retries:
+                    print(f"❌ {url} 에서 데이터를 가져오는 중 오류 발생: {e}")
+                    return None
+                # 지수 백오프 + 지터
+                delay = self.backoff * (2 ** attempt) * (1 + random.random() * 0.1)
+                logger.debug(f"🔁 재시도 {attempt + 1}/{self.retries}: {url} ({delay:.2f}초 후)")
+                await asyncio.sleep(delay)
+        return None
+
+    async def fetch_pages(self, urls: Iterable[str],
+                          request_headers: Optional[Dict[str, Dict[str, str]]] = None,
+                          host_limits: Optional[Dict[str, Tuple[int, float]]] = None
+                          ) -> Dict[str, Optional[PageResult]]:
+        """
+        여러 URL을 하나의 gather로 동시 조회
+
+        Args:
+            urls: 조회할 URL 목록
+            request_headers: URL별 추가 요청 헤더
+            host_limits: 호스트별 (동시 요청 수, 최소 요청 간격 초) - 없으면 max_per_host 사용
+
+        Returns:
+            URL별 조회 결과 딕셔너리
+        """
+        urls = list(dict.fromkeys(urls))
+        request_headers = request_headers or {}
+        host_limits = host_limits or {}
+        limiters: Dict[str, HostLimiter] = {}
+        for url in urls:
+            host = urlsplit(url).netloc
+            if host not in limiters:
+                concurrency, min_interval = host_limits.get(host, (self.max_per_host, 0.0))
+                limiters[host] = HostLimiter(concurrency, min_interval)
+
+        async with self._create_client() as client:
+            results: List[Optional[PageResult]] = await asyncio.gather(*[
+                self.fetch(client, url, limiters[urlsplit(url).netloc],
+                           request_headers.get(url))
+                for url in urls
+            ])
+        return dict(zip(urls, results))
+
+    async def fetch_all(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        여러 URL을 동시 조회하여 본문만 반환
+
+        Returns:
+            URL별 응답 본문 딕셔너리
+        """
+        results = await self.fetch_pages(urls)
+        return {url: result.text if result else None for url, result in results.items()}
+
+    def fetch_pages_sync(self, urls: Iterable[str],
+                         request_headers: Optional[Dict[str, Dict[str, str]]] = None,
+                         host_limits: Optional[Dict[str, Tuple[int, float]]] = None
+                         ) -> Dict[str, Optional[PageResult]]:
+        """fetch_pages의 동기 래퍼"""
+        return self._run_sync(self.fetch_pages(list(urls), request_headers, host_limits))
+
+    def fetch_all_sync(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """fetch_all의 동기 래퍼"""
+        return self._run_sync(self.fetch_all(list(urls)))
+
+    @staticmethod
+    def _run_sync(coroutine):
+        """
+        동기 코드에서 코루틴 실행
+
+        이미 이벤트 루프가 실행 중인 스레드(FastAPI 등)에서 호출되면
+        별도 스레드에서 새 루프로 실행합니다.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        result = {}
+
+        def runner():
+            try:
+                result["value"] = asyncio.run(coroutine)
+            except BaseException as e:
+                # 스레드 안의 예외는 호출한 쪽에서 다시 발생
+                result["error"] = e
+
+        thread = threading.Thread(target=runner, name="async-crawler")
+        thread.start()
+        thread.join()
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
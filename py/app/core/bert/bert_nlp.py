@@ -1,19 +1,16 @@
 import os
 import torch
 import numpy as np
-from transformers import AutoTokenizer, AutoModel
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import KMeans, DBSCAN
 from sklearn.manifold import TSNE
 import matplotlib.pyplot as plt
-import pandas as pd
 from collections import defaultdict
-import platform
-import re
 from typing import List, Dict, Tuple, Optional
 import logging
 
+from .model_registry import get_model_registry, DEFAULT_SENTENCE_MODEL
+from .embedding_engine import EmbeddingEngine, get_embedding_engine
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,43 +21,40 @@ class BertNLP:
     - 문맥 기반 임베딩
     - 단어 유사도 매칭
     - 고급 유사도 계산
+    
+    임베딩 / 유사도 계산은 디바이스 공통 EmbeddingEngine에 위임합니다.
     """
     
-    def __init__(self, model_name: str = "skt/kobert-base-v1"):
+    def __init__(self, model_name: str = "skt/kobert-base-v1", engine: Optional[EmbeddingEngine] = None):
         """
         BERT NLP 서비스 초기화
         
         Args:
             model_name: 사용할 BERT 모델명
+            engine: 사용할 임베딩 엔진 (None이면 모델별 전역 엔진)
         """
         self.model_name = model_name
-        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-        self.tokenizer = None
-        self.model = None
-        self.sentence_transformer = None
+        self.engine = engine or get_embedding_engine(model_name)
+        self.device = torch.device(self.engine.device)
+        # 모델은 전역 레지스트리에서 최초 사용 시점에 한 번만 로드됨
+        self.registry = get_model_registry()
         
         logger.info(f"BERT NLP 서비스 초기화 (Device: {self.device})")
-        self._load_models()
     
-    def _load_models(self):
-        """BERT 모델들 로드"""
-        try:
-            # KoBERT 토크나이저와 모델 로드
-            logger.info(f"KoBERT 모델 로드 중: {self.model_name}")
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModel.from_pretrained(self.model_name)
-            self.model.to(self.device)
-            self.model.eval()
-            
-            # Sentence Transformer 로드 (문장 임베딩용)
-            logger.info("Sentence Transformer 모델 로드 중...")
-            self.sentence_transformer = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
-            
-            logger.info("✅ 모든 BERT 모델 로드 완료")
-            
-        except Exception as e:
-            logger.error(f"❌ BERT 모델 로드 실패: {e}")
-            raise
+    @property
+    def tokenizer(self):
+        """KoBERT 토크나이저 (레지스트리 공유)"""
+        return self.engine.tokenizer
+    
+    @property
+    def model(self):
+        """KoBERT 모델 (레지스트리 공유)"""
+        return self.engine.model
+    
+    @property
+    def sentence_transformer(self):
+        """Sentence Transformer (레지스트리 공유)"""
+        return self.registry.get_sentence_transformer(DEFAULT_SENTENCE_MODEL, self.device.type)
     
     def get_bert_embedding(self, text: str) -> np.ndarray:
         """
@@ -73,35 +67,14 @@ class BertNLP:
             문맥 기반 임베딩 벡터
         """
         if not text or not isinstance(text, str):
-            return np.zeros(768)  # KoBERT 기본 차원
+            return np.zeros(self.engine.output_dim)  # 엔진 출력 차원 (투영 시 축소 차원)
         
         try:
-            # 텍스트 전처리
-            text = self._preprocess_text(text)
-            
-            # 토크나이징
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512,
-                padding=True
-            )
-            
-            # GPU로 이동
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-            
-            # BERT 임베딩 생성
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                # [CLS] 토큰의 임베딩 사용 (문장 전체 표현)
-                embedding = outputs.last_hidden_state[:, 0, :].cpu().numpy()
-            
-            return embedding[0]
+            return self.engine.embed_one(text)
             
         except Exception as e:
             logger.error(f"BERT 임베딩 생성 실패: {e}")
-            return np.zeros(768)
+            return np.zeros(self.engine.output_dim)
     
     def get_sentence_embedding(self, text: str) -> np.ndarray:
         """
@@ -135,10 +108,7 @@ class BertNLP:
         Returns:
             전처리된 텍스트
         """
-        # 특수문자 제거 및 공백 정리
-        text = re.sub(r'[^\w\s가-힣]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+        return self.engine.preprocess(text)
     
     def calculate_contextual_similarity(self, text1: str, text2: str) -> float:
         """
@@ -152,14 +122,9 @@ class BertNLP:
             유사도 점수 (0~1)
         """
         try:
-            # BERT 임베딩 생성
-            embedding1 = self.get_bert_embedding(text1)
-            embedding2 = self.get_bert_embedding(text2)
-            
-            # 코사인 유사도 계산
-            similarity = cosine_similarity([embedding1], [embedding2])[0][0]
-            
-            return float(similarity)
+            # 두 텍스트를 한 번의 배치로 임베딩
+            embeddings = self.engine.embed([text1, text2])
+            return float(self.engine.similarities(embeddings[0], embeddings[1:])[0])
             
         except Exception as e:
             logger.error(f"문맥 유사도 계산 실패: {e}")
@@ -178,17 +143,13 @@ class BertNLP:
             (인덱스, 유사도 점수) 튜플 리스트
         """
         try:
-            similarities = []
-            
-            for i, candidate in enumerate(candidate_texts):
-                if candidate:
-                    similarity = self.calculate_contextual_similarity(query_text, candidate)
-                    similarities.append((i, similarity))
-            
-            # 유사도 순으로 정렬
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            
-            return similarities[:top_k]
+            # 빈 후보는 제외하고 한 번에 임베딩 / 검색
+            valid_indices = [i for i, candidate in enumerate(candidate_texts) if candidate]
+            candidates = self.engine.embed([candidate_texts[i] for i in valid_indices])
+            return [
+                (valid_indices[i], score)
+                for i, score in self.engine.topk(query_text, candidates, k=top_k)
+            ]
             
         except Exception as e:
             logger.error(f"유사 텍스트 검색 실패: {e}")
@@ -205,22 +166,43 @@ class BertNLP:
         Returns:
             키워드 리스트
         """
+        return self.extract_keywords_batch([text], top_k=top_k)[0]
+    
+    def extract_keywords_batch(self, texts: List[str], top_k: int = 10) -> List[List[str]]:
+        """
+        여러 텍스트의 키워드를 한 번에 추출
+        
+        도서 카탈로그로 학습된 TF-IDF 어휘 / IDF가 있으면 명사 TF-IDF 상위 단어를,
+        없으면 워드피스 토큰 빈도를 사용합니다.
+        
+        Args:
+            texts: 키워드를 추출할 텍스트 리스트
+            top_k: 텍스트별 키워드 개수
+            
+        Returns:
+            텍스트별 키워드 리스트
+        """
         try:
-            # 토크나이징
-            tokens = self.tokenizer.tokenize(text)
+            from ..book_keywords import get_book_keyword_extractor
             
-            # 특수 토큰 제거
-            keywords = [token for token in tokens if not token.startswith('[') and not token.startswith('#')]
+            extractor = get_book_keyword_extractor()
+            if extractor.is_fitted:
+                return extractor.extract(texts, top_k=top_k)
             
-            # 빈도수 기반 상위 키워드 선택
             from collections import Counter
-            keyword_freq = Counter(keywords)
-            
-            return [keyword for keyword, freq in keyword_freq.most_common(top_k)]
+            results = []
+            for text in texts:
+                # 특수 토큰 / 서브워드 조각 제거 후 빈도수 기반 상위 키워드 선택
+                tokens = self.tokenizer.tokenize(text)
+                keywords = [token.lstrip('▁') for token in tokens
+                            if not token.startswith('[') and not token.startswith('#')]
+                keyword_freq = Counter(keyword for keyword in keywords if len(keyword) > 1)
+                results.append([keyword for keyword, freq in keyword_freq.most_common(top_k)])
+            return results
             
         except Exception as e:
             logger.error(f"키워드 추출 실패: {e}")
-            return []
+            return [[] for _ in texts]
     
     def calculate_word_similarity(self, word1: str, word2: str) -> float:
         """
@@ -235,13 +217,8 @@ class BertNLP:
         """
         try:
             # 단어를 문장으로 변환하여 임베딩
-            embedding1 = self.get_bert_embedding(word1)
-            embedding2 = self.get_bert_embedding(word2)
-            
-            # 코사인 유사도 계산
-            similarity = cosine_similarity([embedding1], [embedding2])[0][0]
-            
-            return float(similarity)
+            embeddings = self.engine.embed([word1, word2])
+            return float(self.engine.similarities(embeddings[0], embeddings[1:])[0])
             
         except Exception as e:
             logger.error(f"단어 유사도 계산 실패: {e}")
@@ -259,20 +236,12 @@ class BertNLP:
             클러스터별 텍스트 인덱스 딕셔너리
         """
         try:
-            # 텍스트 임베딩 생성
-            embeddings = []
-            valid_indices = []
-            
-            for i, text in enumerate(texts):
-                if text:
-                    embedding = self.get_bert_embedding(text)
-                    embeddings.append(embedding)
-                    valid_indices.append(i)
-            
-            if not embeddings:
+            # 텍스트 임베딩 일괄 생성
+            valid_indices = [i for i, text in enumerate(texts) if text]
+            if not valid_indices:
                 return {}
             
-            embeddings = np.array(embeddings)
+            embeddings = self.engine.embed([texts[i] for i in valid_indices])
             
             # K-means 클러스터링
             kmeans = KMeans(n_clusters=min(n_clusters, len(embeddings)), random_state=42)
@@ -300,21 +269,13 @@ class BertNLP:
             title: 그래프 제목
         """
         try:
-            # 임베딩 생성
-            embeddings = []
-            valid_texts = []
-            
-            for text in texts:
-                if text:
-                    embedding = self.get_bert_embedding(text)
-                    embeddings.append(embedding)
-                    valid_texts.append(text)
-            
-            if not embeddings:
+            # 임베딩 일괄 생성
+            valid_texts = [text for text in texts if text]
+            if not valid_texts:
                 logger.warning("시각화할 텍스트가 없습니다.")
                 return
             
-            embeddings = np.array(embeddings)
+            embeddings = self.engine.embed(valid_texts)
             
             # t-SNE로 차원 축소
             tsne = TSNE(n_components=2, random_state=42, perplexity=min(30, len(embeddings)-1))
@@ -364,7 +325,7 @@ class BertNLP:
             return {
                 'length': 0,
                 'word_count': 0,
-                'embedding': np.zeros(768),
+                'embedding': np.zeros(self.engine.output_dim),
                 'keywords': []
             }
     
@@ -380,23 +341,12 @@ class BertNLP:
             임베딩 리스트
         """
         try:
-            embeddings = []
-            
-            for i in range(0, len(texts), batch_size):
-                batch_texts = texts[i:i+batch_size]
-                batch_embeddings = []
-                
-                for text in batch_texts:
-                    if text:
-                        embedding = self.get_bert_embedding(text)
-                        batch_embeddings.append(embedding)
-                    else:
-                        batch_embeddings.append(np.zeros(768))
-                
-                embeddings.extend(batch_embeddings)
-            
-            return embeddings
+            return list(self.engine.embed(texts, batch_size=batch_size))
             
         except Exception as e:
             logger.error(f"배치 처리 실패: {e}")
-            return [np.zeros(768)] * len(texts) 
\ No newline at end of file
+            return [np.zeros(self.engine.output_dim)] * len(texts)
+    
+    def save_cache(self):
+        """임베딩 캐시 저장 (새 항목만 추가 기록)"""
+        self.engine.save_cache()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CPU 임베딩 프로세스 풀
+- 워커 프로세스마다 PyTorch intra-op 스레드 수를 고정 (프로세스 × 스레드 ≤ CPU 수)
+- 입력 텍스트(UTF-8 + 오프셋)와 결과 행렬을 공유 메모리로 주고받음 (벡터 pickle 없음)
+- 현재 머신에서 가장 빠른 프로세스 × 스레드 조합을 측정해 저장 (EMBEDDING_CPU_PROCESSES=auto)
+"""
+
+import os
+import json
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_TUNING_PATH = os.getenv("CPU_POOL_TUNING_PATH", os.path.join("cache", "cpu_pool_tuning.json"))
+
+# 워커 프로세스별 인코더 (initializer에서 1회 생성)
+_ENCODER = None
+
+
+def set_cpu_threads(threads: int, interop_threads: int = 1):
+    """
+    현재 프로세스의 PyTorch 스레드 수 설정
+
+    Args:
+        threads: intra-op 스레드 수 (행렬 연산 병렬화)
+        interop_threads: inter-op 스레드 수 (연산 간 병렬화 - 배치 단위 추론에는 1이면 충분)
+    """
+    # torch import 전에 설정해야 OpenMP / MKL 풀 크기에 반영됨
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[name] = str(threads)
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(interop_threads)
+    except RuntimeError:  # 병렬 작업이 이미 실행된 프로세스에서는 변경 불가
+        pass
+
+
+def load_tuning(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """저장된 튜닝 결과 (없거나 다른 머신에서 측정한 결과면 None)"""
+    path = path or DEFAULT_TUNING_PATH
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tuning = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"CPU 풀 튜닝 결과 로드 실패: {e}")
+        return None
+    if tuning.get("cpu_count") != os.cpu_count():
+        logger.warning("⚠️ CPU 수가 다른 머신의 튜닝 결과라 무시합니다.")
+        return None
+    return tuning
+
+
+def resolve_cpu_split(processes: Optional[int] = None,
+                      threads: Optional[int] = None) -> Tuple[int, int]:
+    """
+    CPU 임베딩 프로세스 수 / 프로세스당 스레드 수 결정
+
+    Args:
+        processes: 프로세스 수 (기본값: EMBEDDING_CPU_PROCESSES 환경변수 - auto이면 튜닝 결과, 기본 1)
+        threads: 프로세스당 스레드 수 (기본값: EMBEDDING_CPU_THREADS 환경변수, 0이면 CPU 수 / 프로세스 수)
+
+    Returns:
+        (프로세스 수, 스레드 수) - 프로세스 1개에 스레드 0이면 PyTorch 기본값 유지
+    """
+    cpu_count = os.cpu_count() or 1
+    if processes is None:
+        setting = os.getenv("EMBEDDING_CPU_PROCESSES", "1").lower()
+        if setting == "auto":
+            tuning = load_tuning()
+            if tuning:
+                return tuning["processes"], tuning["threads"]
+            processes = 1
+        else:
+            processes = int(setting)
+    processes = max(1, processes)
+    if threads is None:
+        threads = int(os.getenv("EMBEDDING_CPU_THREADS", "0"))
+    if not threads and processes > 1:
+        threads = max(1, cpu_count // processes)
+    return processes, threads
+
+
+def _create_engine_encoder(model_name: str, max_length: int, precision: str, pooling: str = "cls"):
+    """워커용 CPU 임베딩 엔진 (캐시 / 차원 축소는 부모 프로세스가 관리)"""
+    from .embedding_cache import EmbeddingCache
+    from .embedding_engine import EmbeddingEngine
+
+    return EmbeddingEngine(model_name, device="cpu", precision=precision, max_length=max_length,
+                           cache=EmbeddingCache(None), cpu_processes=1, cpu_threads=0,
+                           pooling=pooling, projection_path=None)
+
+
+def _init_worker(threads: int, factory: Callable[..., Any], factory_args: tuple):
+    """워커 초기화 (스레드 수 고정 후 인코더 1회 생성)"""
+    global _ENCODER
+    set_cpu_threads(threads)
+    _ENCODER = factory(*factory_args)
+
+
+def _encode_rows(input_name: str, output_name: str, total: int, dim: int,
+                 start: int, end: int) -> int:
+    """공유 메모리의 [start, end) 텍스트를 임베딩해 결과 행렬의 같은 행에 기록 (워커에서 실행)"""
+    source = shared_memory.SharedMemory(name=input_name)
+    target = shared_memory.SharedMemory(name=output_name)
+    try:
+        header = (total + 1) * 8
+        offsets = np.ndarray((total + 1,), dtype=np.int64, buffer=source.buf)[start:end + 1].tolist()
+        texts = [
+            bytes(source.buf[header + offsets[i]:header + offsets[i + 1]]).decode("utf-8")
+            for i in range(end - start)
+        ]
+        result = np.ndarray((total, dim), dtype=np.float32, buffer=target.buf)
+        result[start:end] = _ENCODER._encode(texts)
+        del result
+    finally:
+        source.close()
+        target.close()
+    return end - start
+
+
+class CPUEmbeddingPool:
+    """공유 메모리 입출력 CPU 임베딩 프로세스 풀"""
+
+    def __init__(self, processes: int, threads: int, factory: Callable[..., Any] = _create_engine_encoder,
+                 factory_args: tuple = (), dim: int = 768):
+        """
+        Args:
+            processes: 워커 프로세스 수
+            threads: 워커당 PyTorch intra-op 스레드 수
+            factory: 워커에서 인코더(_encode(texts) -> ndarray 제공)를 만드는 함수 (모듈 최상위 함수)
+            factory_args: factory 인자
+            dim: 임베딩 차원
+        """
+        self.processes = processes
+        self.threads = threads
+        self.dim = dim
+        # fork 이후 OpenMP 스레드 풀을 쓸 수 없으므로 spawn으로 워커 생성
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(threads, factory, factory_args),
+        )
+        logger.info(f"🧵 CPU 임베딩 풀 시작: 프로세스 {processes}개 × 스레드 {threads}개")
+
+    def encode(self, texts: Sequence[str], batch_size: int = 32) -> np.ndarray:
+        """
+        텍스트 임베딩 (배치 단위 작업을 워커에 분배)
+
+        Args:
+            texts: 전처리된 텍스트 리스트
+            batch_size: 워커 작업 1건의 텍스트 수
+
+        Returns:
+            (텍스트 수, dim) float32 행렬 (입력 순서 유지)
+        """
+        total = len(texts)
+        if total == 0:
+            return np.zeros((0, self.dim), dtype=np.float32)
+
+        encoded = [text.encode("utf-8") for text in texts]
+        offsets = np.zeros(total + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(data) for data in encoded])
+        header = (total + 1) * 8
+
+        # 입력: 오프셋(int64) + UTF-8 본문, 출력: float32 결과 행렬
+        source = shared_memory.SharedMemory(create=True, size=header + max(int(offsets[-1]), 1))
+        target = shared_memory.SharedMemory(create=True, size=total * self.dim * 4)
+        try:
+            np.ndarray((total + 1,), dtype=np.int64, buffer=source.buf)[:] = offsets
+            source.buf[header:header + int(offsets[-1])] = b"".join(encoded)
+
+            # 배치 단위로 나누어 제출하면 먼저 끝난 워커가 다음 배치를 가져가 부하가 고르게 분산됨
+            futures = [
+                self._executor.submit(_encode_rows, source.name, target.name, total, self.dim,
+                                      start, min(start + batch_size, total))
+                for start in range(0, total, batch_size)
+            ]
+            for future in futures:
+                future.result()
+            return np.ndarray((total, self.dim), dtype=np.float32, buffer=target.buf).copy()
+        finally:
+            source.close()
+            source.unlink()
+            target.close()
+            target.unlink()
+
+    def close(self):
+        """워커 프로세스 종료"""
+        self._executor.shutdown()
+
+
+# -------------------------------------------------------------------
+# 프로세스 × 스레드 조합 측정
+# -------------------------------------------------------------------
+def candidate_splits(cpu_count: Optional[int] = None) -> List[Tuple[int, int]]:
+    """측정할 (프로세스 수, 스레드 수) 조합 - 프로세스 수를 2배씩 늘리며 CPU 수를 나눠 가짐"""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    splits = []
+    processes = 1
+    while processes <= cpu_count:
+        splits.append((processes, cpu_count // processes))
+        processes *= 2
+    return splits
+
+
+def autotune(texts: List[str], splits: Optional[List[Tuple[int, int]]] = None, batch_size: int = 32,
+             factory: Callable[..., Any] = _create_engine_encoder, factory_args: tuple = (),
+             dim: int = 768, path: Optional[str] = DEFAULT_TUNING_PATH) -> Dict[str, Any]:
+    """
+    조합별 처리량(텍스트/초)을 측정하고 가장 빠른 조합을 저장
+
+    Args:
+        texts: 측정용 텍스트 (실제 도서 설명과 비슷한 길이 권장)
+        splits: 측정할 (프로세스 수, 스레드 수) 목록 (기본값: candidate_splits())
+        batch_size: 배치 크기
+        factory / factory_args / dim: CPUEmbeddingPool과 같음
+        path: 결과 저장 경로 (None이면 저장하지 않음)
+
+    Returns:
+        {"processes", "threads", "results": [{"processes", "threads", "texts_per_sec", "seconds"}], ...}
+    """
+    results = []
+    for processes, threads in splits or candidate_splits():
+        pool = CPUEmbeddingPool(processes, threads, factory, factory_args, dim)
+        try:
+            # 워커별 모델 로드 / 첫 실행 비용은 측정에서 제외
+            pool.encode(texts[:batch_size * processes], batch_size)
+            start_time = time.perf_counter()
+            pool.encode(texts, batch_size)
+            seconds = time.perf_counter() - start_time
+        finally:
+            pool.close()
+        results.append({
+            "processes": processes,
+            "threads": threads,
+            "seconds": round(seconds, 3),
+            "texts_per_sec": round(len(texts) / seconds, 1) if seconds > 0 else float("inf"),
+        })
+        logger.info(f"⏱️ 프로세스 {processes}개 × 스레드 {threads}개: {results[-1]['texts_per_sec']} 텍스트/초")
+
+    best = max(results, key=lambda result: result["texts_per_sec"])
+    tuning = {
+        "processes": best["processes"],
+        "threads": best["threads"],
+        "cpu_count": os.cpu_count(),
+        "batch_size": batch_size,
+        "samples": len(texts),
+        "results": results,
+        "tuned_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    if path:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(tuning, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    logger.info(f"✅ 최적 조합: 프로세스 {best['processes']}개 × 스레드 {best['threads']}개")
+    return tuning
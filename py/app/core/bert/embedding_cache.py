@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+임베딩 캐시
+- (모델, 백엔드, 정규화 텍스트) 해시 키
+- 메모리 예산 기반 LRU 제거
+- 추가 전용(append-only) 디스크 저장: 저장 시 새 항목만 파일 끝에 기록 (저장 대기 항목이 예산의 1/4을 넘으면 바로 기록)
+- 선택적으로 워커 간 공유 저장소(shared_store)를 2차 캐시로 사용
+"""
+
+import os
+import struct
+import hashlib
+import threading
+import unicodedata
+import weakref
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..metrics import CACHE_ENTRIES, CACHE_EVENTS, get_metrics
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_MB = int(os.getenv("EMBEDDING_CACHE_MB", "256"))
+
+# 레코드 형식: 키(SHA1 20바이트) + 차원 수(uint32) + float32 벡터
+_HEADER = struct.Struct("<20sI")
+_FILE_MAGIC = b"EMBCACHE1\n"
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 공백 정리)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_cache_key(model_name: str, backend: str, text: str) -> bytes:
+    """
+    임베딩 캐시 키
+
+    Args:
+        model_name: 모델 이름
+        backend: 임베딩 방식 (풀링 / 정밀도 등 결과에 영향을 주는 설정)
+        text: 모델에 입력되는 텍스트
+
+    Returns:
+        20바이트 키
+    """
+    payload = "\x00".join((model_name, backend, normalize_text(text)))
+    return hashlib.sha1(payload.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """메모리 예산을 가진 LRU 임베딩 캐시"""
+
+    def __init__(self, path: Optional[str] = None, max_mb: float = DEFAULT_CACHE_MB,
+                 compact_ratio: float = 2.0, shared=None):
+        """
+        Args:
+            path: 저장 파일 경로 (None이면 메모리 전용)
+            max_mb: 메모리 예산(MB) - 초과 시 가장 오래 사용하지 않은 항목부터 제거
+            compact_ratio: 파일 레코드 수가 현재 항목 수의 이 배수를 넘으면 저장 시 파일 재작성
+            shared: 워커 간 공유 저장소 (SharedEmbeddingStore) - LRU에 없으면 조회, 새 항목 추가
+        """
+        self.path = path
+        self.shared = shared
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.compact_ratio = compact_ratio
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        # 아직 파일에 기록하지 않은 항목 (LRU에서 제거돼도 기록 전까지 유지되므로 크기를 따로 제한)
+        self._pending: Dict[bytes, np.ndarray] = {}
+        self._pending_bytes = 0
+        self.max_pending_bytes = max(self.max_bytes // 4, 1)
+        self._bytes = 0
+        self._file_records = 0
+        self._needs_rewrite = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _caches.add(self)
+        if path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._entries
+
+    @property
+    def memory_bytes(self) -> int:
+        """캐시된 벡터 메모리 사용량"""
+        return self._bytes
+
+    # ---------------------------------------------------------------
+    # 조회 / 추가
+    # ---------------------------------------------------------------
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """캐시 조회 (조회된 항목은 최근 사용으로 이동)"""
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return vector
+        # 공유 저장소의 벡터는 mmap 뷰 그대로 사용 (워커별 복사본을 만들지 않음)
+        vector = self.shared.get(key) if self.shared is not None else None
+        with self._lock:
+            if vector is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return vector
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[np.ndarray]]:
+        """여러 키 조회"""
+        return [self.get(key) for key in keys]
+
+    def put(self, key: bytes, vector: np.ndarray, persist: bool = True):
+        """
+        캐시 추가
+
+        Args:
+            key: make_cache_key()로 만든 키
+            vector: 임베딩 벡터
+            persist: 다음 save()에서 파일에 기록할지 여부
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = vector
+            self._bytes += vector.nbytes
+            # 메모리 전용 캐시는 기록할 파일이 없으므로 대기 항목을 쌓지 않음
+            if persist and self.path:
+                previous = self._pending.pop(key, None)
+                if previous is not None:
+                    self._pending_bytes -= previous.nbytes
+                self._pending[key] = vector
+                self._pending_bytes += vector.nbytes
+                if self._pending_bytes > self.max_pending_bytes:
+                    self._write_pending()
+            self._evict()
+        # 공유 저장소는 차원이 고정이므로 다른 차원(투영 전 벡터 등)은 워커 로컬 LRU에만 보관
+        if persist and self.shared is not None and vector.shape == (self.shared.dim,):
+            self.shared.add(key, vector)
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, vector = self._entries.popitem(last=False)
+            self._bytes -= vector.nbytes
+            self.evictions += 1
+
+    # ---------------------------------------------------------------
+    # 디스크 저장
+    # ---------------------------------------------------------------
+    def load(self):
+        """저장 파일 재생 (뒤의 레코드가 앞의 레코드를 덮어씀, 잘린 마지막 레코드는 무시)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        records = 0
+        valid_size = len(_FILE_MAGIC)
+        try:
+            file_size = os.path.getsize(self.path)
+            with open(self.path, "rb") as f:
+                if f.read(len(_FILE_MAGIC)) != _FILE_MAGIC:
+                    logger.warning(f"⚠️ 임베딩 캐시 파일 형식이 달라 무시합니다: {self.path}")
+                    self._needs_rewrite = True
+                    return
+                while True:
+                    header = f.read(_HEADER.size)
+                    if len(header) < _HEADER.size:
+                        break
+                    key, dim = _HEADER.unpack(header)
+                    if f.tell() + dim * 4 > file_size:
+                        break
+                    data = f.read(dim * 4)
+                    if len(data) < dim * 4:
+                        break
+                    self.put(key, np.frombuffer(data, dtype=np.float32), persist=False)
+                    records += 1
+                    valid_size = f.tell()
+            if valid_size < file_size:
+                # 저장 중 중단되어 잘린 레코드 제거 (이후 추가 기록이 어긋나지 않도록)
+                with open(self.path, "r+b") as f:
+                    f.truncate(valid_size)
+                logger.warning(f"⚠️ 임베딩 캐시 파일의 잘린 레코드를 제거했습니다: {file_size - valid_size}바이트")
+        except OSError as e:
+            logger.error(f"임베딩 캐시 로드 실패: {e}")
+            return
+        self._file_records = records
+        logger.info(f"📂 임베딩 캐시 로드 완료: {len(self._entries)}개 ({self._bytes / 1024**2:.1f}MB)")
+
+    def save(self):
+        """새 항목만 파일 끝에 추가 (죽은 레코드가 많으면 현재 항목으로 재작성)"""
+        if self.shared is not None:
+            self.shared.flush()
+        if not self.path:
+            return
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self):
+        """대기 항목 파일 기록 (self._lock 보유 상태에서 호출)"""
+        if (self._needs_rewrite or self._file_records + len(self._pending)
+                > self.compact_ratio * max(len(self._entries), 1)):
+            self._rewrite()
+            return
+        if not self._pending:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        try:
+            is_new = not os.path.exists(self.path)
+            with open(self.path, "ab") as f:
+                if is_new:
+                    f.write(_FILE_MAGIC)
+                for key, vector in self._pending.items():
+                    f.write(_HEADER.pack(key, vector.shape[0]))
+                    f.write(vector.tobytes())
+            self._file_records += len(self._pending)
+            logger.info(f"💾 임베딩 캐시 저장: {len(self._pending)}개 추가")
+            self._pending = {}
+            self._pending_bytes = 0
+        except OSError as e:
+            logger.error(f"임베딩 캐시 저장 실패: {e}")
+            self._drop_pending()
+
+    def _drop_pending(self):
+        """기록 실패 시 대기 항목 비우기 (다음 저장에서 현재 항목으로 파일 재작성)"""
+        self._pending = {}
+        self._pending_bytes = 0
+        self._needs_rewrite = True
+
+    def _rewrite(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_FILE_MAGIC)
+                for key, vector in self._entries.items():
+                    f.write(_HEADER.pack(key, vector.shape[0]))
+                    f.write(vector.tobytes())
+            os.replace(tmp_path, self.path)
+            self._file_records = len(self._entries)
+            self._pending = {}
+            self._pending_bytes = 0
+            self._needs_rewrite = False
+            logger.info(f"💾 임베딩 캐시 파일 정리: {len(self._entries)}개")
+        except OSError as e:
+            logger.error(f"임베딩 캐시 저장 실패: {e}")
+            self._drop_pending()
+
+    def clear(self):
+        """캐시 및 저장 파일 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._pending = {}
+            self._pending_bytes = 0
+            self._bytes = 0
+            self._file_records = 0
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "memory_mb": round(self._bytes / 1024 ** 2, 2),
+            "max_memory_mb": round(self.max_bytes / 1024 ** 2, 2),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+            "shared": self.shared.stats() if self.shared is not None else None,
+        }
+
+
+# 살아 있는 캐시의 히트/미스/제거 수는 /metrics 요청 시점에 합산 (조회 경로에 메트릭 비용 없음)
+_caches: "weakref.WeakSet[EmbeddingCache]" = weakref.WeakSet()
+
+
+def _collect_cache_metrics():
+    caches = list(_caches)
+    for event, attribute in (("hit", "hits"), ("miss", "misses"), ("eviction", "evictions")):
+        CACHE_EVENTS.labels("embedding", event).set(sum(getattr(cache, attribute) for cache in caches))
+    CACHE_ENTRIES.labels("embedding").set(sum(len(cache) for cache in caches))
+
+
+get_metrics().add_collector(_collect_cache_metrics)
@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+디바이스 공통 임베딩 엔진
+- 실행 시점에 디바이스 / 정밀도 / 배치 크기 결정 (CUDA, CPU 모두 같은 코드 경로)
+- 전처리 → 캐시 조회 → 캐시에 없는 텍스트만 길이순 배치 임베딩
+- 정규화 행렬 곱 기반 유사도 / 상위 k개 검색
+- CPU에서는 스레드 수 고정 / 선택적 멀티 프로세스 풀(cpu_pool)로 임베딩
+- CLS / 평균 풀링 선택, 카탈로그로 학습한 PCA(화이트닝) 투영으로 차원 축소
+- 검색 인덱스를 fp16 / int8 / pq 코드로 압축하고 상위 후보만 float32로 재계산
+"""
+
+import os
+import re
+import time
+import threading
+import contextlib
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .model_registry import get_model_registry, DEFAULT_BERT_MODEL
+from .embedding_cache import EmbeddingCache, make_cache_key
+from .shared_store import get_shared_embedding_store
+from .cpu_pool import CPUEmbeddingPool, resolve_cpu_split, set_cpu_threads
+from .projection import DEFAULT_PROJECTION_PATH, EmbeddingProjection, normalize_rows, recall_at_k
+from .vector_store import QuantizedVectorStore
+from ..metrics import EMBEDDING_BATCH_SIZE, EMBEDDING_SECONDS, EMBEDDING_TEXTS, EMBEDDING_THROUGHPUT
+from ..tracing import span
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIM = 768
+DEFAULT_MAX_LENGTH = 256
+# CUDA에서 유사도 계산을 GPU로 넘기는 최소 행 수 (작은 행렬은 전송 비용이 더 큼)
+GPU_SIMILARITY_MIN_ROWS = 1000
+
+_PRECISIONS = ("fp32", "fp16", "bf16")
+_POOLINGS = ("cls", "mean")
+
+
+class EmbeddingIndex:
+    """유사도 검색용 정규화 임베딩 행렬 (CUDA 사용 시 디바이스 복사본을 한 번만 생성)"""
+
+    def __init__(self, embeddings, device: str = "cpu", dim: int = EMBEDDING_DIM):
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim == 1:  # 빈 리스트 또는 벡터 1개
+            vectors = vectors.reshape(-1, dim)
+        self.vectors = normalize_rows(vectors)
+        self.device = device
+        self._device_tensor = None
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def device_tensor(self):
+        """디바이스 텐서 (최초 호출 시 생성)"""
+        if self._device_tensor is None:
+            import torch
+            self._device_tensor = torch.from_numpy(self.vectors).to(self.device)
+        return self._device_tensor
+
+
+class EmbeddingEngine:
+    """KoBERT 문장 임베딩 엔진"""
+
+    def __init__(self, model_name: str = DEFAULT_BERT_MODEL, device: Optional[str] = None,
+                 precision: Optional[str] = None, batch_size: Optional[int] = None,
+                 max_length: Optional[int] = None, cache_dir: str = "cache",
+                 cache: Optional[EmbeddingCache] = None, cpu_processes: Optional[int] = None,
+                 cpu_threads: Optional[int] = None, pooling: Optional[str] = None,
+                 projection_path: Optional[str] = DEFAULT_PROJECTION_PATH):
+        """
+        Args:
+            model_name: HuggingFace 모델명
+            device: cuda / cpu (기본값: EMBEDDING_DEVICE 환경변수, auto이면 CUDA 사용 가능 여부로 결정)
+            precision: fp32 / fp16 / bf16 (기본값: EMBEDDING_PRECISION 환경변수, auto이면 CUDA fp16, CPU fp32)
+            batch_size: 배치 크기 (기본값: EMBEDDING_BATCH_SIZE 환경변수, 0이면 디바이스별 자동)
+            max_length: 최대 토큰 수 (기본값: EMBEDDING_MAX_LENGTH 환경변수, 256)
+            cache_dir: 임베딩 캐시 파일 디렉토리
+            cache: 사용할 임베딩 캐시 (None이면 생성)
+            cpu_processes: CPU 임베딩 프로세스 수 (기본값: EMBEDDING_CPU_PROCESSES 환경변수, 1이면 현재 프로세스)
+            cpu_threads: 프로세스당 PyTorch 스레드 수 (기본값: EMBEDDING_CPU_THREADS 환경변수)
+            pooling: cls / mean (기본값: EMBEDDING_POOLING 환경변수, cls)
+            projection_path: 차원 축소 투영 파일 (EMBEDDING_PROJECTION_DIM > 0일 때 사용, None이면 사용 안 함)
+        """
+        self.model_name = model_name
+        self.registry = get_model_registry()
+        self.device = self._resolve_device(device or os.getenv("EMBEDDING_DEVICE", "auto"))
+        self.precision = self._resolve_precision(precision or os.getenv("EMBEDDING_PRECISION", "auto"))
+        self.batch_size = batch_size or int(os.getenv("EMBEDDING_BATCH_SIZE", "0")) or self._default_batch_size()
+        self.max_length = max_length or int(os.getenv("EMBEDDING_MAX_LENGTH", str(DEFAULT_MAX_LENGTH)))
+        self.pooling = (pooling or os.getenv("EMBEDDING_POOLING", "cls")).lower()
+        if self.pooling not in _POOLINGS:
+            raise ValueError(f"지원하지 않는 풀링 방식입니다: {self.pooling}")
+        self.cpu_processes, self.cpu_threads = (1, 0) if self.device == "cuda" else \
+            resolve_cpu_split(cpu_processes, cpu_threads)
+        if self.cpu_processes == 1 and self.cpu_threads:
+            set_cpu_threads(self.cpu_threads)
+        self._cpu_pool: Optional[CPUEmbeddingPool] = None
+        self._pool_lock = threading.Lock()
+
+        # 차원 축소 투영 (같은 모델 / 임베딩 방식으로 학습된 경우에만 사용)
+        self.projection_path = projection_path
+        self.projection_dim = int(os.getenv("EMBEDDING_PROJECTION_DIM", "0")) if projection_path else 0
+        self.projection: Optional[EmbeddingProjection] = None
+        if self.projection_dim:
+            projection = EmbeddingProjection.load(projection_path)
+            if projection is not None and self._projection_compatible(projection):
+                self.projection = projection
+
+        if cache is None:
+            # 워커가 여러 개면 워커별 파일 대신 mmap 공유 저장소를 사용
+            shared_store = get_shared_embedding_store(self.output_dim)
+            cache = EmbeddingCache(
+                None if shared_store else os.path.join(cache_dir, "bert_embeddings.bin"),
+                shared=shared_store,
+            )
+        self.cache = cache
+
+        logger.info(
+            f"🚀 임베딩 엔진 초기화 (Device: {self.device}, 정밀도: {self.precision}, "
+            f"배치 크기: {self.batch_size}, 최대 토큰: {self.max_length}, "
+            f"CPU 프로세스: {self.cpu_processes} × 스레드: {self.cpu_threads or '기본값'}, "
+            f"풀링: {self.pooling}, 출력 차원: {self.output_dim})"
+        )
+
+    # ---------------------------------------------------------------
+    # 실행 환경 결정
+    # ---------------------------------------------------------------
+    def _resolve_device(self, device: str) -> str:
+        device = device.lower()
+        if device == "auto":
+            device = self.registry.default_device()
+        if device not in ("cuda", "cpu"):
+            raise ValueError(f"지원하지 않는 디바이스입니다: {device}")
+        if device == "cuda":
+            import torch
+            # 입력 길이가 배치마다 달라 cudnn 자동 튜닝 결과를 재사용
+            torch.backends.cudnn.benchmark = True
+        return device
+
+    def _resolve_precision(self, precision: str) -> str:
+        precision = precision.lower()
+        if precision == "auto":
+            return "fp16" if self.device == "cuda" else "fp32"
+        if precision not in _PRECISIONS:
+            raise ValueError(f"지원하지 않는 정밀도입니다: {precision}")
+        if precision == "fp16" and self.device == "cpu":
+            # CPU autocast는 bf16만 지원
+            logger.warning("⚠️ CPU에서는 fp16을 지원하지 않아 fp32를 사용합니다.")
+            return "fp32"
+        return precision
+
+    def _default_batch_size(self) -> int:
+        if self.device != "cuda":
+            return 32
+        import torch
+        # GPU 메모리에 따른 배치 크기
+        total_gb = torch.cuda.get_device_properties(0).total_memory / 1024 ** 3
+        if total_gb < 4:
+            return 16
+        if total_gb < 8:
+            return 32
+        return 64
+
+    # ---------------------------------------------------------------
+    # 모델
+    # ---------------------------------------------------------------
+    @property
+    def tokenizer(self):
+        """토크나이저 (레지스트리 공유)"""
+        return self.registry.get_transformer(self.model_name, self.device)[0]
+
+    @property
+    def model(self):
+        """모델 (레지스트리 공유, CUDA에서는 torch.compile 적용본)"""
+        if self.device != "cuda":
+            return self.registry.get_transformer(self.model_name, self.device)[1]
+        import torch
+        if not hasattr(torch, "compile"):
+            return self.registry.get_transformer(self.model_name, self.device)[1]
+        # 컴파일 결과도 프로세스당 한 번만 생성
+        key = f"transformer:{self.model_name}:cuda:compiled"
+        if not self.registry.is_loaded(key):
+            self.registry.register(key, self._compile_model)
+        return self.registry.get(key)
+
+    def _compile_model(self):
+        import torch
+        base_model = self.registry.get_transformer(self.model_name, self.device)[1]
+        compiled = torch.compile(base_model, mode="reduce-overhead")
+        logger.info("✅ GPU 최적화 적용 완료")
+        return compiled
+
+    def _autocast(self):
+        if self.precision == "fp32":
+            return contextlib.nullcontext()
+        import torch
+        dtype = torch.float16 if self.precision == "fp16" else torch.bfloat16
+        return torch.autocast(device_type=self.device, dtype=dtype)
+
+    # ---------------------------------------------------------------
+    # 임베딩
+    # ---------------------------------------------------------------
+    @staticmethod
+    def preprocess(text: str) -> str:
+        """특수문자 제거, 공백 정리, 길이 제한"""
+        text = re.sub(r'[^\w\s가-힣]', ' ', text)
+        text = re.sub(r'\s+', ' ', text).strip()
+        return text[:500]
+
+    @property
+    def base_backend(self) -> str:
+        """모델 출력 임베딩 방식 (풀링 / 정밀도 / 최대 토큰 수)"""
+        backend = f"{self.pooling}-{self.precision}"
+        if self.max_length != DEFAULT_MAX_LENGTH:
+            backend += f"-len{self.max_length}"
+        return backend
+
+    @property
+    def backend(self) -> str:
+        """캐시 키에 들어가는 임베딩 방식 (차원 축소 투영 포함)"""
+        if self.projection is None:
+            return self.base_backend
+        return f"{self.base_backend}-proj{self.projection.id}"
+
+    @property
+    def output_dim(self) -> int:
+        """embed() 결과 차원"""
+        return self.projection.dim if self.projection is not None else EMBEDDING_DIM
+
+    def cache_key(self, text: str, project: bool = True) -> bytes:
+        """전처리된 텍스트의 캐시 키"""
+        return make_cache_key(self.model_name, self.backend if project else self.base_backend, text)
+
+    def embed(self, texts: Sequence[str], batch_size: Optional[int] = None,
+              project: bool = True) -> np.ndarray:
+        """
+        텍스트 임베딩 (캐시에 없는 텍스트만 계산)
+
+        Args:
+            texts: 텍스트 리스트 (빈 텍스트는 0 벡터)
+            batch_size: 배치 크기 (기본값: 엔진 배치 크기)
+            project: 차원 축소 투영 적용 여부 (False면 모델 출력 그대로)
+
+        Returns:
+            (텍스트 수, output_dim) float32 행렬
+        """
+        project = project and self.projection is not None
+        result = np.zeros((len(texts), self.output_dim if project else EMBEDDING_DIM), dtype=np.float32)
+        missing: Dict[bytes, str] = {}
+        missing_rows: List[Tuple[int, bytes]] = []
+        for row, text in enumerate(texts):
+            text = self.preprocess(text) if isinstance(text, str) else ""
+            if not text:
+                continue
+            key = self.cache_key(text, project)
+            cached = self.cache.get(key)
+            if cached is None and project:
+                # 투영 학습 때 계산한 전체 차원 임베딩이 있으면 모델 대신 투영만 적용
+                cached = self.cache.get(self.cache_key(text, project=False))
+                if cached is not None:
+                    cached = self.projection.transform(cached[None, :])[0]
+                    self.cache.put(key, cached)
+            if cached is not None:
+                result[row] = cached
+            else:
+                missing.setdefault(key, text)
+                missing_rows.append((row, key))
+
+        if missing:
+            with span("embed", texts=len(texts), cached=len(texts) - len(missing_rows), computed=len(missing)):
+                computed = dict(zip(missing, self._embed_missing(list(missing.values()),
+                                                                 batch_size or self.batch_size, project)))
+            for row, key in missing_rows:
+                result[row] = computed[key]
+            logger.info(f"🗃️ 임베딩 캐시: {len(texts) - len(missing_rows)}/{len(texts)}개 재사용, "
+                        f"{len(missing)}개 생성")
+        return result
+
+    def embed_one(self, text: str) -> np.ndarray:
+        """단일 텍스트 임베딩"""
+        return self.embed([text])[0]
+
+    @property
+    def cpu_pool(self) -> Optional[CPUEmbeddingPool]:
+        """CPU 멀티 프로세스 풀 (프로세스 1개면 None, 최초 사용 시 생성)"""
+        if self.cpu_processes <= 1:
+            return None
+        with self._pool_lock:
+            if self._cpu_pool is None:
+                self._cpu_pool = CPUEmbeddingPool(
+                    self.cpu_processes, self.cpu_threads,
+                    factory_args=(self.model_name, self.max_length, self.precision, self.pooling),
+                    dim=EMBEDDING_DIM,
+                )
+            return self._cpu_pool
+
+    def _embed_missing(self, texts: List[str], batch_size: int, project: bool = False) -> np.ndarray:
+        """전처리된 텍스트 배치 임베딩 생성 (투영 적용) 및 캐시 저장"""
+        # 길이가 비슷한 텍스트끼리 배치를 구성해 패딩 낭비 감소
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        ordered_texts = [texts[i] for i in order]
+        start_time = time.perf_counter()
+        pool = self.cpu_pool
+        if pool is not None:
+            # 배치를 워커 프로세스에 나눠 처리 (입출력은 공유 메모리)
+            with span("embed.pool", texts=len(ordered_texts), batch_size=batch_size, processes=pool.processes):
+                encoded = pool.encode(ordered_texts, batch_size)
+        else:
+            batches = []
+            for start in range(0, len(ordered_texts), batch_size):
+                batch = ordered_texts[start:start + batch_size]
+                with span("embed.batch", size=len(batch), max_chars=len(batch[0])):
+                    batches.append(self._encode(batch))
+            encoded = np.concatenate(batches)
+            self.clear_device_cache(log=False)
+        if project:
+            encoded = self.projection.transform(encoded)
+        self._record_metrics(len(texts), batch_size, time.perf_counter() - start_time)
+
+        embeddings = np.empty_like(encoded)
+        embeddings[order] = encoded
+        for text, embedding in zip(texts, embeddings):
+            self.cache.put(self.cache_key(text, project), embedding)
+        return embeddings
+
+    def _record_metrics(self, count: int, batch_size: int, seconds: float):
+        """배치 크기 / 처리량 메트릭 기록 (순전파 경로 밖에서 호출당 한 번)"""
+        device = str(self.device)
+        batches = EMBEDDING_BATCH_SIZE.labels(device)
+        for _ in range(count // batch_size):
+            batches.observe(batch_size)
+        if count % batch_size:
+            batches.observe(count % batch_size)
+        EMBEDDING_TEXTS.labels(device).inc(count)
+        EMBEDDING_SECONDS.labels(device).observe(seconds)
+        if seconds > 0:
+            EMBEDDING_THROUGHPUT.labels(device).set(count / seconds)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """모델 순전파 (CLS 토큰 또는 마스크 평균 풀링)"""
+        import torch
+
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            truncation=True,
+            max_length=self.max_length,
+            padding=True
+        )
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        with torch.inference_mode(), self._autocast():
+            hidden = self.model(**inputs).last_hidden_state
+            if self.pooling == "mean":
+                # 패딩 토큰을 제외한 토큰 벡터 평균
+                mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                embedding = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+            else:
+                embedding = hidden[:, 0, :]
+        return embedding.float().cpu().numpy()
+
+    # ---------------------------------------------------------------
+    # 차원 축소 투영
+    # ---------------------------------------------------------------
+    def _projection_compatible(self, projection: EmbeddingProjection) -> bool:
+        metadata = projection.metadata
+        return (metadata.get("model") == self.model_name
+                and metadata.get("backend") == self.base_backend
+                and projection.dim == self.projection_dim)
+
+    def fit_projection(self, texts: Sequence[str], dim: Optional[int] = None,
+                       whiten: Optional[bool] = None, min_recall: Optional[float] = None,
+                       k: int = 10, catalogue_hash: Optional[str] = None) -> Dict[str, object]:
+        """
+        카탈로그 임베딩으로 차원 축소 투영을 학습하고, 재현율 확인을 통과하면 저장 / 적용
+
+        Args:
+            texts: 학습 텍스트 (도서 설명)
+            dim: 출력 차원 (기본값: EMBEDDING_PROJECTION_DIM 환경변수)
+            whiten: 화이트닝 여부 (기본값: EMBEDDING_PROJECTION_WHITEN 환경변수)
+            min_recall: 적용에 필요한 전체 차원 대비 최소 top-k 재현율 (기본값: EMBEDDING_PROJECTION_MIN_RECALL, 0.9)
+            k: 재현율 측정 상위 개수
+            catalogue_hash: 도서 목록 해시 (메타데이터 기록용)
+
+        Returns:
+            투영 메타데이터 (activated: 적용 여부)
+        """
+        dim = dim or self.projection_dim or 256
+        whiten = whiten if whiten is not None else \
+            os.getenv("EMBEDDING_PROJECTION_WHITEN", "False").lower() == "true"
+        min_recall = min_recall if min_recall is not None else \
+            float(os.getenv("EMBEDDING_PROJECTION_MIN_RECALL", "0.9"))
+
+        full = self.embed(texts, project=False)
+        full = full[np.linalg.norm(full, axis=1) > 0]
+        if len(full) <= dim:
+            logger.warning(f"⚠️ 학습 텍스트({len(full)}개)가 출력 차원({dim})보다 적어 차원 축소를 건너뜁니다.")
+            return {"activated": False, "samples": len(full), "dim": dim}
+
+        projection = EmbeddingProjection.fit(full, dim, whiten, metadata={
+            "model": self.model_name,
+            "backend": self.base_backend,
+            "catalogue_hash": catalogue_hash,
+        })
+        recall = recall_at_k(full, projection.transform(full), k)
+        projection.metadata.update({"recall_at_k": round(recall, 4), "k": k, "min_recall": min_recall})
+        activated = recall >= min_recall
+        if activated:
+            if self.projection_path:
+                projection.save(self.projection_path)
+            self.projection = projection
+            self.projection_dim = projection.dim
+            logger.info(f"✅ 임베딩 차원 축소 적용: {projection.source_dim} → {projection.dim}차원 "
+                        f"(recall@{k} {recall:.3f}, 설명 분산 {projection.metadata['explained_variance']})")
+        else:
+            logger.warning(f"⚠️ 차원 축소 재현율이 낮아 전체 차원을 유지합니다: recall@{k} {recall:.3f} < {min_recall}")
+        return dict(projection.metadata, activated=activated)
+
+    # ---------------------------------------------------------------
+    # 유사도 검색
+    # ---------------------------------------------------------------
+    def build_index(self, embeddings, codec: Optional[str] = None) -> Union[EmbeddingIndex, QuantizedVectorStore]:
+        """
+        반복 검색용 인덱스 생성 (정규화는 한 번만)
+
+        Args:
+            embeddings: 임베딩 행렬 (n, output_dim)
+            codec: fp32 / fp16 / int8 / pq (기본값: EMBEDDING_INDEX_CODEC 환경변수, fp32)
+
+        Returns:
+            fp32면 EmbeddingIndex, 그 외에는 압축 코드 후보 검색 + float32 재계산 저장소 (원본은 mmap 파일)
+        """
+        codec = (codec or os.getenv("EMBEDDING_INDEX_CODEC", "fp32")).lower()
+        if codec == "fp32":
+            return EmbeddingIndex(embeddings, self.device, self.output_dim)
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.output_dim)
+        return QuantizedVectorStore.for_index(vectors, codec)
+
+    def _normalize_query(self, query) -> Tuple[bool, np.ndarray]:
+        """쿼리(텍스트 / 벡터 / 행렬)를 정규화된 (m, d) 행렬로 변환"""
+        if isinstance(query, str):
+            query = self.embed_one(query)
+        elif isinstance(query, (list, tuple)) and query and isinstance(query[0], str):
+            query = self.embed(query)
+        query = normalize_rows(query)
+        single = query.ndim == 1
+        return single, query.reshape(1, -1) if single else query
+
+    def similarities(self, query, index) -> np.ndarray:
+        """
+        코사인 유사도
+
+        Args:
+            query: 텍스트, 벡터 (768,) 또는 행렬 (m, 768)
+            index: EmbeddingIndex, QuantizedVectorStore(근사 유사도) 또는 임베딩 행렬 (n, 768)
+
+        Returns:
+            벡터 쿼리면 (n,), 행렬 / 텍스트 리스트 쿼리면 (m, n) 유사도
+        """
+        if not isinstance(index, (EmbeddingIndex, QuantizedVectorStore)):
+            index = self.build_index(index)
+        single, queries = self._normalize_query(query)
+
+        if isinstance(index, QuantizedVectorStore):
+            scores = index.approximate_scores(queries)
+        elif self.device == "cuda" and len(index) >= GPU_SIMILARITY_MIN_ROWS:
+            import torch
+            query_tensor = torch.from_numpy(queries).to(self.device)
+            scores = torch.mm(query_tensor, index.device_tensor().T).cpu().numpy()
+        else:
+            scores = queries @ index.vectors.T
+        return scores[0] if single else scores
+
+    def topk(self, query, index, k: int = 5,
+             threshold: Optional[float] = None) -> Union[List[Tuple[int, float]], List[List[Tuple[int, float]]]]:
+        """
+        유사도 상위 k개 검색
+
+        Args:
+            query: 텍스트, 벡터 또는 행렬 (similarities()와 같음)
+            index: EmbeddingIndex, QuantizedVectorStore 또는 임베딩 행렬
+            k: 반환할 상위 개수
+            threshold: 최소 유사도 (None이면 제한 없음)
+
+        Returns:
+            (인덱스, 유사도) 리스트 - 행렬 쿼리면 쿼리별 리스트
+        """
+        if not isinstance(index, (EmbeddingIndex, QuantizedVectorStore)):
+            index = self.build_index(index)
+        single, queries = self._normalize_query(query)
+        k = min(k, len(index))
+        if k <= 0:
+            return [] if single else [[] for _ in range(queries.shape[0])]
+
+        if isinstance(index, QuantizedVectorStore):
+            # 압축 코드로 후보를 고른 뒤 후보만 float32로 재계산
+            top, top_scores = index.topk(queries, k)
+        else:
+            # 전체 정렬 대신 상위 k개만 분리한 뒤 정렬
+            scores = self.similarities(queries, index)
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        results = [
+            [(int(i), float(s)) for i, s in zip(row_indices, row_scores)
+             if threshold is None or s >= threshold]
+            for row_indices, row_scores in zip(top, top_scores)
+        ]
+        return results[0] if single else results
+
+    # ---------------------------------------------------------------
+    # 상태 / 정리
+    # ---------------------------------------------------------------
+    def device_stats(self) -> Dict[str, object]:
+        """디바이스 메모리 통계"""
+        if self.device != "cuda":
+            return {
+                'device': self.device,
+                'allocated_memory_mb': 0,
+                'cached_memory_mb': 0,
+                'total_memory_mb': 0,
+                'memory_usage_percent': 0
+            }
+        import torch
+        allocated = torch.cuda.memory_allocated() / 1024 ** 2
+        cached = torch.cuda.memory_reserved() / 1024 ** 2
+        total = torch.cuda.get_device_properties(0).total_memory / 1024 ** 2
+        return {
+            'device': self.device,
+            'allocated_memory_mb': allocated,
+            'cached_memory_mb': cached,
+            'total_memory_mb': total,
+            'memory_usage_percent': (allocated / total) * 100
+        }
+
+    def stats(self) -> Dict[str, object]:
+        """엔진 설정 / 캐시 / 디바이스 통계"""
+        return {
+            "model": self.model_name,
+            "device": self.device,
+            "precision": self.precision,
+            "batch_size": self.batch_size,
+            "max_length": self.max_length,
+            "cpu_processes": self.cpu_processes,
+            "cpu_threads": self.cpu_threads,
+            "pooling": self.pooling,
+            "output_dim": self.output_dim,
+            "projection": self.projection.metadata if self.projection is not None else None,
+            "cache": self.cache.stats(),
+            "device_memory": self.device_stats(),
+        }
+
+    def clear_device_cache(self, log: bool = True):
+        """CUDA 캐시 메모리 반환 (CPU에서는 아무 작업도 하지 않음)"""
+        if self.device != "cuda":
+            return
+        import torch
+        torch.cuda.empty_cache()
+        if log:
+            logger.info("🧹 GPU 캐시 정리 완료")
+
+    def save_cache(self):
+        """임베딩 캐시 저장 (새 항목만 추가 기록)"""
+        self.cache.save()
+
+    def close(self):
+        """CPU 프로세스 풀 종료 및 캐시 저장"""
+        with self._pool_lock:
+            if self._cpu_pool is not None:
+                self._cpu_pool.close()
+                self._cpu_pool = None
+        self.save_cache()
+
+
+_engines: Dict[str, EmbeddingEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_embedding_engine(model_name: str = DEFAULT_BERT_MODEL) -> EmbeddingEngine:
+    """모델별 전역 임베딩 엔진 (추천 시스템 / 엔드포인트가 캐시를 공유)"""
+    with _engines_lock:
+        engine = _engines.get(model_name)
+        if engine is None:
+            engine = _engines[model_name] = EmbeddingEngine(model_name)
+        return engine
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+도서 간 k-최근접 이웃 그래프
+- 정규화 임베딩 블록 × 전체 행렬 곱 → 블록 행마다 상위 k개 (블록은 스레드 풀에서 병렬 처리)
+- CSR 형식 저장: indptr (n+1) / indices (int32) / scores (float16) + ISBN / 제목 배열
+- 카탈로그 버전(도서 목록 + 설명 + 임베딩 방식 + k) 해시가 같으면 다시 만들지 않음
+- 조회는 ISBN → 행 사전 조회 + 배열 슬라이스 (모델 추론 없음)
+"""
+
+import os
+import json
+import hashlib
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .projection import normalize_rows
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_KNN_GRAPH_PATH = os.getenv("KNN_GRAPH_PATH", "cache/knn_graph.npz")
+DEFAULT_BLOCK_ROWS = 256
+# 동시에 처리하는 블록 수 기본 상한 (블록마다 block_rows × n 점수 행렬을 만듦)
+DEFAULT_WORKERS = 4
+
+
+def catalogue_version(isbns: Sequence[str], backend: str, k: int, min_score: float,
+                      descriptions: Optional[Sequence[str]] = None) -> str:
+    """
+    그래프를 다시 만들어야 하는지 판단하는 카탈로그 버전 해시
+
+    Args:
+        isbns: 행 순서 ISBN
+        backend: 임베딩 방식 (EmbeddingEngine.backend)
+        k: 도서당 이웃 수
+        min_score: 최소 유사도
+        descriptions: 행 순서 도서 설명 (설명만 바뀌어도 임베딩이 달라지므로 함께 해시)
+    """
+    digest = hashlib.sha1(f"{backend}\x00{k}\x00{min_score}\n".encode("utf-8"))
+    digest.update("\n".join(isbns).encode("utf-8"))
+    for description in descriptions or ():
+        digest.update(b"\x00")
+        digest.update((description or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _block_topk(vectors: np.ndarray, start: int, stop: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """vectors[start:stop] 행마다 자기 자신을 제외한 상위 k개 (인덱스, 유사도) - 유사도 내림차순"""
+    scores = vectors[start:stop] @ vectors.T
+    rows = np.arange(stop - start)
+    scores[rows, rows + start] = -np.inf
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+
+class KnnGraph:
+    """CSR 형식 도서 이웃 그래프"""
+
+    def __init__(self, isbns: Sequence[str], titles: Sequence[str], indptr: np.ndarray,
+                 indices: np.ndarray, scores: np.ndarray, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            isbns: 행 순서 ISBN
+            titles: 행 순서 제목
+            indptr: 행 i의 이웃은 indices[indptr[i]:indptr[i + 1]]
+            indices: 이웃 행 번호 (유사도 내림차순)
+            scores: 이웃 유사도
+            metadata: version / k / min_score / backend 등
+        """
+        self.isbns = np.asarray(isbns)
+        self.titles = np.asarray(titles)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.scores = np.asarray(scores, dtype=np.float16)
+        self.metadata = dict(metadata or {})
+        self._rows = {str(isbn): row for row, isbn in enumerate(self.isbns)}
+
+    def __len__(self) -> int:
+        return len(self.isbns)
+
+    def __contains__(self, isbn: str) -> bool:
+        return isbn in self._rows
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.metadata.get("version")
+
+    def memory_bytes(self) -> int:
+        return int(self.indptr.nbytes + self.indices.nbytes + self.scores.nbytes)
+
+    @classmethod
+    def build(cls, embeddings, isbns: Sequence[str], titles: Sequence[str], k: int = 20,
+              min_score: float = 0.0, block_rows: int = DEFAULT_BLOCK_ROWS, workers: Optional[int] = None,
+              metadata: Optional[Dict[str, Any]] = None) -> "KnnGraph":
+        """
+        블록 행렬 곱으로 그래프 생성
+
+        Args:
+            embeddings: 도서 임베딩 (n, d) - isbns와 같은 행 순서
+            isbns: 행 순서 ISBN
+            titles: 행 순서 제목
+            k: 도서당 최대 이웃 수
+            min_score: 최소 유사도 (미만 이웃은 제외, 설명이 비어 0 벡터인 도서는 이웃 없음)
+            block_rows: 행렬 곱 블록 행 수 (블록 메모리 = block_rows × n × 4바이트)
+            workers: 블록 병렬 처리 스레드 수 (기본값: CPU 수와 DEFAULT_WORKERS 중 작은 값)
+            metadata: 그래프와 함께 저장할 값
+
+        Returns:
+            KnnGraph
+        """
+        vectors = normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        n = len(vectors)
+        k = min(k, n - 1)
+        blocks = [(start, min(start + block_rows, n)) for start in range(0, n, block_rows)]
+        if k <= 0:
+            counts = np.zeros(n, dtype=np.int64)
+            indices, scores = np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float16)
+        else:
+            # 행렬 곱 / 부분 정렬은 GIL을 놓으므로 스레드로 블록 병렬 처리
+            with ThreadPoolExecutor(max_workers=workers or min(os.cpu_count() or 1, DEFAULT_WORKERS)) as pool:
+                results = list(pool.map(lambda block: _block_topk(vectors, *block, k), blocks))
+            top = np.concatenate([result[0] for result in results])
+            top_scores = np.concatenate([result[1] for result in results])
+            nonzero = np.linalg.norm(vectors, axis=1) > 0
+            keep = (top_scores >= min_score) & nonzero[:, None] & nonzero[top]
+            counts = keep.sum(axis=1)
+            indices, scores = top[keep].astype(np.int32), top_scores[keep].astype(np.float16)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        metadata = dict(metadata or {}, k=k, min_score=min_score, books=n, edges=int(indptr[-1]))
+        # 제목이 없는 도서도 문자열 배열로 저장 (npz를 pickle 없이 읽기 위함)
+        return cls(isbns, [title or "" for title in titles], indptr, indices, scores, metadata)
+
+    def neighbours(self, isbn: str, limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        ISBN의 이웃 도서
+
+        Args:
+            isbn: 도서 ISBN
+            limit: 최대 개수 (None이면 저장된 전체)
+
+        Returns:
+            유사도 순 {books_isbn, books_title, similarity_score} 리스트 (그래프에 없는 ISBN이면 None)
+        """
+        row = self._rows.get(isbn)
+        if row is None:
+            return None
+        start, stop = self.indptr[row], self.indptr[row + 1]
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return [
+            {"books_isbn": str(self.isbns[i]), "books_title": str(self.titles[i]),
+             "similarity_score": round(float(score), 4)}
+            for i, score in zip(self.indices[start:stop], self.scores[start:stop])
+        ]
+
+    def save(self, path: str):
+        """npz 저장 (임시 파일에 쓴 뒤 교체 - 읽는 쪽은 이전 파일 또는 새 파일만 봄)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, isbns=self.isbns, titles=self.titles, indptr=self.indptr,
+                 indices=self.indices, scores=self.scores,
+                 metadata=np.array(json.dumps(self.metadata, ensure_ascii=False)))
+        os.replace(tmp_path, path)
+        logger.info(f"💾 도서 이웃 그래프 저장: {len(self)}권, 이웃 {len(self.indices)}개, "
+                    f"{self.memory_bytes() / 1024 ** 2:.1f}MB ({path})")
+
+    @classmethod
+    def load(cls, path: str) -> Optional["KnnGraph"]:
+        """그래프 로드 (없거나 읽을 수 없으면 None)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as saved:
+                return cls(saved["isbns"], saved["titles"], saved["indptr"], saved["indices"],
+                           saved["scores"], json.loads(str(saved["metadata"])))
+        except (OSError, KeyError, ValueError) as e:
+            logger.error(f"도서 이웃 그래프 로드 실패: {e}")
+            return None
+
+
+class KnnGraphStore:
+    """서버에서 사용하는 그래프 (파일이 바뀌면 다음 조회 때 다시 로드)"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: 그래프 파일 경로 (기본값: KNN_GRAPH_PATH 환경변수)
+        """
+        self.path = path or DEFAULT_KNN_GRAPH_PATH
+        self._graph: Optional[KnnGraph] = None
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[KnnGraph]:
+        """현재 그래프 (파일이 없으면 None)"""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return self._graph
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    graph = KnnGraph.load(self.path)
+                    if graph is not None:
+                        self._graph = graph
+                        logger.info(f"🕸️ 도서 이웃 그래프 로드: {len(graph)}권 (버전 {graph.version})")
+                    self._mtime = mtime
+        return self._graph
+
+
+_store: Optional[KnnGraphStore] = None
+_store_lock = threading.Lock()
+
+
+def get_knn_graph_store() -> KnnGraphStore:
+    """프로세스 공용 그래프 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = KnnGraphStore()
+        return _store
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+프로세스 단위 모델 레지스트리
+- 모델별 1회 로드 (싱글톤)
+- 최초 사용 시점 지연 로드
+- 로드 시간 / 메모리 사용량 기록
+"""
+
+import os
+import time
+import threading
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_BERT_MODEL = "skt/kobert-base-v1"
+DEFAULT_SENTENCE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def _get_rss_mb() -> float:
+    """현재 프로세스 최대 RSS (MB)"""
+    try:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 byte 단위
+        return rss / 1024 if os.uname().sysname != "Darwin" else rss / 1024**2
+    except Exception:
+        return 0.0
+
+
+def _module_size_mb(module: Any) -> float:
+    """torch 모듈의 파라미터 + 버퍼 크기 (MB)"""
+    try:
+        tensors = list(module.parameters()) + list(module.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors) / 1024**2
+    except Exception:
+        return 0.0
+
+
+class ModelRegistry:
+    """
+    모델 레지스트리 (싱글톤)
+
+    엔드포인트, 추천 시스템, 파이프라인이 같은 모델 인스턴스를 공유하도록
+    모델을 키 단위로 한 번만 로드합니다.
+    """
+
+    _instance: Optional["ModelRegistry"] = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instance = instance
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def register(self, key: str, loader: Callable[[], Any], replace: bool = False):
+        """
+        모델 로더 등록 (로드는 최초 get() 호출 시점에 수행)
+
+        Args:
+            key: 모델 키
+            loader: 모델 객체를 반환하는 함수
+            replace: 이미 로드된 모델이 있으면 교체할지 여부
+        """
+        with self._lock:
+            if key in self._models and not replace:
+                return
+            self._loaders[key] = loader
+            if replace:
+                self._models.pop(key, None)
+                self._stats.pop(key, None)
+
+    def get(self, key: str) -> Any:
+        """
+        모델 조회 (필요 시 로드)
+
+        Args:
+            key: 모델 키
+
+        Returns:
+            로드된 모델 객체
+        """
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+            loader = self._loaders.get(key)
+
+        if loader is None:
+            raise KeyError(f"등록되지 않은 모델 키입니다: {key}")
+
+        # 키별 락으로 같은 모델의 중복 로드 방지 (다른 모델 로드는 막지 않음)
+        with key_lock:
+            model = self._models.get(key)
+            if model is not None:
+                return model
+
+            logger.info(f"📥 모델 로드 시작: {key}")
+            rss_before = _get_rss_mb()
+            start_time = time.time()
+            model = loader()
+            load_time = time.time() - start_time
+
+            self._models[key] = model
+            self._stats[key] = {
+                "key": key,
+                "load_time_sec": round(load_time, 3),
+                "memory_mb": round(self._estimate_memory_mb(model), 1),
+                "peak_rss_delta_mb": round(max(_get_rss_mb() - rss_before, 0.0), 1),
+                "loaded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            logger.info(
+                f"✅ 모델 로드 완료: {key} "
+                f"({load_time:.2f}초, {self._stats[key]['memory_mb']}MB)"
+            )
+            return model
+
+    def get_transformer(self, model_name: str = DEFAULT_BERT_MODEL,
+                        device: Optional[str] = None) -> Tuple[Any, Any]:
+        """
+        (토크나이저, 모델) 조회
+
+        Args:
+            model_name: HuggingFace 모델명
+            device: 모델을 올릴 디바이스 (None이면 자동 선택)
+
+        Returns:
+            (tokenizer, model) 튜플
+        """
+        device = device or self.default_device()
+        key = f"transformer:{model_name}:{device}"
+        if key not in self._loaders:
+            self.register(key, lambda: self._load_transformer(model_name, device))
+        return self.get(key)
+
+    def get_sentence_transformer(self, model_name: str = DEFAULT_SENTENCE_MODEL,
+                                 device: Optional[str] = None) -> Any:
+        """
+        Sentence Transformer 조회
+
+        Args:
+            model_name: Sentence Transformer 모델명
+            device: 모델을 올릴 디바이스 (None이면 자동 선택)
+
+        Returns:
+            SentenceTransformer 인스턴스
+        """
+        device = device or self.default_device()
+        key = f"sentence:{model_name}:{device}"
+        if key not in self._loaders:
+            self.register(key, lambda: self._load_sentence_transformer(model_name, device))
+        return self.get(key)
+
+    def is_loaded(self, key: str) -> bool:
+        """모델 로드 여부"""
+        return key in self._models
+
+    def unload(self, key: str) -> bool:
+        """모델 언로드 (로더는 유지되어 다음 get() 시 재로드)"""
+        with self._lock:
+            removed = self._models.pop(key, None) is not None
+            self._stats.pop(key, None)
+        if removed:
+            logger.info(f"🗑️ 모델 언로드: {key}")
+        return removed
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """로드 시간 / 메모리 사용량 통계"""
+        with self._lock:
+            registered = list(self._loaders.keys())
+            stats = dict(self._stats)
+        return [
+            stats.get(key, {"key": key, "loaded": False}) | {"loaded": key in stats}
+            for key in registered
+        ]
+
+    @staticmethod
+    def default_device() -> str:
+        """사용할 기본 디바이스"""
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+
+    @staticmethod
+    def _load_transformer(model_name: str, device: str) -> Tuple[Any, Any]:
+        """HuggingFace 토크나이저 / 모델 로드"""
+        from transformers import AutoTokenizer, AutoModel
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModel.from_pretrained(model_name)
+        model.to(device)
+        model.eval()
+        return tokenizer, model
+
+    @staticmethod
+    def _load_sentence_transformer(model_name: str, device: str) -> Any:
+        """Sentence Transformer 로드"""
+        from sentence_transformers import SentenceTransformer
+
+        return SentenceTransformer(model_name, device=device)
+
+    @staticmethod
+    def _estimate_memory_mb(model: Any) -> float:
+        """모델 메모리 사용량 추정"""
+        if isinstance(model, tuple):
+            return sum(_module_size_mb(part) for part in model)
+        return _module_size_mb(model)
+
+
+def get_model_registry() -> ModelRegistry:
+    """전역 모델 레지스트리 반환"""
+    return ModelRegistry()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+임베딩 차원 축소
+- 도서 카탈로그 임베딩으로 학습한 PCA(선택적으로 화이트닝) 투영 (768 → 128~256차원)
+- 학습 결과 디스크 보관
+- 전체 차원 대비 상위 k개 검색 재현율 확인
+"""
+
+import os
+import pickle
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROJECTION_PATH = os.getenv("EMBEDDING_PROJECTION_PATH",
+                                    os.path.join("cache", "embedding_projection.pkl"))
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (0 벡터는 그대로 두어 유사도 0)"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def recall_at_k(full: np.ndarray, reduced: np.ndarray, k: int = 10,
+                sample: int = 200, seed: int = 0) -> float:
+    """
+    축소 차원 검색의 전체 차원 대비 재현율
+
+    표본 행을 쿼리로 삼아 (자기 자신 제외) 두 공간의 코사인 상위 k개가 겹치는 비율을 구합니다.
+
+    Args:
+        full: 전체 차원 임베딩 (n, d)
+        reduced: 같은 행의 축소 임베딩 (n, d')
+        k: 비교할 상위 개수
+        sample: 쿼리로 사용할 최대 행 수
+        seed: 표본 추출 시드
+
+    Returns:
+        평균 재현율 (0~1)
+    """
+    n = full.shape[0]
+    k = min(k, n - 1)
+    if k <= 0:
+        return 1.0
+    queries = np.random.default_rng(seed).choice(n, size=min(sample, n), replace=False)
+
+    def top_k(vectors: np.ndarray) -> np.ndarray:
+        normalized = normalize_rows(vectors)
+        scores = normalized[queries] @ normalized.T
+        scores[np.arange(len(queries)), queries] = -np.inf
+        return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+    expected, actual = top_k(full), top_k(reduced)
+    overlaps = [len(np.intersect1d(e, a, assume_unique=True)) for e, a in zip(expected, actual)]
+    return float(np.mean(overlaps) / k)
+
+
+class EmbeddingProjection:
+    """PCA / 화이트닝 선형 투영"""
+
+    def __init__(self, mean: np.ndarray, components: np.ndarray,
+                 scale: Optional[np.ndarray] = None, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            mean: 학습 데이터 평균 (d,)
+            components: 주성분 (d', d)
+            scale: 화이트닝 배율 (d',) - None이면 PCA만 적용
+            metadata: 학습 정보 (모델 / 임베딩 방식 / 도서 목록 해시 / 재현율 등)
+        """
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.components = np.asarray(components, dtype=np.float32)
+        self.scale = None if scale is None else np.asarray(scale, dtype=np.float32)
+        self.metadata = metadata or {}
+
+    @property
+    def dim(self) -> int:
+        """출력 차원"""
+        return self.components.shape[0]
+
+    @property
+    def source_dim(self) -> int:
+        """입력 차원"""
+        return self.components.shape[1]
+
+    @property
+    def id(self) -> str:
+        """투영 식별자 (캐시 키 구분용 - 다시 학습하면 바뀜)"""
+        digest = hashlib.sha1(self.components.tobytes())
+        if self.scale is not None:
+            digest.update(self.scale.tobytes())
+        return digest.hexdigest()[:10]
+
+    @classmethod
+    def fit(cls, embeddings: np.ndarray, dim: int = 256, whiten: bool = False,
+            metadata: Optional[Dict[str, Any]] = None) -> "EmbeddingProjection":
+        """
+        임베딩 행렬로 투영 학습
+
+        Args:
+            embeddings: 학습 임베딩 (n, d)
+            dim: 출력 차원 (표본 수보다 클 수 없음)
+            whiten: 주성분별 분산을 1로 맞출지 여부 (이방성 완화)
+            metadata: 함께 저장할 정보
+
+        Returns:
+            학습된 투영
+        """
+        data = np.asarray(embeddings, dtype=np.float64)
+        mean = data.mean(axis=0)
+        _, singular_values, vt = np.linalg.svd(data - mean, full_matrices=False)
+        dim = min(dim, vt.shape[0])
+        variance = singular_values ** 2 / max(len(data) - 1, 1)
+        scale = 1.0 / np.sqrt(variance[:dim] + 1e-6) if whiten else None
+
+        metadata = dict(metadata or {})
+        metadata.update({
+            "dim": dim,
+            "source_dim": data.shape[1],
+            "whiten": whiten,
+            "samples": len(data),
+            "explained_variance": round(float(variance[:dim].sum() / max(variance.sum(), 1e-12)), 4),
+            "fitted_at": datetime.now().isoformat(timespec="seconds"),
+        })
+        return cls(mean, vt[:dim], scale, metadata)
+
+    def transform(self, embeddings: np.ndarray) -> np.ndarray:
+        """투영 적용 ((n, d) → (n, d'), 벡터 하나도 가능)"""
+        projected = (np.asarray(embeddings, dtype=np.float32) - self.mean) @ self.components.T
+        if self.scale is not None:
+            projected *= self.scale
+        return projected.astype(np.float32, copy=False)
+
+    def save(self, path: str = DEFAULT_PROJECTION_PATH):
+        """투영 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"mean": self.mean, "components": self.components,
+                         "scale": self.scale, "metadata": self.metadata},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        logger.info(f"💾 임베딩 투영 저장: {self.source_dim} → {self.dim}차원 ({path})")
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PROJECTION_PATH) -> Optional["EmbeddingProjection"]:
+        """저장된 투영 로드 (없으면 None)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                saved = pickle.load(f)
+            return cls(saved["mean"], saved["components"], saved["scale"], saved["metadata"])
+        except (OSError, KeyError, pickle.UnpicklingError, EOFError) as e:
+            logger.error(f"임베딩 투영 로드 실패: {e}")
+            return None
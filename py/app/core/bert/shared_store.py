@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+워커 간 공유 임베딩 저장소
+- 벡터 파일(float32)을 모든 워커가 읽기 전용 mmap으로 공유 (페이지 캐시 1벌)
+- 키 인덱스 파일은 추가 전용 (행 번호 = 기록 순서)
+- 파일 잠금(flock)을 잡은 워커 하나만 기록, 나머지 워커는 새 벡터를 스풀 파일로 넘김
+"""
+
+import os
+import json
+import glob
+import time
+import threading
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARED_DIR = os.getenv("SHARED_EMBEDDING_DIR", os.path.join("cache", "shared_embeddings"))
+
+_KEY_SIZE = 20
+
+
+class SharedEmbeddingStore:
+    """mmap 기반 읽기 위주 공유 임베딩 저장소"""
+
+    def __init__(self, directory: str = DEFAULT_SHARED_DIR, dim: int = 768,
+                 sync_interval: float = 5.0, refresh_interval: float = 1.0):
+        """
+        Args:
+            directory: 저장소 디렉토리 (모든 워커가 같은 경로 사용)
+            dim: 벡터 차원
+            sync_interval: 새 벡터 기록 / 스풀 반영 주기(초)
+            refresh_interval: 조회 실패 시 인덱스를 다시 읽는 최소 간격(초)
+        """
+        if fcntl is None:
+            raise RuntimeError("공유 임베딩 저장소는 fcntl을 지원하는 OS에서만 사용할 수 있습니다.")
+        self.directory = directory
+        self.dim = dim
+        self.sync_interval = sync_interval
+        self.refresh_interval = refresh_interval
+        self.vectors_path = os.path.join(directory, "vectors.f32")
+        self.keys_path = os.path.join(directory, "keys.bin")
+        self.spool_dir = os.path.join(directory, "spool")
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self._check_meta()
+
+        self._lock = threading.RLock()
+        self._rows: Dict[bytes, int] = {}
+        self._keys_offset = 0
+        self._vectors: Optional[np.memmap] = None
+        self._pending: Dict[bytes, np.ndarray] = {}
+        self._last_refresh = 0.0
+        self._lock_file = None
+        self._stop = threading.Event()
+        self._sync_thread: Optional[threading.Thread] = None
+
+        self.is_writer = False
+        self._try_become_writer()
+        self.refresh()
+        # 기록 워커는 스풀 반영, 다른 워커는 새 벡터를 스풀로 넘기는 주기 작업
+        self._sync_thread = threading.Thread(target=self._sync_loop, name="shared-embedding-sync",
+                                             daemon=True)
+        self._sync_thread.start()
+
+    # ---------------------------------------------------------------
+    # 초기화 / 기록 워커 선정
+    # ---------------------------------------------------------------
+    def _check_meta(self):
+        meta_path = os.path.join(self.directory, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                stored_dim = json.load(f)["dim"]
+            if stored_dim != self.dim:
+                raise ValueError(f"공유 임베딩 저장소 차원이 다릅니다: {stored_dim} != {self.dim}")
+            return
+        tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "dtype": "float32"}, f)
+        os.replace(tmp_path, meta_path)
+
+    def _try_become_writer(self) -> bool:
+        """쓰기 잠금 시도 (잡으면 이 프로세스가 유일한 기록 워커)"""
+        if self.is_writer:
+            return True
+        lock_file = open(os.path.join(self.directory, "writer.lock"), "a+")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        self.is_writer = True
+        logger.info(f"✍️ 공유 임베딩 저장소 기록 워커: pid={os.getpid()}")
+        return True
+
+    def _sync_loop(self):
+        while not self._stop.wait(self.sync_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"공유 임베딩 저장소 동기화 실패: {e}")
+
+    # ---------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._rows
+
+    def refresh(self):
+        """다른 워커가 추가한 키 반영 및 벡터 파일 재매핑"""
+        with self._lock:
+            self._last_refresh = time.monotonic()
+            if not os.path.exists(self.keys_path):
+                return
+            size = os.path.getsize(self.keys_path)
+            size -= size % _KEY_SIZE  # 기록 중인 키는 제외
+            if size <= self._keys_offset:
+                return
+            with open(self.keys_path, "rb") as f:
+                f.seek(self._keys_offset)
+                data = f.read(size - self._keys_offset)
+            row = len(self._rows)
+            for start in range(0, len(data), _KEY_SIZE):
+                self._rows.setdefault(data[start:start + _KEY_SIZE], row)
+                row += 1
+            self._keys_offset = size
+            # 벡터는 키보다 먼저 기록되므로 키 수만큼의 벡터는 항상 존재
+            self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r",
+                                      shape=(size // _KEY_SIZE, self.dim))
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """
+        벡터 조회 (mmap 행 뷰 반환 - 프로세스 메모리에 복사하지 않음)
+
+        Returns:
+            벡터 (없으면 None)
+        """
+        row = self._rows.get(key)
+        if row is None and time.monotonic() - self._last_refresh >= self.refresh_interval:
+            self.refresh()
+            row = self._rows.get(key)
+        if row is None:
+            return None
+        return self._vectors[row]
+
+    # ---------------------------------------------------------------
+    # 추가
+    # ---------------------------------------------------------------
+    def add(self, key: bytes, vector: np.ndarray):
+        """새 벡터 추가 예약 (flush() 시 기록 또는 스풀)"""
+        vector = np.asarray(vector, dtype=np.float32)
+        if vector.shape != (self.dim,):
+            logger.warning(f"⚠️ 공유 임베딩 저장소 차원과 다른 벡터는 건너뜁니다: {vector.shape}")
+            return
+        with self._lock:
+            if key not in self._rows:
+                self._pending[key] = vector
+
+    def flush(self):
+        """
+        예약된 벡터 반영
+
+        기록 워커는 자신의 벡터와 스풀 파일을 저장소 끝에 추가하고,
+        다른 워커는 스풀 파일로 넘깁니다. (기록 워커가 종료되었으면 기록 워커를 이어받음)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if not self.is_writer and not self._try_become_writer():
+                if pending:
+                    self._write_spool(pending)
+                return
+            for spool_path in sorted(glob.glob(os.path.join(self.spool_dir, "*.npz"))):
+                try:
+                    with np.load(spool_path) as spool:
+                        for key, vector in zip(spool["keys"], spool["vectors"]):
+                            pending.setdefault(key.tobytes(), vector)
+                except (OSError, ValueError, KeyError) as e:
+                    logger.error(f"스풀 파일 읽기 실패 ({spool_path}): {e}")
+                os.remove(spool_path)
+            self._append(pending)
+
+    def _write_spool(self, pending: Dict[bytes, np.ndarray]):
+        base = os.path.join(self.spool_dir, f"{os.getpid()}-{time.time_ns()}")
+        # S20 문자열 배열은 끝의 0바이트를 잘라내므로 uint8 배열로 저장
+        keys = np.frombuffer(b"".join(pending), dtype=np.uint8).reshape(-1, _KEY_SIZE)
+        vectors = np.stack(list(pending.values()))
+        # 완성된 파일만 기록 워커가 읽도록 임시 이름으로 쓴 뒤 이름 변경
+        with open(f"{base}.tmp", "wb") as f:
+            np.savez(f, keys=keys, vectors=vectors)
+        os.replace(f"{base}.tmp", f"{base}.npz")
+
+    def _append(self, pending: Dict[bytes, np.ndarray]):
+        self.refresh()
+        new_items = [(key, vector) for key, vector in pending.items() if key not in self._rows]
+        if not new_items:
+            return
+        # 이전 기록 워커가 벡터만 쓰고 종료했으면 키 없는 벡터 / 잘린 키가 남음
+        # → 키 레코드 수에 맞춰 잘라내야 새 키의 행 번호가 자기 벡터를 가리킴
+        records = self._keys_offset // _KEY_SIZE
+        for path, size in ((self.keys_path, self._keys_offset),
+                           (self.vectors_path, records * self.dim * 4)):
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                logger.warning(f"⚠️ 중단된 기록 정리: {path} ({os.path.getsize(path) - size}바이트)")
+                os.truncate(path, size)
+        # 벡터 → 키 순서로 기록 (키가 보이면 벡터는 이미 기록된 상태)
+        with open(self.vectors_path, "ab") as f:
+            f.write(np.stack([vector for _, vector in new_items]).astype(np.float32).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        with open(self.keys_path, "ab") as f:
+            f.write(b"".join(key for key, _ in new_items))
+            f.flush()
+            os.fsync(f.fileno())
+        self.refresh()
+        logger.info(f"💾 공유 임베딩 저장소: {len(new_items)}개 추가 (전체 {len(self._rows)}개)")
+
+    def stats(self) -> Dict[str, object]:
+        """저장소 상태"""
+        return {
+            "entries": len(self._rows),
+            "file_mb": round(len(self._rows) * self.dim * 4 / 1024 ** 2, 2),
+            "is_writer": self.is_writer,
+            "pending": len(self._pending),
+        }
+
+    def close(self):
+        """남은 벡터 반영 및 쓰기 잠금 해제"""
+        self.flush()
+        self._stop.set()
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+            self.is_writer = False
+
+
+_shared_store: Optional[SharedEmbeddingStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def shared_store_enabled() -> bool:
+    """공유 저장소 사용 여부 (SHARED_EMBEDDING_STORE: auto이면 WORKERS > 1일 때 사용)"""
+    mode = os.getenv("SHARED_EMBEDDING_STORE", "auto").lower()
+    if mode == "auto":
+        return int(os.getenv("WORKERS", "1")) > 1 and fcntl is not None
+    return mode in ("true", "1", "yes")
+
+
+def get_shared_embedding_store(dim: int = 768) -> Optional[SharedEmbeddingStore]:
+    """프로세스당 하나의 공유 저장소 (비활성화 시 None)"""
+    global _shared_store
+    if not shared_store_enabled():
+        return None
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = SharedEmbeddingStore(dim=dim)
+        return _shared_store
+
+
+def get_shared_store_stats() -> Optional[Dict[str, object]]:
+    """이 프로세스의 공유 저장소 상태 (생성되지 않았으면 None)"""
+    return _shared_store.stats() if _shared_store is not None else None
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+양자화 도서 벡터 저장소
+- fp16 / 차원별 8비트 스칼라 양자화(int8) / 곱 양자화(pq) 코드로 후보 점수 계산
+- 상위 후보 수백 개만 float32 원본으로 다시 계산 (원본은 디스크 mmap - 코드만 메모리에 상주)
+- 벡터는 행 단위 L2 정규화 상태로 저장 (내적 = 코사인 유사도)
+"""
+
+import os
+import pickle
+import tempfile
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .projection import normalize_rows
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+CODECS = ("fp32", "fp16", "int8", "pq")
+DEFAULT_RESCORE = 256
+DEFAULT_PQ_SUBSPACES = 96
+# 코드 → float32 변환 블록 크기 (행) - 전체 행렬을 한 번에 복원하지 않음
+SCAN_BLOCK_ROWS = 8192
+
+
+def _kmeans(data: np.ndarray, clusters: int, iterations: int = 15, seed: int = 0) -> np.ndarray:
+    """부분 공간 코드북 학습용 k-means (유클리드 거리)"""
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(len(data), size=clusters, replace=False)].copy()
+    for _ in range(iterations):
+        distances = (data ** 2).sum(axis=1, keepdims=True) - 2 * data @ centroids.T + (centroids ** 2).sum(axis=1)
+        labels = distances.argmin(axis=1)
+        counts = np.bincount(labels, minlength=clusters)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, data)
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids
+
+
+def pq_subspaces_for(dim: int, limit: int) -> int:
+    """
+    차원을 나누어떨어지게 하는 PQ 부분 공간 수
+
+    Args:
+        dim: 벡터 차원 (차원 축소 투영을 쓰면 투영 차원)
+        limit: 부분 공간 수 상한
+
+    Returns:
+        dim의 약수 중 limit 이하의 최댓값 (최소 1)
+    """
+    for subspaces in range(max(min(limit, dim), 1), 0, -1):
+        if dim % subspaces == 0:
+            return subspaces
+    return 1
+
+
+def _spill_to_mmap(full: np.ndarray, directory: Optional[str]) -> np.ndarray:
+    """
+    재계산용 원본을 .npy로 내려쓰고 읽기 전용 mmap으로 다시 열기
+
+    Args:
+        full: 정규화 float32 원본
+        directory: 파일을 만들 디렉토리 (None이면 시스템 임시 디렉토리)
+
+    Returns:
+        np.memmap (파일은 바로 삭제 - 매핑이 살아 있는 동안만 유지)
+    """
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="vector_store_", suffix=".npy", dir=directory or None)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, full)
+        mapped = np.load(path, mmap_mode="r")
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            # Windows는 매핑 중인 파일을 지울 수 없음 (임시 디렉토리에 남음)
+            pass
+    return mapped
+
+
+class QuantizedVectorStore:
+    """압축 코드 후보 검색 + float32 재계산 벡터 저장소"""
+
+    def __init__(self, codec: str, codes: np.ndarray, params: Dict[str, np.ndarray],
+                 full: Optional[np.ndarray] = None, rescore: int = DEFAULT_RESCORE):
+        """
+        Args:
+            codec: fp32 / fp16 / int8 / pq
+            codes: 압축 코드 (fp16: (n, d) float16, int8: (n, d) uint8, pq: (n, m) uint8)
+            params: 복원 파라미터 (int8: scale / offset, pq: codebooks)
+            full: 재계산용 정규화 float32 원본 (np.memmap 가능, None이면 근사 점수 그대로 사용)
+            rescore: float32로 다시 계산할 후보 수
+        """
+        if codec not in CODECS:
+            raise ValueError(f"지원하지 않는 벡터 코덱입니다: {codec}")
+        self.codec = codec
+        self.codes = codes
+        self.params = params
+        self.full = full
+        self.rescore = rescore
+
+    @classmethod
+    def from_vectors(cls, vectors, codec: str = "int8", rescore: Optional[int] = None,
+                     pq_subspaces: Optional[int] = None, keep_full: bool = True,
+                     spill: bool = False, spill_dir: Optional[str] = None) -> "QuantizedVectorStore":
+        """
+        임베딩 행렬 양자화
+
+        Args:
+            vectors: 임베딩 행렬 (n, d)
+            codec: fp32 / fp16 / int8 / pq
+            rescore: 재계산 후보 수 (기본값: EMBEDDING_INDEX_RESCORE 환경변수, 256)
+            pq_subspaces: pq 부분 공간 수 상한 (기본값: EMBEDDING_PQ_SUBSPACES 환경변수, 96)
+                          - 실제 값은 d의 약수 중 상한 이하의 최댓값
+            keep_full: 재계산용 float32 원본 보관 여부
+            spill: 원본을 메모리 대신 mmap 파일로 보관할지 여부 (상주 메모리 = 코드 + 파라미터)
+            spill_dir: spill 파일 디렉토리 (None이면 시스템 임시 디렉토리)
+
+        Returns:
+            양자화 저장소
+        """
+        if rescore is None:
+            rescore = int(os.getenv("EMBEDDING_INDEX_RESCORE", str(DEFAULT_RESCORE)))
+        full = normalize_rows(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+        params: Dict[str, np.ndarray] = {}
+        if codec == "fp32":
+            codes = full
+        elif codec == "fp16":
+            codes = full.astype(np.float16)
+        elif codec == "int8":
+            # 차원별 최소~최대 범위를 256단계로 균등 분할
+            low, high = full.min(axis=0), full.max(axis=0)
+            scale = np.maximum(high - low, 1e-12) / 255.0
+            codes = np.rint((full - low) / scale).astype(np.uint8)
+            params = {"scale": scale.astype(np.float32), "offset": low.astype(np.float32)}
+        elif codec == "pq":
+            codes, params = cls._train_pq(full, pq_subspaces or int(os.getenv("EMBEDDING_PQ_SUBSPACES",
+                                                                               str(DEFAULT_PQ_SUBSPACES))))
+        else:
+            raise ValueError(f"지원하지 않는 벡터 코덱입니다: {codec}")
+        if not keep_full or codec == "fp32":
+            full = None
+        elif spill:
+            full = _spill_to_mmap(full, spill_dir)
+        return cls(codec, codes, params, full, rescore)
+
+    @classmethod
+    def for_index(cls, vectors, codec: str) -> "QuantizedVectorStore":
+        """
+        검색 인덱스용 저장소 (EmbeddingEngine.build_index와 벤치마크가 같은 구성을 사용)
+
+        float32 원본을 메모리에 두면 코드와 합쳐 fp32 인덱스보다 커지므로
+        재계산용 원본은 EMBEDDING_INDEX_SPILL_DIR(기본값: 시스템 임시 디렉토리)의 mmap 파일로 보관
+
+        Args:
+            vectors: 임베딩 행렬 (n, d)
+            codec: fp16 / int8 / pq
+
+        Returns:
+            양자화 저장소
+        """
+        return cls.from_vectors(vectors, codec, spill=True, spill_dir=os.getenv("EMBEDDING_INDEX_SPILL_DIR") or None)
+
+    @staticmethod
+    def _train_pq(full: np.ndarray, subspaces: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """부분 공간별 코드북(최대 256개 중심) 학습 및 인코딩"""
+        n, dim = full.shape
+        requested = subspaces
+        subspaces = pq_subspaces_for(dim, subspaces)
+        if subspaces != requested:
+            logger.info(f"ℹ️ PQ 부분 공간 수 조정: {requested} → {subspaces} ({dim}차원)")
+        width = dim // subspaces
+        clusters = min(256, n)
+        # 학습 표본은 최대 10,000개
+        sample = full if n <= 10000 else full[np.random.default_rng(0).choice(n, 10000, replace=False)]
+        codebooks = np.empty((subspaces, clusters, width), dtype=np.float32)
+        codes = np.empty((n, subspaces), dtype=np.uint8)
+        for j in range(subspaces):
+            part = slice(j * width, (j + 1) * width)
+            codebooks[j] = _kmeans(sample[:, part], clusters, seed=j)
+            for start in range(0, n, SCAN_BLOCK_ROWS):
+                block = full[start:start + SCAN_BLOCK_ROWS, part]
+                distances = -2 * block @ codebooks[j].T + (codebooks[j] ** 2).sum(axis=1)
+                codes[start:start + SCAN_BLOCK_ROWS, j] = distances.argmin(axis=1)
+        return codes, {"codebooks": codebooks}
+
+    def __len__(self) -> int:
+        return self.codes.shape[0]
+
+    @property
+    def dim(self) -> int:
+        """벡터 차원"""
+        if self.codec == "pq":
+            codebooks = self.params["codebooks"]
+            return codebooks.shape[0] * codebooks.shape[2]
+        return self.codes.shape[1]
+
+    def memory_bytes(self) -> int:
+        """검색에 상주하는 메모리 (코드 + 복원 파라미터, mmap 원본 제외)"""
+        resident = self.codes.nbytes + sum(param.nbytes for param in self.params.values())
+        if self.full is not None and not isinstance(self.full, np.memmap):
+            resident += self.full.nbytes
+        return resident
+
+    def approximate_scores(self, queries: np.ndarray) -> np.ndarray:
+        """
+        압축 코드로 계산한 근사 코사인 유사도
+
+        Args:
+            queries: 정규화된 쿼리 행렬 (m, d)
+
+        Returns:
+            (m, n) 근사 유사도
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        scores = np.empty((queries.shape[0], len(self)), dtype=np.float32)
+        if self.codec == "pq":
+            # 부분 공간별 (쿼리 조각 · 중심) 표를 만든 뒤 코드로 찾아 더함 (비대칭 거리 계산)
+            codebooks = self.params["codebooks"]
+            subspaces, _, width = codebooks.shape
+            tables = np.einsum("qmw,mkw->qmk", queries.reshape(-1, subspaces, width), codebooks)
+            for start in range(0, len(self), SCAN_BLOCK_ROWS):
+                block = self.codes[start:start + SCAN_BLOCK_ROWS]
+                block_scores = scores[:, start:start + len(block)]
+                block_scores[:] = 0.0
+                for j in range(subspaces):
+                    block_scores += tables[:, j, block[:, j]]
+            return scores
+
+        if self.codec == "int8":
+            # v ≈ code * scale + offset → q·v = (q * scale)·code + q·offset
+            weights = queries * self.params["scale"]
+            bias = queries @ self.params["offset"]
+        else:
+            weights, bias = queries, 0.0
+        for start in range(0, len(self), SCAN_BLOCK_ROWS):
+            block = self.codes[start:start + SCAN_BLOCK_ROWS].astype(np.float32)
+            scores[:, start:start + len(block)] = weights @ block.T
+        scores += np.asarray(bias, dtype=np.float32).reshape(-1, 1)
+        return scores
+
+    def topk(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        상위 k개 검색 (근사 점수 상위 rescore개를 float32로 다시 계산)
+
+        Args:
+            queries: 정규화된 쿼리 행렬 (m, d)
+            k: 반환할 상위 개수 (1 ≤ k ≤ 행 수)
+
+        Returns:
+            (인덱스, 유사도) - 각각 (m, k), 유사도 내림차순
+        """
+        scores = self.approximate_scores(queries)
+        candidates = min(len(self), max(k, self.rescore)) if self.full is not None else k
+        top = np.argpartition(-scores, candidates - 1, axis=1)[:, :candidates]
+        if self.full is not None:
+            # 후보 행만 원본에서 읽어 정확한 점수 계산 (mmap이면 해당 페이지만 읽음)
+            top.sort(axis=1)
+            top_scores = np.einsum("mcd,md->mc", np.asarray(self.full[top.ravel()]).reshape(
+                top.shape[0], candidates, -1), queries)
+        else:
+            top_scores = np.take_along_axis(scores, top, axis=1)
+
+        best = np.argpartition(-top_scores, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(top, best, axis=1)
+        top_scores = np.take_along_axis(top_scores, best, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+    def save(self, path: str):
+        """
+        저장 (코드 / 파라미터는 pickle, 재계산용 원본은 mmap으로 열 수 있게 {path}.full.npy)
+
+        Args:
+            path: 저장 경로
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.full is not None:
+            tmp_full = f"{path}.full.tmp.npy"
+            np.save(tmp_full, np.asarray(self.full))
+            os.replace(tmp_full, f"{path}.full.npy")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"codec": self.codec, "codes": self.codes, "params": self.params,
+                         "rescore": self.rescore, "has_full": self.full is not None},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        logger.info(f"💾 {self.codec} 벡터 저장소 저장: {len(self)}개, "
+                    f"{self.memory_bytes() / 1024 ** 2:.1f}MB ({path})")
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> Optional["QuantizedVectorStore"]:
+        """
+        저장소 로드 (없으면 None)
+
+        Args:
+            path: 저장 경로
+            mmap: 재계산용 원본을 메모리에 올리지 않고 mmap으로 열지 여부
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                saved = pickle.load(f)
+            full = None
+            if saved["has_full"]:
+                full = np.load(f"{path}.full.npy", mmap_mode="r" if mmap else None)
+            return cls(saved["codec"], saved["codes"], saved["params"], full, saved["rescore"])
+        except (OSError, KeyError, ValueError, pickle.UnpicklingError, EOFError) as e:
+            logger.error(f"벡터 저장소 로드 실패: {e}")
+            return None
+
+
+def measure_recall(vectors: np.ndarray, store: QuantizedVectorStore, queries: np.ndarray,
+                   k: int = 10) -> float:
+    """
+    float32 전체 검색 대비 상위 k개 재현율
+
+    Args:
+        vectors: 원본 임베딩 (n, d)
+        store: 평가할 저장소 (같은 행 순서)
+        queries: 쿼리 행렬 (m, d)
+        k: 비교할 상위 개수
+
+    Returns:
+        평균 재현율 (0~1)
+    """
+    queries = normalize_rows(queries)
+    exact = normalize_rows(vectors) @ queries.T
+    expected = np.argpartition(-exact.T, k - 1, axis=1)[:, :k]
+    actual, _ = store.topk(queries, k)
+    overlaps = [len(np.intersect1d(e, a)) for e, a in zip(expected, actual)]
+    return float(np.mean(overlaps) / k)
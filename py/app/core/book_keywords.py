@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+도서 키워드 일괄 추출
+- 전체 도서 설명에 대한 희소 TF-IDF (한 번의 행렬 연산으로 모든 도서의 상위 키워드 선정)
+- 학습된 어휘 / IDF 디스크 보관 (단일 텍스트 키워드 추출에 재사용)
+- tb_books_keyword 일괄 저장
+"""
+
+import os
+import pickle
+import hashlib
+import threading
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from .keyword_extraction import KeywordExtractor, _identity
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = os.getenv("BOOK_KEYWORD_MODEL_PATH", os.path.join("cache", "book_tfidf.pkl"))
+DEFAULT_BOOK_MEMO_PATH = os.path.join("cache", "book_nouns.pkl")
+
+
+def top_terms_per_row(matrix, vocabulary: np.ndarray, top_k: int) -> List[List[str]]:
+    """
+    CSR 행렬의 행별 상위 top_k 항목 (행 반복 없이 한 번의 정렬로 처리)
+
+    Args:
+        matrix: 문서 × 단어 TF-IDF 행렬 (CSR)
+        vocabulary: 열 인덱스별 단어
+        top_k: 행별 항목 수
+
+    Returns:
+        행별 단어 리스트 (점수 내림차순)
+    """
+    matrix = matrix.tocsr()
+    n_rows = matrix.shape[0]
+    row_lengths = np.diff(matrix.indptr)
+    rows = np.repeat(np.arange(n_rows), row_lengths)
+
+    # 행 오름차순 → 점수 내림차순 정렬 후 행 안에서의 순위가 top_k 미만인 항목만 선택
+    order = np.lexsort((-matrix.data, rows))
+    sorted_rows = rows[order]
+    rank = np.arange(len(order)) - matrix.indptr[sorted_rows]
+    keep = order[rank < top_k]
+
+    terms = vocabulary[matrix.indices[keep]]
+    boundaries = np.searchsorted(rows[keep], np.arange(n_rows + 1))
+    return [terms[boundaries[row]:boundaries[row + 1]].tolist() for row in range(n_rows)]
+
+
+class BookKeywordExtractor:
+    """도서 설명 TF-IDF 키워드 추출기"""
+
+    def __init__(self, model_path: str = DEFAULT_MODEL_PATH, top_k: int = 10,
+                 analyzer: Optional[str] = None, memo_path: str = DEFAULT_BOOK_MEMO_PATH,
+                 max_df: float = 0.5, min_df: int = 1):
+        """
+        Args:
+            model_path: 학습된 어휘 / IDF 저장 경로
+            top_k: 도서별 키워드 수
+            analyzer: 명사 추출기 (okt / regex / auto, 기본값: KEYWORD_ANALYZER 환경변수)
+            memo_path: 도서 설명별 명사 메모 저장 경로
+            max_df: 이 비율보다 많은 도서에 나오는 단어는 제외
+            min_df: 최소 등장 도서 수
+        """
+        self.model_path = model_path
+        self.top_k = top_k
+        self.max_df = max_df
+        self.min_df = min_df
+        # 도서 설명은 뉴스 배경 말뭉치와 무관하므로 명사 추출 / 메모만 사용
+        self.nouns = KeywordExtractor(analyzer=analyzer, memo_path=memo_path, corpus_path=None)
+        self._lock = threading.Lock()
+        self.vectorizer: Optional[TfidfVectorizer] = None
+        self.metadata: Dict[str, Any] = {}
+        self._vocabulary: Optional[np.ndarray] = None
+        self._load()
+
+    @property
+    def is_fitted(self) -> bool:
+        """학습된 어휘 / IDF 보유 여부"""
+        return self.vectorizer is not None
+
+    def _load(self):
+        if not os.path.exists(self.model_path):
+            return
+        try:
+            with open(self.model_path, "rb") as f:
+                saved = pickle.load(f)
+            self.vectorizer = saved["vectorizer"]
+            self.metadata = saved["metadata"]
+            self._vocabulary = self.vectorizer.get_feature_names_out()
+            logger.info(f"📂 도서 TF-IDF 로드 완료: 어휘 {len(self._vocabulary)}개")
+        except (OSError, KeyError, pickle.UnpicklingError, EOFError) as e:
+            logger.error(f"도서 TF-IDF 로드 실패: {e}")
+
+    def _save(self):
+        directory = os.path.dirname(self.model_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.model_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"vectorizer": self.vectorizer, "metadata": self.metadata},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.model_path)
+
+    @staticmethod
+    def catalogue_hash(isbns: List[str]) -> str:
+        """도서 목록 해시 (어휘 재학습 필요 여부 판단용)"""
+        return hashlib.sha1("\n".join(isbns).encode("utf-8")).hexdigest()
+
+    def fit_transform(self, descriptions: List[str], catalogue_hash: Optional[str] = None):
+        """
+        전체 도서 설명으로 어휘 / IDF 학습 후 저장
+
+        Returns:
+            도서 × 단어 TF-IDF 행렬
+        """
+        docs = self.nouns.nouns(descriptions)
+        vectorizer = TfidfVectorizer(analyzer=_identity, sublinear_tf=True,
+                                     max_df=self.max_df if len(docs) > 1 else 1.0,
+                                     min_df=self.min_df)
+        matrix = vectorizer.fit_transform(docs)
+        with self._lock:
+            self.vectorizer = vectorizer
+            self._vocabulary = vectorizer.get_feature_names_out()
+            self.metadata = {
+                "documents": len(docs),
+                "vocabulary_size": len(self._vocabulary),
+                "catalogue_hash": catalogue_hash,
+                "fitted_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._save()
+        logger.info(f"✅ 도서 TF-IDF 학습 완료: 도서 {len(docs)}권, 어휘 {len(self._vocabulary)}개")
+        return matrix
+
+    def extract(self, descriptions: List[str], top_k: Optional[int] = None) -> List[List[str]]:
+        """
+        학습된 어휘 / IDF로 여러 텍스트의 키워드를 한 번에 추출
+
+        Args:
+            descriptions: 텍스트 리스트
+            top_k: 텍스트별 키워드 수 (기본값: 생성 시 top_k)
+
+        Returns:
+            텍스트별 키워드 리스트
+        """
+        if not self.is_fitted:
+            raise RuntimeError("도서 TF-IDF가 학습되지 않았습니다. fit_transform()을 먼저 실행하세요.")
+        matrix = self.vectorizer.transform(self.nouns.nouns(descriptions))
+        return top_terms_per_row(matrix, self._vocabulary, top_k or self.top_k)
+
+    def build_books_keywords(self, db, refit: bool = False) -> Dict[str, List[str]]:
+        """
+        전체 도서 키워드를 계산하여 tb_books_keyword에 일괄 저장
+
+        도서 목록이 바뀌었거나 refit이면 어휘 / IDF를 다시 학습합니다.
+
+        Args:
+            db: PostgreSQLDatabase 인스턴스
+            refit: 저장된 어휘 / IDF가 있어도 다시 학습할지 여부
+
+        Returns:
+            ISBN별 키워드 딕셔너리
+        """
+        books = db.fetch_query("""
+            SELECT books_isbn, books_description
+            FROM tb_books
+            WHERE books_description IS NOT NULL AND books_description != ''
+            ORDER BY books_isbn
+        """)
+        isbns = [book[0] for book in books]
+        descriptions = [book[1] for book in books]
+        current_hash = self.catalogue_hash(isbns)
+
+        if refit or not self.is_fitted or self.metadata.get("catalogue_hash") != current_hash:
+            matrix = self.fit_transform(descriptions, current_hash)
+        else:
+            matrix = self.vectorizer.transform(self.nouns.nouns(descriptions))
+        keywords = top_terms_per_row(matrix, self._vocabulary, self.top_k)
+        # 메모는 현재 카탈로그 설명만 보관 (크기 상한이 카탈로그보다 작으면 매번 앞쪽 도서를 다시 분석)
+        self.nouns.max_memo_size = max(self.nouns.max_memo_size, len(descriptions))
+        self.nouns.prune_memo(descriptions)
+        self.nouns.save_memo()
+
+        isbn_tokens = {isbn: terms for isbn, terms in zip(isbns, keywords) if terms}
+        if not db.replace_books_keywords(isbn_tokens):
+            raise RuntimeError("도서 키워드 저장 실패")
+        logger.info(f"💾 도서 키워드 저장 완료: {len(isbn_tokens)}권, "
+                    f"{sum(len(terms) for terms in isbn_tokens.values())}개")
+        return isbn_tokens
+
+    def close(self):
+        """명사 추출 프로세스 풀 종료"""
+        self.nouns.close()
+
+
+_book_keyword_extractor: Optional[BookKeywordExtractor] = None
+_extractor_lock = threading.Lock()
+
+
+def get_book_keyword_extractor() -> BookKeywordExtractor:
+    """전역 도서 키워드 추출기 (저장된 어휘 / IDF 공유)"""
+    global _book_keyword_extractor
+    with _extractor_lock:
+        if _book_keyword_extractor is None:
+            _book_keyword_extractor = BookKeywordExtractor()
+        return _book_keyword_extractor
@@ -1,50 +1,41 @@
-import requests
-from bs4 import BeautifulSoup
-from collections import Counter
-from .database import PostgreSQLDatabase
+from .async_crawler import AsyncCrawler
+from .html_extract import get_extractor
+from .http_cache import HttpCache
+from .news_sources import NewsSource, get_sources
+from .tracing import span
 
 class Crowling:
     
-    def __init__(self):
-        self.sections = {
-            "politics": [
-                "https://www.joongang.co.kr/politics",
-                "https://www.joongang.co.kr/politics?page=2",
-                "https://www.joongang.co.kr/politics?page=3"
-            ],
-            "sports": [
-                "https://www.joongang.co.kr/sports",
-                "https://www.joongang.co.kr/sports?page=2",
-                "https://www.joongang.co.kr/sports?page=3"
-            ],
-            "economic": [
-                "https://www.joongang.co.kr/money",
-                "https://www.joongang.co.kr/money?page=2",
-                "https://www.joongang.co.kr/money?page=3"
-            ],
-            "society": [
-                "https://www.joongang.co.kr/society",
-                "https://www.joongang.co.kr/society?page=2",
-                "https://www.joongang.co.kr/society?page=3"
-            ],
-            "world": [
-                "https://www.joongang.co.kr/world",
-                "https://www.joongang.co.kr/world?page=2",
-                "https://www.joongang.co.kr/world?page=3"
-            ],
-        }
+    def __init__(self, sections=None, crawler=None, http_cache=None, use_cache=True, parser=None,
+                 sources=None):
+        # 모든 섹션 페이지는 하나의 연결 풀을 공유하는 비동기 크롤러로 동시에 수집
+        self.crawler = crawler or AsyncCrawler()
+        # 조건부 요청 + 본문 해시로 변경 없는 페이지는 파싱 생략
+        self.http_cache = http_cache or (HttpCache() if use_cache else None)
+        # 헤드라인 추출 백엔드 (selectolax → lxml → BeautifulSoup 순으로 자동 선택)
+        self.extract_headlines = get_extractor(parser)
+        # 마지막 get_news_titles() 실행에서 내용이 바뀐 섹션
+        self.changed_sections = set()
+        # 뉴스 소스 (sections를 직접 넘기면 단일 임시 소스로 취급)
+        if sources is None:
+            sources = [NewsSource("custom", sections, parser=parser)] if sections else get_sources()
+        self.sources = sources
+        # 카테고리별 전체 소스 URL
+        self.sections = {}
+        for source in self.sources:
+            for section, urls in source.sections.items():
+                self.sections.setdefault(section, []).extend(urls)
     
     def scrape_h2_text(self, url):
         """URL에서 <h2> 태그의 텍스트를 스크래핑"""
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"❌ {url} 에서 데이터를 가져오는 중 오류 발생: {e}")
+        html = self.crawler.fetch_all_sync([url]).get(url)
+        if html is None:
             return []
-        soup = BeautifulSoup(response.text, 'html.parser')
-        h2_tags = soup.find_all('h2')
-        return [tag.get_text(strip=True) for tag in h2_tags]
+        return self.parse_h2_text(html)
+    
+    def parse_h2_text(self, html):
+        """HTML에서 <h2> 태그의 텍스트 추출"""
+        return self.extract_headlines(html, 'h2')
 
     def joongang(self):
         """기존 호환성을 위한 메서드 (사용되지 않음)"""
@@ -54,34 +45,96 @@ class Crowling:
     def get_news_titles(self):
         """뉴스 제목을 그대로 반환 (BERT 시스템용)"""
         news_titles = {}
+        self.changed_sections = set()
+        
+        # 전체 소스 / 섹션 페이지를 한 번에 동시 수집 (도메인별 동시 요청 수 / 간격 제한)
+        all_urls = [url for urls in self.sections.values() for url in urls]
+        request_headers = {}
+        if self.http_cache:
+            request_headers = {url: self.http_cache.conditional_headers(url) for url in all_urls}
+        with span("crawl.fetch", urls=len(all_urls)) as fetch_span:
+            pages = self.crawler.fetch_pages_sync(all_urls, request_headers, self._host_limits())
+            fetch_span.set(fetched=sum(1 for page in pages.values() if page is not None))
+        
+        for source in self.sources:
+            source_count = 0
+            for section, urls in source.sections.items():
+                titles = news_titles.setdefault(section, [])
+                with span("crawl.section", source=source.name, section=section, pages=len(urls)) as section_span:
+                    before = len(titles)
+                    for url in urls:
+                        h2_texts, changed = self._page_titles(url, pages.get(url), source.extract)
+                        if changed:
+                            self.changed_sections.add(section)
+                        # 빈 제목 제거 및 필터링
+                        filtered_titles = [title for title in h2_texts if title and len(title.strip()) > 5]
+                        titles.extend(filtered_titles)
+                        source_count += len(filtered_titles)
+                    section_span.set(titles=len(titles) - before, changed=section in self.changed_sections)
+            if len(self.sources) > 1:
+                print(f"📰 {source.name}: {source_count}개 제목")
+        
+        # 여러 소스에 같은 제목이 있으면 한 번만 사용 (순서 유지)
+        if len(self.sources) > 1:
+            news_titles = {section: list(dict.fromkeys(titles)) for section, titles in news_titles.items()}
         
-        for section, urls in self.sections.items():
-            news_titles[section] = []
-            for url in urls:
-                h2_texts = self.scrape_h2_text(url)
-                # 빈 제목 제거 및 필터링
-                filtered_titles = [title for title in h2_texts if title and len(title.strip()) > 5]
-                news_titles[section].extend(filtered_titles)
+        if self.http_cache:
+            self.http_cache.save()
+            unchanged = set(self.sections) - self.changed_sections
+            if unchanged:
+                print(f"⏭️ 변경 없는 섹션: {', '.join(sorted(unchanged))}")
         
         return news_titles
     
-    def wordExtraction(self):
-        newsData = {}
-
-        # 각 섹션별 단어 추출
-        for section, h2_texts in self.joongang().items():
-            words = []
-            for text in h2_texts:
-                if isinstance(text, list):
-                    words.extend(text)
-                else:
-                    words.extend(text.split())
-
-            # 섹션별 단어 개수 집계
-            word_counts = Counter(words)
-            top_10_words = [word for word, _ in word_counts.most_common(10)]
-
-            # 섹션별 top 10 키워드 저장
-            newsData[section] = top_10_words
+    def _host_limits(self):
+        """도메인별 (동시 요청 수, 최소 요청 간격) - 여러 소스가 같은 도메인이면 더 보수적인 값"""
+        limits = {}
+        for source in self.sources:
+            source_concurrency = source.max_concurrency or self.crawler.max_per_host
+            for domain in source.domains:
+                concurrency, interval = limits.get(domain, (source_concurrency, source.min_interval))
+                limits[domain] = (min(concurrency, source_concurrency),
+                                  max(interval, source.min_interval))
+        return limits
+    
+    def _page_titles(self, url, page, extract=None):
+        """
+        페이지 제목 목록과 변경 여부 반환
+        
+        - 304 응답 또는 본문 해시가 같으면 캐시된 제목 사용 (파싱 생략)
+        - 조회 실패 시 캐시된 제목이 있으면 사용
+        """
+        extract = extract or self.parse_h2_text
+        cached = self.http_cache.get(url) if self.http_cache else None
+        
+        if page is None:
+            return (cached["titles"], False) if cached else ([], False)
+        
+        if page.not_modified and cached:
+            self.http_cache.touch(url, page.etag, page.last_modified)
+            return cached["titles"], False
+        
+        if page.text is None:
+            return [], True
+        
+        if self.http_cache is None:
+            return extract(page.text), True
+        
+        body_hash = HttpCache.hash_body(page.text)
+        if cached and cached.get("body_hash") == body_hash:
+            self.http_cache.touch(url, page.etag, page.last_modified)
+            return cached["titles"], False
+        
+        titles = extract(page.text)
+        self.http_cache.update(url, body_hash, titles, page.etag, page.last_modified)
+        return titles, True
+    
+    def wordExtraction(self, top_k=None):
+        """섹션별 뉴스 제목 키워드 추출 (명사 + TF-IDF, 배경 말뭉치는 파이프라인 keywords 단계만 기록)"""
+        from .keyword_extraction import KeywordExtractor
 
-        return newsData
\ No newline at end of file
+        extractor = KeywordExtractor(top_k=top_k)
+        try:
+            return extractor.extract(self.get_news_titles(), record=False)
+        finally:
+            extractor.close()
@@ -22,6 +22,9 @@ from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 from dotenv import load_dotenv
 
+from .metrics import DB_POOL_WAIT, DB_QUERY_DURATION, DB_QUERY_ERRORS, statement_name
+from .query_stats import get_query_stats
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -89,7 +92,9 @@ class PostgreSQLDatabase:
     def get_connection(self):
         """데이터베이스 연결 컨텍스트 매니저"""
         if self.use_pool and self.pool:
+            wait_start = time.perf_counter()
             conn = self.pool.getconn()
+            DB_POOL_WAIT.observe(time.perf_counter() - wait_start)
             try:
                 yield conn
             finally:
@@ -113,18 +118,20 @@ class PostgreSQLDatabase:
                 self.conn = None
                 self.cursor = None
     
-    def fetch_query(self, query: str, params: Optional[Tuple] = None) -> List[Tuple]:
+    def fetch_query(self, query: str, params: Optional[Tuple] = None, name: Optional[str] = None) -> List[Tuple]:
         """
         쿼리 실행 및 결과 조회
         
         Args:
             query: SQL 쿼리
             params: 쿼리 파라미터
+            name: 메트릭 문장 이름 (기본값: 쿼리에서 추출한 동사:테이블)
             
         Returns:
             쿼리 결과 리스트
         """
-        start_time = time.time()
+        statement = name or statement_name(query)
+        start_time = time.perf_counter()
         
         try:
             if self.use_pool and self.pool:
@@ -143,38 +150,46 @@ class PostgreSQLDatabase:
                 result = self.cursor.fetchall()
                 self.conn.commit()
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
+            DB_QUERY_DURATION.labels(statement).observe(execution_time)
+            get_query_stats().record(query, execution_time, len(result),
+                                     explain=lambda: self._explain(query, params))
             logger.debug(f"📊 쿼리 실행 완료: {execution_time:.3f}초")
             
             return result
             
         except psycopg2.Error as err:
+            self._record_failure(query, statement, start_time, err)
             logger.error(f"❌ 데이터 조회 실패: {err}")
             if self.conn and not self.conn.closed:
                 self.conn.rollback()
             return []
         except Exception as e:
+            self._record_failure(query, statement, start_time, e)
             logger.error(f"❌ 예상치 못한 오류: {e}")
             return []
     
-    def execute_query(self, query: str, params: Optional[Tuple] = None) -> bool:
+    def execute_query(self, query: str, params: Optional[Tuple] = None, name: Optional[str] = None) -> bool:
         """
         쿼리 실행 (INSERT, UPDATE, DELETE)
         
         Args:
             query: SQL 쿼리
             params: 쿼리 파라미터
+            name: 메트릭 문장 이름 (기본값: 쿼리에서 추출한 동사:테이블)
             
         Returns:
             실행 성공 여부
         """
-        start_time = time.time()
+        statement = name or statement_name(query)
+        start_time = time.perf_counter()
         
         try:
             if self.use_pool and self.pool:
                 with self.get_connection() as conn:
                     with conn.cursor() as cursor:
                         cursor.execute(query, params or ())
+                        rows = cursor.rowcount
                         conn.commit()
             else:
                 self.ensure_connection()
@@ -183,40 +198,48 @@ class PostgreSQLDatabase:
                     return False
                 
                 self.cursor.execute(query, params or ())
+                rows = self.cursor.rowcount
                 self.conn.commit()
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
+            DB_QUERY_DURATION.labels(statement).observe(execution_time)
+            get_query_stats().record(query, execution_time, rows)
             logger.debug(f"✅ 쿼리 실행 완료: {execution_time:.3f}초")
             
             return True
             
         except psycopg2.Error as err:
+            self._record_failure(query, statement, start_time, err)
             logger.error(f"❌ 쿼리 실행 실패: {err}")
             if self.conn and not self.conn.closed:
                 self.conn.rollback()
             return False
         except Exception as e:
+            self._record_failure(query, statement, start_time, e)
             logger.error(f"❌ 예상치 못한 오류: {e}")
             return False
     
-    def execute_many(self, query: str, params_list: List[Tuple]) -> bool:
+    def execute_many(self, query: str, params_list: List[Tuple], name: Optional[str] = None) -> bool:
         """
         여러 쿼리 일괄 실행
         
         Args:
             query: SQL 쿼리
             params_list: 파라미터 리스트
+            name: 메트릭 문장 이름 (기본값: 쿼리에서 추출한 동사:테이블)
             
         Returns:
             실행 성공 여부
         """
-        start_time = time.time()
+        statement = name or statement_name(query)
+        start_time = time.perf_counter()
         
         try:
             if self.use_pool and self.pool:
                 with self.get_connection() as conn:
                     with conn.cursor() as cursor:
                         cursor.executemany(query, params_list)
+                        rows = cursor.rowcount
                         conn.commit()
             else:
                 self.ensure_connection()
@@ -225,22 +248,130 @@ class PostgreSQLDatabase:
                     return False
                 
                 self.cursor.executemany(query, params_list)
+                rows = self.cursor.rowcount
                 self.conn.commit()
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
+            DB_QUERY_DURATION.labels(statement).observe(execution_time)
+            get_query_stats().record(query, execution_time, rows)
             logger.info(f"✅ 일괄 쿼리 실행 완료: {len(params_list)}개, {execution_time:.3f}초")
             
             return True
             
         except psycopg2.Error as err:
+            self._record_failure(query, statement, start_time, err)
             logger.error(f"❌ 일괄 쿼리 실행 실패: {err}")
             if self.conn and not self.conn.closed:
                 self.conn.rollback()
             return False
         except Exception as e:
+            self._record_failure(query, statement, start_time, e)
             logger.error(f"❌ 예상치 못한 오류: {e}")
             return False
     
+    def execute_transaction(self, steps: List[Tuple[str, Optional[List[Tuple]]]],
+                            name: Optional[str] = None) -> bool:
+        """
+        여러 쿼리를 한 연결, 한 트랜잭션에서 실행 (모두 성공해야 커밋, 하나라도 실패하면 롤백)
+        
+        Args:
+            steps: (SQL 쿼리, 파라미터 리스트) 목록 - 파라미터 리스트가 None이면 파라미터 없이 한 번 실행
+            name: 메트릭 문장 이름 (기본값: 첫 쿼리에서 추출한 동사:테이블)
+            
+        Returns:
+            실행 성공 여부
+        """
+        query = ";\n".join(step_query.strip() for step_query, _ in steps)
+        statement = name or statement_name(steps[0][0])
+        start_time = time.perf_counter()
+        
+        def run(cursor) -> int:
+            rows = 0
+            for step_query, params_list in steps:
+                if params_list is None:
+                    cursor.execute(step_query)
+                else:
+                    cursor.executemany(step_query, params_list)
+                rows += max(cursor.rowcount, 0)
+            return rows
+        
+        try:
+            if self.use_pool and self.pool:
+                with self.get_connection() as conn:
+                    try:
+                        with conn.cursor() as cursor:
+                            rows = run(cursor)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+            else:
+                self.ensure_connection()
+                if not self.conn or not self.cursor:
+                    logger.error("❌ 데이터베이스 연결 실패")
+                    return False
+                
+                try:
+                    rows = run(self.cursor)
+                    self.conn.commit()
+                except Exception:
+                    if not self.conn.closed:
+                        self.conn.rollback()
+                    raise
+            
+            execution_time = time.perf_counter() - start_time
+            DB_QUERY_DURATION.labels(statement).observe(execution_time)
+            get_query_stats().record(query, execution_time, rows)
+            logger.info(f"✅ 트랜잭션 실행 완료: {len(steps)}개 쿼리, {execution_time:.3f}초")
+            
+            return True
+            
+        except psycopg2.Error as err:
+            self._record_failure(query, statement, start_time, err)
+            logger.error(f"❌ 트랜잭션 실행 실패 (롤백): {err}")
+            return False
+        except Exception as e:
+            self._record_failure(query, statement, start_time, e)
+            logger.error(f"❌ 예상치 못한 오류 (롤백): {e}")
+            return False
+    
+    @staticmethod
+    def _record_failure(query: str, statement: str, start_time: float, error: Exception):
+        """실패한 쿼리 메트릭 / 통계 기록"""
+        DB_QUERY_ERRORS.labels(statement).inc()
+        get_query_stats().record(query, time.perf_counter() - start_time, error=str(error))
+    
+    def _explain(self, query: str, params: Optional[Tuple] = None) -> Optional[str]:
+        """
+        느린 조회 쿼리의 실행 계획 (EXPLAIN (ANALYZE, BUFFERS) - 쿼리를 한 번 더 실행)
+        
+        Args:
+            query: SELECT 쿼리
+            params: 쿼리 파라미터
+            
+        Returns:
+            실행 계획 텍스트 (연결이 없으면 None)
+        """
+        explain_query = "EXPLAIN (ANALYZE, BUFFERS) " + query
+        if self.use_pool and self.pool:
+            with self.get_connection() as conn:
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute(explain_query, params or ())
+                        plan = cursor.fetchall()
+                finally:
+                    conn.rollback()
+        elif self.conn and not self.conn.closed:
+            try:
+                with self.conn.cursor() as cursor:
+                    cursor.execute(explain_query, params or ())
+                    plan = cursor.fetchall()
+            finally:
+                self.conn.rollback()
+        else:
+            return None
+        return "\n".join(row[0] for row in plan)
+    
     def insert_top_keywords(self, newsData: Dict[str, List[str]]) -> bool:
         """
         뉴스 키워드를 데이터베이스에 저장
@@ -288,6 +419,27 @@ class PostgreSQLDatabase:
         
         return self.execute_many(query, data)
     
+    def replace_books_keywords(self, isbn_tokens: Dict[str, List[str]]) -> bool:
+        """
+        책 키워드 전체 교체 (삭제 + 일괄 저장을 한 트랜잭션으로 - 실패하면 기존 키워드 유지)
+        
+        Args:
+            isbn_tokens: ISBN별 키워드 딕셔너리
+            
+        Returns:
+            교체 성공 여부
+        """
+        query = """
+            INSERT INTO tb_books_keyword (books_isbn, books_keyword) 
+            VALUES (%s, %s)
+        """
+        data = [(isbn, token) for isbn, tokens in isbn_tokens.items() for token in tokens]
+        # TRUNCATE 대신 DELETE - 커밋 전까지 다른 연결은 기존 키워드를 그대로 조회
+        return self.execute_transaction(
+            [("DELETE FROM tb_books_keyword", None), (query, data)],
+            name="replace:tb_books_keyword"
+        )
+    
     def fetch_books_keywords(self) -> List[Tuple]:
         """책 키워드 조회"""
         query = "SELECT books_isbn, books_keyword FROM tb_books_keyword"
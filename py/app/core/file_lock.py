@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+프로세스 간 배타 잠금
+- 여러 uvicorn 워커 / 스크립트가 같은 작업을 동시에 실행하지 않도록 flock 사용
+- 잠금을 잡지 못하면 기다리지 않고 바로 실패 (LOCK_NB)
+- 프로세스가 죽으면 OS가 잠금을 자동 해제
+"""
+
+import os
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def exclusive_lock(path: str) -> Iterator[bool]:
+    """
+    비차단 배타 잠금
+
+    Args:
+        path: 잠금 파일 경로 (없으면 생성)
+
+    Yields:
+        잠금을 잡았는지 여부 (fcntl이 없는 OS에서는 항상 True)
+    """
+    if fcntl is None:
+        yield True
+        return
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    lock_file = open(path, "a+")
+    try:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.info(f"🔒 다른 프로세스가 잠금을 보유 중입니다: {path}")
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 헤드라인 중복 제거
+- 문자 n-gram 기반 64비트 SimHash (띄어쓰기/조사 차이에 강한 한국어용 지문)
+- 밴드 인덱스로 해밍 거리 이내 근사 중복 검색
+- 최근 N일 실행의 지문을 디스크에 보관하여 실행 간 중복 제거
+"""
+
+import os
+import re
+import pickle
+import hashlib
+import threading
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = os.getenv("HEADLINE_STORE_PATH", os.path.join("cache", "headlines.pkl"))
+
+FINGERPRINT_BITS = 64
+
+# [속보], (종합) 같은 말머리 / 공백 / 문장부호 제거용
+_PREFIX_PATTERN = re.compile(r"^\s*(\[[^\]]*\]|\([^)]*\)|【[^】]*】)\s*")
+_NON_WORD_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_headline(title: str) -> str:
+    """지문 계산용 제목 정규화 (말머리 / 공백 / 문장부호 제거, 소문자)"""
+    text = title.strip()
+    while True:
+        stripped = _PREFIX_PATTERN.sub("", text, count=1)
+        if stripped == text:
+            break
+        text = stripped
+    return _NON_WORD_PATTERN.sub("", text).lower()
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(title: str, ngram: int = 3) -> int:
+    """
+    제목의 64비트 SimHash
+
+    Args:
+        title: 뉴스 제목
+        ngram: 문자 n-gram 크기
+
+    Returns:
+        64비트 지문 (정수)
+    """
+    text = normalize_headline(title)
+    if len(text) <= ngram:
+        grams = Counter([text])
+    else:
+        grams = Counter(text[i:i + ngram] for i in range(len(text) - ngram + 1))
+
+    weights = [0] * FINGERPRINT_BITS
+    for gram, count in grams.items():
+        value = _feature_hash(gram)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if (value >> bit) & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 해밍 거리"""
+    return bin(a ^ b).count("1")
+
+
+class SimHashIndex:
+    """
+    해밍 거리 검색용 밴드 인덱스
+
+    지문을 (max_distance + 1)개 밴드로 나누면 거리 max_distance 이내인 지문은
+    적어도 한 밴드가 정확히 같으므로 해당 밴드 버킷만 비교하면 됩니다.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = FINGERPRINT_BITS // self.bands
+        self._mask = (1 << self.band_bits) - 1
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(self.bands)]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _band_values(self, fingerprint: int):
+        for band in range(self.bands):
+            yield band, (fingerprint >> (band * self.band_bits)) & self._mask
+
+    def add(self, fingerprint: int):
+        """지문 추가"""
+        for band, value in self._band_values(fingerprint):
+            self._buckets[band].setdefault(value, []).append(fingerprint)
+        self._size += 1
+
+    def find(self, fingerprint: int) -> Optional[int]:
+        """거리 max_distance 이내 지문 검색 (없으면 None)"""
+        for band, value in self._band_values(fingerprint):
+            for candidate in self._buckets[band].get(value, ()):
+                if hamming_distance(fingerprint, candidate) <= self.max_distance:
+                    return candidate
+        return None
+
+
+class HeadlineDeduplicator:
+    """실행 내 / 최근 N일 실행 대비 카테고리별 헤드라인 중복 제거"""
+
+    def __init__(self, store_path: str = DEFAULT_STORE_PATH,
+                 history_days: Optional[int] = None, max_distance: Optional[int] = None):
+        """
+        Args:
+            store_path: 지문 저장 파일 경로
+            history_days: 비교할 과거 실행 기간(일) (기본값: HEADLINE_DEDUP_DAYS 환경변수, 7)
+            max_distance: 근사 중복으로 볼 최대 해밍 거리 (기본값: HEADLINE_DEDUP_DISTANCE 환경변수, 3)
+        """
+        self.store_path = store_path
+        self.history_days = history_days if history_days is not None else int(
+            os.getenv("HEADLINE_DEDUP_DAYS", "7"))
+        self.max_distance = max_distance if max_distance is not None else int(
+            os.getenv("HEADLINE_DEDUP_DISTANCE", "3"))
+        self._lock = threading.Lock()
+        # {run_key: {"date": ISO 날짜, "fingerprints": {category: [지문]}}}
+        self._runs: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.store_path):
+            return {}
+        try:
+            with open(self.store_path, "rb") as f:
+                runs = pickle.load(f)
+            logger.info(f"📂 헤드라인 지문 로드 완료: {len(runs)}회 실행")
+            return runs
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.error(f"헤드라인 지문 로드 실패: {e}")
+            return {}
+
+    def _history_index(self, category: str, run_key: str) -> SimHashIndex:
+        """같은 실행을 제외한 최근 N일 지문 인덱스"""
+        index = SimHashIndex(self.max_distance)
+        cutoff = (datetime.now() - timedelta(days=self.history_days)).date().isoformat()
+        for key, run in self._runs.items():
+            if key == run_key or run["date"] < cutoff:
+                continue
+            for fingerprint in run["fingerprints"].get(category, ()):
+                index.add(fingerprint)
+        return index
+
+    def filter(self, titles_by_category: Dict[str, List[str]], run_key: str) -> Dict[str, Any]:
+        """
+        새 헤드라인만 남기기
+
+        Args:
+            titles_by_category: 카테고리별 뉴스 제목
+            run_key: 실행 식별자 (같은 키로 재실행하면 해당 실행의 지문은 비교에서 제외)
+
+        Returns:
+            {"titles": 새 제목, "unique_titles": 실행 내 중복만 제거한 제목,
+             "fingerprints": 실행 내 고유 제목 지문, "dropped": {category: {"in_run", "history"}}}
+        """
+        result = {"titles": {}, "unique_titles": {}, "fingerprints": {}, "dropped": {}}
+        for category, titles in titles_by_category.items():
+            history = self._history_index(category, run_key)
+            current = SimHashIndex(self.max_distance)
+            new_titles, unique_titles, fingerprints = [], [], []
+            dropped = {"in_run": 0, "history": 0}
+
+            for title in titles:
+                fingerprint = simhash(title)
+                if current.find(fingerprint) is not None:
+                    dropped["in_run"] += 1
+                    continue
+                current.add(fingerprint)
+                unique_titles.append(title)
+                fingerprints.append(fingerprint)
+                if history.find(fingerprint) is not None:
+                    dropped["history"] += 1
+                    continue
+                new_titles.append(title)
+
+            result["titles"][category] = new_titles
+            result["unique_titles"][category] = unique_titles
+            result["fingerprints"][category] = fingerprints
+            result["dropped"][category] = dropped
+        return result
+
+    def record(self, run_key: str, fingerprints: Dict[str, List[int]]):
+        """
+        실행 지문 저장 (기간이 지난 실행은 정리)
+
+        Args:
+            run_key: 실행 식별자
+            fingerprints: 카테고리별 지문 (filter() 결과의 "fingerprints")
+        """
+        with self._lock:
+            self._runs[run_key] = {
+                "date": datetime.now().date().isoformat(),
+                "fingerprints": fingerprints,
+            }
+            cutoff = (datetime.now() - timedelta(days=self.history_days)).date().isoformat()
+            self._runs = {key: run for key, run in self._runs.items() if run["date"] >= cutoff}
+
+            directory = os.path.dirname(self.store_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.store_path}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(self._runs, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.store_path)
+            except OSError as e:
+                logger.error(f"헤드라인 지문 저장 실패: {e}")
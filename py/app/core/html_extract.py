@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 헤드라인 추출기
+- selectolax: C 기반 고속 CSS 추출
+- lxml iterparse: 스트리밍 추출 (처리한 노드는 즉시 해제)
+- BeautifulSoup: 순수 파이썬 폴백
+"""
+
+import os
+import io
+import logging
+from typing import Callable, Dict, List
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 우선순위 순서 (auto 선택 시 설치된 첫 번째 백엔드 사용)
+BACKEND_PRIORITY = ["selectolax", "lxml", "bs4"]
+
+
+def extract_with_selectolax(html: str, tag: str = "h2") -> List[str]:
+    """selectolax(Lexbor)로 태그 텍스트 추출"""
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    return [node.text(deep=True, separator="", strip=True) for node in tree.css(tag)]
+
+
+def extract_with_lxml(html: str, tag: str = "h2") -> List[str]:
+    """lxml iterparse로 태그 텍스트 추출 (전체 DOM을 유지하지 않음)"""
+    from lxml import etree
+
+    texts = []
+    depth = 0  # 대상 태그 내부 깊이 (내부 노드는 대상 태그가 닫힐 때까지 유지)
+    data = html.encode("utf-8") if isinstance(html, str) else html
+    for event, element in etree.iterparse(io.BytesIO(data), events=("start", "end"),
+                                          html=True, recover=True, encoding="utf-8"):
+        if element.tag != tag:
+            if event == "end" and depth == 0:
+                # 처리가 끝난 노드의 하위 트리는 바로 해제
+                element.clear(keep_tail=True)
+            continue
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        texts.append("".join(part.strip() for part in element.itertext()))
+        element.clear(keep_tail=True)
+    return texts
+
+
+def extract_with_bs4(html: str, tag: str = "h2") -> List[str]:
+    """BeautifulSoup(html.parser)으로 태그 텍스트 추출"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    return [node.get_text(strip=True) for node in soup.find_all(tag)]
+
+
+EXTRACTORS: Dict[str, Callable[[str, str], List[str]]] = {
+    "selectolax": extract_with_selectolax,
+    "lxml": extract_with_lxml,
+    "bs4": extract_with_bs4,
+}
+
+
+def _is_available(backend: str) -> bool:
+    module = {"selectolax": "selectolax.lexbor", "lxml": "lxml.etree", "bs4": "bs4"}[backend]
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
+
+def available_backends() -> List[str]:
+    """설치된 파서 백엔드 목록 (우선순위 순)"""
+    return [backend for backend in BACKEND_PRIORITY if _is_available(backend)]
+
+
+def get_extractor(backend: str = None) -> Callable[[str, str], List[str]]:
+    """
+    헤드라인 추출 함수 반환
+
+    Args:
+        backend: selectolax / lxml / bs4 / auto (기본값: CRAWLER_PARSER 환경변수, 없으면 auto)
+
+    Returns:
+        (html, tag) -> 텍스트 리스트 함수
+    """
+    backend = (backend or os.getenv("CRAWLER_PARSER", "auto")).lower()
+    if backend != "auto":
+        if backend not in EXTRACTORS:
+            raise ValueError(f"지원하지 않는 파서 백엔드입니다: {backend}")
+        if _is_available(backend):
+            return EXTRACTORS[backend]
+        logger.warning(f"⚠️ 파서 백엔드를 사용할 수 없어 자동 선택합니다: {backend}")
+
+    for candidate in BACKEND_PRIORITY:
+        if _is_available(candidate):
+            logger.debug(f"HTML 파서 백엔드: {candidate}")
+            return EXTRACTORS[candidate]
+    raise ImportError("사용 가능한 HTML 파서가 없습니다. (selectolax, lxml, beautifulsoup4)")
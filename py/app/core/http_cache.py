@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+크롤러용 디스크 HTTP 캐시
+- ETag / Last-Modified 저장 및 조건부 요청 헤더 생성
+- 본문 해시 비교로 변경 없는 페이지 파싱 생략
+- 페이지별 파싱 결과(제목 목록) 보관
+"""
+
+import os
+import json
+import hashlib
+import threading
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_CACHE_DIR = os.getenv("CRAWLER_CACHE_DIR", os.path.join("cache", "http"))
+
+
+class HttpCache:
+    """URL 단위 조건부 요청 캐시 (JSON 인덱스 파일 1개)"""
+
+    def __init__(self, cache_dir: str = DEFAULT_HTTP_CACHE_DIR):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+        """
+        self.cache_dir = cache_dir
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def hash_body(body: str) -> str:
+        """본문 해시"""
+        return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+    def _load(self):
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+            logger.info(f"📂 HTTP 캐시 로드 완료: {len(self._entries)}개 URL")
+        except (OSError, ValueError) as e:
+            logger.error(f"HTTP 캐시 로드 실패: {e}")
+            self._entries = {}
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """URL 캐시 항목 조회"""
+        return self._entries.get(url)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """저장된 검증자로 조건부 요청 헤더 생성"""
+        entry = self._entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, url: str, body_hash: str, titles: List[str],
+               etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """페이지 조회 결과 저장"""
+        with self._lock:
+            self._entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "body_hash": body_hash,
+                "titles": titles,
+                "fetched_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._dirty = True
+
+    def touch(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """변경 없는 페이지의 확인 시각 / 검증자 갱신"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return
+            if etag:
+                entry["etag"] = etag
+            if last_modified:
+                entry["last_modified"] = last_modified
+            entry["fetched_at"] = datetime.now().isoformat(timespec="seconds")
+            self._dirty = True
+
+    def save(self):
+        """인덱스 파일 저장 (변경된 경우에만)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = f"{self.index_file}.tmp"
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f, ensure_ascii=False)
+                os.replace(tmp_file, self.index_file)
+                self._dirty = False
+            except OSError as e:
+                logger.error(f"HTTP 캐시 저장 실패: {e}")
+
+    def clear(self):
+        """캐시 초기화"""
+        with self._lock:
+            self._entries = {}
+            self._dirty = False
+        if os.path.exists(self.index_file):
+            os.remove(self.index_file)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+백그라운드 작업 관리
+- 일일 크롤링 + 추천 작업을 서버 시작과 분리
+- 작업 진행 상태 조회
+"""
+
+import os
+import time
+import threading
+import logging
+import traceback
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJob:
+    """
+    별도 스레드에서 실행되는 단일 작업
+
+    같은 작업이 동시에 두 번 실행되지 않도록 하고,
+    실행 상태(단계, 시작/종료 시각, 오류)를 기록합니다.
+    """
+
+    def __init__(self, name: str, target: Callable[["BackgroundJob"], Optional[str]],
+                 history_size: int = 10):
+        """
+        Args:
+            name: 작업 이름
+            target: 작업 함수 (job 인스턴스를 받아 단계 보고에 사용, 결과 메시지 반환)
+            history_size: 보관할 과거 실행 기록 수
+        """
+        self.name = name
+        self.target = target
+        self.history_size = history_size
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._state = self._new_state("idle")
+        self._history: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def _new_state(status: str) -> Dict[str, Any]:
+        return {
+            "status": status,
+            "stage": None,
+            "message": None,
+            "started_at": None,
+            "finished_at": None,
+            "duration_sec": None,
+            "error": None,
+            "details": {},
+        }
+
+    def is_running(self) -> bool:
+        """실행 중 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, delay: float = 0.0) -> bool:
+        """
+        작업 시작 (이미 실행 중이면 무시)
+
+        Args:
+            delay: 실행 전 대기 시간(초) - 서버가 요청을 받기 시작한 뒤 실행되도록 사용
+
+        Returns:
+            새로 시작했는지 여부
+        """
+        with self._lock:
+            if self.is_running():
+                logger.info(f"⏭️ 작업이 이미 실행 중입니다: {self.name}")
+                return False
+            self._state = self._new_state("pending")
+            self._thread = threading.Thread(
+                target=self._run, args=(delay,), name=f"job-{self.name}", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def set_stage(self, stage: str, message: Optional[str] = None):
+        """현재 진행 단계 보고"""
+        with self._lock:
+            self._state["stage"] = stage
+            self._state["message"] = message
+        logger.info(f"▶️ [{self.name}] {stage}" + (f": {message}" if message else ""))
+
+    def set_details(self, **details: Any):
+        """작업 상세 정보 기록 (단계별 소요 시간 등)"""
+        with self._lock:
+            self._state["details"].update(details)
+
+    def _run(self, delay: float):
+        if delay > 0:
+            time.sleep(delay)
+
+        start_time = time.time()
+        with self._lock:
+            self._state["status"] = "running"
+            self._state["started_at"] = datetime.now().isoformat(timespec="seconds")
+
+        status, error, message = "succeeded", None, None
+        try:
+            message = self.target(self)
+            if message == "skipped":
+                status = "skipped"
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"❌ 작업 실패: {self.name}: {e}")
+            traceback.print_exc()
+
+        with self._lock:
+            self._state["status"] = status
+            self._state["error"] = error
+            if message and message != "skipped":
+                self._state["message"] = message
+            self._state["finished_at"] = datetime.now().isoformat(timespec="seconds")
+            self._state["duration_sec"] = round(time.time() - start_time, 3)
+            self._history.insert(0, dict(self._state, details=dict(self._state["details"])))
+            del self._history[self.history_size:]
+
+        logger.info(f"🏁 작업 종료: {self.name} ({status})")
+
+    def status(self) -> Dict[str, Any]:
+        """현재 상태 및 최근 실행 기록"""
+        with self._lock:
+            return {
+                "name": self.name,
+                "running": self.is_running(),
+                "current": dict(self._state, details=dict(self._state["details"])),
+                "history": list(self._history),
+            }
+
+
+def run_daily_recommendation(job: BackgroundJob) -> str:
+    """
+    일일 추천 작업: 중복 체크 → 추천 파이프라인 실행
+
+    Args:
+        job: 진행 단계를 보고할 작업 인스턴스
+
+    Returns:
+        결과 메시지 ("skipped"이면 건너뜀)
+    """
+    from utils.duplicate_checker import DuplicateDataChecker
+    from core.file_lock import exclusive_lock
+
+    # 워커마다 시작 시 / cron으로 작업이 실행되므로 잠금을 잡은 워커 하나만 처리
+    with exclusive_lock(get_job_lock_path()) as acquired:
+        if not acquired:
+            job.set_stage("done", "다른 워커에서 실행 중이라 건너뜁니다.")
+            return "skipped"
+
+        job.set_stage("duplicate_check")
+        checker = DuplicateDataChecker()
+        try:
+            should_skip = checker.should_skip_processing()
+        finally:
+            checker.close()
+
+        if should_skip:
+            job.set_stage("done", "오늘자 데이터가 이미 존재하여 처리를 건너뜁니다.")
+            return "skipped"
+
+        from core.pipeline import RecommendationPipeline
+
+        # 같은 날 재실행 시 마지막으로 완료된 단계 다음부터 이어서 처리
+        # (모델은 embed_books 단계에서 처음 로드되며 서버 준비 상태와 무관)
+        pipeline = RecommendationPipeline()
+        try:
+            outputs = pipeline.run(on_stage=lambda stage, status: job.set_stage(stage, status))
+        finally:
+            job.set_details(stage_durations=pipeline.stage_durations())
+            pipeline.close()
+
+        if outputs is None:
+            job.set_stage("done", "같은 실행이 다른 프로세스에서 진행 중이라 건너뜁니다.")
+            return "skipped"
+
+        job.set_details(dropped_headlines=outputs["publish"].get("dropped_headlines", {}))
+        return f"추천 {outputs['publish']['rows']}건 저장"
+
+
+# 전역 일일 추천 작업
+daily_job = BackgroundJob("daily_recommendation", run_daily_recommendation)
+
+# 전역 파이프라인 스케줄러 (PIPELINE_CRON이 비어 있으면 비활성화)
+pipeline_scheduler = None
+
+
+def start_pipeline_scheduler():
+    """cron 스케줄러 시작"""
+    global pipeline_scheduler
+    expression = os.getenv("PIPELINE_CRON", "0 7 * * *").strip()
+    if not expression:
+        logger.info("⏰ 파이프라인 스케줄러 비활성화 (PIPELINE_CRON 미설정)")
+        return None
+    if pipeline_scheduler is None:
+        from core.pipeline import PipelineScheduler
+        pipeline_scheduler = PipelineScheduler(expression, daily_job.start)
+    pipeline_scheduler.start()
+    return pipeline_scheduler
+
+
+def get_job_lock_path() -> str:
+    """일일 작업 잠금 파일 경로 (워커 간 중복 실행 방지)"""
+    return os.getenv("JOB_LOCK_PATH", os.path.join("cache", "daily_job.lock"))
+
+
+def get_job_startup_delay() -> float:
+    """서버 시작 후 일일 작업 실행까지의 대기 시간(초)"""
+    return float(os.getenv("JOB_STARTUP_DELAY", "5"))
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 제목 키워드 추출
+- konlpy(Okt) 명사 추출을 프로세스 풀에서 배치 단위로 실행 (워커당 분석기 1회 초기화)
+- 제목별 명사 추출 결과 메모이제이션 (디스크 보관)
+- 최근 N일 제목을 배경 말뭉치로 사용하는 TF-IDF로 섹션별 상위 키워드 선정
+"""
+
+import os
+import re
+import pickle
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_CORPUS_PATH = os.getenv("KEYWORD_CORPUS_PATH", os.path.join("cache", "keyword_corpus.pkl"))
+DEFAULT_MEMO_PATH = os.getenv("KEYWORD_MEMO_PATH", os.path.join("cache", "nouns.pkl"))
+
+# 메모이제이션 최대 제목 수 (초과 시 오래된 항목부터 제거)
+MAX_MEMO_SIZE = 50000
+
+# 뉴스 제목에 자주 나오지만 주제와 무관한 단어
+STOPWORDS = {
+    "속보", "단독", "종합", "사진", "영상", "기자", "뉴스", "오늘", "내일", "어제",
+    "이번", "관련", "진행", "발표", "지난", "올해", "최근", "가운데", "이유", "논란",
+}
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[A-Za-z][A-Za-z0-9]+|[0-9]+[가-힣A-Za-z]+")
+# konlpy가 없을 때 사용하는 간이 조사 제거 (긴 조사부터)
+_JOSA_SUFFIXES = sorted([
+    "에서는", "으로는", "에게서", "까지", "부터", "에서", "으로", "에게", "처럼", "보다",
+    "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "도", "로", "만",
+], key=len, reverse=True)
+
+# 워커 프로세스별 분석기 (initializer에서 1회 생성)
+_ANALYZER = None
+_ANALYZER_NAME = None
+# 설정 이름 → 실제 사용하는 분석기 (auto는 konlpy 사용 가능 여부에 따라 okt 또는 regex)
+_RESOLVED_ANALYZERS: Dict[str, str] = {}
+
+
+def _regex_nouns(text: str) -> List[str]:
+    """정규식 토큰 + 조사 제거 기반 간이 명사 추출"""
+    nouns = []
+    for token in _TOKEN_PATTERN.findall(text):
+        for suffix in _JOSA_SUFFIXES:
+            if len(token) > len(suffix) + 1 and token.endswith(suffix):
+                token = token[:-len(suffix)]
+                break
+        nouns.append(token)
+    return nouns
+
+
+def _create_analyzer(name: str) -> Tuple[str, Callable[[str], List[str]]]:
+    """명사 추출 함수 생성 (okt / regex / auto) - (실제 분석기 이름, 함수)"""
+    if name in ("okt", "auto"):
+        try:
+            from konlpy.tag import Okt
+            return "okt", Okt().nouns
+        except Exception as e:  # konlpy 미설치 또는 JVM 초기화 실패
+            if name == "okt":
+                raise
+            logger.warning(f"⚠️ konlpy를 사용할 수 없어 간이 명사 추출을 사용합니다: {e}")
+    elif name != "regex":
+        raise ValueError(f"지원하지 않는 형태소 분석기입니다: {name}")
+    return "regex", _regex_nouns
+
+
+def _init_worker(analyzer_name: str):
+    """프로세스 풀 워커 초기화 (분석기 1회 생성)"""
+    global _ANALYZER, _ANALYZER_NAME
+    _RESOLVED_ANALYZERS[analyzer_name], _ANALYZER = _create_analyzer(analyzer_name)
+    _ANALYZER_NAME = analyzer_name
+
+
+def resolve_analyzer(name: str) -> str:
+    """설정한 분석기 이름(auto 포함)이 실제로 사용하는 분석기 (okt / regex)"""
+    if name not in _RESOLVED_ANALYZERS:
+        # 현재 프로세스에서 분석기를 만들어 확인 (작은 배치는 어차피 현재 프로세스에서 분석)
+        _init_worker(name)
+    return _RESOLVED_ANALYZERS[name]
+
+
+def _extract_nouns_batch(titles: List[str], min_length: int = 2) -> List[List[str]]:
+    """제목 배치의 명사 추출 (워커 프로세스에서 실행)"""
+    return [
+        [noun for noun in _ANALYZER(title) if len(noun) >= min_length and noun not in STOPWORDS]
+        for title in titles
+    ]
+
+
+def _identity(tokens: List[str]) -> List[str]:
+    return tokens
+
+
+class KeywordExtractor:
+    """섹션별 뉴스 제목 키워드 추출기"""
+
+    def __init__(self, top_k: Optional[int] = None, analyzer: Optional[str] = None,
+                 max_workers: Optional[int] = None, batch_size: int = 64,
+                 corpus_path: Optional[str] = DEFAULT_CORPUS_PATH, memo_path: str = DEFAULT_MEMO_PATH,
+                 history_days: Optional[int] = None, min_length: int = 2,
+                 max_memo_size: int = MAX_MEMO_SIZE):
+        """
+        Args:
+            top_k: 섹션별 키워드 수 (기본값: KEYWORD_TOP_K 환경변수, 10)
+            analyzer: okt / regex / auto (기본값: KEYWORD_ANALYZER 환경변수, auto)
+            max_workers: 명사 추출 프로세스 수 (기본값: KEYWORD_WORKERS 환경변수, CPU 수)
+            batch_size: 워커에 한 번에 넘기는 제목 수 (이보다 적으면 현재 프로세스에서 처리)
+            corpus_path: 배경 말뭉치 저장 경로 (None이면 배경 말뭉치를 읽지도 기록하지도 않음)
+            memo_path: 제목별 명사 메모 저장 경로
+            history_days: 배경 말뭉치 보관 기간(일) (기본값: KEYWORD_CORPUS_DAYS 환경변수, 7)
+            min_length: 최소 명사 길이
+            max_memo_size: 메모 최대 제목 수 (초과 시 오래된 항목부터 제거)
+        """
+        self.top_k = top_k or int(os.getenv("KEYWORD_TOP_K", "10"))
+        self.analyzer_name = (analyzer or os.getenv("KEYWORD_ANALYZER", "auto")).lower()
+        self.max_workers = max_workers or int(os.getenv("KEYWORD_WORKERS", "0")) or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.corpus_path = corpus_path
+        self.memo_path = memo_path
+        self.history_days = history_days if history_days is not None else int(
+            os.getenv("KEYWORD_CORPUS_DAYS", "7"))
+        self.min_length = min_length
+        self.max_memo_size = max_memo_size
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._memo: Dict[Tuple[str, str], List[str]] = self._load_pickle(memo_path, {})
+        self._memo_dirty = False
+        # {run_key: {"date": ISO 날짜, "docs": [명사 리스트]}}
+        self._corpus: Dict[str, Dict[str, Any]] = self._load_pickle(corpus_path, {}) if corpus_path else {}
+
+    # ---------------------------------------------------------------
+    # 명사 추출
+    # ---------------------------------------------------------------
+    @staticmethod
+    def _load_pickle(path: str, default):
+        if not os.path.exists(path):
+            return default
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.error(f"키워드 캐시 로드 실패 ({path}): {e}")
+            return default
+
+    @staticmethod
+    def _save_pickle(path: str, data):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"키워드 캐시 저장 실패 ({path}): {e}")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # JVM(konlpy)은 fork 이후 사용할 수 없으므로 spawn으로 워커 생성
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.analyzer_name,),
+            )
+        return self._executor
+
+    def nouns(self, titles: List[str]) -> List[List[str]]:
+        """
+        제목별 명사 리스트 (메모에 없는 제목만 분석)
+
+        Args:
+            titles: 뉴스 제목 리스트
+
+        Returns:
+            제목 순서와 같은 명사 리스트
+        """
+        # 분석기에 따라 결과가 다르므로 (실제 분석기, 제목) 단위로 메모
+        # (auto가 konlpy 설치 여부에 따라 다른 분석기가 되어도 이전 결과와 섞이지 않음)
+        analyzer = resolve_analyzer(self.analyzer_name)
+        missing = list(dict.fromkeys(title for title in titles if (analyzer, title) not in self._memo))
+        if missing:
+            if len(missing) <= self.batch_size or self.max_workers <= 1:
+                if _ANALYZER_NAME != self.analyzer_name:
+                    _init_worker(self.analyzer_name)
+                results = _extract_nouns_batch(missing, self.min_length)
+            else:
+                batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+                results = []
+                for batch_result in self._get_executor().map(
+                        _extract_nouns_batch, batches, [self.min_length] * len(batches)):
+                    results.extend(batch_result)
+            self._memo.update(zip(((analyzer, title) for title in missing), results))
+            self._memo_dirty = True
+            logger.info(f"🔤 명사 추출: {len(missing)}개 제목 (메모 재사용 {len(set(titles)) - len(missing)}개)")
+        return [self._memo[(analyzer, title)] for title in titles]
+
+    # ---------------------------------------------------------------
+    # TF-IDF 키워드 선정
+    # ---------------------------------------------------------------
+    def _background_docs(self, run_key: Optional[str]) -> List[List[str]]:
+        cutoff = (datetime.now() - timedelta(days=self.history_days)).date().isoformat()
+        docs = []
+        for key, entry in self._corpus.items():
+            if key != run_key and entry["date"] >= cutoff:
+                docs.extend(entry["docs"])
+        return docs
+
+    def extract(self, titles_by_category: Dict[str, List[str]], run_key: Optional[str] = None,
+                record: bool = True) -> Dict[str, List[str]]:
+        """
+        섹션별 상위 키워드 추출
+
+        Args:
+            titles_by_category: 카테고리별 뉴스 제목
+            run_key: 실행 식별자 (배경 말뭉치 기록용, 기본값: 오늘 날짜)
+            record: 이번 제목을 배경 말뭉치에 기록할지 여부
+
+        Returns:
+            카테고리별 키워드 리스트 (TF-IDF 점수 내림차순)
+        """
+        run_key = run_key or datetime.now().strftime("%Y-%m-%d")
+        categories = list(titles_by_category)
+        all_titles = [title for category in categories for title in titles_by_category[category]]
+        docs = self.nouns(all_titles)
+        keywords: Dict[str, List[str]] = {category: [] for category in categories}
+
+        if any(docs):
+            # 배경 말뭉치 + 이번 제목으로 IDF 계산
+            vectorizer = TfidfVectorizer(analyzer=_identity, sublinear_tf=True)
+            vectorizer.fit(self._background_docs(run_key) + docs)
+            doc_matrix = vectorizer.transform(docs)
+
+            # 제목 행렬을 카테고리별로 합산 (카테고리 × 제목 지시 행렬 곱)
+            counts = [len(titles_by_category[category]) for category in categories]
+            rows = np.repeat(np.arange(len(categories)), counts)
+            indicator = sparse.csr_matrix(
+                (np.ones(len(rows)), (rows, np.arange(len(rows)))),
+                shape=(len(categories), len(rows)),
+            )
+            scores = (indicator @ doc_matrix).toarray()
+
+            vocabulary = vectorizer.get_feature_names_out()
+            k = min(self.top_k, scores.shape[1])
+            top_indices = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+            for row, category in enumerate(categories):
+                keywords[category] = [
+                    str(vocabulary[index]) for index in top_indices[row] if scores[row, index] > 0
+                ]
+
+        if record and self.corpus_path:
+            self._corpus[run_key] = {"date": datetime.now().date().isoformat(), "docs": docs}
+            cutoff = (datetime.now() - timedelta(days=self.history_days)).date().isoformat()
+            self._corpus = {key: entry for key, entry in self._corpus.items() if entry["date"] >= cutoff}
+            self._save_pickle(self.corpus_path, self._corpus)
+        self.save_memo()
+        return keywords
+
+    def prune_memo(self, titles: List[str]):
+        """메모를 주어진 제목(현재 분석기)만 남기도록 정리 - 일괄 처리 대상이 전부일 때 사용"""
+        analyzer = resolve_analyzer(self.analyzer_name)
+        keep = {(analyzer, title) for title in titles}
+        pruned = {key: nouns for key, nouns in self._memo.items() if key in keep}
+        if len(pruned) != len(self._memo):
+            self._memo = pruned
+            self._memo_dirty = True
+
+    def save_memo(self):
+        """명사 메모 저장 (변경된 경우에만)"""
+        if not self._memo_dirty:
+            return
+        if len(self._memo) > self.max_memo_size:
+            self._memo = dict(list(self._memo.items())[-self.max_memo_size:])
+        self._save_pickle(self.memo_path, self._memo)
+        self._memo_dirty = False
+
+    def close(self):
+        """프로세스 풀 종료 및 메모 저장"""
+        self.save_memo()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
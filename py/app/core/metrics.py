@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+메트릭 수집 (Prometheus 텍스트 형식)
+- 카운터 / 게이지 / 히스토그램 (라벨별 자식 객체, 고정 버킷)
+- 요청 지연 (라우트별), 캐시 히트/미스/제거, DB 쿼리 시간 (문장 이름별), 연결 풀 대기 시간,
+  임베딩 배치 크기 / 처리량
+- 핫 패스 비용: 라벨 자식 조회(dict) + 버킷 이분 탐색 + 락 1회. 이미 다른 곳에서 세고 있는 값
+  (임베딩 캐시 히트 수 등)은 수집기로 /metrics 요청 시점에만 읽음
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 기본 지연 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 배치 크기 버킷
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+# Response가 charset을 덧붙이므로 여기서는 생략
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """라벨 값 조합별 자식 객체를 가진 메트릭"""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values) -> object:
+        """
+        라벨 값 조합의 자식 객체 (핫 패스에서는 반환값을 변수에 보관해 재사용)
+
+        Args:
+            values: labelnames 순서의 라벨 값
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 {self.labelnames}가 필요합니다: {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def clear(self):
+        with self._lock:
+            self._children.clear()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for values, child in sorted(self._children.items()):
+            yield from self._render_child(values, child)
+
+    def _render_child(self, values, child) -> Iterator[str]:
+        yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def set(self, value: float):
+        """값 설정 (게이지 / 다른 곳에서 누적한 카운트를 수집 시점에 옮길 때)"""
+        self.value = value
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def set(self, value: float):
+        self._default.set(value)
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램 (버킷 상한 이하 누적 개수 / 합계 / 개수)"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help, labelnames)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def _render_child(self, values, child) -> Iterator[str]:
+        with child._lock:
+            counts, total, count = list(child.counts), child.sum, child.count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.labelnames, values, f'le="{_format_value(float(bound))}"')
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        labels = _format_labels(self.labelnames, values)
+        yield f"{self.name}_sum{labels} {_format_value(total)}"
+        yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """메트릭 등록 / Prometheus 텍스트 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"이미 다른 형식으로 등록된 메트릭입니다: {metric.name}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]):
+        """/metrics 출력 직전에 호출할 함수 (다른 곳에서 누적한 값을 메트릭에 반영)"""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def reset(self):
+        """모든 메트릭 값 초기화 (테스트용)"""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 출력"""
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception:
+                # 수집기 오류로 /metrics 전체가 실패하지 않도록 해당 값만 건너뜀
+                pass
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """프로세스 공용 메트릭 레지스트리"""
+    return _registry
+
+
+# -------------------------------------------------------------------
+# 공용 메트릭
+# -------------------------------------------------------------------
+REQUEST_LATENCY = _registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트별)", ("method", "route", "status"))
+CACHE_EVENTS = _registry.counter(
+    "cache_events_total", "캐시 이벤트 수 (hit / miss / expired / eviction)", ("cache", "event"))
+CACHE_ENTRIES = _registry.gauge("cache_entries", "캐시 항목 수", ("cache",))
+DB_QUERY_DURATION = _registry.histogram(
+    "db_query_duration_seconds", "DB 쿼리 실행 시간 (문장 이름별)", ("statement",))
+DB_QUERY_ERRORS = _registry.counter("db_query_errors_total", "DB 쿼리 실패 수 (문장 이름별)", ("statement",))
+DB_POOL_WAIT = _registry.histogram("db_pool_wait_seconds", "연결 풀 체크아웃 대기 시간")
+EMBEDDING_BATCH_SIZE = _registry.histogram(
+    "embedding_batch_size", "모델 순전파 배치 크기", ("device",), buckets=SIZE_BUCKETS)
+EMBEDDING_TEXTS = _registry.counter("embedding_texts_total", "새로 계산한 임베딩 수", ("device",))
+EMBEDDING_SECONDS = _registry.histogram(
+    "embedding_encode_seconds", "캐시 미스 텍스트 임베딩 계산 시간 (호출 단위)", ("device",))
+EMBEDDING_THROUGHPUT = _registry.gauge(
+    "embedding_throughput_texts_per_second", "최근 임베딩 계산 처리량", ("device",))
+
+
+_VERB_PATTERN = re.compile(r"^\s*(\w+)(?:\s+(?:table\s+)?([\w.]+))?", re.IGNORECASE)
+_TABLE_PATTERN = re.compile(r"\b(?:from|into)\s+([\w.]+)", re.IGNORECASE)
+_statement_names: Dict[str, str] = {}
+_STATEMENT_CACHE_SIZE = 1024
+
+
+def statement_name(query: str) -> str:
+    """
+    쿼리의 문장 이름 (동사:첫 테이블, 예: select:tb_recommend) - 라벨 수가 쿼리 문자열 수만큼 늘지 않도록 사용
+
+    Args:
+        query: SQL 쿼리
+
+    Returns:
+        문장 이름 (인식하지 못하면 "other")
+    """
+    name = _statement_names.get(query)
+    if name is not None:
+        return name
+    text = re.sub(r"--[^\n]*", "", query)
+    match = _VERB_PATTERN.match(text)
+    if match is None:
+        name = "other"
+    else:
+        verb = match.group(1).lower()
+        if verb in ("update", "truncate", "alter"):
+            table = match.group(2)
+        else:
+            found = _TABLE_PATTERN.search(text)
+            table = found.group(1) if found else None
+        name = f"{verb}:{table.lower()}" if table else verb
+    if len(_statement_names) < _STATEMENT_CACHE_SIZE:
+        _statement_names[query] = name
+    return name
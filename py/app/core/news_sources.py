@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 소스 레지스트리
+- 소스별 섹션(카테고리) / 페이지 URL / 헤드라인 추출 방식 선언
+- 도메인별 동시 요청 수 / 요청 간격 제한
+"""
+
+import os
+import logging
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from .html_extract import get_extractor
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+class NewsSource:
+    """뉴스 소스 정의"""
+
+    def __init__(self, name: str, sections: Dict[str, List[str]], tag: str = "h2",
+                 parser: Optional[str] = None,
+                 extractor: Optional[Callable[[str], List[str]]] = None,
+                 max_concurrency: Optional[int] = None, min_interval: float = 0.0):
+        """
+        Args:
+            name: 소스 이름
+            sections: 카테고리별 페이지 URL 목록 (카테고리는 추천 시스템 카테고리와 동일)
+            tag: 헤드라인 태그
+            parser: 파서 백엔드 (None이면 CRAWLER_PARSER / 자동 선택)
+            extractor: HTML → 헤드라인 리스트 함수 (지정 시 tag/parser 대신 사용)
+            max_concurrency: 도메인별 동시 요청 수 (None이면 크롤러 기본값)
+            min_interval: 같은 도메인 요청 간 최소 간격(초)
+        """
+        self.name = name
+        self.sections = sections
+        self.tag = tag
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._extractor = extractor
+        self._parser = parser
+        self._backend = None
+
+    @property
+    def domains(self) -> List[str]:
+        """소스가 사용하는 도메인 목록"""
+        return sorted({urlsplit(url).netloc for urls in self.sections.values() for url in urls})
+
+    def extract(self, html: str) -> List[str]:
+        """페이지 HTML에서 헤드라인 추출"""
+        if self._extractor is not None:
+            return self._extractor(html)
+        if self._backend is None:
+            self._backend = get_extractor(self._parser)
+        return self._backend(html, self.tag)
+
+
+def _paged(base_url: str, pages: int = 3) -> List[str]:
+    """1페이지 + ?page=N 페이지 URL 목록"""
+    return [base_url] + [f"{base_url}?page={page}" for page in range(2, pages + 1)]
+
+
+# 중앙일보
+JOONGANG = NewsSource(
+    name="joongang",
+    sections={
+        "politics": _paged("https://www.joongang.co.kr/politics"),
+        "sports": _paged("https://www.joongang.co.kr/sports"),
+        "economic": _paged("https://www.joongang.co.kr/money"),
+        "society": _paged("https://www.joongang.co.kr/society"),
+        "world": _paged("https://www.joongang.co.kr/world"),
+    },
+    tag="h2",
+    max_concurrency=4,
+)
+
+SOURCE_REGISTRY: Dict[str, NewsSource] = {}
+
+
+def register_source(source: NewsSource, replace: bool = False):
+    """
+    뉴스 소스 등록
+
+    Args:
+        source: 등록할 소스
+        replace: 같은 이름의 소스가 있으면 교체할지 여부
+    """
+    if source.name in SOURCE_REGISTRY and not replace:
+        raise ValueError(f"이미 등록된 뉴스 소스입니다: {source.name}")
+    SOURCE_REGISTRY[source.name] = source
+
+
+def get_sources(names: Optional[List[str]] = None) -> List[NewsSource]:
+    """
+    사용할 뉴스 소스 목록
+
+    Args:
+        names: 소스 이름 목록 (기본값: NEWS_SOURCES 환경변수, 쉼표 구분)
+
+    Returns:
+        등록된 소스 중 요청된 소스 리스트
+    """
+    if names is None:
+        names = [name.strip() for name in os.getenv("NEWS_SOURCES", "joongang").split(",") if name.strip()]
+    sources = []
+    for name in names:
+        if name not in SOURCE_REGISTRY:
+            logger.warning(f"⚠️ 등록되지 않은 뉴스 소스를 건너뜁니다: {name}")
+            continue
+        sources.append(SOURCE_REGISTRY[name])
+    return sources
+
+
+register_source(JOONGANG)
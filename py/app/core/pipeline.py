@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+일일 추천 파이프라인
+- 단계별 실행 (crawl → keywords → embed_books → score → publish → similar_books)
+- 단계 결과 체크포인트 저장 및 재실행 시 이어서 처리
+- 단계별 소요 시간 기록 (PROFILE_STAGES로 지정한 단계는 샘플링 프로파일 저장)
+- 실행 1회 = 트레이스 1개, 단계마다 스팬 (TRACING_EXPORTER)
+- cron 형식 스케줄러
+"""
+
+import os
+import json
+import time
+import pickle
+import hashlib
+import shutil
+import threading
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .file_lock import exclusive_lock
+from .profiling import profile, profiled_stages
+from .tracing import span, start_trace
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = os.getenv("PIPELINE_CHECKPOINT_DIR", "checkpoints")
+
+
+class PipelineStage:
+    """파이프라인 단계"""
+
+    def __init__(self, name: str, func: Callable[[Dict[str, Any]], Any]):
+        """
+        Args:
+            name: 단계 이름
+            func: 이전 단계 결과 딕셔너리를 받아 이 단계의 결과를 반환하는 함수
+        """
+        self.name = name
+        self.func = func
+
+
+class Pipeline:
+    """
+    체크포인트 기반 파이프라인 실행기
+
+    각 단계의 결과를 `{checkpoint_dir}/{name}/{run_id}/` 아래에 저장하고,
+    같은 run_id로 다시 실행하면 마지막으로 완료된 단계 다음부터 이어서 실행합니다.
+    """
+
+    def __init__(self, name: str, stages: List[PipelineStage],
+                 checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR,
+                 run_id: Optional[str] = None, keep_runs: int = 7,
+                 profile_stages: Optional[Iterable[str]] = None):
+        """
+        Args:
+            name: 파이프라인 이름
+            stages: 실행 순서대로 나열된 단계 리스트
+            checkpoint_dir: 체크포인트 루트 디렉토리
+            run_id: 실행 ID (기본값: 오늘 날짜 - 같은 날 재실행 시 이어서 처리)
+            keep_runs: 보관할 과거 실행 체크포인트 수
+            profile_stages: 프로파일을 저장할 단계 이름 ("all"이면 전체, 기본값: PROFILE_STAGES 환경변수)
+        """
+        self.name = name
+        self.stages = stages
+        self.profile_stages = set(profile_stages) if profile_stages is not None else profiled_stages()
+        self.run_id = run_id or datetime.now().strftime("%Y-%m-%d")
+        self.keep_runs = keep_runs
+        self.base_dir = os.path.join(checkpoint_dir, name)
+        self.run_dir = os.path.join(self.base_dir, self.run_id)
+        self.manifest = self._load_manifest()
+
+    # ---------------------------------------------------------------
+    # 체크포인트 관리
+    # ---------------------------------------------------------------
+    def _manifest_path(self) -> str:
+        return os.path.join(self.run_dir, "manifest.json")
+
+    def _checkpoint_path(self, index: int, stage: PipelineStage) -> str:
+        return os.path.join(self.run_dir, f"{index:02d}_{stage.name}.pkl")
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        path = self._manifest_path()
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ 파이프라인 매니페스트 로드 실패, 처음부터 실행: {e}")
+        return {"pipeline": self.name, "run_id": self.run_id, "stages": {}}
+
+    def _save_manifest(self):
+        self._atomic_write(self._manifest_path(), json.dumps(
+            self.manifest, ensure_ascii=False, indent=2
+        ).encode("utf-8"))
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes):
+        """임시 파일에 쓴 뒤 교체 (중간 실패 시 깨진 체크포인트 방지)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def is_completed(self, stage_name: str) -> bool:
+        """단계 완료 여부"""
+        record = self.manifest["stages"].get(stage_name, {})
+        return record.get("status") == "completed"
+
+    def reset(self, from_stage: Optional[str] = None):
+        """
+        체크포인트 초기화
+
+        Args:
+            from_stage: 지정 시 해당 단계부터 이후 단계만 초기화
+        """
+        names = [stage.name for stage in self.stages]
+        start = names.index(from_stage) if from_stage else 0
+        for index, stage in enumerate(self.stages[start:], start=start):
+            self.manifest["stages"].pop(stage.name, None)
+            path = self._checkpoint_path(index, stage)
+            if os.path.exists(path):
+                os.remove(path)
+        if os.path.isdir(self.run_dir):
+            self._save_manifest()
+
+    def load_previous_output(self, stage_name: str) -> Optional[Any]:
+        """
+        이전 실행에서 완료된 단계 결과 조회
+
+        Args:
+            stage_name: 단계 이름
+
+        Returns:
+            가장 최근 이전 실행의 단계 결과 (없으면 None)
+        """
+        if not os.path.isdir(self.base_dir):
+            return None
+        index = [stage.name for stage in self.stages].index(stage_name)
+        runs = sorted(
+            (entry for entry in os.listdir(self.base_dir)
+             if entry < self.run_id and os.path.isdir(os.path.join(self.base_dir, entry))),
+            reverse=True
+        )
+        for run in runs:
+            run_dir = os.path.join(self.base_dir, run)
+            try:
+                with open(os.path.join(run_dir, "manifest.json"), "r", encoding="utf-8") as f:
+                    record = json.load(f)["stages"].get(stage_name, {})
+                if record.get("status") != "completed":
+                    continue
+                with open(os.path.join(run_dir, f"{index:02d}_{stage_name}.pkl"), "rb") as f:
+                    return pickle.load(f)
+            except (OSError, ValueError, KeyError, pickle.UnpicklingError):
+                continue
+        return None
+
+    def _cleanup_old_runs(self):
+        """오래된 실행 체크포인트 삭제"""
+        if not os.path.isdir(self.base_dir):
+            return
+        runs = sorted(
+            entry for entry in os.listdir(self.base_dir)
+            if os.path.isdir(os.path.join(self.base_dir, entry))
+        )
+        for run in runs[:-self.keep_runs] if self.keep_runs > 0 else []:
+            shutil.rmtree(os.path.join(self.base_dir, run), ignore_errors=True)
+            logger.info(f"🗑️ 오래된 파이프라인 체크포인트 삭제: {run}")
+
+    # ---------------------------------------------------------------
+    # 실행
+    # ---------------------------------------------------------------
+    def run(self, resume: bool = True,
+            on_stage: Optional[Callable[[str, str], None]] = None) -> Optional[Dict[str, Any]]:
+        """
+        파이프라인 실행
+
+        같은 run_id를 다른 프로세스가 실행 중이면 체크포인트가 섞이지 않도록 바로 반환합니다.
+
+        Args:
+            resume: 완료된 단계의 체크포인트를 재사용할지 여부
+            on_stage: 단계 시작/재사용 시 호출되는 콜백 (stage_name, status)
+
+        Returns:
+            단계 이름별 결과 딕셔너리 (다른 프로세스가 실행 중이면 None)
+        """
+        os.makedirs(self.run_dir, exist_ok=True)
+        with exclusive_lock(os.path.join(self.run_dir, "run.lock")) as acquired:
+            if not acquired:
+                logger.warning(f"⏭️ 파이프라인이 다른 프로세스에서 실행 중입니다: {self.name} (run_id={self.run_id})")
+                return None
+            # 인스턴스 생성 이후 다른 프로세스가 완료한 단계 반영
+            self.manifest = self._load_manifest()
+            return self._run_locked(resume, on_stage)
+
+    def _run_locked(self, resume: bool,
+                    on_stage: Optional[Callable[[str, str], None]]) -> Dict[str, Any]:
+        """run_dir 잠금을 잡은 상태에서 단계 실행"""
+        if not resume:
+            self.reset()
+
+        outputs: Dict[str, Any] = {}
+        pipeline_start = time.time()
+        logger.info(f"🚀 파이프라인 시작: {self.name} (run_id={self.run_id})")
+
+        with start_trace(f"pipeline.{self.name}", run_id=self.run_id, resume=resume) as root:
+            self.manifest["trace_id"] = getattr(root, "trace_id", None)
+            for index, stage in enumerate(self.stages):
+                path = self._checkpoint_path(index, stage)
+
+                if self.is_completed(stage.name) and os.path.exists(path):
+                    with open(path, "rb") as f:
+                        outputs[stage.name] = pickle.load(f)
+                    logger.info(f"⏭️ [{stage.name}] 체크포인트 재사용")
+                    if on_stage:
+                        on_stage(stage.name, "resumed")
+                    with span(stage.name, resumed=True):
+                        pass
+                    continue
+
+                if on_stage:
+                    on_stage(stage.name, "running")
+                logger.info(f"▶️ [{stage.name}] 단계 시작")
+
+                start_time = time.time()
+                try:
+                    output, profile_id = self._execute(stage, outputs)
+                except Exception as e:
+                    self.manifest["stages"][stage.name] = {
+                        "status": "failed",
+                        "error": str(e),
+                        "duration_sec": round(time.time() - start_time, 3),
+                        "finished_at": datetime.now().isoformat(timespec="seconds"),
+                    }
+                    self._save_manifest()
+                    logger.error(f"❌ [{stage.name}] 단계 실패: {e}")
+                    raise
+
+                duration = time.time() - start_time
+                self._atomic_write(path, pickle.dumps(output, protocol=pickle.HIGHEST_PROTOCOL))
+                outputs[stage.name] = output
+                self.manifest["stages"][stage.name] = {
+                    "status": "completed",
+                    "duration_sec": round(duration, 3),
+                    "finished_at": datetime.now().isoformat(timespec="seconds"),
+                    "checkpoint": os.path.basename(path),
+                }
+                if profile_id:
+                    self.manifest["stages"][stage.name]["profile"] = profile_id
+                self._save_manifest()
+                logger.info(f"✅ [{stage.name}] 단계 완료: {duration:.2f}초")
+
+        self.manifest["total_duration_sec"] = round(time.time() - pipeline_start, 3)
+        self._save_manifest()
+        self._cleanup_old_runs()
+        logger.info(f"🎉 파이프라인 완료: {self.name} ({self.manifest['total_duration_sec']:.2f}초)")
+        return outputs
+
+    def _execute(self, stage: PipelineStage, outputs: Dict[str, Any]):
+        """단계 함수 실행 (트레이스 스팬, 지정한 단계는 샘플링 프로파일) - (결과, 프로파일 ID)"""
+        with span(stage.name):
+            if stage.name in self.profile_stages or "all" in self.profile_stages:
+                with profile("stage", f"{self.name}.{stage.name}", extra={"run_id": self.run_id}) as result:
+                    output = stage.func(outputs)
+                return output, result["id"]
+            return stage.func(outputs), None
+
+    def stage_durations(self) -> Dict[str, Optional[float]]:
+        """단계별 소요 시간 (초)"""
+        return {
+            stage.name: self.manifest["stages"].get(stage.name, {}).get("duration_sec")
+            for stage in self.stages
+        }
+
+    def close(self):
+        """리소스 정리 (하위 클래스에서 재정의)"""
+
+
+class RecommendationPipeline(Pipeline):
+    """
+    뉴스 기반 도서 추천 파이프라인
+
+    crawl → keywords → embed_books → score → publish → similar_books
+    """
+
+    STAGE_NAMES = ["crawl", "keywords", "embed_books", "score", "publish", "similar_books"]
+
+    def __init__(self, checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR,
+                 run_id: Optional[str] = None, recommender=None, crawler=None, deduplicator=None,
+                 knn_graph_path: Optional[str] = None):
+        """
+        Args:
+            checkpoint_dir: 체크포인트 루트 디렉토리
+            run_id: 실행 ID (기본값: 오늘 날짜)
+            recommender: 추천 시스템 (None이면 최초 사용 시 GPUBertRecommendationSystem 생성)
+            crawler: 뉴스 크롤러 (None이면 crawl 단계마다 기본 소스로 Crowling 생성)
+            deduplicator: 헤드라인 중복 제거기 (None이면 최초 사용 시 생성)
+            knn_graph_path: 도서 이웃 그래프 파일 (기본값: KNN_GRAPH_PATH 환경변수)
+        """
+        from .bert.knn_graph import DEFAULT_KNN_GRAPH_PATH
+
+        self._recommender = recommender
+        self._deduplicator = deduplicator
+        self._crawler = crawler
+        self.knn_graph_path = knn_graph_path or DEFAULT_KNN_GRAPH_PATH
+        stages = [
+            PipelineStage("crawl", self.crawl),
+            PipelineStage("keywords", self.keywords),
+            PipelineStage("embed_books", self.embed_books),
+            PipelineStage("score", self.score),
+            PipelineStage("publish", self.publish),
+            PipelineStage("similar_books", self.similar_books),
+        ]
+        super().__init__("recommendation", stages, checkpoint_dir=checkpoint_dir,
+                         run_id=run_id, keep_runs=int(os.getenv("PIPELINE_KEEP_RUNS", "7")))
+
+    @property
+    def recommender(self):
+        """추천 시스템 (최초 사용 시 생성 - 모델/DB 연결 지연)"""
+        if self._recommender is None:
+            from .recommendation.bert_recommendation_gpu import GPUBertRecommendationSystem
+            self._recommender = GPUBertRecommendationSystem()
+        return self._recommender
+
+    @property
+    def method(self) -> str:
+        """tb_recommend.method 값"""
+        return "gpu_bert" if self.recommender.use_gpu else "bert"
+
+    @property
+    def deduplicator(self):
+        """헤드라인 중복 제거기 (최근 실행 지문 보관)"""
+        if self._deduplicator is None:
+            from .headline_dedup import HeadlineDeduplicator
+            self._deduplicator = HeadlineDeduplicator()
+        return self._deduplicator
+
+    def crawl(self, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        뉴스 제목 크롤링 및 중복 제거
+
+        페이지 간 / 최근 실행과 같거나 거의 같은 제목은 제외하고 새 제목만 다음 단계로 넘깁니다.
+        """
+        from .crowling import Crowling
+
+        crawler = self._crawler or Crowling()
+        news_titles = crawler.get_news_titles()
+        deduped = self.deduplicator.filter(
+            {category: [title.strip() for title in titles if title.strip()]
+             for category, titles in news_titles.items()},
+            self.run_id,
+        )
+        for category, titles in news_titles.items():
+            dropped = deduped["dropped"][category]
+            logger.info(
+                f"  - {category}: {len(titles)}개 제목 → 새 제목 {len(deduped['titles'][category])}개 "
+                f"(실행 내 중복 {dropped['in_run']}개, 이전 실행 중복 {dropped['history']}개 제외)"
+            )
+        return {
+            "titles": deduped["titles"],
+            "unique_titles": deduped["unique_titles"],
+            "fingerprints": deduped["fingerprints"],
+            "dropped": deduped["dropped"],
+            "changed_sections": sorted(crawler.changed_sections),
+        }
+
+    def keywords(self, outputs: Dict[str, Any]) -> Dict[str, Dict[str, List[str]]]:
+        """
+        카테고리별 추천 키워드 선정 (새 뉴스 제목의 명사 TF-IDF 상위 키워드)
+
+        새 제목이 없는 카테고리는 이번 실행의 고유 제목 전체로 만든 키워드를
+        fallback에 담아 두고, 이전 점수를 재사용할 수 없을 때만 사용합니다.
+        """
+        from .keyword_extraction import KeywordExtractor
+
+        crawl = outputs["crawl"]
+        extractor = KeywordExtractor()
+        try:
+            keywords = extractor.extract(crawl["titles"], run_key=self.run_id)
+            empty = {
+                category: crawl.get("unique_titles", {}).get(category, [])
+                for category, kws in keywords.items() if not kws
+            }
+            fallback = extractor.extract(empty, record=False) if empty else {}
+        finally:
+            extractor.close()
+        for category, kws in keywords.items():
+            logger.info(f"  - {category}: {', '.join(kws) or '(새 키워드 없음)'}")
+        return {"keywords": keywords, "fallback": fallback}
+
+    def embed_books(self, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """도서 로드 및 임베딩"""
+        books_data = self.recommender.load_books()
+        embeddings = self.recommender.embed_books(books_data)
+        return {
+            "books": books_data,
+            "embeddings": embeddings,
+            "catalogue_hash": hashlib.sha1("\n".join(books_data["isbn"]).encode("utf-8")).hexdigest(),
+        }
+
+    def score(self, outputs: Dict[str, Any]) -> Dict[str, List]:
+        """
+        카테고리별 추천 도서 점수 계산
+
+        뉴스 내용이 바뀌지 않았거나 새 제목이 없고 도서 목록도 같으면 이전 실행의 점수를 재사용합니다.
+        """
+        embedded = outputs["embed_books"]
+        keywords = outputs["keywords"]["keywords"]
+        fallback = outputs["keywords"]["fallback"]
+        changed = set(outputs["crawl"]["changed_sections"])
+
+        reused = {}
+        unchanged = [category for category in keywords
+                     if category not in changed or not keywords[category]]
+        if unchanged:
+            previous_scores = self.load_previous_output("score")
+            previous_embedded = self.load_previous_output("embed_books")
+            if (previous_scores and previous_embedded
+                    and previous_embedded.get("catalogue_hash") == embedded["catalogue_hash"]):
+                reused = {
+                    category: previous_scores[category]
+                    for category in unchanged if category in previous_scores
+                }
+        if reused:
+            logger.info(f"⏭️ 변경 없는 카테고리 점수 재사용: {', '.join(sorted(reused))}")
+
+        to_score = {}
+        for category, kws in keywords.items():
+            if category in reused:
+                continue
+            # 새 키워드가 없는데 재사용할 점수도 없으면 이번 실행의 고유 제목 전체 키워드로 계산
+            kws = kws or fallback.get(category, [])
+            if kws:
+                to_score[category] = kws
+        recommendations = self.recommender.score_categories(
+            to_score, embedded["embeddings"], embedded["books"]
+        ) if to_score else {}
+        recommendations.update(reused)
+        return recommendations
+
+    def publish(self, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """추천 결과 DB 저장"""
+        recommendations = outputs["score"]
+        if not self.recommender.save_recommendations_to_db(recommendations, self.method):
+            raise RuntimeError("추천 결과 DB 저장 실패")
+        # 저장까지 끝난 실행의 제목만 이후 실행의 중복 비교 대상으로 기록
+        if outputs["crawl"].get("fingerprints") is not None:
+            self.deduplicator.record(self.run_id, outputs["crawl"]["fingerprints"])
+        return {
+            "method": self.method,
+            "rows": sum(len(recs) for recs in recommendations.values()),
+            "dropped_headlines": outputs["crawl"].get("dropped", {}),
+        }
+
+    def similar_books(self, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        도서 간 이웃 그래프 생성 (/api/books/{isbn}/similar)
+
+        추천 점수 계산의 도서 수 상한(RECOMMEND_BOOK_LIMIT)과 무관하게 전체 카탈로그로 만들고,
+        도서 목록 / 설명 / 임베딩 방식 / k가 그대로면 기존 그래프를 재사용합니다.
+        """
+        from .bert.knn_graph import KnnGraph, catalogue_version
+
+        embedded = outputs["embed_books"]
+        books = embedded["books"]
+        if self.recommender.book_limit > 0:
+            books = self.recommender.load_books(limit=0)
+        k = int(os.getenv("KNN_GRAPH_K", "20"))
+        min_score = float(os.getenv("KNN_GRAPH_MIN_SCORE", "0"))
+        backend = self.recommender.engine.backend
+        version = catalogue_version(books["isbn"], backend, k, min_score, books["description"])
+
+        existing = KnnGraph.load(self.knn_graph_path)
+        if existing is not None and existing.version == version:
+            logger.info(f"⏭️ 카탈로그가 같아 도서 이웃 그래프 재사용: {len(existing)}권")
+            return {"path": self.knn_graph_path, "version": version, "books": len(existing), "reused": True}
+
+        # 상한으로 잘린 도서는 여기서 임베딩 (추천 단계에서 계산한 설명은 캐시 재사용)
+        embeddings = embedded["embeddings"] if books is embedded["books"] else self.recommender.embed_books(books)
+        with span("knn.build", books=len(books["isbn"]), k=k) as build_span:
+            graph = KnnGraph.build(
+                embeddings, books["isbn"], books["title"], k=k, min_score=min_score,
+                block_rows=int(os.getenv("KNN_GRAPH_BLOCK_ROWS", "256")),
+                workers=int(os.getenv("KNN_GRAPH_WORKERS", "0")) or None,
+                metadata={"version": version, "backend": backend, "run_id": self.run_id,
+                          "built_at": datetime.now().isoformat(timespec="seconds")},
+            )
+            build_span.set(edges=len(graph.indices))
+        graph.save(self.knn_graph_path)
+        return {"path": self.knn_graph_path, "version": version, "books": len(graph), "reused": False}
+
+    def close(self):
+        """추천 시스템 리소스 정리"""
+        if self._recommender is not None:
+            self._recommender.close()
+            self._recommender = None
+
+
+# -------------------------------------------------------------------
+# cron 스케줄러
+# -------------------------------------------------------------------
+class CronSchedule:
+    """
+    5필드 cron 표현식 (분 시 일 월 요일)
+
+    `*`, 숫자, 목록(`1,15`), 범위(`1-5`), 간격(`*/10`, `0-30/5`)을 지원합니다.
+    요일은 0(일요일)~6(토요일)이며 7도 일요일로 처리합니다.
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드가 필요합니다: '{expression}'")
+        self.expression = expression
+        parsed = [self._parse_field(field, low, high)
+                  for field, (low, high) in zip(fields, self.FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {0 if day == 7 else day for day in weekdays}
+        self._day_any = fields[2] == "*"
+        self._weekday_any = fields[4] == "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> set:
+        values = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_str = part.split("/", 1)
+                step = int(step_str)
+                if step <= 0:
+                    raise ValueError(f"cron 간격은 1 이상이어야 합니다: '{field}'")
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start, end = (int(value) for value in part.split("-", 1))
+            else:
+                start = end = int(part)
+            if start < low or end > high or start > end:
+                raise ValueError(f"cron 필드 범위 오류: '{field}' ({low}-{high})")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        weekday = (dt.weekday() + 1) % 7  # 일요일=0
+        day_ok = dt.day in self.days
+        weekday_ok = weekday in self.weekdays
+        # cron 규칙: 일/요일이 모두 지정되면 둘 중 하나만 맞아도 실행
+        if self._day_any or self._weekday_any:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, dt: datetime) -> datetime:
+        """dt 이후 다음 실행 시각"""
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 4)
+        while candidate < limit:
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식입니다: '{self.expression}'")
+
+
+class PipelineScheduler:
+    """cron 일정에 맞춰 작업을 시작하는 백그라운드 스케줄러"""
+
+    def __init__(self, expression: str, trigger: Callable[[], Any]):
+        """
+        Args:
+            expression: cron 표현식
+            trigger: 실행 시각에 호출할 함수
+        """
+        self.schedule = CronSchedule(expression)
+        self.trigger = trigger
+        self.next_run: Optional[datetime] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """스케줄러 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="pipeline-scheduler", daemon=True)
+        self._thread.start()
+        logger.info(f"⏰ 파이프라인 스케줄러 시작: '{self.schedule.expression}'")
+
+    def stop(self):
+        """스케줄러 중지"""
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.next_run = self.schedule.next_after(datetime.now())
+            wait = (self.next_run - datetime.now()).total_seconds()
+            # 시스템 시간 변경에 대비해 최대 1분 단위로 나눠서 대기
+            while wait > 0 and not self._stop.is_set():
+                self._stop.wait(min(wait, 60))
+                wait = (self.next_run - datetime.now()).total_seconds()
+            if self._stop.is_set():
+                break
+            logger.info(f"⏰ 예약 실행: {self.next_run.isoformat(timespec='minutes')}")
+            try:
+                self.trigger()
+            except Exception as e:
+                logger.error(f"❌ 예약 실행 실패: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        """스케줄러 상태"""
+        return {
+            "cron": self.schedule.expression,
+            "running": bool(self._thread and self._thread.is_alive()),
+            "next_run": self.next_run.isoformat(timespec="minutes") if self.next_run else None,
+        }
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+선택적 샘플링 프로파일러
+- 요청 / 파이프라인 단계 단위로 켜는 스택 샘플러 (sys._current_frames, 기본 5ms 간격)
+- 결과는 collapsed stack 형식 (flamegraph.pl / speedscope에서 바로 열 수 있음)으로 PROFILE_DIR에 저장
+- 최근 PROFILE_KEEP개만 보관, 목록 / 다운로드는 관리자 API에서 제공
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import threading
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_DIR = os.getenv("PROFILE_DIR", "cache/profiles")
+COLLAPSED_SUFFIX = ".collapsed"
+META_SUFFIX = ".json"
+_PROFILE_ID = re.compile(r"^[\w.-]+$")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """별도 스레드에서 대상 스레드의 스택을 주기적으로 수집"""
+
+    def __init__(self, interval: Optional[float] = None, threads: Optional[Set[int]] = None):
+        """
+        Args:
+            interval: 샘플 간격(초) (기본값: PROFILE_INTERVAL_MS 환경변수)
+            threads: 수집할 스레드 ID (None이면 샘플러를 제외한 모든 스레드)
+        """
+        self.interval = interval or float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000
+        self.threads = threads
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample_once(self):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own or (self.threads is not None and ident not in self.threads):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(names.get(ident, f"thread-{ident}"))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample_once()
+
+    def start(self) -> "SamplingProfiler":
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        """샘플링 중지 후 collapsed stack별 샘플 수 반환"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started_at if self.started_at else 0.0
+        return self.stacks
+
+    def collapsed(self) -> str:
+        """collapsed stack 텍스트 ("frame;frame;frame count" 줄 단위)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileStore:
+    """프로파일 파일 저장 / 목록 / 보관 개수 관리"""
+
+    def __init__(self, directory: Optional[str] = None, keep: Optional[int] = None):
+        """
+        Args:
+            directory: 저장 디렉토리 (기본값: PROFILE_DIR 환경변수)
+            keep: 보관할 최근 프로파일 수 (기본값: PROFILE_KEEP 환경변수)
+        """
+        self.directory = directory or DEFAULT_PROFILE_DIR
+        self.keep = keep or int(os.getenv("PROFILE_KEEP", "50"))
+        self._lock = threading.Lock()
+
+    def save(self, profiler: SamplingProfiler, kind: str, target: str,
+             extra: Optional[Dict[str, Any]] = None) -> str:
+        """
+        프로파일 저장
+
+        Args:
+            profiler: 중지한 프로파일러
+            kind: "request" / "stage"
+            target: 라우트 또는 단계 이름
+            extra: 메타데이터에 추가할 값
+
+        Returns:
+            프로파일 ID (다운로드 경로에 사용)
+        """
+        slug = re.sub(r"[^\w-]+", "_", target).strip("_")[:60] or "root"
+        profile_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}_{kind}_{slug}"
+        meta = {
+            "id": profile_id,
+            "kind": kind,
+            "target": target,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "duration_sec": round(profiler.duration, 4),
+            "samples": profiler.samples,
+            "interval_ms": round(profiler.interval * 1000, 3),
+            "stacks": len(profiler.stacks),
+            "format": "collapsed",
+            **(extra or {}),
+        }
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, profile_id)
+            with open(path + COLLAPSED_SUFFIX, "w", encoding="utf-8") as f:
+                f.write(profiler.collapsed())
+            with open(path + META_SUFFIX, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            self._prune()
+        logger.info(f"🔬 프로파일 저장: {profile_id} ({profiler.samples}개 샘플, {profiler.duration:.2f}초)")
+        return profile_id
+
+    def _prune(self):
+        for meta in self.list()[self.keep:]:
+            for suffix in (COLLAPSED_SUFFIX, META_SUFFIX):
+                path = os.path.join(self.directory, meta["id"] + suffix)
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def list(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 프로파일 메타데이터 (최신순)"""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in sorted(os.listdir(self.directory), reverse=True):
+            if not name.endswith(META_SUFFIX):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return profiles[:limit] if limit else profiles
+
+    def path(self, profile_id: str) -> Optional[str]:
+        """collapsed stack 파일 경로 (없거나 잘못된 ID면 None)"""
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        path = os.path.join(self.directory, profile_id + COLLAPSED_SUFFIX)
+        return path if os.path.exists(path) else None
+
+
+_store: Optional[ProfileStore] = None
+_store_lock = threading.Lock()
+
+
+def get_profile_store() -> ProfileStore:
+    """프로세스 공용 프로파일 저장소"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ProfileStore()
+        return _store
+
+
+@contextmanager
+def profile(kind: str, target: str, threads: Optional[Set[int]] = None,
+            extra: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    블록 실행 동안 샘플링 후 저장
+
+    Args:
+        kind: "request" / "stage"
+        target: 라우트 또는 단계 이름
+        threads: 수집할 스레드 ID (None이면 모든 스레드)
+        extra: 메타데이터에 추가할 값
+
+    Yields:
+        블록이 끝나면 "id"에 프로파일 ID가 채워지는 딕셔너리
+    """
+    result: Dict[str, Any] = {"id": None}
+    profiler = SamplingProfiler(threads=threads).start()
+    try:
+        yield result
+    finally:
+        profiler.stop()
+        try:
+            result["id"] = get_profile_store().save(profiler, kind, target, extra)
+        except OSError as e:
+            logger.warning(f"⚠️ 프로파일 저장 실패: {e}")
+
+
+def profiled_stages() -> Set[str]:
+    """PROFILE_STAGES 환경변수의 단계 이름 (쉼표 구분, all이면 전체)"""
+    return {name.strip() for name in os.getenv("PROFILE_STAGES", "").split(",") if name.strip()}
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+쿼리 통계 / 느린 쿼리 로그
+- 정규화한 SQL 지문(fingerprint)별 호출 수, 총 / 평균 / p95 시간, 반환(영향) 행 수, 실패 수
+- 기준 시간(QUERY_SLOW_MS)을 넘은 쿼리는 고정 크기 링 버퍼에 기록
+- 선택적으로 느린 SELECT의 EXPLAIN (ANALYZE, BUFFERS) 결과를 함께 보관 (지문별 최소 간격)
+"""
+
+import os
+import re
+import time
+import hashlib
+import threading
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# p95 계산에 사용하는 지문별 최근 실행 시간 수
+DURATION_WINDOW = 512
+# 지문 수 상한 (넘으면 새 지문은 OVERFLOW_FINGERPRINT로 합산)
+DEFAULT_MAX_FINGERPRINTS = 500
+OVERFLOW_FINGERPRINT = "(overflow)"
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s|\$\d+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(query: str) -> str:
+    """
+    SQL 정규화 (주석 / 리터럴 / 자리 표시자 → ?, IN (?, ?, ...) → (?), 공백 축약)
+
+    Args:
+        query: SQL 쿼리
+
+    Returns:
+        정규화한 SQL (같은 문장 구조면 파라미터가 달라도 같은 문자열)
+    """
+    text = _COMMENT.sub(" ", query)
+    text = _STRING.sub("?", text)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _VALUE_LIST.sub("(?)", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def fingerprint(query: str) -> str:
+    """정규화한 SQL의 짧은 해시"""
+    return hashlib.sha1(normalize_sql(query).encode("utf-8")).hexdigest()[:12]
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class StatementStats:
+    """지문 1개의 누적 통계"""
+
+    __slots__ = ("fingerprint", "sql", "calls", "errors", "total", "max", "rows", "durations",
+                 "last_explain")
+
+    def __init__(self, fingerprint: str, sql: str):
+        self.fingerprint = fingerprint
+        self.sql = sql
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.durations: Deque[float] = deque(maxlen=DURATION_WINDOW)
+        self.last_explain = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "sql": self.sql,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.calls, 3) if self.calls else 0.0,
+            "p95_ms": round(_percentile(list(self.durations), 0.95) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "rows": self.rows,
+            "rows_per_call": round(self.rows / self.calls, 2) if self.calls else 0.0,
+        }
+
+
+class QueryStatsRecorder:
+    """SQL 지문별 실행 통계 + 느린 쿼리 링 버퍼"""
+
+    SORT_KEYS = ("total_ms", "mean_ms", "p95_ms", "max_ms", "calls", "rows", "errors")
+
+    def __init__(self, slow_ms: Optional[float] = None, slow_log_size: Optional[int] = None,
+                 explain: Optional[bool] = None, explain_interval: Optional[float] = None,
+                 max_fingerprints: int = DEFAULT_MAX_FINGERPRINTS):
+        """
+        Args:
+            slow_ms: 느린 쿼리 기준 시간(ms) (기본값: QUERY_SLOW_MS 환경변수, 0이면 기록 안 함)
+            slow_log_size: 느린 쿼리 로그 크기 (기본값: QUERY_SLOW_LOG_SIZE 환경변수)
+            explain: 느린 SELECT의 실행 계획 수집 여부 (기본값: QUERY_EXPLAIN_SLOW 환경변수)
+            explain_interval: 같은 지문의 실행 계획을 다시 수집하기까지 최소 간격(초)
+                (기본값: QUERY_EXPLAIN_INTERVAL 환경변수)
+            max_fingerprints: 지문 수 상한
+        """
+        self.slow_ms = slow_ms if slow_ms is not None else float(os.getenv("QUERY_SLOW_MS", "200"))
+        size = slow_log_size or int(os.getenv("QUERY_SLOW_LOG_SIZE", "100"))
+        self.explain = explain if explain is not None else \
+            os.getenv("QUERY_EXPLAIN_SLOW", "False").lower() == "true"
+        self.explain_interval = explain_interval if explain_interval is not None else \
+            float(os.getenv("QUERY_EXPLAIN_INTERVAL", "300"))
+        self.max_fingerprints = max_fingerprints
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self._stats: Dict[str, StatementStats] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def _statement(self, query: str) -> StatementStats:
+        # 같은 쿼리 문자열은 정규화를 한 번만 (대부분의 호출 경로는 상수 쿼리)
+        key = self._fingerprints.get(query)
+        if key is None:
+            sql = normalize_sql(query)
+            key = hashlib.sha1(sql.encode("utf-8")).hexdigest()[:12]
+            if key not in self._stats and len(self._stats) >= self.max_fingerprints:
+                key, sql = OVERFLOW_FINGERPRINT, OVERFLOW_FINGERPRINT
+            if len(self._fingerprints) < self.max_fingerprints * 4:
+                self._fingerprints[query] = key
+            self._stats.setdefault(key, StatementStats(key, sql))
+        return self._stats[key]
+
+    def record(self, query: str, seconds: float, rows: int = 0, error: Optional[str] = None,
+               explain: Optional[Callable[[], Optional[str]]] = None):
+        """
+        실행 결과 기록
+
+        Args:
+            query: 실행한 SQL
+            seconds: 실행 시간(초)
+            rows: 반환 행 수 (조회) / 영향 행 수 (변경)
+            error: 실패 메시지 (성공이면 None)
+            explain: 느린 쿼리일 때 실행 계획 텍스트를 반환하는 함수 (SELECT만, 지문별 최소 간격 적용)
+        """
+        with self._lock:
+            stats = self._statement(query)
+            stats.calls += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+            stats.rows += max(rows, 0)
+            stats.durations.append(seconds)
+            if error is not None:
+                stats.errors += 1
+            if not self.slow_ms or seconds * 1000 < self.slow_ms:
+                return
+            now = time.time()
+            run_explain = (self.explain and explain is not None and error is None
+                           and stats.sql.lower().startswith("select")
+                           and now - stats.last_explain >= self.explain_interval)
+            if run_explain:
+                stats.last_explain = now
+            entry = {
+                "fingerprint": stats.fingerprint,
+                "sql": query.strip(),
+                "duration_ms": round(seconds * 1000, 3),
+                "rows": rows,
+                "error": error,
+                "at": datetime.now().isoformat(timespec="seconds"),
+                "plan": None,
+            }
+            self._slow.append(entry)
+
+        logger.warning(f"🐢 느린 쿼리 ({entry['duration_ms']:.0f}ms, {stats.fingerprint}): {stats.sql[:200]}")
+        if run_explain:
+            # 실행 계획은 락 밖에서 수집 (ANALYZE는 쿼리를 한 번 더 실행)
+            try:
+                entry["plan"] = explain()
+            except Exception as e:
+                entry["plan"] = f"EXPLAIN 실패: {e}"
+
+    def snapshot(self, sort: str = "total_ms", limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        지문별 통계
+
+        Args:
+            sort: 정렬 기준 (SORT_KEYS 중 하나, 내림차순)
+            limit: 최대 개수
+        """
+        if sort not in self.SORT_KEYS:
+            raise ValueError(f"정렬 기준은 {', '.join(self.SORT_KEYS)} 중 하나여야 합니다: {sort}")
+        with self._lock:
+            rows = [stats.to_dict() for stats in self._stats.values()]
+        rows.sort(key=lambda row: row[sort], reverse=True)
+        return rows[:limit]
+
+    def slow_queries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """느린 쿼리 로그 (최신순)"""
+        with self._lock:
+            entries = [dict(entry) for entry in reversed(self._slow)]
+        return entries[:limit] if limit else entries
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = sum(stats.calls for stats in self._stats.values())
+            total = sum(stats.total for stats in self._stats.values())
+            return {
+                "since": self.started_at,
+                "fingerprints": len(self._stats),
+                "calls": calls,
+                "total_ms": round(total * 1000, 3),
+                "slow_ms": self.slow_ms,
+                "slow_logged": len(self._slow),
+                "explain": self.explain,
+            }
+
+    def reset(self):
+        """통계 / 느린 쿼리 로그 초기화"""
+        with self._lock:
+            self._stats.clear()
+            self._fingerprints.clear()
+            self._slow.clear()
+            self.started_at = datetime.now().isoformat(timespec="seconds")
+
+
+_recorder: Optional[QueryStatsRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_query_stats() -> QueryStatsRecorder:
+    """프로세스 공용 쿼리 통계 기록기"""
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = QueryStatsRecorder()
+        return _recorder
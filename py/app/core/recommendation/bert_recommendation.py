@@ -16,7 +16,6 @@ from ..bert.bert_nlp import BertNLP
 from ..database import PostgreSQLDatabase
 from datetime import datetime
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 from collections import defaultdict
 import logging
 from typing import List, Dict, Tuple, Optional
@@ -30,10 +29,18 @@ class BertRecommendationSystem:
     BERT 기반 향상된 추천 시스템
     """
     
-    def __init__(self):
-        """BERT 추천 시스템 초기화"""
-        self.bert_nlp = BertNLP()
-        self.db = PostgreSQLDatabase()
+    def __init__(self, bert_nlp: Optional[BertNLP] = None, db=None):
+        """
+        BERT 추천 시스템 초기화
+
+        Args:
+            bert_nlp: 사용할 BERT NLP (None이면 전역 엔진을 쓰는 기본 BertNLP)
+            db: fetch_query / execute_query를 제공하는 DB (None이면 PostgreSQL)
+        """
+        self.bert_nlp = bert_nlp or BertNLP()
+        # 임베딩 / 유사도 검색 엔진 (GPU 추천 시스템과 같은 엔진 / 캐시 공유)
+        self.engine = self.bert_nlp.engine
+        self.db = db or PostgreSQLDatabase()
         logger.info("BERT 추천 시스템 초기화 완료")
     
     def recommend_books_by_context(self, news_data: dict) -> Dict[str, List[Tuple[str, float]]]:
@@ -62,32 +69,28 @@ class BertRecommendationSystem:
             'description': [book[2] for book in books]
         }
         
-        recommendations = {}
+        # 도서 설명은 한 번만 임베딩하고, 모든 키워드 문맥을 한 번의 행렬 곱으로 검색
+        index = self.engine.build_index(self.engine.embed(book_data['description']))
+        contexts = [
+            (category, f"{category} 관련 {keyword}에 대한 내용")
+            for category, keywords in news_data.items()
+            for keyword in keywords
+        ]
+        top_books = self.engine.topk(
+            self.engine.embed([context for _, context in contexts]), index, k=5, threshold=0.3
+        ) if contexts and len(index) else []
+        
+        category_recommendations = defaultdict(list)
+        for (category, _), hits in zip(contexts, top_books):
+            category_recommendations[category].extend(
+                (book_data['isbn'][i], score, book_data['title'][i]) for i, score in hits
+            )
         
-        for category, keywords in news_data.items():
-            logger.info(f"📰 {category} 카테고리 처리 중...")
-            
-            category_recommendations = []
-            
-            for keyword in keywords:
-                # 키워드를 포함한 문맥 생성
-                context = f"{category} 관련 {keyword}에 대한 내용"
-                
-                # 문맥 기반 유사도 계산
-                similarities = self._calculate_contextual_similarities(
-                    context, book_data['description']
-                )
-                
-                # 상위 추천 도서 선택
-                top_books = self._get_top_recommendations(
-                    similarities, book_data['isbn'], book_data['title'], 
-                    threshold=0.3, top_k=5
-                )
-                
-                category_recommendations.extend(top_books)
-            
+        recommendations = {}
+        for category in news_data:
+            logger.info(f"📰 {category} 카테고리 처리 완료")
             # 중복 제거 및 점수 통합
-            recommendations[category] = self._merge_recommendations(category_recommendations)
+            recommendations[category] = self._merge_recommendations(category_recommendations[category])
         
         return recommendations
     
@@ -113,25 +116,40 @@ class BertRecommendationSystem:
         
         recommendations = defaultdict(list)
         
-        for category, keywords in news_data.items():
-            for keyword in keywords:
-                # 키워드 추출
-                keyword_tokens = self.bert_nlp.extract_keywords(keyword, top_k=5)
-                
-                for isbn, title, description in books:
-                    if description:
-                        # 도서 설명에서 키워드 추출
-                        book_keywords = self.bert_nlp.extract_keywords(description, top_k=10)
-                        
-                        # 키워드 간 유사도 계산
-                        keyword_similarity = 0
-                        for kw1 in keyword_tokens:
-                            for kw2 in book_keywords:
-                                similarity = self.bert_nlp.calculate_word_similarity(kw1, kw2)
-                                keyword_similarity = max(keyword_similarity, similarity)
-                        
-                        if keyword_similarity > 0.4:  # 키워드 유사도 임계값
-                            recommendations[keyword].append((isbn, keyword_similarity))
+        # 도서 설명 키워드는 전체 도서를 한 번에 추출 (키워드마다 반복하지 않음)
+        all_book_keywords = self.bert_nlp.extract_keywords_batch(
+            [description for _, _, description in books], top_k=10
+        )
+        
+        keywords = [keyword for category_keywords in news_data.values() for keyword in category_keywords]
+        all_keyword_tokens = self.bert_nlp.extract_keywords_batch(keywords, top_k=5)
+        
+        # 등장하는 모든 단어를 한 번만 임베딩
+        vocabulary = list(dict.fromkeys(
+            word for words in all_keyword_tokens + all_book_keywords for word in words
+        ))
+        word_index = {word: i for i, word in enumerate(vocabulary)}
+        # 단어 벡터 행을 직접 꺼내 쓰므로 압축하지 않는 fp32 인덱스 사용
+        word_vectors = self.engine.build_index(self.engine.embed(vocabulary), codec="fp32")
+        
+        # 도서별 키워드 위치를 이어 붙인 배열 (np.maximum.reduceat으로 도서별 최댓값 계산)
+        book_rows = [row for row, ((_, _, description), book_keywords)
+                     in enumerate(zip(books, all_book_keywords)) if description and book_keywords]
+        flat_words = np.array([word_index[word] for row in book_rows for word in all_book_keywords[row]],
+                              dtype=np.int64)
+        starts = np.cumsum([0] + [len(all_book_keywords[row]) for row in book_rows[:-1]])
+        
+        for keyword, keyword_tokens in zip(keywords, all_keyword_tokens):
+            if not keyword_tokens or not book_rows:
+                continue
+            # 단어별로 키워드 토큰과의 최고 유사도 → 도서별 최고 유사도
+            token_vectors = word_vectors.vectors[[word_index[token] for token in keyword_tokens]]
+            best_per_word = self.engine.similarities(token_vectors, word_vectors).max(axis=0)
+            book_scores = np.maximum.reduceat(best_per_word[flat_words], starts)
+            
+            for row, keyword_similarity in zip(book_rows, book_scores):
+                if keyword_similarity > 0.4:  # 키워드 유사도 임계값
+                    recommendations[keyword].append((books[row][0], float(keyword_similarity)))
         
         # 결과 정리
         final_recommendations = {}
@@ -172,20 +190,20 @@ class BertRecommendationSystem:
         
         recommendations = {}
         
-        for category, keywords in news_data.items():
-            for keyword in keywords:
-                # 키워드가 속할 가장 적합한 클러스터 찾기
-                best_cluster = self._find_best_cluster(keyword, clusters, descriptions)
+        # 키워드가 속할 가장 적합한 클러스터 찾기 (모든 키워드를 한 번에 계산)
+        keywords = [keyword for category_keywords in news_data.values() for keyword in category_keywords]
+        best_clusters = self._find_best_clusters(keywords, clusters, descriptions)
+        
+        for keyword, best_cluster in zip(keywords, best_clusters):
+            if best_cluster is not None:
+                # 해당 클러스터의 도서들 추천
+                cluster_books = clusters[best_cluster]
                 
-                if best_cluster is not None:
-                    # 해당 클러스터의 도서들 추천
-                    cluster_books = clusters[best_cluster]
-                    
-                    for book_idx in cluster_books:
-                        if book_idx < len(isbns):
-                            isbn = isbns[book_idx]
-                            # 클러스터 기반 점수 (0.6으로 고정)
-                            recommendations.setdefault(keyword, []).append((isbn, 0.6))
+                for book_idx in cluster_books:
+                    if book_idx < len(isbns):
+                        isbn = isbns[book_idx]
+                        # 클러스터 기반 점수 (0.6으로 고정)
+                        recommendations.setdefault(keyword, []).append((isbn, 0.6))
         
         # 결과 정리
         final_recommendations = {}
@@ -286,32 +304,6 @@ class BertRecommendationSystem:
         except Exception as e:
             logger.error(f"❌ 추천 결과 저장 실패: {e}")
     
-    def _calculate_contextual_similarities(self, context: str, descriptions: List[str]) -> List[float]:
-        """문맥 기반 유사도 계산"""
-        similarities = []
-        for description in descriptions:
-            if description:
-                similarity = self.bert_nlp.calculate_contextual_similarity(context, description)
-                similarities.append(similarity)
-            else:
-                similarities.append(0.0)
-        return similarities
-    
-    def _get_top_recommendations(self, similarities: List[float], isbns: List[str], 
-                               titles: List[str], threshold: float = 0.3, 
-                               top_k: int = 5) -> List[Tuple[str, float, str]]:
-        """상위 추천 도서 선택"""
-        recommendations = []
-        
-        for i, similarity in enumerate(similarities):
-            if similarity >= threshold and i < len(isbns):
-                recommendations.append((isbns[i], similarity, titles[i]))
-        
-        # 점수 순으로 정렬
-        recommendations.sort(key=lambda x: x[1], reverse=True)
-        
-        return recommendations[:top_k]
-    
     def _merge_recommendations(self, recommendations: List[Tuple[str, float, str]]) -> List[Tuple[str, float]]:
         """추천 결과 통합 및 중복 제거"""
         merged = {}
@@ -325,31 +317,27 @@ class BertRecommendationSystem:
         
         return sorted_recs[:5]  # 상위 10개 반환
     
-    def _find_best_cluster(self, keyword: str, clusters: Dict[int, List[int]], 
-                          descriptions: List[str]) -> Optional[int]:
-        """키워드와 가장 유사한 클러스터 찾기"""
-        best_cluster = None
-        best_similarity = 0.0
-        
-        for cluster_id, book_indices in clusters.items():
-            cluster_similarity = 0.0
-            
-            for book_idx in book_indices:
-                if book_idx < len(descriptions):
-                    description = descriptions[book_idx]
-                    if description:
-                        similarity = self.bert_nlp.calculate_contextual_similarity(keyword, description)
-                        cluster_similarity += similarity
-            
-            # 클러스터 평균 유사도
-            if book_indices:
-                cluster_similarity /= len(book_indices)
-                
-                if cluster_similarity > best_similarity:
-                    best_similarity = cluster_similarity
-                    best_cluster = cluster_id
-        
-        return best_cluster
+    def _find_best_clusters(self, keywords: List[str], clusters: Dict[int, List[int]],
+                            descriptions: List[str]) -> List[Optional[int]]:
+        """키워드별로 평균 유사도가 가장 높은 클러스터 찾기"""
+        if not keywords or not clusters:
+            return [None] * len(keywords)
+        
+        # 키워드 × 도서 유사도 행렬 (도서 임베딩은 클러스터링 때 캐시됨)
+        similarities = self.engine.similarities(
+            self.engine.embed(keywords), self.engine.embed(descriptions)
+        )
+        cluster_ids = list(clusters)
+        cluster_means = np.stack([
+            similarities[:, [i for i in clusters[cluster_id] if i < len(descriptions)]].mean(axis=1)
+            for cluster_id in cluster_ids
+        ], axis=1)
+        
+        best = cluster_means.argmax(axis=1)
+        return [
+            cluster_ids[column] if cluster_means[row, column] > 0.0 else None
+            for row, column in enumerate(best)
+        ]
     
     def evaluate_recommendation_quality(self, method: str = "hybrid"):
         """추천 품질 평가"""
@@ -397,6 +385,7 @@ class BertRecommendationSystem:
     
     def close(self):
         """리소스 정리"""
+        self.bert_nlp.save_cache()
         self.db.close()
         logger.info("BERT 추천 시스템 종료")
 
@@ -10,21 +10,17 @@ GPU 최적화된 BERT 기반 추천 시스템
 
 import sys
 import os
+import hashlib
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ..bert.bert_nlp_gpu import GPUBertNLP
+from ..bert.embedding_engine import EmbeddingEngine, get_embedding_engine
 from ..database import PostgreSQLDatabase
+from ..tracing import span
 from datetime import datetime
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from collections import defaultdict
 import logging
 from typing import List, Dict, Tuple, Optional
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import pickle
-import hashlib
-import torch
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -33,33 +29,38 @@ logger = logging.getLogger(__name__)
 class GPUBertRecommendationSystem:
     """
     GPU 최적화된 BERT 기반 추천 시스템
+    
+    임베딩 / 유사도 검색은 EmbeddingEngine을 사용하므로 CPU 환경에서도
+    캐시, 배치 임베딩, 행렬 곱 검색이 그대로 적용됩니다.
     """
     
-    def __init__(self, cache_dir: str = "cache", batch_size: int = 128, max_workers: int = 2):
-        """GPU 최적화된 BERT 추천 시스템 초기화"""
-        self.bert_nlp = GPUBertNLP()
-        self.db = PostgreSQLDatabase()
-        self.cache_dir = cache_dir
-        self.batch_size = batch_size
-        self.max_workers = max_workers
-        
-        # GPU 사용 가능 여부 확인
-        self.use_gpu = torch.cuda.is_available()
+    def __init__(self, batch_size: Optional[int] = None, engine: Optional[EmbeddingEngine] = None,
+                 db=None, book_limit: Optional[int] = None):
+        """
+        GPU 최적화된 BERT 추천 시스템 초기화
         
-        # 캐시 디렉토리 생성
-        os.makedirs(cache_dir, exist_ok=True)
+        Args:
+            batch_size: 도서 임베딩 배치 크기 (None이면 디바이스에 따라 엔진이 결정)
+            engine: 사용할 임베딩 엔진 (None이면 전역 엔진)
+            db: fetch_query / execute_query / execute_many를 제공하는 DB (None이면 PostgreSQL)
+            book_limit: 추천 대상 도서 수 상한 (기본값: RECOMMEND_BOOK_LIMIT 환경변수 / 0이면 제한 없음,
+                        설정하지 않으면 CUDA 2000 / CPU 전체 - 기존 CPU 추천 시스템과 같게 전체 카탈로그 사용)
+        """
+        self.engine = engine or get_embedding_engine()
+        self.db = db or PostgreSQLDatabase()
+        self.batch_size = batch_size
+        self.book_limit = book_limit if book_limit is not None else int(
+            os.getenv("RECOMMEND_BOOK_LIMIT") or (2000 if self.engine.device == "cuda" else 0))
         
-        # 임베딩 캐시
-        self.embedding_cache = {}
+        # GPU 사용 여부 (tb_recommend.method 구분용)
+        self.use_gpu = self.engine.device == "cuda"
         
         logger.info(f"🚀 GPU 최적화된 BERT 추천 시스템 초기화 완료")
         logger.info(f"   - GPU 사용: {self.use_gpu}")
-        logger.info(f"   - 배치 크기: {batch_size}")
-        logger.info(f"   - 워커 수: {max_workers}")
+        logger.info(f"   - 배치 크기: {batch_size or self.engine.batch_size}")
         
         # GPU 통계 출력
-        gpu_stats = self.bert_nlp.get_gpu_stats()
-        logger.info(f"   - GPU 통계: {gpu_stats}")
+        logger.info(f"   - GPU 통계: {self.engine.device_stats()}")
     
     def recommend_books_by_context_gpu(self, news_data: dict) -> Dict[str, List[Tuple[str, float]]]:
         """
@@ -75,61 +76,106 @@ class GPUBertRecommendationSystem:
         logger.info("🧠 GPU 최적화된 문맥 기반 도서 추천 시작")
         
         # 1. 도서 데이터 배치 로드
-        books_data = self._load_books_batch()
-        logger.info(f"📚 {len(books_data['isbn'])}권의 도서 데이터 로드 완료")
+        books_data = self.load_books()
         
         # 2. 도서 임베딩 GPU 배치 생성 (캐시 활용)
-        book_embeddings = self._get_book_embeddings_gpu_batch(books_data['description'])
-        logger.info(f"🔍 {len(book_embeddings)}개의 도서 임베딩 생성 완료")
-        
-        recommendations = {}
+        book_embeddings = self.embed_books(books_data)
         
-        # 3. 카테고리별 병렬 처리 (GPU 사용 시 워커 수 줄임)
-        if self.use_gpu:
-            # GPU 사용 시 메모리 경합을 피하기 위해 워커 수 줄임
-            actual_workers = min(self.max_workers, 2)
-        else:
-            actual_workers = self.max_workers
-        
-        with ThreadPoolExecutor(max_workers=actual_workers) as executor:
-            future_to_category = {}
-            
-            for category, keywords in news_data.items():
-                future = executor.submit(
-                    self._process_category_gpu,
-                    category, keywords, book_embeddings, books_data
-                )
-                future_to_category[future] = category
-            
-            # 결과 수집
-            for future in as_completed(future_to_category):
-                category = future_to_category[future]
-                try:
-                    category_recommendations = future.result()
-                    recommendations[category] = category_recommendations
-                    logger.info(f"✅ {category} 카테고리 처리 완료: {len(category_recommendations)}권")
-                except Exception as e:
-                    logger.error(f"❌ {category} 카테고리 처리 실패: {e}")
-                    recommendations[category] = []
+        # 3. 카테고리별 추천
+        recommendations = self.score_categories(news_data, book_embeddings, books_data)
         
         total_time = time.time() - start_time
         logger.info(f"🎉 전체 추천 완료: {total_time:.2f}초")
         
         # GPU 통계 출력
-        final_gpu_stats = self.bert_nlp.get_gpu_stats()
+        final_gpu_stats = self.engine.device_stats()
         logger.info(f"💾 최종 GPU 통계: {final_gpu_stats}")
         
         return recommendations
     
-    def _load_books_batch(self) -> Dict[str, List]:
-        """도서 데이터 배치 로드"""
+    def load_books(self, limit: Optional[int] = None) -> Dict[str, List]:
+        """
+        추천 대상 도서 데이터 로드 (ISBN 순)
+
+        Args:
+            limit: 도서 수 상한 (None이면 book_limit, 0이면 전체 카탈로그)
+        """
+        books_data = self._load_books_batch(self.book_limit if limit is None else limit)
+        logger.info(f"📚 {len(books_data['isbn'])}권의 도서 데이터 로드 완료")
+        return books_data
+    
+    def embed_books(self, books_data: Dict[str, List]) -> np.ndarray:
+        """도서 설명 임베딩 생성 (캐시에 없는 설명만 계산)"""
+        if self.engine.projection_dim and self.engine.projection is None:
+            # 차원 축소를 켰는데 학습된 투영이 없으면 (또는 모델 / 임베딩 방식이 바뀌었으면) 카탈로그로 학습
+            catalogue_hash = hashlib.sha1("\n".join(books_data['isbn']).encode("utf-8")).hexdigest()
+            self.engine.fit_projection(books_data['description'], catalogue_hash=catalogue_hash)
+        book_embeddings = self.engine.embed(books_data['description'], batch_size=self.batch_size)
+        logger.info(f"🔍 {len(book_embeddings)}개의 도서 임베딩 생성 완료")
+        return book_embeddings
+    
+    def score_categories(self, news_data: dict, book_embeddings: np.ndarray,
+                         books_data: Dict[str, List]) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        카테고리별 추천 도서 선정
+        
+        모든 카테고리의 키워드 문맥을 한 번에 임베딩하고, 도서 임베딩 행렬과의
+        행렬 곱 한 번으로 문맥별 상위 도서를 구합니다.
+        
+        Args:
+            news_data: 카테고리별 키워드(뉴스 제목) 딕셔너리
+            book_embeddings: 도서 임베딩 행렬 (도서 수 × 임베딩 차원)
+            books_data: 도서 데이터 딕셔너리
+            
+        Returns:
+            카테고리별 추천 도서 리스트
+        """
+        contexts = [
+            (category, f"{category} 관련 {keyword}에 대한 내용")
+            for category, keywords in news_data.items()
+            for keyword in keywords
+        ]
+        recommendations = {category: [] for category in news_data}
+        if not contexts or len(book_embeddings) == 0:
+            return recommendations
+        
+        with span("score.index", books=len(book_embeddings)):
+            index = self.engine.build_index(book_embeddings)
+        with span("score.contexts", contexts=len(contexts)):
+            context_embeddings = self.engine.embed([context for _, context in contexts])
+        with span("score.topk", contexts=len(contexts), books=len(book_embeddings), k=5):
+            top_books = self.engine.topk(context_embeddings, index, k=5, threshold=0.3)
+        
+        candidates: Dict[str, List[Tuple[str, float, str]]] = {category: [] for category in news_data}
+        for (category, _), hits in zip(contexts, top_books):
+            candidates[category].extend(
+                (books_data['isbn'][i], score, books_data['title'][i]) for i, score in hits
+            )
+        
+        # 중복 제거 및 점수 통합
+        for category, category_candidates in candidates.items():
+            with span("score.category", category=category, keywords=len(news_data[category]),
+                      candidates=len(category_candidates)) as category_span:
+                recommendations[category] = self._merge_recommendations_gpu(category_candidates)
+                category_span.set(rows=len(recommendations[category]))
+            logger.info(f"✅ {category} 카테고리 처리 완료: {len(recommendations[category])}권")
+        
+        return recommendations
+    
+    def _load_books_batch(self, limit: int) -> Dict[str, List]:
+        """도서 데이터 배치 로드 (상한이 있어도 매번 같은 도서가 선택되도록 ISBN 순)"""
         query = """
             SELECT books_isbn, books_title, books_description 
             FROM tb_books 
             WHERE books_description IS NOT NULL AND books_description != ''
-            LIMIT 2000  -- GPU 사용 시 더 많은 데이터 처리 가능
+            ORDER BY books_isbn
         """
-        books = self.db.fetch_query(query)
+        with span("db.select", table="tb_books", limit=limit) as select_span:
+            if limit > 0:
+                books = self.db.fetch_query(query + " LIMIT %s", (limit,))
+            else:
+                books = self.db.fetch_query(query)
+            select_span.set(rows=len(books))
         
         return {
             'isbn': [book[0] for book in books],
@@ -137,94 +183,6 @@ class GPUBertRecommendationSystem:
             'description': [book[2] for book in books]
         }
     
-    def _get_book_embeddings_gpu_batch(self, descriptions: List[str]) -> List[np.ndarray]:
-        """도서 임베딩 GPU 배치 생성 (캐시 활용)"""
-        embeddings = []
-        
-        # GPU 메모리에 따른 배치 크기 조정
-        if self.use_gpu:
-            gpu_stats = self.bert_nlp.get_gpu_stats()
-            gpu_memory_gb = gpu_stats['total_memory_mb'] / 1024
-            
-            if gpu_memory_gb < 4:  # 4GB 미만
-                batch_size = min(self.batch_size, 32)
-            elif gpu_memory_gb < 8:  # 8GB 미만
-                batch_size = min(self.batch_size, 64)
-            else:  # 8GB 이상
-                batch_size = min(self.batch_size, 128)
-        else:
-            batch_size = min(self.batch_size, 32)
-        
-        logger.info(f"📦 GPU 배치 처리 시작 (배치 크기: {batch_size})")
-        
-        for i in range(0, len(descriptions), batch_size):
-            batch_descriptions = descriptions[i:i+batch_size]
-            
-            # GPU 배치 임베딩 생성
-            batch_embeddings = self.bert_nlp.get_embeddings_batch_gpu(batch_descriptions, batch_size)
-            embeddings.extend(batch_embeddings)
-            
-            # 진행률 출력
-            progress = (i + batch_size) / len(descriptions) * 100
-            logger.info(f"   진행률: {min(progress, 100):.1f}%")
-        
-        return embeddings
-    
-    def _process_category_gpu(self, category: str, keywords: List[str], 
-                            book_embeddings: List[np.ndarray], 
-                            books_data: Dict[str, List]) -> List[Tuple[str, float]]:
-        """카테고리별 GPU 최적화된 처리"""
-        category_recommendations = []
-        
-        for keyword in keywords:
-            # 키워드 임베딩 생성
-            context = f"{category} 관련 {keyword}에 대한 내용"
-            context_embedding = self.bert_nlp.get_bert_embedding_gpu(context)
-            
-            # GPU 배치 유사도 계산
-            similarities = self._calculate_similarities_gpu_batch(context_embedding, book_embeddings)
-            
-            # 상위 추천 도서 선택
-            top_books = self._get_top_recommendations_gpu(
-                similarities, books_data['isbn'], books_data['title'], 
-                threshold=0.3, top_k=5
-            )
-            
-            category_recommendations.extend(top_books)
-        
-        # 중복 제거 및 점수 통합
-        return self._merge_recommendations_gpu(category_recommendations)
-    
-    def _calculate_similarities_gpu_batch(self, query_embedding: np.ndarray, 
-                                        book_embeddings: List[np.ndarray]) -> List[float]:
-        """GPU 배치 유사도 계산"""
-        if self.use_gpu and len(book_embeddings) > 1000:
-            # GPU에서 대용량 유사도 계산
-            return self.bert_nlp._calculate_similarities_gpu(query_embedding, book_embeddings)
-        else:
-            # CPU에서 계산 (소용량 데이터)
-            similarities = []
-            for book_embedding in book_embeddings:
-                similarity = cosine_similarity([query_embedding], [book_embedding])[0][0]
-                similarities.append(float(similarity))
-            return similarities
-    
-    def _get_top_recommendations_gpu(self, similarities: List[float], 
-                                   isbns: List[str], titles: List[str], 
-                                   threshold: float = 0.3, 
-                                   top_k: int = 5) -> List[Tuple[str, float, str]]:
-        """GPU 최적화된 상위 추천 도서 선택"""
-        # numpy 배열로 변환하여 빠른 정렬
-        similarities_array = np.array(similarities)
-        indices = np.argsort(similarities_array)[::-1]  # 내림차순 정렬
-        
-        recommendations = []
-        for idx in indices:
-            if similarities_array[idx] >= threshold and len(recommendations) < top_k:
-                recommendations.append((isbns[idx], similarities_array[idx], titles[idx]))
-        
-        return recommendations
-    
     def _merge_recommendations_gpu(self, recommendations: List[Tuple[str, float, str]]) -> List[Tuple[str, float]]:
         """GPU 최적화된 추천 결과 통합"""
         merged = {}
@@ -239,66 +197,58 @@ class GPUBertRecommendationSystem:
         return sorted_recs[:10]  # 상위 10개 반환
     
     def save_recommendations_to_db(self, recommendations: Dict[str, List[Tuple[str, float]]], 
-                                 method: str = "gpu_bert"):
-        """추천 결과를 DB에 저장"""
+                                 method: str = "gpu_bert") -> bool:
+        """
+        추천 결과를 DB에 저장
+        
+        Returns:
+            저장 성공 여부
+        """
         logger.info(f"💾 추천 결과 DB 저장 시작 (방법: {method})")
         
         try:
             # 기존 추천 데이터 삭제
             delete_query = "DELETE FROM tb_recommend WHERE method = %s"
-            self.db.execute_query(delete_query, (method,))
+            with span("db.delete", table="tb_recommend", method=method):
+                if not self.db.execute_query(delete_query, (method,)):
+                    return False
             
-            # 새로운 추천 데이터 삽입
+            # 새로운 추천 데이터 일괄 삽입
             insert_query = """
                 INSERT INTO tb_recommend (news_keyword, books_isbn, similarity_score, method, created_at)
                 VALUES (%s, %s, %s, %s, %s)
             """
             
-            total_inserted = 0
-            for category, recs in recommendations.items():
-                for isbn, score in recs:
-                    self.db.execute_query(insert_query, (
-                        category, isbn, score, method, datetime.now()
-                    ))
-                    total_inserted += 1
+            now = datetime.now()
+            rows = [
+                (category, isbn, float(score), method, now)
+                for category, recs in recommendations.items()
+                for isbn, score in recs
+            ]
+            with span("db.insert", table="tb_recommend", rows=len(rows)):
+                if rows and not self.db.execute_many(insert_query, rows):
+                    return False
             
-            logger.info(f"✅ 추천 결과 DB 저장 완료: {total_inserted}개")
+            logger.info(f"✅ 추천 결과 DB 저장 완료: {len(rows)}개")
+            return True
             
         except Exception as e:
             logger.error(f"❌ 추천 결과 DB 저장 실패: {e}")
-    
-    def _get_cache_key(self, text: str) -> str:
-        """캐시 키 생성"""
-        return hashlib.md5(text.encode()).hexdigest()
+            return False
     
     def save_cache(self):
-        """임베딩 캐시 저장"""
-        cache_file = os.path.join(self.cache_dir, "gpu_embedding_cache.pkl")
-        with open(cache_file, 'wb') as f:
-            pickle.dump(self.embedding_cache, f)
-        logger.info(f"💾 GPU 임베딩 캐시 저장 완료: {len(self.embedding_cache)}개")
-    
-    def load_cache(self):
-        """임베딩 캐시 로드"""
-        cache_file = os.path.join(self.cache_dir, "gpu_embedding_cache.pkl")
-        if os.path.exists(cache_file):
-            with open(cache_file, 'rb') as f:
-                self.embedding_cache = pickle.load(f)
-            logger.info(f"📂 GPU 임베딩 캐시 로드 완료: {len(self.embedding_cache)}개")
+        """임베딩 캐시 저장 (새 항목만 추가 기록)"""
+        self.engine.save_cache()
     
     def clear_cache(self):
         """캐시 초기화"""
-        self.embedding_cache.clear()
-        cache_file = os.path.join(self.cache_dir, "gpu_embedding_cache.pkl")
-        if os.path.exists(cache_file):
-            os.remove(cache_file)
+        self.engine.cache.clear()
         logger.info("🗑️ GPU 캐시 초기화 완료")
     
     def close(self):
         """리소스 정리"""
-        self.save_cache()
-        self.bert_nlp.save_cache()
-        self.bert_nlp.clear_gpu_cache()
+        self.engine.save_cache()
+        self.engine.clear_device_cache()
         self.db.close()
         logger.info("🔚 GPU 최적화된 BERT 추천 시스템 종료")
 
@@ -328,13 +278,7 @@ def main():
         logger.info(f"✅ 뉴스 제목 크롤링 완료: {len(news_titles)}개 카테고리")
         
         # GPU 최적화된 BERT 추천 시스템 초기화
-        recommender = GPUBertRecommendationSystem(
-            batch_size=128,  # GPU 사용 시 더 큰 배치 크기
-            max_workers=2    # GPU 사용 시 워커 수 줄임
-        )
-        
-        # 캐시 로드
-        recommender.load_cache()
+        recommender = GPUBertRecommendationSystem()
         
         # GPU 최적화된 추천 실행
         logger.info("🔄 GPU 최적화된 BERT 추천 시작...")
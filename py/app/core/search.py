@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+도서 의미 검색
+- 카탈로그 스냅샷(표시 필드) + 도서 설명 임베딩 인덱스를 메모리에 유지 (SEARCH_INDEX_TTL마다 백그라운드 갱신)
+- 검색어 임베딩은 LRU에 보관해 같은 검색어는 모델을 다시 거치지 않음
+- 검색은 엔진 인덱스(fp32 / 압축 코덱)의 상위 k개 검색 한 번 + 스냅샷 행 조회
+"""
+
+import os
+import time
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .metrics import CACHE_ENTRIES, CACHE_EVENTS, get_metrics
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 스냅샷 행 필드 순서 (SELECT 컬럼 순서와 같음)
+CATALOGUE_FIELDS = ("books_isbn", "books_title", "books_description", "books_img", "books_publisher")
+
+
+class SearchIndexNotReady(RuntimeError):
+    """첫 검색 인덱스가 아직 만들어지지 않음"""
+
+
+class QueryEmbeddingLRU:
+    """검색어 임베딩 LRU (키: 임베딩 방식 + 전처리한 검색어)"""
+
+    def __init__(self, max_size: Optional[int] = None):
+        """
+        Args:
+            max_size: 최대 검색어 수 (기본값: SEARCH_QUERY_CACHE_SIZE 환경변수, 0이면 캐시 안 함)
+        """
+        self.max_size = max_size if max_size is not None else int(os.getenv("SEARCH_QUERY_CACHE_SIZE", "1024"))
+        self._entries: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, str]) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+        CACHE_EVENTS.labels("search_query", "miss" if vector is None else "hit").inc()
+        return vector
+
+    def put(self, key: Tuple[str, str], vector: np.ndarray):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            CACHE_EVENTS.labels("search_query", "eviction").inc(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class CatalogueSnapshot:
+    """검색 시점에 바꿔 끼우는 카탈로그 행 + 임베딩 인덱스 (생성 후 변경하지 않음)"""
+
+    __slots__ = ("rows", "index", "backend", "built_at", "build_seconds")
+
+    def __init__(self, rows: Sequence[Tuple], index, backend: str, build_seconds: float = 0.0):
+        self.rows = list(rows)
+        self.index = index
+        self.backend = backend
+        self.built_at = time.time()
+        self.build_seconds = build_seconds
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class BookSearchIndex:
+    """도서 설명 임베딩 기반 의미 검색"""
+
+    def __init__(self, engine=None, db=None, book_limit: Optional[int] = None, ttl: Optional[float] = None,
+                 query_cache: Optional[QueryEmbeddingLRU] = None):
+        """
+        Args:
+            engine: 임베딩 엔진 (None이면 최초 갱신 시 전역 엔진)
+            db: fetch_query를 제공하는 DB (None이면 갱신할 때마다 PostgreSQL 연결 생성 / 종료)
+            book_limit: 색인할 도서 수 상한 (기본값: SEARCH_BOOK_LIMIT 환경변수, 0이면 전체)
+            ttl: 스냅샷 갱신 주기(초) (기본값: SEARCH_INDEX_TTL 환경변수, 0이면 갱신 안 함)
+            query_cache: 검색어 임베딩 LRU (None이면 생성)
+        """
+        self._engine = engine
+        self.db = db
+        self.book_limit = book_limit if book_limit is not None else int(os.getenv("SEARCH_BOOK_LIMIT", "0"))
+        self.ttl = ttl if ttl is not None else float(os.getenv("SEARCH_INDEX_TTL", "3600"))
+        self.query_cache = query_cache or QueryEmbeddingLRU()
+        self.snapshot: Optional[CatalogueSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from .bert.embedding_engine import get_embedding_engine
+            self._engine = get_embedding_engine()
+        return self._engine
+
+    # ---------------------------------------------------------------
+    # 스냅샷 갱신
+    # ---------------------------------------------------------------
+    def _load_catalogue(self) -> List[Tuple]:
+        query = f"""
+            SELECT {', '.join(CATALOGUE_FIELDS)}
+            FROM tb_books
+            WHERE books_description IS NOT NULL AND books_description != ''
+            ORDER BY books_isbn
+        """
+        db = self.db
+        if db is None:
+            from .database import PostgreSQLDatabase
+            db = PostgreSQLDatabase()
+        try:
+            if self.book_limit > 0:
+                return db.fetch_query(query + " LIMIT %s", (self.book_limit,), name="search_catalogue")
+            return db.fetch_query(query, name="search_catalogue")
+        finally:
+            if self.db is None:
+                db.close()
+
+    def refresh(self) -> CatalogueSnapshot:
+        """
+        카탈로그 / 임베딩 인덱스를 다시 만들어 교체 (진행 중인 검색은 이전 스냅샷 사용)
+
+        Returns:
+            새 스냅샷
+        """
+        with self._refresh_lock:
+            start_time = time.perf_counter()
+            rows = self._load_catalogue()
+            engine = self.engine
+            # 추천 파이프라인과 같은 엔진 / 캐시를 쓰므로 이미 계산한 도서 설명은 재사용
+            embeddings = engine.embed([row[2] for row in rows])
+            snapshot = CatalogueSnapshot(rows, engine.build_index(embeddings), engine.backend,
+                                         time.perf_counter() - start_time)
+            self.snapshot = snapshot
+        logger.info(f"🔎 검색 인덱스 갱신: {len(snapshot)}권, {snapshot.build_seconds:.2f}초")
+        return snapshot
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"❌ 검색 인덱스 갱신 실패 (이전 스냅샷 유지): {e}")
+
+    def ensure_fresh(self, wait: bool = True) -> Optional[CatalogueSnapshot]:
+        """
+        사용할 스냅샷 반환 (TTL이 지났으면 이전 스냅샷으로 응답하면서 백그라운드 갱신)
+
+        Args:
+            wait: 스냅샷이 아직 없을 때 지금 생성할지 여부 (False면 백그라운드 생성 후 None)
+        """
+        snapshot = self.snapshot
+        if snapshot is None and wait:
+            with self._refresh_lock:
+                snapshot = self.snapshot
+            return snapshot or self.refresh()
+        stale = snapshot is None or (self.ttl > 0 and time.time() - snapshot.built_at >= self.ttl)
+        if stale:
+            self._start_background_refresh()
+        return snapshot
+
+    def _start_background_refresh(self):
+        """진행 중인 갱신이 없으면 백그라운드 갱신 시작"""
+        if self._refresh_thread is None or not self._refresh_thread.is_alive():
+            self._refresh_thread = threading.Thread(target=self._refresh_in_background,
+                                                    name="search-index-refresh", daemon=True)
+            self._refresh_thread.start()
+
+    # ---------------------------------------------------------------
+    # 검색
+    # ---------------------------------------------------------------
+    def embed_query(self, query: str) -> Tuple[Optional[np.ndarray], bool]:
+        """
+        검색어 임베딩 (LRU 우선)
+
+        Returns:
+            (임베딩, 캐시 히트 여부) - 전처리 후 빈 검색어면 (None, False)
+        """
+        engine = self.engine
+        text = engine.preprocess(query)
+        if not text:
+            return None, False
+        key = (engine.backend, text)
+        vector = self.query_cache.get(key)
+        if vector is not None:
+            return vector, True
+        vector = engine.embed([text])[0]
+        self.query_cache.put(key, vector)
+        return vector, False
+
+    def search(self, query: str, k: int = 10, wait: bool = True) -> Dict[str, Any]:
+        """
+        의미 검색
+
+        Args:
+            query: 검색어
+            k: 반환할 도서 수
+            wait: 인덱스가 없거나 임베딩 방식이 바뀌었을 때 재생성을 기다릴지 여부
+                  (False면 백그라운드 재생성을 시작하고 SearchIndexNotReady)
+
+        Returns:
+            results(표시 필드 + similarity_score), total_books, cache_hit, embed_ms, search_ms
+        """
+        snapshot = self.ensure_fresh(wait=wait)
+        if snapshot is None:
+            raise SearchIndexNotReady("검색 인덱스를 만드는 중입니다.")
+        if snapshot.backend != self.engine.backend:
+            # 차원 축소 투영이 바뀌면 이전 인덱스와 검색어 임베딩의 차원이 달라져 이전 스냅샷은 쓸 수 없음
+            if not wait:
+                self._start_background_refresh()
+                raise SearchIndexNotReady("임베딩 방식이 바뀌어 검색 인덱스를 다시 만드는 중입니다.")
+            snapshot = self.refresh()
+
+        start_time = time.perf_counter()
+        vector, cache_hit = self.embed_query(query)
+        embed_time = time.perf_counter()
+        hits = self.engine.topk(vector, snapshot.index, k=k) if vector is not None and len(snapshot) else []
+        results = [
+            dict(zip(CATALOGUE_FIELDS, snapshot.rows[i]), similarity_score=score)
+            for i, score in hits
+        ]
+        return {
+            "results": results,
+            "total_books": len(snapshot),
+            "cache_hit": cache_hit,
+            "embed_ms": round((embed_time - start_time) * 1000, 3),
+            "search_ms": round((time.perf_counter() - embed_time) * 1000, 3),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self.snapshot
+        return {
+            "books": len(snapshot) if snapshot else 0,
+            "built_at": snapshot.built_at if snapshot else None,
+            "build_seconds": round(snapshot.build_seconds, 3) if snapshot else None,
+            "ttl": self.ttl,
+            "query_cache_size": len(self.query_cache),
+        }
+
+
+_search_index: Optional[BookSearchIndex] = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index() -> BookSearchIndex:
+    """프로세스 공용 검색 인덱스"""
+    global _search_index
+    with _search_index_lock:
+        if _search_index is None:
+            _search_index = BookSearchIndex()
+        return _search_index
+
+
+def _collect_search_metrics():
+    if _search_index is not None:
+        CACHE_ENTRIES.labels("search_query").set(len(_search_index.query_cache))
+
+get_metrics().add_collector(_collect_search_metrics)
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+경량 트레이싱
+- contextvars 기반 중첩 스팬 (이름 + 속성 + 상태), 트레이스 루트가 끝나면 한 번에 내보냄
+- 내보내기: 로컬 JSON Lines 파일 / OTLP HTTP JSON 수집기 (TRACING_EXPORTER)
+- 트레이스가 시작되지 않은 곳(API 요청 등)의 span()은 아무 일도 하지 않음 (핫 패스 비용 없음)
+- 트레이스별 임계 경로(critical path) 계산
+"""
+
+import os
+import json
+import time
+import secrets
+import threading
+import logging
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_FILE = os.getenv("TRACE_FILE", "cache/traces.jsonl")
+DEFAULT_OTLP_ENDPOINT = os.getenv("OTLP_ENDPOINT", "http://localhost:4318")
+SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "book-recommender")
+
+
+class Span:
+    """실행 구간 1개"""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes",
+                 "status", "error", "_trace")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], trace: List["Span"],
+                 attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self._trace = trace
+
+    def set(self, **attributes):
+        """속성 추가 (행 수 / 배치 크기 등 구간이 끝난 뒤 알 수 있는 값)"""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """트레이스 밖에서 사용하는 빈 스팬"""
+
+    def set(self, **attributes):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+_current: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+
+# -------------------------------------------------------------------
+# 내보내기
+# -------------------------------------------------------------------
+class JsonLinesExporter:
+    """스팬을 한 줄에 하나씩 JSON으로 파일 끝에 추가"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_TRACE_FILE
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Dict[str, Any]]):
+        directory = os.path.dirname(self.path)
+        with self._lock:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                for span in spans:
+                    f.write(json.dumps(span, ensure_ascii=False, default=str) + "\n")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Dict[str, Any]], service_name: str = SERVICE_NAME) -> Dict[str, Any]:
+    """스팬 목록 → OTLP/HTTP JSON 요청 본문 (ExportTraceServiceRequest)"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{
+                "scope": {"name": "core.tracing"},
+                "spans": [{
+                    "traceId": span["trace_id"],
+                    "spanId": span["span_id"],
+                    **({"parentSpanId": span["parent_id"]} if span["parent_id"] else {}),
+                    "name": span["name"],
+                    "kind": 1,
+                    "startTimeUnixNano": str(span["start_ns"]),
+                    "endTimeUnixNano": str(span["end_ns"]),
+                    "attributes": [{"key": key, "value": _otlp_value(value)}
+                                   for key, value in span["attributes"].items()],
+                    "status": {"code": 2, "message": span["error"] or ""} if span["status"] == "error"
+                    else {"code": 1},
+                } for span in spans],
+            }],
+        }],
+    }
+
+
+def _from_otlp_value(value: Dict[str, Any]) -> Any:
+    if "intValue" in value:
+        return int(value["intValue"])
+    for key in ("doubleValue", "boolValue", "stringValue"):
+        if key in value:
+            return value[key]
+    return None
+
+
+def from_otlp(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """OTLP/HTTP JSON 요청 본문 → 스팬 목록 (JSON Lines와 같은 형식)"""
+    spans = []
+    for resource_spans in body.get("resourceSpans", []):
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for span in scope_spans.get("spans", []):
+                start, end = int(span["startTimeUnixNano"]), int(span["endTimeUnixNano"])
+                status = span.get("status", {})
+                spans.append({
+                    "trace_id": span["traceId"],
+                    "span_id": span["spanId"],
+                    "parent_id": span.get("parentSpanId") or None,
+                    "name": span["name"],
+                    "start_ns": start,
+                    "end_ns": end,
+                    "duration_ms": round((end - start) / 1e6, 3),
+                    "attributes": {item["key"]: _from_otlp_value(item["value"])
+                                   for item in span.get("attributes", [])},
+                    "status": "error" if status.get("code") == 2 else "ok",
+                    "error": status.get("message") or None,
+                })
+    return spans
+
+
+class OTLPExporter:
+    """OTLP/HTTP JSON 수집기로 전송 (POST {endpoint}/v1/traces)"""
+
+    def __init__(self, endpoint: Optional[str] = None, timeout: float = 5.0):
+        self.url = (endpoint or DEFAULT_OTLP_ENDPOINT).rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+
+    def export(self, spans: List[Dict[str, Any]]):
+        request = urllib.request.Request(
+            self.url, data=json.dumps(to_otlp(spans), default=str).encode("utf-8"),
+            headers={"Content-Type": "application/json"}, method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class MemoryExporter:
+    """메모리에 보관 (테스트 / 벤치마크용)"""
+
+    def __init__(self):
+        self.spans: List[Dict[str, Any]] = []
+
+    def export(self, spans: List[Dict[str, Any]]):
+        self.spans.extend(spans)
+
+
+# -------------------------------------------------------------------
+# 트레이서
+# -------------------------------------------------------------------
+class Tracer:
+    """트레이스 / 스팬 생성 및 내보내기"""
+
+    def __init__(self, exporter=None):
+        """
+        Args:
+            exporter: export(spans)를 제공하는 객체 (None이면 트레이싱 비활성화)
+        """
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def start_trace(self, name: str, **attributes) -> Iterator[Any]:
+        """
+        새 트레이스의 루트 스팬 (블록이 끝나면 트레이스 전체를 내보냄)
+
+        이미 트레이스 안이면 일반 하위 스팬으로 동작합니다.
+        """
+        if self.exporter is None:
+            yield NOOP_SPAN
+            return
+        if _current.get() is not None:
+            with self.span(name, **attributes) as span:
+                yield span
+            return
+        trace: List[Span] = []
+        root = Span(name, secrets.token_hex(16), None, trace, attributes)
+        try:
+            with self._activate(root):
+                yield root
+        finally:
+            self._flush(trace)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Any]:
+        """현재 트레이스의 하위 스팬 (트레이스 밖이면 빈 스팬)"""
+        parent = _current.get()
+        if parent is None:
+            yield NOOP_SPAN
+            return
+        child = Span(name, parent.trace_id, parent.span_id, parent._trace, attributes)
+        with self._activate(child):
+            yield child
+
+    @contextmanager
+    def _activate(self, span: Span):
+        token = _current.set(span)
+        try:
+            yield
+        except BaseException as e:
+            span.status = "error"
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current.reset(token)
+            span._trace.append(span)
+
+    def _flush(self, trace: List[Span]):
+        try:
+            self.exporter.export([span.to_dict() for span in trace])
+        except Exception as e:
+            # 트레이스 내보내기 실패로 작업이 실패하지 않도록 경고만 기록
+            logger.warning(f"⚠️ 트레이스 내보내기 실패: {e}")
+
+
+def _exporter_from_env():
+    kind = os.getenv("TRACING_EXPORTER", "").strip().lower()
+    if kind == "jsonl":
+        return JsonLinesExporter()
+    if kind == "otlp":
+        return OTLPExporter()
+    if kind not in ("", "none", "off"):
+        logger.warning(f"⚠️ 알 수 없는 TRACING_EXPORTER: {kind} (트레이싱 비활성화)")
+    return None
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """프로세스 공용 트레이서 (TRACING_EXPORTER 환경변수: jsonl / otlp / 빈 값이면 비활성화)"""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer(_exporter_from_env())
+        return _tracer
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """공용 트레이서 교체 (벤치마크 / 테스트에서 메모리 내보내기 사용 시)"""
+    global _tracer
+    with _tracer_lock:
+        _tracer = tracer
+        return tracer
+
+
+def start_trace(name: str, **attributes):
+    """공용 트레이서로 트레이스 시작"""
+    return get_tracer().start_trace(name, **attributes)
+
+
+def span(name: str, **attributes):
+    """공용 트레이서로 하위 스팬 생성"""
+    return get_tracer().span(name, **attributes)
+
+
+# -------------------------------------------------------------------
+# 분석
+# -------------------------------------------------------------------
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """JSON Lines 파일의 스팬 (잘린 줄은 무시)"""
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except ValueError:
+                continue
+    return spans
+
+
+def critical_path(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    트레이스 1개의 임계 경로
+
+    루트 끝에서부터 거꾸로, 현재 시점 이전에 끝난 하위 스팬 중 가장 늦게 끝난 스팬을 따라갑니다.
+    하위 스팬 사이의 빈 구간은 부모 스팬 자신의 시간으로 계산합니다.
+
+    Args:
+        spans: 같은 trace_id의 스팬 목록
+
+    Returns:
+        경로 위 스팬 (시간순, 부모 먼저) - {"name", "span_id", "depth", "duration_ms",
+        "self_ms"(경로에서 이 스팬 자신이 차지한 시간), "attributes"}
+    """
+    ids = {span["span_id"] for span in spans}
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    roots = []
+    for span in spans:
+        if span.get("parent_id") in ids:
+            children.setdefault(span["parent_id"], []).append(span)
+        else:
+            roots.append(span)
+    if not roots:
+        return []
+    root = max(roots, key=lambda span: span["end_ns"] - span["start_ns"])
+
+    path: List[Dict[str, Any]] = []
+
+    def walk(span: Dict[str, Any], limit: int, depth: int):
+        cursor = min(span["end_ns"], limit)
+        self_ns = 0
+        chosen = []
+        for child in sorted(children.get(span["span_id"], []), key=lambda c: c["end_ns"], reverse=True):
+            if child["end_ns"] > cursor:
+                continue  # 이미 선택한 구간과 겹치는 (동시 실행된) 스팬
+            self_ns += cursor - child["end_ns"]
+            chosen.append(child)
+            cursor = child["start_ns"]
+        self_ns += max(cursor - span["start_ns"], 0)
+        path.append({
+            "name": span["name"],
+            "span_id": span["span_id"],
+            "depth": depth,
+            "duration_ms": round((span["end_ns"] - span["start_ns"]) / 1e6, 3),
+            "self_ms": round(self_ns / 1e6, 3),
+            "attributes": span.get("attributes", {}),
+        })
+        for child in reversed(chosen):
+            walk(child, child["end_ns"], depth + 1)
+
+    walk(root, root["end_ns"], 0)
+    return path
@@ -11,14 +11,20 @@ FastAPI 메인 애플리케이션
 
 import sys
 import os
+import time
 
 # 현재 app 폴더를 PYTHONPATH에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
 from api.endpoints import router
+from api.admin import is_admin_token, router as admin_router
 from fastapi.middleware.cors import CORSMiddleware
-from core.crowling import Crowling
+from core import jobs
+from core.jobs import daily_job, get_job_startup_delay, start_pipeline_scheduler
+from core.metrics import CONTENT_TYPE, REQUEST_LATENCY, get_metrics
+from core.profiling import profile
 
 app = FastAPI(title="News-Book Recommender API")
 
@@ -36,38 +42,73 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+
+if METRICS_ENABLED:
+    @app.middleware("http")
+    async def record_request_metrics(request: Request, call_next):
+        """라우트별 요청 처리 시간 기록 (라벨은 경로 템플릿 - 경로 파라미터 값마다 늘지 않음)"""
+        start_time = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            REQUEST_LATENCY.labels(
+                request.method, getattr(route, "path", "unmatched"), status
+            ).observe(time.perf_counter() - start_time)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus 메트릭"""
+        return Response(get_metrics().render(), media_type=CONTENT_TYPE)
+
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    """
+    관리자 요청 프로파일링 (X-Profile: 1 헤더 또는 ?profile=1 + X-Admin-Token)
+
+    샘플러는 모든 스레드를 수집하므로 동시에 처리 중인 다른 요청의 스택도 섞일 수 있습니다.
+    """
+    flag = request.headers.get("x-profile") or request.query_params.get("profile")
+    if flag not in ("1", "true") or not is_admin_token(request.headers.get("x-admin-token")):
+        return await call_next(request)
+    with profile("request", f"{request.method} {request.url.path}") as result:
+        response = await call_next(request)
+    if result["id"]:
+        response.headers["X-Profile-Id"] = result["id"]
+    return response
+
 @app.on_event("startup")
 async def startup_event():
-    print("🚀 서버 시작과 함께 추천 시스템 실행 중...")
-    try:
-        # 중복 데이터 체크
-        from utils.duplicate_checker import DuplicateDataChecker
-        
-        checker = DuplicateDataChecker()
-        should_skip = checker.should_skip_processing()
-        checker.close()
-        
-        if should_skip:
-            print("⏭️  오늘자 데이터가 이미 존재하여 처리를 건너뜁니다.")
-            print("✅ 추천 시스템 초기화 완료 (건너뛰기)")
-            return
-        
-        # 정상 처리 진행
-        crawler = Crowling()
-        news_data = crawler.wordExtraction()  # ✅ 여기서 먼저 데이터 만들고
-        recommend_books_by_keywords(news_data)  # ✅ 그걸 넣어서 실행
-        print("✅ 추천 시스템 초기화 완료")
-    except Exception as e:
-        print(f"❌ 추천 시스템 초기화 실패: {e}")
-        # 초기화 실패해도 서버는 시작
-        pass
+    # cron 일정에 따른 일일 파이프라인 실행
+    start_pipeline_scheduler()
+    
+    # 크롤링 + 추천 작업은 백그라운드에서 실행 (서버 준비 상태를 막지 않음)
+    if os.getenv("RUN_JOB_ON_STARTUP", "True").lower() != "true":
+        print("⏭️  시작 시 추천 작업 실행이 비활성화되어 있습니다.")
+        return
+    daily_job.start(delay=get_job_startup_delay())
+    print("🚀 추천 시스템 작업을 백그라운드에서 시작합니다. (/jobs/status 에서 확인)")
 
 @app.get("/health")
 async def health_check():
     """헬스체크"""
     return {"status": "healthy", "message": "FastAPI 서버가 정상적으로 실행 중입니다."}
 
+@app.get("/jobs/status")
+async def jobs_status():
+    """백그라운드 작업 상태"""
+    scheduler = jobs.pipeline_scheduler
+    return {
+        "jobs": [daily_job.status()],
+        "scheduler": scheduler.status() if scheduler else None
+    }
+
 app.include_router(router, prefix="/api")
+app.include_router(admin_router, prefix="/api/admin", tags=["admin"])
 
 if __name__ == "__main__":
     import uvicorn
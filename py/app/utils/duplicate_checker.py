@@ -7,7 +7,7 @@
 
 import time
 from datetime import datetime, date
-from ..core.database import PostgreSQLDatabase
+from core.database import PostgreSQLDatabase
 
 class DuplicateDataChecker:
     def __init__(self):
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+BERT 코드 경로 오프라인 벤치마크
+- KoBERT / Supabase 없이 소형 BERT + 합성 코퍼스 + SQLite DB로 실행
+- BertNLP / GPUBertNLP / 두 추천 시스템의 임베딩 처리량, 유사도 / 상위 k개 지연,
+  클러스터링 시간, DB 저장 처리량 측정
+- 결과 JSON 보고서를 커밋 간에 비교 (--compare)
+
+사용법:
+    python benchmarks/bench_bert.py --books 1000 --output reports/bert.json
+    python benchmarks/bench_bert.py --compare reports/bert.json
+"""
+
+import os
+import sys
+import logging
+import argparse
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PY_DIR = os.path.dirname(BENCH_DIR)
+sys.path.append(os.path.join(PY_DIR, "app"))
+
+from report import build_report, compare_reports, load_report, measure, print_comparison, \
+    print_results, write_report
+from standins import SQLiteDatabase, SyntheticCorpus, build_tiny_model, corpus_hash
+
+from core.bert.bert_nlp import BertNLP
+from core.bert.bert_nlp_gpu import GPUBertNLP
+from core.bert.embedding_cache import EmbeddingCache
+from core.bert.embedding_engine import EmbeddingEngine
+from core.recommendation.bert_recommendation import BertRecommendationSystem
+from core.recommendation.bert_recommendation_gpu import GPUBertRecommendationSystem
+
+DEFAULT_MODEL_DIR = os.path.join(PY_DIR, "cache", "bench_tiny_bert")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="BERT 코드 경로 오프라인 벤치마크")
+    parser.add_argument("--books", type=int, default=500, help="합성 도서 수")
+    parser.add_argument("--queries", type=int, default=50, help="유사도 / 단건 임베딩 쿼리 수")
+    parser.add_argument("--news-per-category", type=int, default=5, help="카테고리별 뉴스 제목 수")
+    parser.add_argument("--device", default="cpu", help="cpu / cuda / auto")
+    parser.add_argument("--layers", type=int, default=2, help="소형 BERT 층 수")
+    parser.add_argument("--model-dir", default=DEFAULT_MODEL_DIR, help="소형 BERT 저장 경로")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--seed", type=int, default=0, help="코퍼스 시드")
+    parser.add_argument("--only", default="", help="이름에 이 문자열이 들어간 항목만 실행 (쉼표 구분)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 기준 보고서 JSON")
+    return parser.parse_args()
+
+
+class Suite:
+    """이름별 측정 결과 수집 (실패한 항목은 오류로 기록하고 계속 진행)"""
+
+    def __init__(self, repeat: int, only: str = ""):
+        self.repeat = repeat
+        self.only = [name for name in only.split(",") if name]
+        self.results = {}
+
+    def run(self, name, fn, items=1, setup=None, extra=None):
+        if self.only and not any(part in name for part in self.only):
+            return
+        print(f"⏱️ {name}")
+        try:
+            result = measure(fn, self.repeat, items, setup)
+            if extra is not None:
+                result.update(extra())
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        self.results[name] = result
+
+
+def main():
+    args = parse_args()
+    corpus = SyntheticCorpus(seed=args.seed)
+    books = corpus.books(args.books)
+    news = corpus.news(args.news_per_category)
+    queries = corpus.texts(args.queries)
+    descriptions = [description for _, _, description in books]
+
+    print(f"📚 합성 도서 {len(books)}권, 뉴스 {sum(map(len, news.values()))}건, 쿼리 {len(queries)}개")
+    try:
+        model_dir = build_tiny_model(args.model_dir, descriptions + queries, layers=args.layers)
+    except ImportError as e:
+        print(f"❌ 소형 BERT 생성에는 torch / transformers가 필요합니다: {e}")
+        sys.exit(1)
+    db = SQLiteDatabase()
+    db.load_books(books)
+
+    # 전역 엔진 / 캐시 파일과 분리된 엔진 (차원 축소 / 멀티 프로세스 풀 없이 코드 경로만 측정)
+    engine = EmbeddingEngine(model_dir, device=args.device, cache=EmbeddingCache(None),
+                             cpu_processes=1, projection_path=None)
+    # 추천 시스템 로그는 측정 출력만 남기도록 줄임
+    logging.getLogger().setLevel(logging.WARNING)
+    bert_nlp = BertNLP(model_dir, engine=engine)
+    gpu_nlp = GPUBertNLP(model_dir, engine=engine)
+    suite = Suite(args.repeat, args.only)
+    cold = engine.cache.clear
+
+    # 1. 임베딩 처리량 (캐시 비운 상태)
+    suite.run("engine.embed", lambda: engine.embed(descriptions), len(descriptions), cold)
+    suite.run("bert_nlp.get_bert_embedding", lambda: [bert_nlp.get_bert_embedding(text) for text in queries],
+              len(queries), cold)
+    suite.run("bert_nlp.batch_process", lambda: bert_nlp.batch_process(descriptions), len(descriptions), cold)
+    suite.run("gpu_bert_nlp.get_embeddings_batch_gpu", lambda: gpu_nlp.get_embeddings_batch_gpu(descriptions),
+              len(descriptions), cold)
+
+    # 2. 유사도 / 상위 k개 (임베딩은 캐시된 상태)
+    engine.embed(descriptions + queries)
+    pairs = list(zip(queries, descriptions))
+    suite.run("bert_nlp.calculate_contextual_similarity",
+              lambda: [bert_nlp.calculate_contextual_similarity(a, b) for a, b in pairs], len(pairs))
+    suite.run("bert_nlp.find_similar_texts",
+              lambda: [bert_nlp.find_similar_texts(query, descriptions, top_k=5) for query in queries], len(queries))
+    suite.run("gpu_bert_nlp.find_similar_texts_gpu",
+              lambda: [gpu_nlp.find_similar_texts_gpu(query, descriptions, top_k=5) for query in queries],
+              len(queries))
+    book_vectors, query_vectors = engine.embed(descriptions), engine.embed(queries)
+    for codec in ("fp32", "int8"):
+        index = engine.build_index(book_vectors, codec=codec)
+        suite.run(f"engine.topk[{codec}]", lambda: engine.topk(query_vectors, index, k=10), len(queries))
+
+    # 3. 클러스터링
+    suite.run("bert_nlp.cluster_texts", lambda: bert_nlp.cluster_texts(descriptions, n_clusters=8), len(descriptions))
+
+    # 4. GPU 추천 시스템 단계별
+    gpu_recommender = GPUBertRecommendationSystem(engine=engine, db=db)
+    books_data = gpu_recommender.load_books()
+    suite.run("gpu_recommender.load_books", gpu_recommender.load_books, len(books_data["isbn"]))
+    suite.run("gpu_recommender.embed_books", lambda: gpu_recommender.embed_books(books_data),
+              len(books_data["isbn"]), cold)
+    book_embeddings = gpu_recommender.embed_books(books_data)
+    contexts = sum(map(len, news.values()))
+    suite.run("gpu_recommender.score_categories",
+              lambda: gpu_recommender.score_categories(news, book_embeddings, books_data), contexts)
+    gpu_recs = gpu_recommender.score_categories(news, book_embeddings, books_data)
+    gpu_rows = sum(map(len, gpu_recs.values()))
+    suite.run("gpu_recommender.save_recommendations_to_db",
+              lambda: gpu_recommender.save_recommendations_to_db(gpu_recs, "bench_gpu_bert"), gpu_rows,
+              extra=lambda: {"rows_written": db.count("tb_recommend", "method = ?", ("bench_gpu_bert",)),
+                             "failed_queries": db.failed})
+
+    # 5. 기본 추천 시스템 방법별
+    recommender = BertRecommendationSystem(bert_nlp=bert_nlp, db=db)
+    suite.run("bert_recommender.recommend_books_by_context",
+              lambda: recommender.recommend_books_by_context(news), contexts)
+    suite.run("bert_recommender.recommend_books_by_keywords",
+              lambda: recommender.recommend_books_by_keywords(news), contexts)
+    suite.run("bert_recommender.recommend_books_by_clustering",
+              lambda: recommender.recommend_books_by_clustering(news), contexts)
+    recs = recommender.recommend_books_by_context(news)
+    rows = sum(map(len, recs.values()))
+    suite.run("bert_recommender.save_recommendations_to_db",
+              lambda: recommender.save_recommendations_to_db(recs, "bench_bert"), rows,
+              extra=lambda: {"rows_written": db.count("tb_recommend", "method = ?", ("bench_bert",)),
+                             "failed_queries": db.failed})
+
+    print()
+    print_results(suite.results)
+    report = build_report(suite.results, {
+        "books": len(books),
+        "queries": len(queries),
+        "news_per_category": args.news_per_category,
+        "device": engine.device,
+        "precision": engine.precision,
+        "batch_size": engine.batch_size,
+        "layers": args.layers,
+        "corpus": corpus_hash(books),
+    })
+    if args.compare:
+        baseline = load_report(args.compare)
+        print_comparison(compare_reports(baseline, report), baseline["meta"])
+    if args.output:
+        write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTML 헤드라인 추출 마이크로 벤치마크
+- 백엔드별(selectolax / lxml / bs4) 페이지당 파싱 시간
+- 백엔드별 최대 메모리 (별도 프로세스에서 측정)
+
+사용법:
+    python benchmarks/bench_html_extract.py
+    python benchmarks/bench_html_extract.py --pages saved/*.html --repeat 50
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+import multiprocessing
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PY_DIR = os.path.dirname(BENCH_DIR)
+sys.path.append(os.path.join(PY_DIR, "app"))
+
+from core.html_extract import EXTRACTORS, available_backends
+
+DEFAULT_PAGES = os.path.join(PY_DIR, "tests", "fixtures", "*.html")
+
+CARD_TEMPLATE = """
+<li class="card">
+  <div class="card_image"><a href="/article/{i}"><img src="/img/{i}.jpg" alt="기사 이미지 {i}"></a></div>
+  <div class="card_body">
+    <h2 class="headline"><a href="/article/{i}">주요 뉴스 헤드라인 {i}번 — 경제·정치·사회 현안 분석</a></h2>
+    <p class="description">기사 요약 {i}: 정부는 오늘 관계 부처 합동 회의를 열고 후속 대책을 논의했다.</p>
+    <p class="date">2024.01.01 {hour:02d}:00</p>
+  </div>
+</li>
+"""
+
+
+def build_synthetic_page(cards: int) -> str:
+    """실제 섹션 페이지와 비슷한 구조의 대용량 페이지 생성"""
+    body = "".join(CARD_TEMPLATE.format(i=i, hour=i % 24) for i in range(cards))
+    scripts = "<script>window.__DATA__ = %s;</script>" % json.dumps({"items": list(range(2000))})
+    return (
+        "<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'>"
+        f"<title>섹션</title>{scripts}</head><body><ul class='story_list'>{body}</ul></body></html>"
+    )
+
+
+def _measure_memory(backend: str, html: str, queue):
+    """새 프로세스에서 1회 파싱 시 최대 메모리 측정"""
+    import resource
+
+    extractor = EXTRACTORS[backend]
+    extractor("<html><h2>warmup</h2></html>", "h2")  # 모듈 로드 비용 제외
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    extractor(html, "h2")
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put({
+        "python_peak_kb": round(python_peak / 1024, 1),
+        "rss_peak_delta_kb": rss_after - rss_before,
+    })
+
+
+def measure_memory(backend: str, html: str) -> dict:
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_measure_memory, args=(backend, html, queue))
+    process.start()
+    result = queue.get(timeout=120)
+    process.join()
+    return result
+
+
+def measure_time(backend: str, html: str, repeat: int) -> dict:
+    extractor = EXTRACTORS[backend]
+    extractor(html, "h2")
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extractor(html, "h2")
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 헤드라인 추출 벤치마크")
+    parser.add_argument("--pages", default=DEFAULT_PAGES, help="벤치마크할 HTML 파일 glob")
+    parser.add_argument("--synthetic-cards", type=int, default=500,
+                        help="합성 대용량 페이지 카드 수 (0이면 생략)")
+    parser.add_argument("--repeat", type=int, default=30, help="페이지당 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    pages = {}
+    for path in sorted(glob.glob(args.pages)):
+        with open(path, encoding="utf-8") as f:
+            pages[os.path.basename(path)] = f.read()
+    if args.synthetic_cards:
+        pages[f"synthetic_{args.synthetic_cards}_cards"] = build_synthetic_page(args.synthetic_cards)
+
+    backends = available_backends()
+    print(f"📊 백엔드: {', '.join(backends)} / 페이지: {len(pages)}개 / 반복: {args.repeat}회")
+
+    results = []
+    for page_name, html in pages.items():
+        expected = EXTRACTORS["bs4"](html, "h2") if "bs4" in backends else None
+        for backend in backends:
+            row = {"page": page_name, "size_kb": round(len(html.encode("utf-8")) / 1024, 1),
+                   "backend": backend}
+            row.update(measure_time(backend, html, args.repeat))
+            row.update(measure_memory(backend, html))
+            row["matches_bs4"] = expected is None or EXTRACTORS[backend](html, "h2") == expected
+            results.append(row)
+
+    header = f"{'page':<28}{'KB':>8}  {'backend':<11}{'median ms':>10}{'py peak KB':>12}{'rss Δ KB':>10}  same"
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(f"{row['page']:<28}{row['size_kb']:>8}  {row['backend']:<11}{row['median_ms']:>10}"
+              f"{row['python_peak_kb']:>12}{row['rss_peak_delta_kb']:>10}  {row['matches_bs4']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+양자화 벡터 저장소 벤치마크
+- EmbeddingEngine.build_index가 만드는 저장소(QuantizedVectorStore.for_index - 재계산용 원본은 mmap)를 측정
+- 코덱별(fp32 / fp16 / int8 / pq) 상주 메모리, 쿼리 배치 검색 시간
+- float32 전체 검색 대비 상위 k개 재현율 (재계산 전 / 후)
+
+사용법:
+    python benchmarks/bench_vector_store.py
+    python benchmarks/bench_vector_store.py --embeddings cache/book_embeddings.npy --queries 200
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PY_DIR = os.path.dirname(BENCH_DIR)
+sys.path.append(os.path.join(PY_DIR, "app"))
+
+from core.bert.projection import normalize_rows
+from core.bert.vector_store import CODECS, QuantizedVectorStore, measure_recall
+
+
+def build_synthetic_embeddings(rows: int, dim: int, clusters: int = 200, seed: int = 0) -> np.ndarray:
+    """도서 설명 임베딩처럼 주제별로 뭉친 합성 벡터 생성"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    labels = rng.integers(clusters, size=rows)
+    return (centers[labels] + rng.normal(scale=0.6, size=(rows, dim))).astype(np.float32)
+
+
+def measure_search(store: QuantizedVectorStore, queries: np.ndarray, k: int, repeat: int) -> dict:
+    store.topk(queries, k)
+    scan, total = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        store.approximate_scores(queries)
+        scan.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        store.topk(queries, k)
+        total.append((time.perf_counter() - start) * 1000)
+    return {
+        "scan_ms": round(statistics.median(scan), 2),
+        "topk_ms": round(statistics.median(total), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="양자화 벡터 저장소 벤치마크")
+    parser.add_argument("--embeddings", help="실제 임베딩 행렬(.npy) - 없으면 합성 벡터")
+    parser.add_argument("--rows", type=int, default=50000, help="합성 벡터 수")
+    parser.add_argument("--dim", type=int, default=768, help="합성 벡터 차원")
+    parser.add_argument("--queries", type=int, default=100, help="쿼리 수 (임베딩 행에서 표본 추출)")
+    parser.add_argument("--k", type=int, default=10, help="상위 개수")
+    parser.add_argument("--rescore", type=int, default=256, help="float32 재계산 후보 수")
+    parser.add_argument("--pq-subspaces", type=int, default=96, help="PQ 부분 공간 수")
+    parser.add_argument("--codecs", default=",".join(CODECS), help="측정할 코덱 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if args.embeddings:
+        vectors = np.load(args.embeddings).astype(np.float32)
+    else:
+        vectors = build_synthetic_embeddings(args.rows, args.dim)
+    rng = np.random.default_rng(1)
+    # 쿼리는 기존 행에 잡음을 더해 실제 키워드 문맥처럼 특정 주제 근처에 위치
+    queries = vectors[rng.choice(len(vectors), size=args.queries, replace=False)]
+    queries = normalize_rows(queries + rng.normal(scale=0.3 * queries.std(), size=queries.shape).astype(np.float32))
+    print(f"📊 벡터: {vectors.shape[0]}개 × {vectors.shape[1]}차원 / 쿼리: {len(queries)}개 / k={args.k}")
+
+    # build_index와 같은 설정 경로(환경변수)로 전달
+    os.environ["EMBEDDING_INDEX_RESCORE"] = str(args.rescore)
+    os.environ["EMBEDDING_PQ_SUBSPACES"] = str(args.pq_subspaces)
+
+    results = []
+    for codec in args.codecs.split(","):
+        start = time.perf_counter()
+        store = QuantizedVectorStore.for_index(vectors, codec)
+        build_s = time.perf_counter() - start
+        approximate = QuantizedVectorStore(store.codec, store.codes, store.params, None)
+        # 상주 메모리 (mmap 원본 제외 - fp32는 정규화 행렬 전체)
+        resident_bytes = store.memory_bytes()
+        row = {
+            "codec": codec,
+            "build_s": round(build_s, 2),
+            "code_mb": round(resident_bytes / 1024 ** 2, 1),
+            "compression": round(vectors.nbytes / resident_bytes, 2),
+            "recall_codes": round(measure_recall(vectors, approximate, queries, args.k), 4),
+            "recall_rescored": round(measure_recall(vectors, store, queries, args.k), 4),
+        }
+        row.update(measure_search(store, queries, args.k, args.repeat))
+        results.append(row)
+
+    header = (f"{'codec':<7}{'MB':>8}{'×':>7}{'build s':>9}{'scan ms':>9}{'topk ms':>9}"
+              f"{'recall':>9}{'rescored':>10}")
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(f"{row['codec']:<7}{row['code_mb']:>8}{row['compression']:>7}{row['build_s']:>9}"
+              f"{row['scan_ms']:>9}{row['topk_ms']:>9}{row['recall_codes']:>9}{row['recall_rescored']:>10}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
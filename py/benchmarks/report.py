@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+벤치마크 측정 / JSON 보고서 / 커밋 간 비교
+"""
+
+import os
+import json
+import time
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def git_commit() -> Optional[str]:
+    """현재 커밋 (git이 없으면 None)"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def measure(fn: Callable[[], Any], repeat: int = 3, items: int = 1,
+            setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """
+    fn 실행 시간 측정 (반복마다 setup 실행 후 측정, 중앙값 기준)
+
+    Args:
+        fn: 측정할 함수
+        repeat: 반복 횟수
+        items: 1회 실행에서 처리하는 항목 수 (처리량 계산용)
+        setup: 매 반복 전에 실행할 함수 (캐시 비우기 등, 측정 제외)
+
+    Returns:
+        {"seconds", "min_seconds", "items", "items_per_sec", "ms_per_item"}
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    seconds = statistics.median(timings)
+    return {
+        "seconds": round(seconds, 4),
+        "min_seconds": round(min(timings), 4),
+        "items": items,
+        "items_per_sec": round(items / seconds, 2) if seconds > 0 else None,
+        "ms_per_item": round(seconds * 1000 / items, 3) if items else None,
+    }
+
+
+def build_report(results: Dict[str, Dict[str, Any]], config: Dict[str, Any]) -> Dict[str, Any]:
+    """보고서 (실행 환경 + 설정 + 결과)"""
+    try:
+        import torch
+        torch_version = torch.__version__
+    except ImportError:
+        torch_version = None
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "torch": torch_version,
+        },
+        "config": config,
+        "results": results,
+    }
+
+
+def write_report(report: Dict[str, Any], path: str):
+    """보고서 JSON 저장"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"💾 결과 저장: {path}")
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    metric: str = "seconds") -> List[Dict[str, Any]]:
+    """
+    두 보고서의 같은 항목 비교
+
+    Returns:
+        [{"name", "baseline", "current", "change_pct"}] - change_pct > 0이면 느려짐
+    """
+    rows = []
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name, {}).get(metric)
+        after = result.get(metric)
+        if before is None or after is None:
+            continue
+        rows.append({
+            "name": name,
+            "baseline": before,
+            "current": after,
+            "change_pct": round((after - before) / before * 100, 1) if before else 0.0,
+        })
+    return rows
+
+
+def print_results(results: Dict[str, Dict[str, Any]]):
+    header = f"{'benchmark':<48}{'sec':>10}{'items/s':>12}{'ms/item':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<48}  ❌ {result['error']}")
+            continue
+        print(f"{name:<48}{result['seconds']:>10}{result['items_per_sec'] or '-':>12}"
+              f"{result['ms_per_item'] or '-':>10}")
+
+
+def print_comparison(rows: List[Dict[str, Any]], baseline_meta: Dict[str, Any]):
+    print(f"\n📊 기준 보고서 비교 (commit {baseline_meta.get('commit')}, {baseline_meta.get('created_at')})")
+    header = f"{'benchmark':<48}{'baseline':>10}{'current':>10}{'change':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(f"{row['name']:<48}{row['baseline']:>10}{row['current']:>10}{row['change_pct']:>8}%")
+
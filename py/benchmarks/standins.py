@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+오프라인 벤치마크용 대체 구성 요소
+- 무작위 초기화한 소형 BERT + 로컬 WordPiece 토크나이저 (KoBERT 다운로드 없음)
+- 한국어 형태의 합성 도서 / 뉴스 코퍼스 (크기 조절 가능)
+- PostgreSQLDatabase와 같은 메서드를 제공하는 SQLite DB (Supabase 접속 없음)
+"""
+
+import os
+import re
+import sqlite3
+import hashlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SPECIAL_TOKENS = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+CATEGORIES = ["경제", "정치", "사회", "국제", "문화", "스포츠", "IT과학", "생활"]
+
+# 합성 단어를 만들 음절 (초성 / 중성 조합 일부만 사용해 어휘를 작게 유지)
+_INITIALS = range(0, 19, 2)
+_MEDIALS = range(0, 21, 3)
+_FINALS = (0, 4, 8, 16, 21)
+
+
+def _syllables() -> List[str]:
+    return [chr(0xAC00 + (initial * 21 + medial) * 28 + final)
+            for initial in _INITIALS for medial in _MEDIALS for final in _FINALS]
+
+
+class SyntheticCorpus:
+    """주제별 단어 분포를 가진 한국어 형태의 합성 코퍼스"""
+
+    def __init__(self, vocabulary: int = 3000, topics: int = 40, seed: int = 0):
+        """
+        Args:
+            vocabulary: 합성 단어 수
+            topics: 주제 수 (도서 / 뉴스가 주제별 단어를 주로 사용)
+            seed: 난수 시드
+        """
+        self.rng = np.random.default_rng(seed)
+        syllables = _syllables()
+        words = set()
+        while len(words) < vocabulary:
+            length = int(self.rng.integers(2, 4))
+            words.add("".join(syllables[i] for i in self.rng.integers(len(syllables), size=length)))
+        self.words = sorted(words)
+        # 단어 빈도는 Zipf 분포, 주제마다 전체 어휘의 일부를 주로 사용
+        ranks = np.arange(1, vocabulary + 1)
+        self.weights = (1.0 / ranks) / (1.0 / ranks).sum()
+        self.topics = [self.rng.choice(vocabulary, size=vocabulary // 10, replace=False) for _ in range(topics)]
+        self.particles = ["은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "으로", "에서"]
+
+    def sentence(self, words: int, topic: Optional[int] = None) -> str:
+        """단어 words개로 된 문장 (주제 단어 60%, 공통 단어 40%)"""
+        topic_words = self.topics[topic if topic is not None else int(self.rng.integers(len(self.topics)))]
+        tokens = []
+        for _ in range(words):
+            if self.rng.random() < 0.6:
+                word = self.words[int(self.rng.choice(topic_words))]
+            else:
+                word = self.words[int(self.rng.choice(len(self.words), p=self.weights))]
+            if self.rng.random() < 0.5:
+                word += self.particles[int(self.rng.integers(len(self.particles)))]
+            tokens.append(word)
+        return " ".join(tokens)
+
+    def books(self, count: int) -> List[Tuple[str, str, str]]:
+        """(isbn, 제목, 설명) 목록 - 설명 길이는 20~120 단어"""
+        books = []
+        for i in range(count):
+            topic = int(self.rng.integers(len(self.topics)))
+            books.append((
+                f"979{i:010d}",
+                self.sentence(int(self.rng.integers(2, 6)), topic),
+                self.sentence(int(self.rng.integers(20, 121)), topic),
+            ))
+        return books
+
+    def news(self, per_category: int = 10) -> Dict[str, List[str]]:
+        """카테고리별 뉴스 제목"""
+        return {
+            category: [self.sentence(int(self.rng.integers(4, 10))) for _ in range(per_category)]
+            for category in CATEGORIES
+        }
+
+    def texts(self, count: int, words: Tuple[int, int] = (5, 60)) -> List[str]:
+        """길이가 다양한 임의 텍스트"""
+        return [self.sentence(int(self.rng.integers(*words))) for _ in range(count)]
+
+
+# -------------------------------------------------------------------
+# 소형 BERT
+# -------------------------------------------------------------------
+def build_tiny_model(directory: str, texts: Sequence[str], layers: int = 2, hidden: int = 768,
+                     heads: int = 12, intermediate: int = 1024, seed: int = 0) -> str:
+    """
+    무작위 초기화한 소형 BERT와 음절 단위 WordPiece 토크나이저를 저장
+
+    임베딩 엔진이 768차원을 가정하므로 hidden 기본값은 KoBERT와 같고,
+    층 수 / FFN 크기만 줄여 순전파 비용을 낮춥니다.
+
+    Args:
+        directory: 저장 경로 (이미 있으면 그대로 사용 - from_pretrained 경로로 사용)
+        texts: 어휘 생성용 텍스트
+        layers / hidden / heads / intermediate: BERT 설정
+        seed: 가중치 초기화 시드
+
+    Returns:
+        모델 경로 (EmbeddingEngine의 model_name으로 사용)
+    """
+    import torch
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    if os.path.exists(os.path.join(directory, "config.json")):
+        return directory
+    os.makedirs(directory, exist_ok=True)
+
+    # 음절 단위 어휘 (단어 첫 음절 / ## 이어지는 음절) + 자주 쓰는 단어
+    syllables, words = set(), {}
+    for text in texts:
+        for word in re.findall(r"\w+", text):
+            syllables.update(word)
+            words[word] = words.get(word, 0) + 1
+    frequent = sorted(words, key=words.get, reverse=True)[:2000]
+    vocab = SPECIAL_TOKENS + sorted(syllables) + [f"##{s}" for s in sorted(syllables)] + \
+        [word for word in frequent if len(word) > 1]
+    vocab = list(dict.fromkeys(vocab))
+    vocab_path = os.path.join(directory, "vocab.txt")
+    with open(vocab_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(vocab) + "\n")
+
+    tokenizer = BertTokenizerFast(vocab_file=vocab_path, do_lower_case=False, tokenize_chinese_chars=False)
+    tokenizer.save_pretrained(directory)
+
+    torch.manual_seed(seed)
+    config = BertConfig(vocab_size=len(vocab), hidden_size=hidden, num_hidden_layers=layers,
+                        num_attention_heads=heads, intermediate_size=intermediate,
+                        max_position_embeddings=512)
+    BertModel(config).save_pretrained(directory)
+    return directory
+
+
+# -------------------------------------------------------------------
+# SQLite DB
+# -------------------------------------------------------------------
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tb_books (
+    books_isbn TEXT PRIMARY KEY,
+    books_title TEXT,
+    books_description TEXT,
+    books_img TEXT,
+    books_publisher TEXT
+);
+CREATE TABLE IF NOT EXISTS tb_recommend (
+    recommend_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    news_keyword TEXT,
+    books_isbn TEXT,
+    similarity_score REAL,
+    method TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+class SQLiteDatabase:
+    """PostgreSQLDatabase의 fetch_query / execute_query / execute_many를 흉내 내는 SQLite DB"""
+
+    def __init__(self, path: str = ":memory:"):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self.queries = 0
+        self.failed = 0
+
+    @staticmethod
+    def _translate(query: str) -> str:
+        # psycopg2 자리 표시자 → sqlite, SQL 주석 제거
+        query = re.sub(r"--[^\n]*", "", query)
+        return query.replace("%s", "?")
+
+    def fetch_query(self, query: str, params: Optional[Tuple] = None, name: Optional[str] = None) -> List[Tuple]:
+        self.queries += 1
+        try:
+            return self.conn.execute(self._translate(query), params or ()).fetchall()
+        except sqlite3.Error:
+            self.failed += 1
+            return []
+
+    def execute_query(self, query: str, params: Optional[Tuple] = None, name: Optional[str] = None) -> bool:
+        self.queries += 1
+        try:
+            self.conn.execute(self._translate(query), params or ())
+            self.conn.commit()
+            return True
+        except sqlite3.Error:
+            self.failed += 1
+            self.conn.rollback()
+            return False
+
+    def execute_many(self, query: str, params_list: List[Tuple], name: Optional[str] = None) -> bool:
+        self.queries += 1
+        try:
+            self.conn.executemany(self._translate(query), params_list)
+            self.conn.commit()
+            return True
+        except sqlite3.Error:
+            self.failed += 1
+            self.conn.rollback()
+            return False
+
+    def load_books(self, books: Sequence[Tuple[str, str, str]]):
+        """tb_books 채우기"""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO tb_books (books_isbn, books_title, books_description) VALUES (?, ?, ?)", books
+        )
+        self.conn.commit()
+
+    def count(self, table: str, where: str = "", params: Tuple = ()) -> int:
+        query = f"SELECT COUNT(*) FROM {table}" + (f" WHERE {where}" if where else "")
+        return self.conn.execute(query, params).fetchone()[0]
+
+    def close(self):
+        # 벤치마크 중 추천 시스템 close()가 호출돼도 결과를 확인할 수 있도록 연결은 유지
+        pass
+
+
+def corpus_hash(books: Sequence[Tuple[str, str, str]]) -> str:
+    """보고서 비교용 코퍼스 식별자"""
+    digest = hashlib.sha1()
+    for isbn, title, description in books:
+        digest.update(f"{isbn}\t{title}\t{description}\n".encode("utf-8"))
+    return digest.hexdigest()[:10]
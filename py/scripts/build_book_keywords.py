@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+도서 키워드 일괄 생성 스크립트
+- 전체 도서 설명 TF-IDF 상위 키워드를 tb_books_keyword에 저장
+"""
+
+import sys
+import os
+import argparse
+
+# app 폴더를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+py_dir = os.path.dirname(current_dir)
+app_dir = os.path.join(py_dir, 'app')
+sys.path.append(app_dir)
+
+from core.book_keywords import BookKeywordExtractor
+from core.database import PostgreSQLDatabase
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="도서 키워드 일괄 생성")
+    parser.add_argument("--top-k", type=int, default=10, help="도서별 키워드 수")
+    parser.add_argument("--refit", action="store_true",
+                        help="저장된 어휘 / IDF를 무시하고 다시 학습")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    print("🚀 도서 키워드 생성 시작...")
+
+    extractor = BookKeywordExtractor(top_k=args.top_k)
+    db = PostgreSQLDatabase()
+    try:
+        isbn_tokens = extractor.build_books_keywords(db, refit=args.refit)
+        print(f"✅ 도서 키워드 생성 완료: {len(isbn_tokens)}권")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        extractor.close()
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+임베딩 차원 축소 학습 스크립트
+- 도서 설명 임베딩으로 PCA(선택적 화이트닝) 투영을 학습
+- 전체 차원 대비 top-k 재현율을 출력하고, 기준을 통과하면 cache/embedding_projection.pkl에 저장
+"""
+
+import sys
+import os
+import argparse
+import hashlib
+
+# app 폴더를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+py_dir = os.path.dirname(current_dir)
+app_dir = os.path.join(py_dir, 'app')
+sys.path.append(app_dir)
+
+from core.bert.embedding_engine import EmbeddingEngine
+from core.bert.model_registry import DEFAULT_BERT_MODEL
+from core.bert.projection import DEFAULT_PROJECTION_PATH
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="임베딩 차원 축소 학습")
+    parser.add_argument("--dim", type=int, default=int(os.getenv("EMBEDDING_PROJECTION_DIM", "0")) or 256,
+                        help="출력 차원 (권장 128~256)")
+    parser.add_argument("--whiten", action="store_true", help="화이트닝 적용")
+    parser.add_argument("--min-recall", type=float, default=None,
+                        help="적용 기준 top-k 재현율 (기본값: EMBEDDING_PROJECTION_MIN_RECALL, 0.9)")
+    parser.add_argument("--k", type=int, default=10, help="재현율 측정 상위 개수")
+    parser.add_argument("--output", default=DEFAULT_PROJECTION_PATH, help="투영 저장 경로")
+    return parser.parse_args()
+
+def load_books():
+    """학습용 도서 ISBN / 설명"""
+    from core.database import PostgreSQLDatabase
+    db = PostgreSQLDatabase()
+    try:
+        rows = db.fetch_query("""
+            SELECT books_isbn, books_description FROM tb_books
+            WHERE books_description IS NOT NULL AND books_description != ''
+            ORDER BY books_isbn
+        """)
+    finally:
+        db.close()
+    return [row[0] for row in rows], [row[1] for row in rows]
+
+def main():
+    args = parse_args()
+    isbns, descriptions = load_books()
+    print(f"🚀 임베딩 차원 축소 학습 시작: 도서 {len(descriptions)}권, {args.dim}차원")
+
+    engine = EmbeddingEngine(DEFAULT_BERT_MODEL, projection_path=args.output)
+    try:
+        catalogue_hash = hashlib.sha1("\n".join(isbns).encode("utf-8")).hexdigest()
+        metadata = engine.fit_projection(descriptions, dim=args.dim, whiten=args.whiten,
+                                         min_recall=args.min_recall, k=args.k,
+                                         catalogue_hash=catalogue_hash)
+    finally:
+        engine.close()
+
+    if "recall_at_k" not in metadata:
+        print(f"⚠️ 학습 데이터가 부족합니다: 도서 {metadata['samples']}권 ≤ {metadata['dim']}차원")
+        return
+    print(f"📊 설명 분산: {metadata['explained_variance']}, recall@{metadata['k']}: {metadata['recall_at_k']}")
+    if metadata["activated"]:
+        print(f"✅ 투영 저장 완료 → {args.output}")
+        print(f"   EMBEDDING_PROJECTION_DIM={metadata['dim']}으로 설정하면 이 투영을 사용합니다.")
+    else:
+        print(f"❌ 재현율이 기준({metadata['min_recall']})보다 낮아 저장하지 않았습니다. 차원을 늘려 보세요.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+로컬 OTLP 수집기 대체
+- OTLP/HTTP JSON(POST /v1/traces)을 받아 JSON Lines 트레이스 파일에 기록
+- TRACING_EXPORTER=otlp 설정을 실제 수집기 없이 확인할 때 사용 (결과는 trace_report.py로 확인)
+
+사용법:
+    python scripts/otlp_collector.py --port 4318 --output cache/otlp_traces.jsonl
+    TRACING_EXPORTER=otlp OTLP_ENDPOINT=http://localhost:4318 python scripts/run_recommendation.py
+"""
+
+import os
+import sys
+import json
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# app 폴더를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+app_dir = os.path.join(os.path.dirname(current_dir), 'app')
+sys.path.append(app_dir)
+
+from core.tracing import JsonLinesExporter, from_otlp
+
+
+def make_handler(exporter: JsonLinesExporter):
+    class CollectorHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip("/") != "/v1/traces":
+                self.send_error(404)
+                return
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                spans = from_otlp(body)
+            except (ValueError, KeyError) as e:
+                self.send_error(400, str(e))
+                return
+            exporter.export(spans)
+            print(f"📥 스팬 {len(spans)}개 수신")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    return CollectorHandler
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="로컬 OTLP/HTTP JSON 수집기")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--output", default="cache/otlp_traces.jsonl", help="JSON Lines 출력 파일")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(JsonLinesExporter(args.output)))
+    print(f"🚀 OTLP 수집기 실행: http://{args.host}:{args.port}/v1/traces → {args.output}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("🔚 수집기 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
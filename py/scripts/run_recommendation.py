@@ -3,10 +3,12 @@
 
 """
 BERT 기반 추천 시스템 실행 스크립트
+- 단계별 체크포인트로 실패 시 마지막 완료 단계부터 재실행
 """
 
 import sys
 import os
+import argparse
 import torch
 
 # app 폴더를 Python 경로에 추가
@@ -15,52 +17,70 @@ py_dir = os.path.dirname(current_dir)
 app_dir = os.path.join(py_dir, 'app')
 sys.path.append(app_dir)
 
-from core.crowling import Crowling
+from core.pipeline import RecommendationPipeline
 from utils.duplicate_checker import DuplicateDataChecker
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="BERT 기반 추천 파이프라인 실행")
+    parser.add_argument("--restart", action="store_true",
+                        help="체크포인트를 무시하고 처음부터 실행")
+    parser.add_argument("--from-stage", choices=RecommendationPipeline.STAGE_NAMES,
+                        help="지정한 단계부터 다시 실행")
+    parser.add_argument("--force", action="store_true",
+                        help="오늘자 데이터가 있어도 처음부터 다시 실행 (--from-stage와 함께 쓰면 해당 단계부터)")
+    parser.add_argument("--run-id", help="실행 ID (기본값: 오늘 날짜)")
+    parser.add_argument("--profile-stage", action="append", default=[],
+                        choices=RecommendationPipeline.STAGE_NAMES + ["all"],
+                        help="샘플링 프로파일을 저장할 단계 (여러 번 지정 가능, PROFILE_DIR에 저장)")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
     print("🚀 BERT 기반 추천 시스템 실행 시작...")
     print(f"🔧 GPU 사용 가능: {torch.cuda.is_available()}")
     
+    pipeline = None
     try:
         # 중복 데이터 체크
-        print("🔍 오늘자 데이터 중복 체크 중...")
-        checker = DuplicateDataChecker()
-        should_skip = checker.should_skip_processing()
+        if not args.force:
+            print("🔍 오늘자 데이터 중복 체크 중...")
+            checker = DuplicateDataChecker()
+            should_skip = checker.should_skip_processing()
+            checker.close()
+            
+            if should_skip:
+                print("⏭️ 오늘자 데이터가 이미 존재합니다. 건너뜁니다.")
+                print("💡 강제 재처리를 원하시면 --force 옵션을 사용하세요.")
+                return
         
-        if should_skip:
-            print("⏭️ 오늘자 데이터가 이미 존재합니다. 건너뜁니다.")
-            print("💡 강제 재처리를 원하시면 데이터베이스를 확인해주세요.")
+        # crawl → keywords → embed_books → score → publish → similar_books
+        pipeline = RecommendationPipeline(run_id=args.run_id)
+        pipeline.profile_stages.update(args.profile_stage)
+        if args.from_stage:
+            pipeline.reset(from_stage=args.from_stage)
+        # --force는 오늘 완료된 체크포인트를 그대로 재사용하지 않도록 처음부터 (또는 --from-stage부터) 실행
+        outputs = pipeline.run(resume=not (args.restart or (args.force and not args.from_stage)))
+        if outputs is None:
+            print(f"⏭️ 같은 실행({pipeline.run_id})이 다른 프로세스에서 진행 중입니다. 건너뜁니다.")
             return
         
-        # 크롤러 초기화
-        crawler = Crowling()
-        
-        # 뉴스 데이터 크롤링
-        print("📡 중앙일보 뉴스 키워드 크롤링 중...")
-        news_data = crawler.wordExtraction()
-        print("✅ 키워드 추출 완료:", news_data)
-        
-        # BERT 추천 시스템 실행
-        if torch.cuda.is_available():
-            print("🚀 GPU 최적화된 BERT 추천 시스템 실행 중...")
-            from core.recommendation.bert_recommendation_gpu import GPUBertRecommendationSystem
-            
-            bert_system = GPUBertRecommendationSystem()
-            bert_system.recommend_books_by_context(news_data)
-        else:
-            print("🚀 CPU BERT 추천 시스템 실행 중...")
-            from core.recommendation.bert_recommendation import BertRecommendationSystem
-            
-            bert_system = BertRecommendationSystem()
-            bert_system.recommend_books_by_context(news_data)
+        print("⏱️ 단계별 소요 시간:")
+        for stage, duration in pipeline.stage_durations().items():
+            print(f"   - {stage}: {duration:.2f}초" if duration is not None else f"   - {stage}: -")
+        for stage, record in pipeline.manifest["stages"].items():
+            if record.get("profile"):
+                print(f"🔬 {stage} 프로파일: {record['profile']}")
         
         print("✅ BERT 기반 추천 완료 및 DB 저장 완료")
         
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
+        print("💡 다시 실행하면 마지막으로 완료된 단계 다음부터 이어서 처리합니다.")
         import traceback
         traceback.print_exc()
+    finally:
+        if pipeline is not None:
+            pipeline.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+트레이스 임계 경로 보고서
+- JSON Lines 트레이스 파일(TRACE_FILE 또는 scripts/otlp_collector.py 출력)에서
+  일일 실행 1회의 임계 경로와 경로 위 스팬별 자기 시간을 출력
+
+사용법:
+    python scripts/trace_report.py                       # 가장 최근 파이프라인 실행
+    python scripts/trace_report.py --trace-id <trace_id>
+    python scripts/trace_report.py --list
+"""
+
+import os
+import sys
+import argparse
+
+# app 폴더를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+app_dir = os.path.join(os.path.dirname(current_dir), 'app')
+sys.path.append(app_dir)
+
+from core.tracing import DEFAULT_TRACE_FILE, critical_path, load_spans
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="트레이스 임계 경로 보고서")
+    parser.add_argument("--file", default=DEFAULT_TRACE_FILE, help="JSON Lines 트레이스 파일")
+    parser.add_argument("--trace-id", help="트레이스 ID (기본값: 가장 최근 루트 스팬)")
+    parser.add_argument("--list", action="store_true", help="트레이스 목록만 출력")
+    parser.add_argument("--top", type=int, default=10, help="자기 시간 상위 스팬 수")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not os.path.exists(args.file):
+        print(f"❌ 트레이스 파일이 없습니다: {args.file} (TRACING_EXPORTER=jsonl로 실행하세요)")
+        sys.exit(1)
+    spans = load_spans(args.file)
+    roots = sorted((span for span in spans if not span.get("parent_id")), key=lambda span: span["start_ns"])
+    if not roots:
+        print("❌ 루트 스팬이 없습니다.")
+        sys.exit(1)
+
+    if args.list:
+        for root in roots:
+            attributes = ", ".join(f"{key}={value}" for key, value in root.get("attributes", {}).items())
+            print(f"{root['trace_id']}  {root['name']:<28}{root['duration_ms'] / 1000:>9.2f}초  {attributes}")
+        return
+
+    trace_id = args.trace_id or roots[-1]["trace_id"]
+    trace = [span for span in spans if span["trace_id"] == trace_id]
+    if not trace:
+        print(f"❌ 트레이스를 찾을 수 없습니다: {trace_id}")
+        sys.exit(1)
+    path = critical_path(trace)
+    total = path[0]["duration_ms"]
+
+    print(f"🧭 임계 경로: {path[0]['name']} (trace {trace_id}, {total / 1000:.2f}초, 스팬 {len(trace)}개)")
+    print(f"{'span':<44}{'duration ms':>14}{'self ms':>12}{'share':>8}")
+    for entry in path:
+        name = "  " * entry["depth"] + entry["name"]
+        share = entry["self_ms"] / total * 100 if total else 0.0
+        print(f"{name:<44}{entry['duration_ms']:>14.1f}{entry['self_ms']:>12.1f}{share:>7.1f}%")
+
+    print(f"\n🐢 경로 위 자기 시간 상위 {args.top}개")
+    for entry in sorted(path, key=lambda entry: entry["self_ms"], reverse=True)[:args.top]:
+        attributes = ", ".join(f"{key}={value}" for key, value in entry["attributes"].items())
+        print(f"   - {entry['name']}: {entry['self_ms']:.1f}ms {f'({attributes})' if attributes else ''}")
+
+
+if __name__ == "__main__":
+    main()
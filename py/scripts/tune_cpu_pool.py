@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CPU 임베딩 프로세스 × 스레드 조합 측정 스크립트
+- 조합별 처리량을 측정해 cache/cpu_pool_tuning.json에 저장
+- EMBEDDING_CPU_PROCESSES=auto이면 임베딩 엔진이 저장된 최적 조합을 사용
+"""
+
+import sys
+import os
+import argparse
+
+# app 폴더를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+py_dir = os.path.dirname(current_dir)
+app_dir = os.path.join(py_dir, 'app')
+sys.path.append(app_dir)
+
+from core.bert.cpu_pool import DEFAULT_TUNING_PATH, autotune, candidate_splits
+from core.bert.embedding_engine import EmbeddingEngine
+from core.bert.model_registry import DEFAULT_BERT_MODEL
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="CPU 임베딩 프로세스 × 스레드 조합 측정")
+    parser.add_argument("--samples", type=int, default=256, help="측정에 사용할 텍스트 수")
+    parser.add_argument("--batch-size", type=int, default=32, help="배치 크기")
+    parser.add_argument("--splits", default="",
+                        help="측정할 조합 (예: 1x8,2x4,4x2 - 기본값: CPU 수 기준 자동)")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="DB 도서 설명 대신 생성한 문장으로 측정")
+    parser.add_argument("--output", default=DEFAULT_TUNING_PATH, help="결과 저장 경로")
+    return parser.parse_args()
+
+def load_texts(samples: int, synthetic: bool):
+    """측정용 텍스트 (기본: 실제 도서 설명)"""
+    if not synthetic:
+        try:
+            from core.database import PostgreSQLDatabase
+            db = PostgreSQLDatabase()
+            try:
+                rows = db.fetch_query("""
+                    SELECT books_description FROM tb_books
+                    WHERE books_description IS NOT NULL AND books_description != ''
+                    LIMIT %s
+                """, (samples,))
+            finally:
+                db.close()
+            if rows:
+                return [EmbeddingEngine.preprocess(row[0]) for row in rows]
+        except Exception as e:
+            print(f"⚠️ 도서 설명을 불러오지 못해 생성한 문장을 사용합니다: {e}")
+    words = ["경제", "금융", "정책", "정치", "개혁", "사회", "문제", "국제", "외교", "기술", "문화", "역사"]
+    return [" ".join(words[(i + j) % len(words)] for j in range(20 + i % 60)) for i in range(samples)]
+
+def main():
+    args = parse_args()
+    splits = [tuple(int(part) for part in split.split("x")) for split in args.splits.split(",") if split] \
+        or candidate_splits()
+    texts = load_texts(args.samples, args.synthetic)
+    print(f"🚀 CPU 임베딩 조합 측정 시작: 텍스트 {len(texts)}개, 조합 {splits}")
+
+    # 워커는 엔진과 같은 설정(모델 / 최대 토큰 / 정밀도 / 풀링)으로 생성
+    engine_settings = EmbeddingEngine(DEFAULT_BERT_MODEL, device="cpu", cpu_processes=1)
+    tuning = autotune(
+        texts, splits, batch_size=args.batch_size,
+        factory_args=(DEFAULT_BERT_MODEL, engine_settings.max_length, engine_settings.precision,
+                      engine_settings.pooling),
+        path=args.output,
+    )
+
+    print("\n프로세스 × 스레드   텍스트/초   소요(초)")
+    for result in tuning["results"]:
+        print(f"{result['processes']:>5} × {result['threads']:<8} {result['texts_per_sec']:>10} {result['seconds']:>9}")
+    print(f"\n✅ 최적 조합: 프로세스 {tuning['processes']}개 × 스레드 {tuning['threads']}개 → {args.output}")
+    print("   EMBEDDING_CPU_PROCESSES=auto로 설정하면 이 조합을 사용합니다.")
+
+if __name__ == "__main__":
+    main()
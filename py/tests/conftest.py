@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+테스트 공통 설정
+- app 폴더를 PYTHONPATH에 추가 (main.py와 동일한 import 방식)
+- 픽스처 HTML을 제공하는 로컬 스텁 HTTP 서버
+"""
+
+import os
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(TESTS_DIR, "fixtures")
+sys.path.append(os.path.join(os.path.dirname(TESTS_DIR), "app"))
+
+
+class StubServer:
+    """경로별 픽스처 HTML / 상태 코드 / 지연을 설정할 수 있는 스텁 서버"""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return f"{self.base_url}{path}"
+
+    def add_fixture(self, path, fixture_name, delay=0.0, statuses=None, headers=None):
+        """
+        Args:
+            path: 요청 경로 (쿼리 포함)
+            fixture_name: fixtures 폴더의 HTML 파일명
+            delay: 응답 지연(초)
+            statuses: 요청 순서대로 반환할 상태 코드 (소진되면 200)
+            headers: 추가 응답 헤더
+        """
+        with open(os.path.join(FIXTURES_DIR, fixture_name), "rb") as f:
+            body = f.read()
+        self.routes[path] = {
+            "body": body,
+            "delay": delay,
+            "statuses": list(statuses or []),
+            "headers": dict(headers or {}),
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                route = server.routes.get(self.path)
+                if route is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                if route["delay"]:
+                    time.sleep(route["delay"])
+                status = route["statuses"].pop(0) if route["statuses"] else 200
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                for name, value in route["headers"].items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if status == 200:
+                    self.wfile.write(route["body"])
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+여러 카테고리 추천 API 테스트 (윈도 함수 쿼리 1회, 단일 카테고리 API 캐시 채우기)
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+from fastapi import FastAPI
+
+from api import endpoints
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from standins import SQLiteDatabase
+
+NEWS_SCHEMA = """
+CREATE TABLE tb_news_keyword (news_id INTEGER PRIMARY KEY, news_category TEXT, news_date TEXT);
+ALTER TABLE tb_recommend ADD COLUMN news_id INTEGER;
+"""
+
+
+def make_db():
+    db = SQLiteDatabase()
+    db.conn.executescript(NEWS_SCHEMA)
+    db.load_books([(f"isbn{i}", f"책 {i}", f"설명 {i}") for i in range(12)])
+    db.conn.executemany("INSERT INTO tb_news_keyword VALUES (?, ?, ?)",
+                        [(1, "politics", "2024-05-01"), (2, "sports", "2024-05-01"), (3, "politics", "2024-05-02")])
+    rows = [(f"isbn{i}", 0.9 - i * 0.05, 1) for i in range(5)] + \
+        [(f"isbn{i}", 0.8 - i * 0.05, 2) for i in range(5, 8)] + [("isbn4", 0.95, 3)]
+    db.conn.executemany("INSERT INTO tb_recommend (books_isbn, similarity_score, news_id) VALUES (?, ?, ?)", rows)
+    db.conn.commit()
+    return db
+
+
+def test_batch_recommend_runs_one_query_and_fills_single_category_cache(monkeypatch):
+    db = make_db()
+    monkeypatch.setattr(endpoints, "recommendation_cache", {})
+    monkeypatch.setattr(endpoints, "cache_timestamps", {})
+    app = FastAPI()
+    app.include_router(endpoints.router, prefix="/api")
+    app.dependency_overrides[endpoints.get_database] = lambda: db
+
+    async def get(url, params=None):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(url, params=params)
+
+    response = asyncio.run(get("/api/recommend", {"categories": "politics,sport,world", "limit": 3}))
+    assert response.status_code == 200 and db.queries == 1 and db.failed == 0
+    body = response.json()
+    assert list(body["categories"]) == ["politics", "sports", "world"] and body["cache_hits"] == 0
+    politics = body["categories"]["politics"]
+    assert politics["total"] == 5 and politics["total_pages"] == 2
+    assert [book["books_isbn"] for book in politics["books"]] == ["isbn4", "isbn0", "isbn1"]
+    assert [book["books_isbn"] for book in body["categories"]["sports"]["books"]] == ["isbn5", "isbn6", "isbn7"]
+    assert body["categories"]["world"]["total"] == 0
+
+    # 단일 카테고리 API는 DB 없이 같은 캐시 항목으로 응답, 추천이 없는 카테고리는 그대로 404
+    single = asyncio.run(get("/api/recommend/politics", {"limit": 3})).json()
+    assert single["cache_hit"] and single["books"] == politics["books"] and db.queries == 1
+    assert asyncio.run(get("/api/recommend/world", {"limit": 3})).status_code == 404
+
+    again = asyncio.run(get("/api/recommend", {"categories": "politics,sports", "limit": 3})).json()
+    assert again["cache_hits"] == 2 and db.queries == 2  # world 404 확인의 COUNT 1회만 추가
+    assert asyncio.run(get("/api/recommend", {"categories": "politics,nope"})).status_code == 400
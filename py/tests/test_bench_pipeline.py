@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+파이프라인 벤치마크 CLI 테스트 (픽스처 서버 + SQLite DB + 해시 임베딩 엔진으로 전 단계 실행)
+"""
+
+import os
+
+from test_bench_standins import HashEngine
+
+from bench import find_regressions, parse_args, run_scale
+
+
+def test_run_scale_measures_every_stage(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    args = parse_args(["pipeline", "--pages", "2", "--headlines", "8"])
+    results = run_scale(40, args, str(tmp_path), engine=HashEngine())
+
+    stages = ["crawl", "keywords", "embed_books", "score", "publish", "similar_books"]
+    assert list(results) == stages + ["total"]
+    for stage in stages:
+        assert results[stage]["seconds"] >= 0
+        assert results[stage]["cpu_seconds"] >= 0
+        assert results[stage]["peak_rss_mb"] > 0
+    assert results["crawl"]["rows"] > 0
+    assert results["embed_books"]["rows"] == 40
+    assert results["publish"]["rows"] == results["score"]["rows"]
+    assert results["similar_books"]["rows"] == 40
+    assert os.path.exists(tmp_path / "checkpoints" / "recommendation" / "bench-40" / "manifest.json")
+
+
+def test_find_regressions_ignores_short_stages():
+    baseline = {"results": {"1000.crawl": {"seconds": 1.0}, "1000.score": {"seconds": 0.01}}}
+    current = {"results": {"1000.crawl": {"seconds": 1.3}, "1000.score": {"seconds": 0.05}}}
+    assert [row["name"] for row in find_regressions(baseline, current, 20, 0.05)] == ["1000.crawl"]
+    assert find_regressions(baseline, current, 50, 0.05) == []
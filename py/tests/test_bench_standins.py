@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+오프라인 벤치마크 대체 구성 요소 테스트 (합성 코퍼스 / SQLite DB / 보고서 비교)
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from report import compare_reports, measure
+from standins import CATEGORIES, SQLiteDatabase, SyntheticCorpus, corpus_hash
+
+from core.bert.embedding_cache import EmbeddingCache
+from core.bert.embedding_engine import EMBEDDING_DIM, EmbeddingEngine
+from core.recommendation.bert_recommendation_gpu import GPUBertRecommendationSystem
+
+
+class HashEngine(EmbeddingEngine):
+    def __init__(self):
+        super().__init__(device="cpu", cache=EmbeddingCache(None), projection_path=None)
+
+    def _encode(self, texts):
+        vectors = np.zeros((len(texts), EMBEDDING_DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                vectors[row, sum(map(ord, word)) % EMBEDDING_DIM] += 1.0
+        return vectors
+
+
+def test_synthetic_corpus_is_deterministic():
+    books = SyntheticCorpus(seed=3).books(20)
+    assert books == SyntheticCorpus(seed=3).books(20)
+    assert corpus_hash(books) != corpus_hash(SyntheticCorpus(seed=4).books(20))
+    assert len({isbn for isbn, _, _ in books}) == 20
+    assert all("가" <= description[0] <= "힣" for _, _, description in books)
+    assert set(SyntheticCorpus().news(2)) == set(CATEGORIES)
+
+
+def test_gpu_recommender_runs_against_sqlite():
+    corpus = SyntheticCorpus(seed=1)
+    db = SQLiteDatabase()
+    db.load_books(corpus.books(60))
+    recommender = GPUBertRecommendationSystem(engine=HashEngine(), db=db)
+
+    books_data = recommender.load_books()
+    assert len(books_data["isbn"]) == 60
+    embeddings = recommender.embed_books(books_data)
+    news = {category: [books_data["description"][i]] for i, category in enumerate(CATEGORIES[:3])}
+    recommendations = recommender.score_categories(news, embeddings, books_data)
+    assert recommender.save_recommendations_to_db(recommendations, "bench")
+    assert db.count("tb_recommend", "method = ?", ("bench",)) == sum(map(len, recommendations.values())) > 0
+    assert db.failed == 0
+
+
+def test_compare_reports_flags_slower_entries():
+    fast = {"results": {"a": measure(lambda: None, repeat=1), "b": {"seconds": 2.0}}}
+    current = {"results": {"b": {"seconds": 3.0}, "c": {"seconds": 1.0}}}
+    rows = compare_reports(fast, current)
+    assert rows == [{"name": "b", "baseline": 2.0, "current": 3.0, "change_pct": 50.0}]
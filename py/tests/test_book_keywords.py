@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+도서 키워드 TF-IDF 추출 테스트
+"""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+
+from scipy import sparse
+
+from core.book_keywords import BookKeywordExtractor, top_terms_per_row
+
+
+class FakeDatabase:
+    def __init__(self, books):
+        self.books = books
+        self.inserted = None
+
+    def fetch_query(self, query, params=None):
+        return self.books
+
+    def replace_books_keywords(self, isbn_tokens):
+        self.inserted = isbn_tokens
+        return True
+
+
+def test_top_terms_per_row_matches_row_by_row_sort():
+    matrix = sparse.csr_matrix(np.array([
+        [0.1, 0.0, 0.7, 0.3],
+        [0.0, 0.0, 0.0, 0.0],
+        [0.5, 0.9, 0.0, 0.2],
+    ]))
+    vocabulary = np.array(["a", "b", "c", "d"], dtype=object)
+
+    assert top_terms_per_row(matrix, vocabulary, 2) == [["c", "d"], [], ["b", "a"]]
+
+
+def test_build_books_keywords_persists_vocabulary_and_inserts_in_bulk(tmp_path):
+    db = FakeDatabase([
+        ("isbn-1", "경제학 입문서 경제 원리와 시장"),
+        ("isbn-2", "축구 전술 해설서 축구 역사"),
+        ("isbn-3", "시장 경제와 금융 위기"),
+    ])
+    model_path = str(tmp_path / "book_tfidf.pkl")
+    extractor = BookKeywordExtractor(model_path=model_path, top_k=2, analyzer="regex",
+                                     memo_path=str(tmp_path / "nouns.pkl"), max_df=1.0)
+    isbn_tokens = extractor.build_books_keywords(db)
+    extractor.close()
+
+    assert db.inserted == isbn_tokens
+    assert isbn_tokens["isbn-2"][0] == "축구"
+    assert all(len(terms) == 2 for terms in isbn_tokens.values())
+
+    # 저장된 어휘 / IDF로 재학습 없이 추출
+    reloaded = BookKeywordExtractor(model_path=model_path, analyzer="regex",
+                                    memo_path=str(tmp_path / "nouns.pkl"))
+    assert reloaded.is_fitted
+    # 학습 어휘에 없는 단어(경기)는 제외
+    assert set(reloaded.extract(["축구 경기 전술"], top_k=5)[0]) == {"축구", "전술"}
+
+
+def test_batch_build_keeps_memo_for_whole_catalogue_without_news_corpus(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    books = [(f"isbn-{i}", f"도서 설명 {i}번 경제 시장") for i in range(5)]
+    memo_path = str(tmp_path / "nouns.pkl")
+    extractor = BookKeywordExtractor(model_path=str(tmp_path / "book_tfidf.pkl"), analyzer="regex",
+                                     memo_path=memo_path, max_df=1.0)
+    extractor.nouns.max_memo_size = 2
+    extractor.nouns._memo[("regex", "삭제된 도서 설명")] = ["삭제"]
+    extractor.build_books_keywords(FakeDatabase(books))
+    extractor.close()
+
+    # 뉴스 배경 말뭉치는 읽지도 기록하지도 않음
+    assert extractor.nouns.corpus_path is None
+    assert not (tmp_path / "cache" / "keyword_corpus.pkl").exists()
+
+    # 메모 상한(2)보다 카탈로그가 커도 전체 설명 보관, 카탈로그에 없는 설명은 정리
+    reloaded = BookKeywordExtractor(model_path=str(tmp_path / "book_tfidf.pkl"), analyzer="regex",
+                                    memo_path=memo_path)
+    assert sorted(title for _, title in reloaded.nouns._memo) == sorted(text for _, text in books)
+
+
+class SQLiteConnection:
+    """psycopg2 연결처럼 %s 자리 표시자를 받는 SQLite 연결"""
+
+    closed = False
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE tb_books_keyword (books_isbn TEXT, books_keyword TEXT NOT NULL)")
+        self.commits = 0
+
+    def cursor(self):
+        return SQLiteCursor(self.conn.cursor())
+
+    def commit(self):
+        self.commits += 1
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+
+class SQLiteCursor:
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    @property
+    def rowcount(self):
+        return self.cursor.rowcount
+
+    def execute(self, query, params=()):
+        self.cursor.execute(query.replace("%s", "?"), params)
+
+    def executemany(self, query, params_list):
+        self.cursor.executemany(query.replace("%s", "?"), params_list)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cursor.close()
+
+
+def test_replace_books_keywords_is_one_transaction():
+    pytest.importorskip("psycopg2")
+    from core.database import PostgreSQLDatabase
+
+    db = PostgreSQLDatabase.__new__(PostgreSQLDatabase)
+    db.use_pool, db.pool = False, None
+    db.conn = SQLiteConnection()
+    db.cursor = db.conn.cursor()
+    rows = lambda: db.conn.conn.execute(
+        "SELECT books_isbn, books_keyword FROM tb_books_keyword ORDER BY 1, 2").fetchall()
+
+    assert db.replace_books_keywords({"isbn-1": ["경제", "시장"]})
+    assert rows() == [("isbn-1", "경제"), ("isbn-1", "시장")] and db.conn.commits == 1
+
+    # 일괄 저장이 실패하면 삭제도 롤백되어 기존 키워드 유지
+    assert not db.replace_books_keywords({"isbn-2": ["축구", None]})
+    assert rows() == [("isbn-1", "경제"), ("isbn-1", "시장")] and db.conn.commits == 1
+
+    assert db.replace_books_keywords({"isbn-2": ["축구"]})
+    assert rows() == [("isbn-2", "축구")] and db.conn.commits == 2
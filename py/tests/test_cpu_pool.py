@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CPU 임베딩 프로세스 풀 테스트 (워커 인코더는 결정적 벡터로 대체)
+"""
+
+import json
+
+import numpy as np
+
+from core.bert import cpu_pool
+from core.bert.cpu_pool import CPUEmbeddingPool, autotune, candidate_splits, resolve_cpu_split
+
+DIM = 4
+
+
+class FakeEncoder:
+    def _encode(self, texts):
+        return np.array([[len(text), sum(map(ord, text)) % 97, text.count(" "), 1.0]
+                         for text in texts], dtype=np.float32)
+
+
+def make_fake_encoder():
+    return FakeEncoder()
+
+
+def test_pool_returns_rows_in_input_order():
+    texts = [f"문장 {i} " * (i % 5 + 1) for i in range(23)] + ["", "emoji 😀 텍스트"]
+    pool = CPUEmbeddingPool(2, 1, factory=make_fake_encoder, dim=DIM)
+    try:
+        result = pool.encode(texts, batch_size=4)
+    finally:
+        pool.close()
+    np.testing.assert_array_equal(result, FakeEncoder()._encode(texts))
+
+
+def test_resolve_cpu_split_and_autotune(tmp_path, monkeypatch):
+    monkeypatch.setattr(cpu_pool.os, "cpu_count", lambda: 8)
+    assert candidate_splits() == [(1, 8), (2, 4), (4, 2), (8, 1)]
+
+    monkeypatch.setenv("EMBEDDING_CPU_PROCESSES", "4")
+    monkeypatch.delenv("EMBEDDING_CPU_THREADS", raising=False)
+    assert resolve_cpu_split() == (4, 2)
+    monkeypatch.setenv("EMBEDDING_CPU_PROCESSES", "1")
+    assert resolve_cpu_split() == (1, 0)  # 현재 프로세스, PyTorch 기본 스레드 수
+
+    path = str(tmp_path / "tuning.json")
+    tuning = autotune(["가나다 라마"] * 20, splits=[(1, 1), (2, 1)], batch_size=5,
+                      factory=make_fake_encoder, dim=DIM, path=path)
+    assert (tuning["processes"], tuning["threads"]) in [(1, 1), (2, 1)]
+    assert len(tuning["results"]) == 2
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["cpu_count"] == 8
+
+    monkeypatch.setattr(cpu_pool, "DEFAULT_TUNING_PATH", path)
+    monkeypatch.setenv("EMBEDDING_CPU_PROCESSES", "auto")
+    assert resolve_cpu_split() == (tuning["processes"], tuning["threads"])
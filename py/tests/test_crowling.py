@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 크롤러 테스트 (로컬 스텁 HTTP 서버 사용)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("bs4")
+
+from core.async_crawler import AsyncCrawler
+from core.crowling import Crowling
+from core.http_cache import HttpCache
+from conftest import FIXTURES_DIR
+
+
+def make_crowling(stub_server, sections, http_cache=None, **crawler_options):
+    crawler = AsyncCrawler(timeout=5, backoff=0.01, **crawler_options)
+    return Crowling(
+        sections={
+            section: [stub_server.url(path) for path in paths]
+            for section, paths in sections.items()
+        },
+        crawler=crawler,
+        http_cache=http_cache,
+        use_cache=http_cache is not None,
+    )
+
+
+def test_get_news_titles_parses_fixture_pages(stub_server):
+    stub_server.add_fixture("/politics", "politics.html")
+    stub_server.add_fixture("/sports", "sports.html")
+    crowling = make_crowling(stub_server, {"politics": ["/politics"], "sports": ["/sports"]})
+
+    news_titles = crowling.get_news_titles()
+
+    assert news_titles["politics"][:2] == ["많이 본 기사", "국회, 내년도 예산안 본회의 처리 일정 합의"]
+    assert len(news_titles["politics"]) == 5
+    # 5자 이하 제목과 빈 제목은 제외
+    assert news_titles["sports"] == [
+        "대표팀, 월드컵 예선 첫 경기 승리로 출발",
+        "프로야구 포스트시즌 일정 발표",
+        "골프 메이저 대회 한국 선수 공동 3위",
+    ]
+
+
+def test_get_news_titles_fetches_pages_concurrently(stub_server):
+    paths = [f"/politics?page={page}" for page in range(1, 7)]
+    for path in paths:
+        stub_server.add_fixture(path, "politics.html", delay=0.3)
+    crowling = make_crowling(stub_server, {"politics": paths}, max_per_host=6)
+
+    start_time = time.time()
+    news_titles = crowling.get_news_titles()
+    elapsed = time.time() - start_time
+
+    assert len(news_titles["politics"]) == 5 * len(paths)
+    # 순차 실행이면 1.8초 이상 걸림
+    assert elapsed < 1.0
+
+
+def test_per_host_limit_serializes_requests(stub_server):
+    paths = [f"/sports?page={page}" for page in range(1, 4)]
+    for path in paths:
+        stub_server.add_fixture(path, "sports.html", delay=0.2)
+    crowling = make_crowling(stub_server, {"sports": paths}, max_per_host=1)
+
+    start_time = time.time()
+    crowling.get_news_titles()
+
+    assert time.time() - start_time >= 0.6
+
+
+def test_retries_transient_errors_then_gives_up(stub_server):
+    stub_server.add_fixture("/flaky", "sports.html", statuses=[503, 502])
+    stub_server.add_fixture("/down", "sports.html", statuses=[503] * 10)
+    crowling = make_crowling(stub_server, {"sports": ["/flaky", "/down"]}, retries=2)
+
+    news_titles = crowling.get_news_titles()
+
+    assert len(news_titles["sports"]) == 3
+    assert sum(1 for path, _ in stub_server.requests if path == "/down") == 3
+
+
+def test_missing_page_returns_empty_list(stub_server):
+    crowling = make_crowling(stub_server, {"world": []})
+
+    assert crowling.scrape_h2_text(stub_server.url("/missing")) == []
+
+
+def test_conditional_get_skips_unchanged_pages(stub_server, tmp_path, monkeypatch):
+    stub_server.add_fixture("/politics", "politics.html", headers={"ETag": '"v1"'})
+    stub_server.add_fixture("/sports", "sports.html")
+    sections = {"politics": ["/politics"], "sports": ["/sports"]}
+
+    first = make_crowling(stub_server, sections, http_cache=HttpCache(str(tmp_path)))
+    first_titles = first.get_news_titles()
+    assert first.changed_sections == {"politics", "sports"}
+
+    # 두 번째 실행: ETag가 있는 페이지는 304, 없는 페이지는 같은 본문 → 둘 다 파싱 생략
+    stub_server.routes["/politics"]["statuses"] = [304]
+    second = make_crowling(stub_server, sections, http_cache=HttpCache(str(tmp_path)))
+    monkeypatch.setattr(second, "parse_h2_text", lambda html: pytest.fail("파싱되면 안 됨"))
+    second_titles = second.get_news_titles()
+
+    assert second_titles == first_titles
+    assert second.changed_sections == set()
+    politics_headers = [headers for path, headers in stub_server.requests if path == "/politics"]
+    assert politics_headers[-1].get("If-None-Match") == '"v1"'
+
+
+def test_changed_body_marks_section_changed(stub_server, tmp_path):
+    stub_server.add_fixture("/sports", "sports.html")
+    sections = {"sports": ["/sports"]}
+    make_crowling(stub_server, sections, http_cache=HttpCache(str(tmp_path))).get_news_titles()
+
+    stub_server.add_fixture("/sports", "politics.html")
+    crowling = make_crowling(stub_server, sections, http_cache=HttpCache(str(tmp_path)))
+    news_titles = crowling.get_news_titles()
+
+    assert crowling.changed_sections == {"sports"}
+    assert "국회, 내년도 예산안 본회의 처리 일정 합의" in news_titles["sports"]
+
+
+@pytest.mark.parametrize("backend", ["selectolax", "lxml", "bs4"])
+@pytest.mark.parametrize("fixture", ["politics.html", "sports.html"])
+def test_parser_backends_agree_with_beautifulsoup(backend, fixture):
+    from core.html_extract import EXTRACTORS, available_backends
+
+    if backend not in available_backends():
+        pytest.skip(f"{backend} 미설치")
+    with open(f"{FIXTURES_DIR}/{fixture}", encoding="utf-8") as f:
+        html = f.read()
+
+    assert EXTRACTORS[backend](html, "h2") == EXTRACTORS["bs4"](html, "h2")
+
+
+def test_multiple_sources_are_merged_by_category(stub_server):
+    from core.news_sources import NewsSource
+
+    stub_server.add_fixture("/a/politics", "politics.html")
+    stub_server.add_fixture("/b/politics", "politics.html")
+    stub_server.add_fixture("/b/sports", "sports.html")
+    sources = [
+        NewsSource("a", {"politics": [stub_server.url("/a/politics")]}),
+        NewsSource("b", {
+            "politics": [stub_server.url("/b/politics")],
+            "sports": [stub_server.url("/b/sports")],
+        }, extractor=lambda html: ["다른 언론사 헤드라인 제목"]),
+    ]
+    crowling = Crowling(sources=sources, crawler=AsyncCrawler(timeout=5), use_cache=False)
+
+    news_titles = crowling.get_news_titles()
+
+    # 소스별 추출기 사용, 카테고리 단위로 병합
+    assert len(news_titles["politics"]) == 6
+    assert news_titles["politics"][-1] == "다른 언론사 헤드라인 제목"
+    assert news_titles["sports"] == ["다른 언론사 헤드라인 제목"]
+    assert crowling.changed_sections == {"politics", "sports"}
+
+
+def test_min_interval_spaces_requests_to_same_domain(stub_server):
+    from core.news_sources import NewsSource
+
+    paths = [f"/world?page={page}" for page in range(1, 4)]
+    for path in paths:
+        stub_server.add_fixture(path, "sports.html")
+    source = NewsSource("slow", {"world": [stub_server.url(path) for path in paths]},
+                        min_interval=0.2)
+    crowling = Crowling(sources=[source], crawler=AsyncCrawler(timeout=5), use_cache=False)
+
+    start_time = time.time()
+    crowling.get_news_titles()
+
+    assert time.time() - start_time >= 0.4
+
+
+def test_run_sync_reraises_errors_from_running_loop():
+    async def fail():
+        raise ValueError("페이지 파싱 실패")
+
+    async def call_from_loop():
+        # 실행 중인 이벤트 루프 안에서 호출되면 별도 스레드에서 실행
+        return AsyncCrawler._run_sync(fail())
+
+    with pytest.raises(ValueError, match="페이지 파싱 실패"):
+        asyncio.run(call_from_loop())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+임베딩 캐시 테스트
+"""
+
+import os
+
+import numpy as np
+
+from core.bert.embedding_cache import EmbeddingCache, make_cache_key
+
+
+def vector(value, dim=4):
+    return np.full(dim, value, dtype=np.float32)
+
+
+def test_keys_cover_model_backend_and_normalized_text():
+    key = make_cache_key("kobert", "cls-fp32", "경제  위기\n전망")
+
+    assert key == make_cache_key("kobert", "cls-fp32", " 경제 위기 전망 ")
+    assert key != make_cache_key("kobert", "cls-fp16", "경제 위기 전망")
+    assert key != make_cache_key("other-model", "cls-fp32", "경제 위기 전망")
+
+
+def test_lru_eviction_respects_memory_budget():
+    cache = EmbeddingCache(max_mb=48 / 1024 / 1024)  # 4차원 float32 벡터 3개
+    for index in range(3):
+        cache.put(bytes([index]) * 20, vector(index))
+    cache.get(bytes([0]) * 20)  # 0번을 최근 사용으로 이동
+    cache.put(bytes([3]) * 20, vector(3))
+
+    assert len(cache) == 3
+    assert bytes([1]) * 20 not in cache
+    assert bytes([0]) * 20 in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_save_appends_only_new_entries_and_reloads(tmp_path):
+    path = str(tmp_path / "embeddings.bin")
+    cache = EmbeddingCache(path)
+    cache.put(b"a" * 20, vector(1.0))
+    cache.save()
+    first_size = os.path.getsize(path)
+
+    cache.put(b"b" * 20, vector(2.0))
+    cache.save()
+    record_size = os.path.getsize(path) - first_size
+    assert record_size == 24 + 16  # 헤더 + 벡터 1개만 추가
+
+    # 잘린 마지막 레코드는 무시하고 로드
+    with open(path, "ab") as f:
+        f.write(b"c" * 30)
+    reloaded = EmbeddingCache(path)
+    assert len(reloaded) == 2
+    np.testing.assert_array_equal(reloaded.get(b"b" * 20), vector(2.0))
+    assert os.path.getsize(path) == first_size + record_size
+
+
+def test_pending_entries_are_flushed_past_threshold(tmp_path):
+    path = str(tmp_path / "embeddings.bin")
+    cache = EmbeddingCache(path, max_mb=160 / 1024 / 1024)  # 4차원 벡터 10개, 대기 항목은 40바이트까지
+    for index in range(50):
+        cache.put(bytes([index]) * 20, vector(index))
+        assert cache._pending_bytes <= cache.max_pending_bytes
+
+    # LRU에서 제거된 항목도 대기 중에 붙잡혀 있지 않고 파일에 기록됨
+    assert len(cache) == 10
+    cache.save()
+    assert len(EmbeddingCache(path, max_mb=1)) >= 10
+
+    # 메모리 전용 캐시는 대기 항목을 쌓지 않음
+    memory_only = EmbeddingCache(max_mb=1)
+    memory_only.put(b"a" * 20, vector(1.0))
+    assert memory_only._pending == {} and memory_only._pending_bytes == 0
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+디바이스 공통 임베딩 엔진 테스트 (모델 순전파는 결정적 벡터로 대체)
+"""
+
+import numpy as np
+
+from core.bert.embedding_cache import EmbeddingCache
+from core.bert.embedding_engine import EMBEDDING_DIM, EmbeddingEngine
+
+
+class FakeEngine(EmbeddingEngine):
+    def __init__(self, **kwargs):
+        super().__init__(device="cpu", cache=EmbeddingCache(None), **kwargs)
+        self.encoded = []
+
+    def _encode(self, texts):
+        self.encoded.append(list(texts))
+        vectors = np.zeros((len(texts), EMBEDDING_DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            vectors[row, sum(map(ord, text)) % EMBEDDING_DIM] = 1.0
+            vectors[row, len(text) % EMBEDDING_DIM] += 0.5
+        return vectors
+
+
+def test_embed_only_encodes_missing_texts_once():
+    engine = FakeEngine(batch_size=2)
+    assert engine.precision == "fp32"
+
+    first = engine.embed(["경제 위기", "경제 위기!", "", "정치 개혁", "스포츠"])
+    assert first.shape == (5, EMBEDDING_DIM)
+    assert not first[2].any()  # 빈 텍스트는 0 벡터
+    # 전처리 후 같은 텍스트는 한 번만 계산, 배치 크기 2로 길이순 처리
+    assert sorted(text for batch in engine.encoded for text in batch) == ["경제 위기", "스포츠", "정치 개혁"]
+    assert all(len(batch) <= 2 for batch in engine.encoded)
+    np.testing.assert_array_equal(first[0], first[1])
+
+    engine.encoded.clear()
+    second = engine.embed(["정치 개혁", "스포츠"])
+    assert engine.encoded == []
+    np.testing.assert_array_equal(second, first[[3, 4]])
+
+
+def test_topk_matches_brute_force_cosine():
+    engine = FakeEngine()
+    rng = np.random.default_rng(0)
+    books = rng.normal(size=(50, EMBEDDING_DIM)).astype(np.float32)
+    books[7] = 0.0  # 0 벡터는 유사도 0
+    queries = rng.normal(size=(3, EMBEDDING_DIM)).astype(np.float32)
+
+    index = engine.build_index(books)
+    results = engine.topk(queries, index, k=4)
+    normalized = books / np.maximum(np.linalg.norm(books, axis=1, keepdims=True), 1e-12)
+    for query, hits in zip(queries, results):
+        expected = normalized @ (query / np.linalg.norm(query))
+        assert [i for i, _ in hits] == list(np.argsort(-expected)[:4])
+        np.testing.assert_allclose([s for _, s in hits], np.sort(expected)[::-1][:4], rtol=1e-5)
+
+    single = engine.topk(queries[0], books, k=50, threshold=0.0)
+    assert all(score >= 0.0 for _, score in single)
+    assert 7 not in [i for i, score in single if score > 0.0]
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+헤드라인 중복 제거 테스트
+"""
+
+from core.headline_dedup import HeadlineDeduplicator, SimHashIndex, hamming_distance, simhash
+
+
+def test_near_duplicate_titles_have_close_fingerprints():
+    base = simhash("국회, 내년도 예산안 본회의 처리 일정 합의")
+    spaced = simhash("[속보] 국회 내년도 예산안 본회의 처리일정 합의")
+    other = simhash("프로야구 포스트시즌 일정 발표")
+
+    assert hamming_distance(base, spaced) <= 3
+    assert hamming_distance(base, other) > 3
+
+
+def test_band_index_finds_fingerprints_within_distance():
+    index = SimHashIndex(max_distance=3)
+    index.add(0b1011 << 40)
+
+    assert index.find((0b1011 << 40) ^ 0b111) is not None
+    assert index.find((0b1011 << 40) ^ 0b1111) is None
+
+
+def test_filter_drops_in_run_and_previous_run_duplicates(tmp_path):
+    store_path = str(tmp_path / "headlines.pkl")
+    dedup = HeadlineDeduplicator(store_path, history_days=7, max_distance=3)
+    first = dedup.filter({"politics": [
+        "국회, 내년도 예산안 본회의 처리 일정 합의",
+        "국회 내년도 예산안 본회의 처리 일정 합의",
+        "여야 원내대표 회동… 민생법안 처리 논의",
+    ]}, "day-1")
+    assert first["dropped"]["politics"] == {"in_run": 1, "history": 0}
+    dedup.record("day-1", first["fingerprints"])
+
+    # 디스크에서 다시 로드해도 이전 실행 지문과 비교
+    second = HeadlineDeduplicator(store_path, history_days=7, max_distance=3).filter({"politics": [
+        "[속보] 국회, 내년도 예산안 본회의 처리 일정 합의",
+        "대통령실, 개각 발표 임박",
+    ]}, "day-2")
+    assert second["titles"]["politics"] == ["대통령실, 개각 발표 임박"]
+    assert second["dropped"]["politics"] == {"in_run": 0, "history": 1}
+
+    # 같은 실행 키로 다시 실행하면 자기 자신과는 비교하지 않음
+    rerun = dedup.filter({"politics": ["여야 원내대표 회동… 민생법안 처리 논의"]}, "day-1")
+    assert rerun["titles"]["politics"] == ["여야 원내대표 회동… 민생법안 처리 논의"]
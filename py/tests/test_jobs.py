@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+백그라운드 작업 상태 전이 테스트 (대기 → 실행 → 성공 / 건너뜀 / 실패, 중복 실행 방지)
+"""
+
+import threading
+
+from core import jobs
+from core.jobs import BackgroundJob
+
+
+def test_job_status_transitions_and_single_run():
+    release = threading.Event()
+    started = threading.Event()
+
+    def target(job):
+        job.set_stage("crawl", "running")
+        job.set_details(rows=3)
+        started.set()
+        release.wait(5)
+        return "완료"
+
+    job = BackgroundJob("test", target, history_size=2)
+    assert job.status()["current"]["status"] == "idle"
+    assert job.start()
+    started.wait(5)
+    current = job.status()["current"]
+    assert current["status"] == "running" and current["stage"] == "crawl"
+    assert not job.start()  # 실행 중에는 다시 시작하지 않음
+
+    release.set()
+    job._thread.join(5)
+    status = job.status()
+    assert not status["running"]
+    assert status["current"]["status"] == "succeeded" and status["current"]["message"] == "완료"
+    assert status["current"]["details"] == {"rows": 3} and status["current"]["duration_sec"] >= 0
+    assert len(status["history"]) == 1
+
+
+def test_job_records_skipped_and_failed_runs():
+    results = iter(["skipped", RuntimeError("DB 연결 실패"), "완료"])
+
+    def target(job):
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    job = BackgroundJob("test", target, history_size=2)
+    for _ in range(3):
+        assert job.start()
+        job._thread.join(5)
+
+    history = job.status()["history"]
+    # 최신 실행이 앞, history_size개만 보관
+    assert [run["status"] for run in history] == ["succeeded", "failed"]
+    assert history[1]["error"] == "DB 연결 실패"
+
+
+def test_daily_job_skips_when_today_exists(monkeypatch, tmp_path):
+    monkeypatch.setenv("JOB_LOCK_PATH", str(tmp_path / "daily_job.lock"))
+    class Checker:
+        closed = False
+
+        def should_skip_processing(self):
+            return True
+
+        def close(self):
+            Checker.closed = True
+
+    monkeypatch.setattr("utils.duplicate_checker.DuplicateDataChecker", Checker)
+    job = BackgroundJob("daily", jobs.run_daily_recommendation)
+    job.start()
+    job._thread.join(5)
+
+    current = job.status()["current"]
+    assert current["status"] == "skipped" and current["stage"] == "done"
+    assert Checker.closed
+
+
+def test_daily_job_skips_while_another_worker_holds_lock(monkeypatch, tmp_path):
+    from core.file_lock import exclusive_lock
+
+    class Checker:
+        created = False
+
+        def __init__(self):
+            Checker.created = True
+
+    lock_path = str(tmp_path / "daily_job.lock")
+    monkeypatch.setenv("JOB_LOCK_PATH", lock_path)
+    monkeypatch.setattr("utils.duplicate_checker.DuplicateDataChecker", Checker)
+    job = BackgroundJob("daily", jobs.run_daily_recommendation)
+    # 다른 워커가 같은 잠금 파일을 잡고 있는 상태
+    with exclusive_lock(lock_path) as acquired:
+        assert acquired
+        job.start()
+        job._thread.join(5)
+
+    current = job.status()["current"]
+    assert current["status"] == "skipped" and current["stage"] == "done"
+    assert not Checker.created
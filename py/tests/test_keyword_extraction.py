@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 제목 키워드 추출 테스트 (konlpy 없이 간이 명사 추출 사용)
+"""
+
+import pytest
+
+pytest.importorskip("sklearn")
+
+from core.keyword_extraction import KeywordExtractor, resolve_analyzer
+
+
+def make_extractor(tmp_path, analyzer="regex", **options):
+    return KeywordExtractor(
+        top_k=3, analyzer=analyzer,
+        corpus_path=str(tmp_path / "corpus.pkl"), memo_path=str(tmp_path / "nouns.pkl"),
+        **options,
+    )
+
+
+def test_extract_ranks_section_specific_nouns(tmp_path):
+    extractor = make_extractor(tmp_path)
+    keywords = extractor.extract({
+        "politics": ["국회 예산안 처리 합의", "국회 예산안 본회의 통과", "정부 개각 발표 임박"],
+        "sports": ["대표팀 월드컵 예선 승리", "월드컵 대표팀 명단 발표"],
+    }, run_key="day-1")
+    extractor.close()
+
+    assert keywords["politics"][:2] == ["국회", "예산안"]
+    assert set(keywords["sports"][:2]) == {"대표팀", "월드컵"}
+    # 불용어 제외
+    assert "발표" not in keywords["politics"] + keywords["sports"]
+
+
+def test_nouns_use_process_pool_and_memo(tmp_path):
+    titles = [f"반도체 수출 {index}개월 연속 증가" for index in range(6)]
+    extractor = make_extractor(tmp_path, max_workers=2, batch_size=2)
+    try:
+        first = extractor.nouns(titles)
+    finally:
+        extractor.close()
+
+    assert first[0] == ["반도체", "수출", "0개월", "연속", "증가"]
+
+    # 디스크 메모를 다시 읽으면 분석 없이 같은 결과
+    reloaded = make_extractor(tmp_path, max_workers=2, batch_size=2)
+    reloaded._get_executor = None  # 풀을 쓰면 실패
+    assert reloaded.nouns(titles) == first
+
+
+def test_memo_keyed_on_resolved_analyzer(tmp_path):
+    titles = ["국회 예산안 처리 합의"]
+    regex = make_extractor(tmp_path)
+    first = regex.nouns(titles)
+    regex.close()
+
+    # 메모 키는 설정 이름(auto)이 아니라 실제 분석기 - konlpy가 없으면 regex 메모를 그대로 사용
+    auto = make_extractor(tmp_path, analyzer="auto")
+    nouns = auto.nouns(titles)
+    resolved = resolve_analyzer("auto")
+    assert (resolved, titles[0]) in auto._memo and ("auto", titles[0]) not in auto._memo
+    if resolved == "regex":
+        assert nouns == first and len(auto._memo) == 1
+
+
+def test_word_extraction_does_not_record_corpus(tmp_path, monkeypatch):
+    from core.crowling import Crowling
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("KEYWORD_ANALYZER", "regex")
+    crowling = Crowling(sections={"politics": []}, use_cache=False)
+    monkeypatch.setattr(crowling, "get_news_titles", lambda: {"politics": ["국회 예산안 처리 합의"]})
+    assert crowling.wordExtraction(top_k=2)["politics"]
+
+    # 배경 말뭉치는 파이프라인 keywords 단계만 기록
+    extractor = KeywordExtractor(analyzer="regex")
+    assert extractor._corpus == {}
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+도서 이웃 그래프 테스트 (블록 병렬 생성 = 전체 정렬 결과, CSR 저장 / 로드, /api/books/{isbn}/similar)
+"""
+
+import asyncio
+import os
+
+import httpx
+import numpy as np
+from fastapi import FastAPI
+
+from api.endpoints import router
+from core.bert.knn_graph import KnnGraph, KnnGraphStore, catalogue_version
+
+
+def make_graph(n=50, k=5, **kwargs):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(n, 16)).astype(np.float32)
+    isbns = [f"isbn{i:03d}" for i in range(n)]
+    titles = [f"책 {i}" if i % 7 else None for i in range(n)]
+    return vectors, isbns, KnnGraph.build(vectors, isbns, titles, k=k, **kwargs)
+
+
+def test_blocked_build_matches_full_sort():
+    vectors, isbns, graph = make_graph(block_rows=8, workers=3)
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ normalized.T
+    np.fill_diagonal(scores, -np.inf)
+    expected = np.argsort(-scores, axis=1)[:, :5]
+
+    assert graph.indptr.tolist() == list(range(0, 251, 5))
+    assert graph.indices.reshape(-1, 5).tolist() == expected.tolist()
+    neighbours = graph.neighbours("isbn003", limit=2)
+    assert [book["books_isbn"] for book in neighbours] == [isbns[i] for i in expected[3, :2]]
+    assert abs(neighbours[0]["similarity_score"] - scores[3, expected[3, 0]]) < 1e-2
+    assert graph.neighbours("missing") is None
+
+
+def test_min_score_and_zero_vectors_make_ragged_rows(tmp_path):
+    vectors = np.array([[1, 0], [0.9, 0.1], [0, 1], [0, 0]], dtype=np.float32)
+    graph = KnnGraph.build(vectors, ["a", "b", "c", "d"], ["A", "B", "C", "D"], k=3, min_score=0.5,
+                           metadata={"version": "v1"})
+    assert graph.indptr.tolist() == [0, 1, 2, 2, 2]
+    assert [book["books_isbn"] for book in graph.neighbours("a")] == ["b"]
+    assert graph.neighbours("d") == []
+
+    path = str(tmp_path / "graph.npz")
+    graph.save(path)
+    loaded = KnnGraph.load(path)
+    assert loaded.version == "v1" and loaded.neighbours("b") == graph.neighbours("b")
+    assert catalogue_version(["a", "b"], "cls-fp32", 3, 0.5) != catalogue_version(["a", "b"], "mean-fp32", 3, 0.5)
+
+
+def test_similar_endpoint_serves_and_reloads_graph(tmp_path, monkeypatch):
+    path = str(tmp_path / "graph.npz")
+    store = KnnGraphStore(path)
+    monkeypatch.setattr("core.bert.knn_graph._store", store)
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+
+    async def get(url):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(url)
+
+    assert asyncio.run(get("/api/books/isbn001/similar")).status_code == 503
+
+    _, _, graph = make_graph(metadata={"version": "v1"})
+    graph.save(path)
+    response = asyncio.run(get("/api/books/isbn001/similar?limit=3"))
+    assert response.status_code == 200
+    body = response.json()
+    assert body["graph_version"] == "v1" and len(body["books"]) == 3
+    assert body["books"] == graph.neighbours("isbn001", 3)
+    assert asyncio.run(get("/api/books/nope/similar")).status_code == 404
+
+    _, _, rebuilt = make_graph(n=10, k=2, metadata={"version": "v2"})
+    rebuilt.save(path)
+    os.utime(path, (1, 1))  # 같은 초 안에 다시 저장해도 변경을 감지하도록 mtime 변경
+    assert asyncio.run(get("/api/books/isbn001/similar")).json()["graph_version"] == "v2"
+
+
+def test_pipeline_graph_covers_full_catalogue_beyond_book_limit(tmp_path):
+    from test_bench_standins import HashEngine
+    from standins import SQLiteDatabase, SyntheticCorpus
+    from core.pipeline import RecommendationPipeline
+    from core.recommendation.bert_recommendation_gpu import GPUBertRecommendationSystem
+
+    db = SQLiteDatabase()
+    books = SyntheticCorpus(seed=2).books(30)
+    db.load_books(books)
+    recommender = GPUBertRecommendationSystem(engine=HashEngine(), db=db, book_limit=10)
+    pipeline = RecommendationPipeline(checkpoint_dir=str(tmp_path), run_id="r1", recommender=recommender,
+                                      knn_graph_path=str(tmp_path / "graph.npz"))
+
+    # 추천 점수는 ISBN 순 상위 10권만, 이웃 그래프는 30권 전체
+    embedded = pipeline.embed_books({})
+    assert embedded["books"]["isbn"] == sorted(isbn for isbn, _, _ in books)[:10]
+    result = pipeline.similar_books({"embed_books": embedded})
+    assert result["books"] == 30 and not result["reused"]
+    assert pipeline.similar_books({"embed_books": embedded})["reused"]
+
+    # 설명만 바뀌어도 다시 생성
+    isbn, title, _ = books[0]
+    db.load_books([(isbn, title, "완전히 새로운 설명")])
+    assert not pipeline.similar_books({"embed_books": embedded})["reused"]
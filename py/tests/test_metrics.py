@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+메트릭 수집 테스트 (Prometheus 텍스트 형식, 문장 이름, 임베딩 캐시 수집기)
+"""
+
+import numpy as np
+
+from core.bert.embedding_cache import EmbeddingCache
+from core.metrics import MetricsRegistry, get_metrics, statement_name
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("request_seconds", "요청 시간", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.labels("/api/recommend/{category}").observe(value)
+    registry.counter("errors_total", "오류 수").inc(2)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE request_seconds histogram" in lines
+    assert 'request_seconds_bucket{route="/api/recommend/{category}",le="0.1"} 1' in lines
+    assert 'request_seconds_bucket{route="/api/recommend/{category}",le="1.0"} 3' in lines
+    assert 'request_seconds_bucket{route="/api/recommend/{category}",le="+Inf"} 4' in lines
+    assert 'request_seconds_count{route="/api/recommend/{category}"} 4' in lines
+    assert "errors_total 2.0" in lines
+
+
+def test_statement_name_groups_queries_by_verb_and_table():
+    assert statement_name("SELECT COUNT(*)\n FROM tb_recommend r JOIN tb_books b") == "select:tb_recommend"
+    assert statement_name("-- 저장\nINSERT INTO tb_recommend (a) VALUES (%s)") == "insert:tb_recommend"
+    assert statement_name("UPDATE tb_recommend SET method = 'x'") == "update:tb_recommend"
+    assert statement_name("TRUNCATE TABLE tb_books_keyword") == "truncate:tb_books_keyword"
+
+
+def test_embedding_cache_events_are_collected_at_scrape():
+    cache = EmbeddingCache(None, max_mb=0.004)
+    for i in range(3):
+        cache.put(bytes([i]) * 20, np.ones(768, dtype=np.float32))
+    cache.get(bytes([2]) * 20)
+    cache.get(b"missing" * 3)
+
+    text = get_metrics().render()
+    lines = {line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+             for line in text.splitlines() if line.startswith("cache_events_total")}
+    assert lines['cache_events_total{cache="embedding",event="hit"}'] >= 1
+    assert lines['cache_events_total{cache="embedding",event="miss"}'] >= 1
+    assert lines['cache_events_total{cache="embedding",event="eviction"}'] >= 1
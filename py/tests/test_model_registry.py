@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+모델 레지스트리 테스트 (동시 요청 시 1회 로드, 지연 로드, 통계 / 언로드)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.bert.model_registry import get_model_registry
+
+
+class CountingLoader:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.loads = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.loads += 1
+        time.sleep(self.delay)  # 로드 중에 다른 스레드가 같은 키를 요청하도록
+        return object()
+
+
+def test_concurrent_get_loads_once_and_lazily():
+    registry = get_model_registry()
+    assert registry is get_model_registry()
+    loader, other = CountingLoader(), CountingLoader()
+    registry.register("test:concurrent", loader, replace=True)
+    registry.register("test:other", other, replace=True)
+
+    # 등록만으로는 로드하지 않음
+    assert loader.loads == 0 and not registry.is_loaded("test:concurrent")
+    stats = {row["key"]: row for row in registry.stats()}
+    assert stats["test:concurrent"]["loaded"] is False
+
+    barrier = threading.Barrier(16)
+
+    def get(_):
+        barrier.wait()
+        return registry.get("test:concurrent")
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        models = list(pool.map(get, range(16)))
+    assert loader.loads == 1 and other.loads == 0
+    assert all(model is models[0] for model in models)
+
+    stats = {row["key"]: row for row in registry.stats()}
+    assert stats["test:concurrent"]["loaded"] is True
+    assert stats["test:concurrent"]["load_time_sec"] >= loader.delay * 0.9
+    assert stats["test:other"]["loaded"] is False
+
+
+def test_unload_reloads_and_unknown_key_fails():
+    registry = get_model_registry()
+    loader = CountingLoader(delay=0)
+    registry.register("test:unload", loader, replace=True)
+    first = registry.get("test:unload")
+    assert registry.unload("test:unload") and not registry.is_loaded("test:unload")
+    assert registry.get("test:unload") is not first and loader.loads == 2
+
+    # 이미 로드된 모델은 replace 없이 다시 등록해도 유지
+    registry.register("test:unload", CountingLoader(delay=0))
+    assert registry.get("test:unload") is not first and loader.loads == 2
+
+    with pytest.raises(KeyError):
+        registry.get("test:missing")
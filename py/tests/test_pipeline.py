@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+체크포인트 파이프라인 / cron 스케줄 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+
+from core.pipeline import CronSchedule, Pipeline, PipelineStage
+
+
+def make_pipeline(tmp_path, calls, fail=None, run_id="2026-01-02"):
+    def stage(name):
+        def func(outputs):
+            calls.append(name)
+            if name == fail:
+                raise RuntimeError(f"{name} 실패")
+            return sorted(outputs) + [name]
+        return PipelineStage(name, func)
+
+    return Pipeline("test", [stage("a"), stage("b"), stage("c")], checkpoint_dir=str(tmp_path),
+                    run_id=run_id, profile_stages=[])
+
+
+def test_failed_stage_is_recorded_and_resumed(tmp_path):
+    calls = []
+    with pytest.raises(RuntimeError):
+        make_pipeline(tmp_path, calls, fail="b").run()
+    assert calls == ["a", "b"]
+
+    # 실패 기록은 매니페스트에 남고, 다시 실행하면 완료된 a는 체크포인트 재사용
+    failed = make_pipeline(tmp_path, calls)
+    assert failed.manifest["stages"]["b"]["status"] == "failed"
+    assert "b 실패" in failed.manifest["stages"]["b"]["error"]
+    assert failed.is_completed("a") and not failed.is_completed("b")
+
+    calls.clear()
+    statuses = []
+    outputs = failed.run(on_stage=lambda name, status: statuses.append((name, status)))
+    assert calls == ["b", "c"]
+    assert statuses == [("a", "resumed"), ("b", "running"), ("c", "running")]
+    assert outputs["c"] == ["a", "b", "c"]
+    assert all(failed.stage_durations()[name] is not None for name in "abc")
+
+
+def test_same_run_id_runs_in_one_process_at_a_time(tmp_path):
+    calls = []
+    first = make_pipeline(tmp_path, calls)
+    second = make_pipeline(tmp_path, calls)
+    nested = []
+
+    # 첫 실행이 run_dir 잠금을 잡은 동안 같은 run_id의 두 번째 실행은 바로 반환
+    first.stages[0].func = lambda outputs: nested.append(second.run()) or ["a"]
+    assert first.run()["c"] == ["a", "b", "c"]
+    assert nested == [None] and calls == ["b", "c"]
+
+    # 잠금이 풀린 뒤에는 첫 실행이 완료한 단계를 그대로 재사용
+    calls.clear()
+    assert second.run()["c"] == ["a", "b", "c"]
+    assert calls == []
+
+
+def test_reset_from_stage_and_restart(tmp_path):
+    calls = []
+    make_pipeline(tmp_path, calls).run()
+
+    pipeline = make_pipeline(tmp_path, calls)
+    pipeline.reset(from_stage="b")
+    assert pipeline.is_completed("a") and not pipeline.is_completed("b")
+    calls.clear()
+    pipeline.run()
+    assert calls == ["b", "c"]
+
+    calls.clear()
+    make_pipeline(tmp_path, calls).run(resume=False)
+    assert calls == ["a", "b", "c"]
+
+
+def test_load_previous_output_uses_latest_earlier_run(tmp_path):
+    make_pipeline(tmp_path, [], run_id="2026-01-01").run()
+    with pytest.raises(RuntimeError):
+        make_pipeline(tmp_path, [], fail="c", run_id="2026-01-02").run()
+
+    pipeline = make_pipeline(tmp_path, [], run_id="2026-01-03")
+    assert pipeline.load_previous_output("b") == ["a", "b"]
+    # 2일 실행의 c는 실패했으므로 1일 실행 결과 사용
+    assert pipeline.load_previous_output("c") == ["a", "b", "c"]
+    assert make_pipeline(tmp_path, [], run_id="2026-01-01").load_previous_output("a") is None
+
+
+def test_cron_schedule_parsing_and_next_run():
+    schedule = CronSchedule("*/15 7-9 * * 1-5")
+    assert schedule.minutes == {0, 15, 30, 45} and schedule.hours == {7, 8, 9}
+    # 2026-01-02은 금요일 → 다음 실행은 월요일 07:00
+    assert schedule.next_after(datetime(2026, 1, 2, 9, 50)) == datetime(2026, 1, 5, 7, 0)
+    assert schedule.next_after(datetime(2026, 1, 2, 7, 0)) == datetime(2026, 1, 2, 7, 15)
+
+    # 일 / 요일이 모두 지정되면 둘 중 하나만 맞아도 실행, 7은 일요일
+    either = CronSchedule("0 0 1 * 7")
+    assert either.weekdays == {0}
+    assert either.next_after(datetime(2026, 1, 1, 0, 0)) == datetime(2026, 1, 4, 0, 0)
+
+    for expression in ("0 7 * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *"):
+        with pytest.raises(ValueError):
+            CronSchedule(expression)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+샘플링 프로파일러 / 프로파일 저장소 / 파이프라인 단계 프로파일 테스트
+"""
+
+import time
+
+from core.pipeline import Pipeline, PipelineStage
+from core.profiling import ProfileStore, SamplingProfiler
+
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+def test_sampler_collects_collapsed_stacks(tmp_path):
+    profiler = SamplingProfiler(interval=0.002).start()
+    busy_loop(0.1)
+    profiler.stop()
+
+    assert profiler.samples > 5
+    assert any("busy_loop (test_profiling.py" in stack for stack in profiler.stacks)
+    first = profiler.collapsed().splitlines()[0]
+    assert first.rsplit(" ", 1)[1].isdigit()
+
+    store = ProfileStore(str(tmp_path), keep=2)
+    ids = [store.save(profiler, "request", f"GET /api/recommend/{i}") for i in range(3)]
+    assert [meta["id"] for meta in store.list()] == ids[:0:-1]
+    assert store.path(ids[0]) is None and store.path("../etc/passwd") is None
+    with open(store.path(ids[-1]), encoding="utf-8") as f:
+        assert f.read() == profiler.collapsed()
+
+
+def test_pipeline_profiles_selected_stages(tmp_path, monkeypatch):
+    monkeypatch.setattr("core.profiling._store", ProfileStore(str(tmp_path / "profiles")))
+    pipeline = Pipeline("demo", [
+        PipelineStage("fast", lambda outputs: 1),
+        PipelineStage("slow", lambda outputs: busy_loop(0.05)),
+    ], checkpoint_dir=str(tmp_path), run_id="r1", profile_stages=["slow"])
+    pipeline.run()
+
+    assert "profile" not in pipeline.manifest["stages"]["fast"]
+    profile_id = pipeline.manifest["stages"]["slow"]["profile"]
+    assert profile_id.endswith("_stage_demo_slow")
+    assert (tmp_path / "profiles" / f"{profile_id}.collapsed").exists()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+임베딩 차원 축소 테스트 (저차원 구조의 합성 임베딩 사용)
+"""
+
+import numpy as np
+
+from core.bert.embedding_cache import EmbeddingCache
+from core.bert.embedding_engine import EMBEDDING_DIM, EmbeddingEngine
+from core.bert.projection import EmbeddingProjection, recall_at_k
+
+RANK = 16
+BASIS = np.random.default_rng(1).normal(size=(RANK, EMBEDDING_DIM)).astype(np.float32)
+
+
+def low_rank_vectors(seeds):
+    """RANK차원 구조 + 작은 잡음"""
+    vectors = []
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        vectors.append(rng.normal(size=RANK) @ BASIS + rng.normal(scale=0.01, size=EMBEDDING_DIM))
+    return np.asarray(vectors, dtype=np.float32)
+
+
+class LowRankEngine(EmbeddingEngine):
+    def __init__(self, **kwargs):
+        super().__init__(device="cpu", cache=EmbeddingCache(None), **kwargs)
+        self.encoded = 0
+
+    def _encode(self, texts):
+        self.encoded += len(texts)
+        return low_rank_vectors(sum(map(ord, text)) for text in texts)
+
+
+def test_fit_transform_and_roundtrip(tmp_path):
+    embeddings = low_rank_vectors(range(300))
+    projection = EmbeddingProjection.fit(embeddings, dim=32)
+    reduced = projection.transform(embeddings)
+    assert reduced.shape == (300, 32)
+    assert projection.metadata["explained_variance"] > 0.99
+    assert recall_at_k(embeddings, reduced, k=10) > 0.95
+
+    # 화이트닝하면 주성분 분산이 1
+    whitened = EmbeddingProjection.fit(embeddings, dim=RANK, whiten=True).transform(embeddings)
+    np.testing.assert_allclose(whitened.var(axis=0, ddof=1), 1.0, rtol=1e-3)
+
+    path = str(tmp_path / "projection.pkl")
+    projection.save(path)
+    loaded = EmbeddingProjection.load(path)
+    assert loaded.id == projection.id
+    np.testing.assert_array_equal(loaded.transform(embeddings), reduced)
+    assert EmbeddingProjection.load(str(tmp_path / "missing.pkl")) is None
+
+
+def test_engine_fit_projection_switches_output_dim(tmp_path, monkeypatch):
+    monkeypatch.setenv("EMBEDDING_PROJECTION_DIM", "32")
+    path = str(tmp_path / "projection.pkl")
+    texts = [f"도서 설명 {i}" for i in range(120)]
+
+    engine = LowRankEngine(projection_path=path)
+    assert engine.projection is None and engine.output_dim == EMBEDDING_DIM
+    full_key = engine.cache_key(texts[0])
+
+    metadata = engine.fit_projection(texts, catalogue_hash="abc")
+    assert metadata["activated"] and metadata["recall_at_k"] > 0.9
+    assert engine.output_dim == 32
+    assert engine.cache_key(texts[0]) != full_key  # 투영별로 캐시 키 분리
+    assert engine.embed(texts[:5]).shape == (5, 32)
+    # 투영 키가 없어도 학습 때 캐시한 전체 차원 임베딩을 투영 (모델은 텍스트당 한 번만)
+    np.testing.assert_allclose(engine.embed(texts), engine.projection.transform(engine.embed(texts, project=False)),
+                               rtol=1e-5, atol=1e-5)
+    assert engine.encoded == len(texts)
+    assert engine.embed(texts[:5], project=False).shape == (5, EMBEDDING_DIM)
+    assert len(engine.topk(texts[0], engine.embed(texts), k=3)) == 3
+
+    # 같은 모델 / 임베딩 방식이면 저장된 투영을 다시 사용, 풀링이 다르면 사용하지 않음
+    assert LowRankEngine(projection_path=path).projection.id == engine.projection.id
+    assert LowRankEngine(projection_path=path, pooling="mean").projection is None
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+쿼리 통계 / 느린 쿼리 로그 / 관리자 API 테스트
+"""
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from api.admin import router
+from core.query_stats import QueryStatsRecorder, fingerprint, get_query_stats, normalize_sql
+
+
+def test_fingerprint_ignores_literals_and_whitespace():
+    a = "SELECT * FROM tb_books WHERE books_isbn IN (%s, %s, %s) -- 조회\n AND price > 10"
+    b = "SELECT * FROM tb_books\n  WHERE books_isbn IN ('1', '2') AND price > 20.5"
+    assert normalize_sql(a) == "SELECT * FROM tb_books WHERE books_isbn IN (?) AND price > ?"
+    assert fingerprint(a) == fingerprint(b)
+
+
+def test_recorder_tracks_percentiles_and_slow_log():
+    recorder = QueryStatsRecorder(slow_ms=50, slow_log_size=2, explain=True, explain_interval=3600)
+    query = "SELECT books_isbn FROM tb_books WHERE books_title = %s"
+    for ms in range(1, 101):
+        recorder.record(query, ms / 1000, rows=2, explain=lambda: "Seq Scan on tb_books")
+    recorder.record("INSERT INTO tb_recommend VALUES (%s)", 0.2, error="unique violation")
+
+    stats = {row["sql"]: row for row in recorder.snapshot(sort="calls")}
+    select = stats["SELECT books_isbn FROM tb_books WHERE books_title = ?"]
+    assert select["calls"] == 100 and select["rows"] == 200
+    assert select["mean_ms"] == 50.5 and select["p95_ms"] == 95.0 and select["max_ms"] == 100.0
+    assert stats["INSERT INTO tb_recommend VALUES (?)"]["errors"] == 1
+
+    slow = recorder.slow_queries()
+    assert len(slow) == 2 and slow[0]["error"] == "unique violation"
+    # 실행 계획은 지문별 간격 안에서 한 번만 (첫 느린 쿼리 50ms에서 수집)
+    assert slow[1]["plan"] is None
+    assert recorder.summary()["calls"] == 101
+
+
+def test_admin_endpoint_requires_token(monkeypatch):
+    app = FastAPI()
+    app.include_router(router, prefix="/api/admin")
+    get_query_stats().record("SELECT 1", 0.001, rows=1)
+
+    async def call(headers):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/admin/query-stats", headers=headers)
+
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert asyncio.run(call({})).status_code == 403
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    assert asyncio.run(call({"X-Admin-Token": "wrong"})).status_code == 401
+    response = asyncio.run(call({"X-Admin-Token": "secret"}))
+    assert response.status_code == 200
+    assert any(row["sql"] == "SELECT ?" for row in response.json()["statements"])
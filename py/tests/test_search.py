@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+도서 의미 검색 테스트 (카탈로그 스냅샷 조인, 검색어 임베딩 LRU, /api/search)
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from test_bench_standins import HashEngine
+
+from api.endpoints import router
+from core.search import BookSearchIndex, QueryEmbeddingLRU, SearchIndexNotReady
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from standins import SQLiteDatabase, SyntheticCorpus
+
+
+class CountingEngine(HashEngine):
+    def __init__(self):
+        super().__init__()
+        self.encoded = 0
+
+    def _encode(self, texts):
+        self.encoded += len(texts)
+        return super()._encode(texts)
+
+
+def make_index(count=40):
+    db = SQLiteDatabase()
+    books = SyntheticCorpus(seed=5).books(count)
+    db.load_books(books)
+    db.conn.execute("UPDATE tb_books SET books_img = 'img/' || books_isbn, books_publisher = '출판사'")
+    return BookSearchIndex(engine=CountingEngine(), db=db, ttl=0), books
+
+
+def test_search_joins_catalogue_and_reuses_query_embedding():
+    index, books = make_index()
+    isbn, title, description = books[7]
+
+    first = index.search(description, k=3)
+    assert first["total_books"] == len(books) and not first["cache_hit"]
+    top = first["results"][0]
+    assert (top["books_isbn"], top["books_title"], top["books_img"], top["books_publisher"]) == \
+        (isbn, title, f"img/{isbn}", "출판사")
+    assert top["similarity_score"] > 0.99 and len(first["results"]) == 3
+
+    encoded = index.engine.encoded
+    again = index.search(f"  {description}!! ", k=3)  # 전처리 후 같은 검색어
+    assert again["cache_hit"] and index.engine.encoded == encoded
+    assert [book["books_isbn"] for book in again["results"]] == [book["books_isbn"] for book in first["results"]]
+    assert index.search("!!!", k=3)["results"] == []
+
+
+def test_backend_change_rebuilds_in_background_without_blocking():
+    index, books = make_index(10)
+    index.refresh()
+    index.snapshot.backend = "cls-fp32-projold"  # 이전 투영으로 만든 스냅샷
+
+    # 기다리지 않는 요청은 재생성을 백그라운드로 넘기고 바로 실패
+    with pytest.raises(SearchIndexNotReady):
+        index.search(books[0][2], wait=False)
+    index._refresh_thread.join(timeout=10)
+    assert index.snapshot.backend == index.engine.backend
+    assert index.search(books[0][2], k=1, wait=False)["results"][0]["books_isbn"] == books[0][0]
+
+
+def test_query_lru_evicts_oldest():
+    cache = QueryEmbeddingLRU(max_size=2)
+    for text in ("a", "b", "c"):
+        cache.put(("cls", text), text)
+    assert cache.get(("cls", "a")) is None
+    assert cache.get(("cls", "c")) == "c" and len(cache) == 2
+
+
+def test_search_endpoint(monkeypatch):
+    index, books = make_index(20)
+    monkeypatch.setattr("core.search._search_index", index)
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+
+    async def get(params):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/api/search", params=params)
+
+    # 첫 인덱스가 만들어지기 전에는 기다리지 않고 503
+    monkeypatch.setattr(index, "refresh", lambda: None)
+    response = asyncio.run(get({"q": books[0][2]}))
+    assert response.status_code == 503 and response.headers["retry-after"] == "30"
+
+    monkeypatch.delattr(index, "refresh")
+    index.refresh()
+    response = asyncio.run(get({"q": books[3][2], "k": 2}))
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_books"] == 20 and body["k"] == 2
+    assert body["books"][0]["books_isbn"] == books[3][0]
+    assert asyncio.run(get({"q": "x", "k": 0})).status_code == 422
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+워커 간 공유 임베딩 저장소 테스트
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("fcntl")
+
+from core.bert.embedding_cache import EmbeddingCache
+from core.bert.shared_store import SharedEmbeddingStore
+
+
+def test_single_writer_and_reader_share_vectors(tmp_path):
+    directory = str(tmp_path / "shared")
+    # 같은 잠금 파일을 여는 두 인스턴스 = 두 워커 (먼저 연 쪽만 기록 워커)
+    writer = SharedEmbeddingStore(directory, dim=4, sync_interval=60, refresh_interval=0)
+    reader = SharedEmbeddingStore(directory, dim=4, sync_interval=60, refresh_interval=0)
+    assert writer.is_writer and not reader.is_writer
+
+    # 읽기 워커가 만든 벡터는 스풀을 거쳐 기록 워커가 반영
+    reader.add(b"r" * 19 + b"\x00", np.arange(4, dtype=np.float32))
+    reader.flush()
+    assert b"r" * 19 + b"\x00" not in writer
+    writer.add(b"w" * 20, np.ones(4, dtype=np.float32))
+    writer.flush()
+
+    vector = reader.get(b"r" * 19 + b"\x00")
+    assert isinstance(vector, np.memmap)
+    np.testing.assert_array_equal(vector, np.arange(4, dtype=np.float32))
+    np.testing.assert_array_equal(reader.get(b"w" * 20), np.ones(4, dtype=np.float32))
+
+    # 기록 워커가 종료되면 다음 flush에서 다른 워커가 이어받음
+    writer.close()
+    reader.add(b"x" * 20, np.zeros(4, dtype=np.float32))
+    reader.flush()
+    assert reader.is_writer
+    assert len(reader) == 3
+    reader.close()
+
+
+def test_embedding_cache_falls_back_to_shared_store(tmp_path):
+    directory = str(tmp_path / "shared")
+    store = SharedEmbeddingStore(directory, dim=4, sync_interval=60, refresh_interval=0)
+    first = EmbeddingCache(shared=store)
+    first.put(b"k" * 20, np.full(4, 2.0, dtype=np.float32))
+    first.save()
+
+    second = EmbeddingCache(shared=store)
+    np.testing.assert_array_equal(second.get(b"k" * 20), np.full(4, 2.0, dtype=np.float32))
+    # 공유 저장소 조회 결과는 워커 LRU에 복사하지 않음
+    assert len(second) == 0
+    store.close()
+
+
+def test_torn_append_is_truncated_before_next_write(tmp_path):
+    directory = str(tmp_path / "shared")
+    store = SharedEmbeddingStore(directory, dim=4, sync_interval=60, refresh_interval=0)
+    store.add(b"a" * 20, np.full(4, 1.0, dtype=np.float32))
+    store.flush()
+    store.close()
+
+    # 기록 워커가 벡터를 쓰고 키를 다 쓰기 전에 종료된 상태
+    with open(store.vectors_path, "ab") as f:
+        f.write(np.full(4, 9.0, dtype=np.float32).tobytes())
+    with open(store.keys_path, "ab") as f:
+        f.write(b"o" * 7)
+
+    writer = SharedEmbeddingStore(directory, dim=4, sync_interval=60, refresh_interval=0)
+    writer.add(b"b" * 20, np.full(4, 2.0, dtype=np.float32))
+    writer.flush()
+    np.testing.assert_array_equal(writer.get(b"a" * 20), np.full(4, 1.0, dtype=np.float32))
+    np.testing.assert_array_equal(writer.get(b"b" * 20), np.full(4, 2.0, dtype=np.float32))
+
+    reader = SharedEmbeddingStore(directory, dim=4, sync_interval=60, refresh_interval=0)
+    np.testing.assert_array_equal(reader.get(b"b" * 20), np.full(4, 2.0, dtype=np.float32))
+    writer.close()
+    reader.close()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+트레이싱 테스트 (중첩 스팬, 임계 경로, OTLP 변환 + 로컬 수집기, 파이프라인 전 단계 스팬)
+"""
+
+import os
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from core.tracing import (JsonLinesExporter, MemoryExporter, OTLPExporter, Tracer, critical_path,
+                          from_otlp, load_spans, set_tracer, to_otlp)
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+
+def span_at(name, start, end, span_id, parent=None):
+    return {"trace_id": "t", "span_id": span_id, "parent_id": parent, "name": name,
+            "start_ns": start * 10 ** 6, "end_ns": end * 10 ** 6, "attributes": {}}
+
+
+def test_nested_spans_share_trace_and_record_errors():
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter)
+    with tracer.span("outside") as noop:
+        noop.set(ignored=True)
+    with pytest.raises(ValueError):
+        with tracer.start_trace("pipeline.demo", run_id="r1"):
+            with tracer.span("embed.batch", size=32) as batch:
+                batch.set(rows=32)
+            with tracer.span("db.insert"):
+                raise ValueError("boom")
+
+    spans = {span["name"]: span for span in exporter.spans}
+    assert set(spans) == {"pipeline.demo", "embed.batch", "db.insert"}
+    assert len({span["trace_id"] for span in exporter.spans}) == 1
+    assert spans["embed.batch"]["parent_id"] == spans["pipeline.demo"]["span_id"]
+    assert spans["embed.batch"]["attributes"] == {"size": 32, "rows": 32}
+    assert spans["db.insert"]["status"] == "error" and "boom" in spans["db.insert"]["error"]
+
+
+def test_critical_path_follows_latest_finishing_children():
+    spans = [
+        span_at("run", 0, 100, "root"),
+        span_at("crawl", 0, 30, "a", "root"),
+        span_at("embed", 30, 90, "b", "root"),
+        span_at("embed.batch", 30, 50, "b1", "b"),
+        span_at("embed.batch", 50, 85, "b2", "b"),
+        span_at("side", 40, 60, "c", "root"),  # embed와 겹치는 동시 실행 구간
+    ]
+    path = critical_path(spans)
+    assert [entry["span_id"] for entry in path] == ["root", "a", "b", "b1", "b2"]
+    assert {entry["span_id"]: entry["self_ms"] for entry in path} == \
+        {"root": 10.0, "a": 30.0, "b": 5.0, "b1": 20.0, "b2": 35.0}
+    assert sum(entry["self_ms"] for entry in path) == 100.0
+
+
+def test_otlp_export_round_trips_through_local_collector(tmp_path):
+    from otlp_collector import make_handler
+
+    output = tmp_path / "otlp.jsonl"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(JsonLinesExporter(str(output))))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        exporter = MemoryExporter()
+        tracer = Tracer(exporter)
+        with tracer.start_trace("pipeline.demo", run_id="r1", resume=False):
+            with tracer.span("score.topk", k=5, ratio=0.5):
+                pass
+        assert from_otlp(to_otlp(exporter.spans)) == exporter.spans
+
+        host, port = server.server_address
+        OTLPExporter(f"http://{host}:{port}").export(exporter.spans)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert load_spans(str(output)) == exporter.spans
+
+
+def test_pipeline_run_emits_stage_and_sub_spans(tmp_path, monkeypatch):
+    from test_bench_standins import HashEngine
+    from bench import parse_args, run_scale
+
+    exporter = MemoryExporter()
+    previous = set_tracer(Tracer(exporter))
+    monkeypatch.chdir(tmp_path)
+    try:
+        run_scale(30, parse_args(["pipeline", "--pages", "1", "--headlines", "5"]), str(tmp_path),
+                  engine=HashEngine())
+    finally:
+        set_tracer(previous)
+
+    names = {span["name"] for span in exporter.spans}
+    assert {"pipeline.recommendation", "crawl", "keywords", "embed_books", "score", "publish",
+            "crawl.fetch", "crawl.section", "embed", "embed.batch", "score.topk", "score.category",
+            "db.select", "db.insert"} <= names
+    path = critical_path(exporter.spans)
+    assert path[0]["name"] == "pipeline.recommendation"
+    assert abs(sum(entry["self_ms"] for entry in path) - path[0]["duration_ms"]) < 1.0
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+양자화 벡터 저장소 테스트 (군집 구조의 합성 임베딩 사용)
+"""
+
+import numpy as np
+import pytest
+
+from core.bert.vector_store import QuantizedVectorStore, measure_recall
+
+DIM = 64
+
+
+def clustered_vectors(rows, clusters=40, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, DIM))
+    return (centers[rng.integers(clusters, size=rows)] + rng.normal(scale=0.3, size=(rows, DIM))).astype(np.float32)
+
+
+@pytest.mark.parametrize("codec, max_ratio", [("fp16", 0.5), ("int8", 0.26), ("pq", 0.15)])
+def test_quantized_topk_recall_and_memory(codec, max_ratio):
+    vectors = clustered_vectors(3000)
+    queries = clustered_vectors(50, seed=1)
+    store = QuantizedVectorStore.from_vectors(vectors, codec, rescore=100, pq_subspaces=16)
+
+    # 압축 코드 크기 (재계산용 원본 제외)
+    compact = QuantizedVectorStore.from_vectors(vectors, codec, pq_subspaces=16, keep_full=False)
+    assert compact.memory_bytes() <= vectors.nbytes * max_ratio
+    assert measure_recall(vectors, store, queries, k=10) >= 0.95
+
+    indices, scores = store.topk(queries[:1] / np.linalg.norm(queries[:1]), k=5)
+    assert indices.shape == (1, 5) and np.all(np.diff(scores[0]) <= 0)
+
+
+def test_save_load_with_mmap_rescoring(tmp_path):
+    vectors = clustered_vectors(500)
+    store = QuantizedVectorStore.from_vectors(vectors, "int8", rescore=50)
+    path = str(tmp_path / "books.vec")
+    store.save(path)
+
+    loaded = QuantizedVectorStore.load(path)
+    assert isinstance(loaded.full, np.memmap)
+    assert loaded.memory_bytes() < store.memory_bytes()
+    query = vectors[:3] / np.linalg.norm(vectors[:3], axis=1, keepdims=True)
+    np.testing.assert_array_equal(loaded.topk(query, 5)[0], store.topk(query, 5)[0])
+    assert loaded.topk(query, 1)[0][:, 0].tolist() == [0, 1, 2]
+    assert QuantizedVectorStore.load(str(tmp_path / "missing.vec")) is None
+
+
+def test_index_store_keeps_rescore_source_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv("EMBEDDING_INDEX_SPILL_DIR", str(tmp_path))
+    vectors = clustered_vectors(2000)
+    store = QuantizedVectorStore.for_index(vectors, "int8")
+
+    # 상주 메모리는 코드만 (fp32 행렬보다 작아야 함), 재계산 원본은 mmap
+    assert isinstance(store.full, np.memmap)
+    assert store.memory_bytes() <= vectors.nbytes * 0.26
+    query = vectors[:3] / np.linalg.norm(vectors[:3], axis=1, keepdims=True)
+    assert store.topk(query, 1)[0][:, 0].tolist() == [0, 1, 2]
+
+
+def test_pq_subspaces_follow_projected_dimension(tmp_path, monkeypatch):
+    monkeypatch.setenv("EMBEDDING_INDEX_SPILL_DIR", str(tmp_path))
+    # 차원 축소 투영(256차원)에서도 기본 상한 96 대신 256의 약수(64)를 사용
+    vectors = np.random.default_rng(0).random((500, 256)).astype(np.float32)
+    store = QuantizedVectorStore.for_index(vectors, "pq")
+    assert store.codes.shape == (500, 64) and store.dim == 256
+    query = vectors[:2] / np.linalg.norm(vectors[:2], axis=1, keepdims=True)
+    assert store.topk(query, 1)[0][:, 0].tolist() == [0, 1]
@@ -13,12 +13,11 @@ import os
 import logging
 from typing import List, Dict
 
-# 프로젝트 루트 경로 추가
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# py/app 폴더를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "py", "app"))
 
-from py.app.services.bert_nlp import BertNLP
-from py.app.utils.bert_recommendation import BertRecommendationSystem
-from py.app.services.database import MySQLDatabase
+from core.bert.bert_nlp import BertNLP
+from core.recommendation.bert_recommendation import BertRecommendationSystem
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -119,7 +118,7 @@ def test_bert_recommendation():
         recommender = BertRecommendationSystem()
         
         # 실제 뉴스 제목으로 테스트
-        from py.app.services.crowling import Crowling
+        from core.crowling import Crowling
         crawler = Crowling()
         
         logger.info("📡 실제 뉴스 제목 크롤링 중...")